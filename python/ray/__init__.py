@@ -62,6 +62,7 @@ from ray.profiling import profile  # noqa: E402
 from ray.state import (jobs, nodes, actors, objects, timeline,
                        object_transfer_timeline, cluster_resources,
                        available_resources, errors)  # noqa: E402
+from ray.async_compat import as_completed, get_async, wait_async  # noqa: E402
 from ray.worker import (
     LOCAL_MODE,
     SCRIPT_MODE,
@@ -113,9 +114,11 @@ __all__ = [
     "_config",
     "_get_runtime_context",
     "actor",
+    "as_completed",
     "connect",
     "disconnect",
     "get",
+    "get_async",
     "get_gpu_ids",
     "get_resource_ids",
     "get_webui_url",
@@ -132,6 +135,7 @@ __all__ = [
     "shutdown",
     "show_in_webui",
     "wait",
+    "wait_async",
     "Language",
     "java_function",
     "java_actor_class",
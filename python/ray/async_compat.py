@@ -26,15 +26,47 @@ AsyncGetResponse = namedtuple("AsyncGetResponse",
                               ["plasma_fallback_id", "result"])
 
 
-def get_async(object_id):
-    """Asyncio compatible version of ray.get"""
+def get_async(object_ids):
+    """Asyncio compatible version of ray.get.
+
+    Args:
+        object_ids: Object ID of the object to get or a list of object IDs to
+            get.
+
+    Returns:
+        A future of a Python object or a list of Python objects. The future
+        raises an exception if the task that created one of the objects
+        raised an exception.
+    """
+    is_individual_id = isinstance(object_ids, ray.ObjectID)
+    if is_individual_id:
+        object_ids = [object_ids]
+    _check_object_ids("get_async", object_ids)
+
+    futures = _get_futures(object_ids)
+    if is_individual_id:
+        return futures[0]
+    return asyncio.gather(*futures)
+
+
+def _check_object_ids(name, object_ids):
+    if not isinstance(object_ids, list):
+        raise TypeError("{}() expected a list of ray.ObjectID, got {}".format(
+            name, type(object_ids)))
+    for object_id in object_ids:
+        if not isinstance(object_id, ray.ObjectID):
+            raise TypeError("{}() expected a list of ray.ObjectID, got list "
+                            "containing {}".format(name, type(object_id)))
+
+
+def _get_futures(object_ids):
+    """Returns a future of the value of each object ID."""
     # Delayed import because raylet import this file and
     # it creates circular imports.
-    from ray.experimental.async_api import init as async_api_init, as_future
+    from ray.experimental.async_api import (init as async_api_init, as_future,
+                                            as_futures)
     from ray.experimental.async_plasma import PlasmaObjectFuture
 
-    assert isinstance(object_id, ray.ObjectID), "Batched get is not supported."
-
     # Setup
     async_api_init()
     loop = asyncio.get_event_loop()
@@ -45,9 +77,8 @@ def get_async(object_id):
     # - If direct call, first try to get it from in memory store.
     #   If the object if promoted to plasma, retry it from plasma API.
     # - If not direct call, directly use plasma API to get it.
-    user_future = loop.create_future()
-
-    # We have three future objects here.
+    #
+    # We have three future objects per object ID here.
     # user_future is directly returned to the user from this function.
     #     and it will be eventually fulfilled by the final result.
     # inner_future is the first attempt to retrieve the object. It can be
@@ -59,46 +90,179 @@ def get_async(object_id):
     #     promoted to plasma. It will also invoke the done_callback when it's
     #     fulfilled.
 
-    def done_callback(future):
-        result = future.result()
-        # Result from async plasma, transparently pass it to user future
-        if isinstance(future, PlasmaObjectFuture):
-            if isinstance(result, ray.exceptions.RayTaskError):
-                ray.worker.last_task_error_raise_time = time.time()
-                user_future.set_exception(result.as_instanceof_cause())
-            else:
-                user_future.set_result(result)
+    def set_user_result(user_future, result):
+        if user_future.done():
+            # The user cancelled the future.
+            return
+        if isinstance(result, ray.exceptions.RayTaskError):
+            ray.worker.last_task_error_raise_time = time.time()
+            user_future.set_exception(result.as_instanceof_cause())
         else:
-            # Result from direct call.
-            assert isinstance(result, AsyncGetResponse), result
-            if result.plasma_fallback_id is None:
-                if isinstance(result.result, ray.exceptions.RayTaskError):
-                    ray.worker.last_task_error_raise_time = time.time()
-                    user_future.set_exception(
-                        result.result.as_instanceof_cause())
-                else:
-                    user_future.set_result(result.result)
+            user_future.set_result(result)
+
+    def make_done_callback(user_future):
+        def done_callback(future):
+            if future.cancelled():
+                user_future.cancel()
+                return
+            result = future.result()
+            # Result from async plasma, transparently pass it to user future
+            if isinstance(future, PlasmaObjectFuture):
+                set_user_result(user_future, result)
             else:
-                # Schedule plasma to async get, use the the same callback.
-                retry_plasma_future = as_future(result.plasma_fallback_id)
-                retry_plasma_future.add_done_callback(done_callback)
-                # A hack to keep reference to the future so it doesn't get GC.
-                user_future.retry_plasma_future = retry_plasma_future
-
-    if object_id.is_direct_call_type():
-        inner_future = loop.create_future()
-        # We must add the done_callback before sending to in_memory_store_get
-        inner_future.add_done_callback(done_callback)
-        core_worker.in_memory_store_get_async(object_id, inner_future)
-    else:
-        inner_future = as_future(object_id)
-        inner_future.add_done_callback(done_callback)
-    # A hack to keep reference to inner_future so it doesn't get GC.
-    user_future.inner_future = inner_future
-    # A hack to keep a reference to the object ID for ref counting.
-    user_future.object_id = object_id
-
-    return user_future
+                # Result from direct call.
+                assert isinstance(result, AsyncGetResponse), result
+                if result.plasma_fallback_id is None:
+                    set_user_result(user_future, result.result)
+                else:
+                    # Schedule plasma to async get, use the the same callback.
+                    retry_plasma_future = as_future(result.plasma_fallback_id)
+                    retry_plasma_future.add_done_callback(done_callback)
+                    # A hack to keep reference to the future so it doesn't
+                    # get GC.
+                    user_future.retry_plasma_future = retry_plasma_future
+
+        return done_callback
+
+    user_futures = [loop.create_future() for _ in object_ids]
+    inner_futures = [None] * len(object_ids)
+    plasma_indices = []
+    for i, object_id in enumerate(object_ids):
+        if object_id.is_direct_call_type():
+            inner_futures[i] = loop.create_future()
+            # We must add the done_callback before sending to
+            # in_memory_store_get
+            inner_futures[i].add_done_callback(
+                make_done_callback(user_futures[i]))
+            core_worker.in_memory_store_get_async(object_id, inner_futures[i])
+        else:
+            plasma_indices.append(i)
+    # Check and subscribe to all plasma objects at once.
+    plasma_futures = as_futures([object_ids[i] for i in plasma_indices])
+    for i, inner_future in zip(plasma_indices, plasma_futures):
+        inner_futures[i] = inner_future
+        inner_future.add_done_callback(make_done_callback(user_futures[i]))
+
+    for object_id, user_future, inner_future in zip(object_ids, user_futures,
+                                                    inner_futures):
+        # A hack to keep reference to inner_future so it doesn't get GC.
+        user_future.inner_future = inner_future
+        # A hack to keep a reference to the object ID for ref counting.
+        user_future.object_id = object_id
+    return user_futures
+
+
+async def wait_async(object_ids, num_returns=1, timeout=None):
+    """Asyncio compatible version of ray.wait.
+
+    Args:
+        object_ids (List[ObjectID]): List of object IDs for objects that may or
+            may not be ready. Note that these IDs must be unique.
+        num_returns (int): The number of object IDs that should be returned.
+        timeout (float): The maximum amount of time in seconds to wait before
+            returning.
+
+    Returns:
+        A list of object IDs that are ready and a list of the remaining object
+        IDs, in the same order as in object_ids.
+    """
+    _check_object_ids("wait_async", object_ids)
+    if timeout is not None and timeout < 0:
+        raise ValueError("The 'timeout' argument must be nonnegative. "
+                         "Received {}".format(timeout))
+    if len(object_ids) == 0:
+        return [], []
+    if len(object_ids) != len(set(object_ids)):
+        raise ValueError("Wait requires a list of unique object IDs.")
+    if num_returns <= 0:
+        raise ValueError(
+            "Invalid number of objects to return %d." % num_returns)
+    if num_returns > len(object_ids):
+        raise ValueError("num_returns cannot be greater than the number "
+                         "of objects provided to ray.wait_async.")
+
+    futures = _get_futures(object_ids)
+    for future in futures:
+        # Only readiness matters here, so don't warn about exceptions that
+        # are never retrieved.
+        future.add_done_callback(_ignore_exception)
+    loop = asyncio.get_event_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    pending = set(futures)
+    while len(futures) - len(pending) < num_returns:
+        remaining = None if deadline is None else deadline - loop.time()
+        if remaining is not None and remaining <= 0:
+            break
+        _, pending = await asyncio.wait(
+            pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+
+    ready_ids = []
+    remaining_ids = []
+    for object_id, future in zip(object_ids, futures):
+        if future.done() and len(ready_ids) < num_returns:
+            ready_ids.append(object_id)
+        else:
+            remaining_ids.append(object_id)
+    return ready_ids, remaining_ids
+
+
+def as_completed(object_ids):
+    """Iterates over the values of objects in the order they become ready.
+
+    Examples:
+        >>> async for object_id, value in as_completed(object_ids):
+        ...     print(object_id, value)
+
+    Args:
+        object_ids (List[ObjectID]): List of object IDs to get.
+
+    Returns:
+        An asynchronous iterator of tuples of an object ID and its value. An
+        exception is raised if the task that created the next object raised
+        an exception.
+    """
+    _check_object_ids("as_completed", object_ids)
+    return _AsCompletedIterator(object_ids)
+
+
+class _AsCompletedIterator:
+    """The asynchronous iterator returned by as_completed.
+
+    This is not an async generator, which would require Python 3.6.
+    """
+
+    def __init__(self, object_ids):
+        self._object_ids = object_ids
+        self._indices = None
+        self._pending = None
+        # Futures that are done but weren't returned yet, in reverse order.
+        self._done = []
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._indices is None:
+            futures = _get_futures(self._object_ids)
+            for future in futures:
+                # Don't warn about exceptions of objects that aren't
+                # iterated over.
+                future.add_done_callback(_ignore_exception)
+            self._indices = {future: i for i, future in enumerate(futures)}
+            self._pending = set(futures)
+        if not self._done:
+            if not self._pending:
+                raise StopAsyncIteration
+            done, self._pending = await asyncio.wait(
+                self._pending, return_when=asyncio.FIRST_COMPLETED)
+            self._done = sorted(done, key=self._indices.get, reverse=True)
+        future = self._done.pop()
+        return self._object_ids[self._indices[future]], future.result()
+
+
+def _ignore_exception(future):
+    if not future.cancelled():
+        future.exception()
 
 
 class AsyncMonitorState:
@@ -23,6 +23,7 @@ from ray.autoscaler.tags import (TAG_RAY_LAUNCH_CONFIG, TAG_RAY_RUNTIME_CONFIG,
 from ray.autoscaler.updater import NodeUpdaterThread
 from ray.ray_constants import AUTOSCALER_MAX_NUM_FAILURES, \
     AUTOSCALER_MAX_LAUNCH_BATCH, AUTOSCALER_MAX_CONCURRENT_LAUNCHES, \
+    AUTOSCALER_MAX_CONCURRENT_UPDATES, \
     AUTOSCALER_UPDATE_INTERVAL_S, AUTOSCALER_HEARTBEAT_TIMEOUT_S, \
     AUTOSCALER_RESOURCE_REQUEST_CHANNEL, MEMORY_RESOURCE_UNIT_BYTES
 import ray.services as services
@@ -194,11 +195,59 @@ class LoadMetrics:
         }
 
 
+class PhaseTimes:
+    """Thread-safe statistics of how long launching and updating nodes took.
+
+    The durations are grouped by phase, e.g., "launch" for creating nodes
+    with the node provider, or "sync_files" for the file mounts sync of a
+    NodeUpdater.
+    """
+
+    def __init__(self):
+        self._counts = defaultdict(int)
+        self._totals = defaultdict(float)
+        self._maxes = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def record(self, phase, duration_s):
+        with self._lock:
+            self._counts[phase] += 1
+            self._totals[phase] += duration_s
+            self._maxes[phase] = max(self._maxes[phase], duration_s)
+
+    def record_all(self, phase_times):
+        for phase, duration_s in phase_times.items():
+            self.record(phase, duration_s)
+
+    def summary(self):
+        """Returns a map from phase to (count, mean, max) of durations."""
+        with self._lock:
+            return {
+                phase: (count, self._totals[phase] / count, self._maxes[phase])
+                for phase, count in self._counts.items()
+            }
+
+    def info_string(self):
+        return ", ".join([
+            "{}=Count={} Mean={:.1f}s Max={:.1f}s".format(
+                phase, count, mean, max_s)
+            for phase, (count, mean, max_s) in sorted(self.summary().items())
+        ])
+
+
 class NodeLauncher(threading.Thread):
-    def __init__(self, provider, queue, pending, index=None, *args, **kwargs):
+    def __init__(self,
+                 provider,
+                 queue,
+                 pending,
+                 index=None,
+                 phase_times=None,
+                 *args,
+                 **kwargs):
         self.queue = queue
         self.pending = pending
         self.provider = provider
+        self.phase_times = phase_times
         self.index = str(index) if index is not None else ""
         super(NodeLauncher, self).__init__(*args, **kwargs)
 
@@ -207,6 +256,7 @@ class NodeLauncher(threading.Thread):
         before = self.provider.non_terminated_nodes(tag_filters=worker_filter)
         launch_hash = hash_launch_conf(config["worker_nodes"], config["auth"])
         self.log("Launching {} nodes.".format(count))
+        start = time.time()
         self.provider.create_node(
             config["worker_nodes"], {
                 TAG_RAY_NODE_NAME: "ray-{}-worker".format(
@@ -215,6 +265,8 @@ class NodeLauncher(threading.Thread):
                 TAG_RAY_NODE_STATUS: STATUS_UNINITIALIZED,
                 TAG_RAY_LAUNCH_CONFIG: launch_hash,
             }, count)
+        if self.phase_times is not None:
+            self.phase_times.record("launch", time.time() - start)
         after = self.provider.non_terminated_nodes(tag_filters=worker_filter)
         if set(after).issubset(before):
             self.log("No new nodes reported after node creation.")
@@ -280,6 +332,7 @@ class StandardAutoscaler:
                  load_metrics,
                  max_launch_batch=AUTOSCALER_MAX_LAUNCH_BATCH,
                  max_concurrent_launches=AUTOSCALER_MAX_CONCURRENT_LAUNCHES,
+                 max_concurrent_updates=AUTOSCALER_MAX_CONCURRENT_UPDATES,
                  max_failures=AUTOSCALER_MAX_NUM_FAILURES,
                  process_runner=subprocess,
                  update_interval_s=AUTOSCALER_UPDATE_INTERVAL_S):
@@ -292,6 +345,7 @@ class StandardAutoscaler:
         self.max_failures = max_failures
         self.max_launch_batch = max_launch_batch
         self.max_concurrent_launches = max_concurrent_launches
+        self.max_concurrent_updates = max_concurrent_updates
         self.process_runner = process_runner
 
         # Map from node_id to NodeUpdater processes
@@ -302,6 +356,7 @@ class StandardAutoscaler:
         self.last_update_time = 0.0
         self.update_interval_s = update_interval_s
         self.bringup = True
+        self.phase_times = PhaseTimes()
 
         # Node launchers
         self.launch_queue = queue.Queue()
@@ -313,7 +368,8 @@ class StandardAutoscaler:
                 provider=self.provider,
                 queue=self.launch_queue,
                 index=i,
-                pending=self.num_launches_pending)
+                pending=self.num_launches_pending,
+                phase_times=self.phase_times)
             node_launcher.daemon = True
             node_launcher.start()
 
@@ -404,11 +460,14 @@ class StandardAutoscaler:
         # Launch new nodes if needed
         num_workers = len(nodes) + num_pending
         if num_workers < target_workers:
-            max_allowed = min(self.max_launch_batch,
-                              self.max_concurrent_launches - num_pending)
-
-            num_launches = min(max_allowed, target_workers - num_workers)
-            self.launch_new_node(num_launches)
+            num_launches = min(target_workers - num_workers,
+                               self.max_concurrent_launches - num_pending)
+            # Queue the launches in batches, which the node launchers create
+            # concurrently.
+            while num_launches > 0:
+                count = min(self.max_launch_batch, num_launches)
+                self.launch_new_node(count)
+                num_launches -= count
             nodes = self.workers()
             self.log_info_string(nodes, target_workers)
         elif self.load_metrics.num_workers_connected() >= target_workers:
@@ -425,6 +484,8 @@ class StandardAutoscaler:
             for node_id in completed:
                 if self.updaters[node_id].exitcode == 0:
                     self.num_successful_updates[node_id] += 1
+                    self.phase_times.record_all(
+                        self.updaters[node_id].phase_times)
                 else:
                     self.num_failed_updates[node_id] += 1
                 del self.updaters[node_id]
@@ -434,14 +495,20 @@ class StandardAutoscaler:
             nodes = self.workers()
             self.log_info_string(nodes, target_workers)
 
-        # Update nodes with out-of-date files.
+        # Update nodes with out-of-date files, at most max_concurrent_updates
+        # at a time.
         # TODO(edoakes): Spawning these threads directly seems to cause
         # problems. They should at a minimum be spawned as daemon threads.
         # See https://github.com/ray-project/ray/pull/5903 for more info.
         T = []
+        nodes_to_update = set()
+        num_updates_allowed = self.max_concurrent_updates - len(self.updaters)
         for node_id, commands, ray_start in (self.should_update(node_id)
                                              for node_id in nodes):
-            if node_id is not None:
+            if node_id is None:
+                continue
+            nodes_to_update.add(node_id)
+            if len(T) < num_updates_allowed:
                 T.append(
                     threading.Thread(
                         target=self.spawn_updater,
@@ -451,9 +518,14 @@ class StandardAutoscaler:
         for t in T:
             t.join()
 
-        # Attempt to recover unhealthy nodes
+        # Attempt to recover unhealthy nodes. Nodes that are waiting for
+        # max_concurrent_updates to allow their update are skipped, since the
+        # update will also start Ray.
         for node_id in nodes:
-            self.recover_if_needed(node_id, now)
+            if len(self.updaters) >= self.max_concurrent_updates:
+                break
+            if node_id not in nodes_to_update:
+                self.recover_if_needed(node_id, now)
 
     def reload_config(self, errors_fatal=False):
         try:
@@ -466,9 +538,12 @@ class StandardAutoscaler:
                 new_config["worker_setup_commands"],
                 new_config["worker_start_ray_commands"]
             ])
+            new_file_mounts_contents_hash = hash_file_mounts_contents(
+                new_config["file_mounts"])
             self.config = new_config
             self.launch_hash = new_launch_hash
             self.runtime_hash = new_runtime_hash
+            self.file_mounts_contents_hash = new_file_mounts_contents_hash
         except Exception as e:
             if errors_fatal:
                 raise e
@@ -588,7 +663,8 @@ class StandardAutoscaler:
             ray_start_commands=with_head_node_ip(ray_start_commands),
             runtime_hash=self.runtime_hash,
             process_runner=self.process_runner,
-            use_internal_ip=True)
+            use_internal_ip=True,
+            file_mounts_contents_hash=self.file_mounts_contents_hash)
         updater.start()
         self.updaters[node_id] = updater
 
@@ -616,6 +692,9 @@ class StandardAutoscaler:
         logger.info("StandardAutoscaler: {}".format(
             self.info_string(nodes, target)))
         logger.info("LoadMetrics: {}".format(self.load_metrics.info_string()))
+        phase_times = self.phase_times.info_string()
+        if phase_times:
+            logger.info("PhaseTimes: {}".format(phase_times))
 
     def info_string(self, nodes, target):
         suffix = ""
@@ -697,9 +776,12 @@ def hash_launch_conf(node_conf, auth):
 # inadvertently restarting workers if the file mount content is mutated on the
 # head node.
 _hash_cache = {}
+# The file mounts are hashed separately, so that changing only the commands
+# doesn't rescan them, and so that updaters can skip syncing unchanged files.
+_file_mounts_hash_cache = {}
 
 
-def hash_runtime_conf(file_mounts, extra_objs):
+def hash_file_mounts_contents(file_mounts):
     hasher = hashlib.sha1()
 
     def add_content_hashes(path):
@@ -722,15 +804,27 @@ def hash_runtime_conf(file_mounts, extra_objs):
         else:
             add_hash_of_file(path)
 
-    conf_str = (json.dumps(file_mounts, sort_keys=True).encode("utf-8") +
-                json.dumps(extra_objs, sort_keys=True).encode("utf-8"))
+    mounts_str = json.dumps(file_mounts, sort_keys=True).encode("utf-8")
 
     # Important: only hash the files once. Otherwise, we can end up restarting
     # workers if the files were changed and we re-hashed them.
-    if conf_str not in _hash_cache:
-        hasher.update(conf_str)
+    if mounts_str not in _file_mounts_hash_cache:
+        hasher.update(mounts_str)
         for local_path in sorted(file_mounts.values()):
             add_content_hashes(local_path)
+        _file_mounts_hash_cache[mounts_str] = hasher.hexdigest()
+
+    return _file_mounts_hash_cache[mounts_str]
+
+
+def hash_runtime_conf(file_mounts, extra_objs):
+    conf_str = (json.dumps(file_mounts, sort_keys=True).encode("utf-8") +
+                json.dumps(extra_objs, sort_keys=True).encode("utf-8"))
+
+    if conf_str not in _hash_cache:
+        hasher = hashlib.sha1()
+        hasher.update(conf_str)
+        hasher.update(hash_file_mounts_contents(file_mounts).encode("utf-8"))
         _hash_cache[conf_str] = hasher.hexdigest()
 
     return _hash_cache[conf_str]
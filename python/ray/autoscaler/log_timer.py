@@ -7,11 +7,14 @@ logger = logging.getLogger(__name__)
 class LogTimer:
     def __init__(self, message):
         self._message = message
+        self.duration_s = None
 
     def __enter__(self):
         self._start_time = datetime.datetime.utcnow()
+        return self
 
     def __exit__(self, *_):
         td = datetime.datetime.utcnow() - self._start_time
+        self.duration_s = td.total_seconds()
         logger.info(self._message +
                     " [LogTimer={:.0f}ms]".format(td.total_seconds() * 1000))
@@ -25,3 +25,7 @@ TAG_RAY_LAUNCH_CONFIG = "ray-launch-config"
 
 # Hash of the node runtime config, used to determine if updates are needed
 TAG_RAY_RUNTIME_CONFIG = "ray-runtime-config"
+
+# Hash of the contents of the file mounts, used to skip syncing them if only
+# the commands of the runtime config changed
+TAG_RAY_FILE_MOUNTS_CONTENTS = "ray-file-mounts-contents"
@@ -14,8 +14,8 @@ from threading import Thread
 from getpass import getuser
 
 from ray.autoscaler.tags import TAG_RAY_NODE_STATUS, TAG_RAY_RUNTIME_CONFIG, \
-    STATUS_UP_TO_DATE, STATUS_UPDATE_FAILED, STATUS_WAITING_FOR_SSH, \
-    STATUS_SETTING_UP, STATUS_SYNCING_FILES
+    TAG_RAY_FILE_MOUNTS_CONTENTS, STATUS_UP_TO_DATE, STATUS_UPDATE_FAILED, \
+    STATUS_WAITING_FOR_SSH, STATUS_SETTING_UP, STATUS_SYNCING_FILES
 from ray.autoscaler.log_timer import LogTimer
 
 logger = logging.getLogger(__name__)
@@ -316,7 +316,8 @@ class NodeUpdater:
                  ray_start_commands,
                  runtime_hash,
                  process_runner=subprocess,
-                 use_internal_ip=False):
+                 use_internal_ip=False,
+                 file_mounts_contents_hash=None):
 
         self.log_prefix = "NodeUpdater: {}: ".format(node_id)
         if provider_config["type"] == "kubernetes":
@@ -342,6 +343,10 @@ class NodeUpdater:
         self.setup_commands = setup_commands
         self.ray_start_commands = ray_start_commands
         self.runtime_hash = runtime_hash
+        self.file_mounts_contents_hash = file_mounts_contents_hash
+        # Map from the phases of the update to how long they took, in
+        # seconds.
+        self.phase_times = {}
 
     def run(self):
         logger.info(self.log_prefix +
@@ -361,16 +366,19 @@ class NodeUpdater:
                 self.node_id, {TAG_RAY_NODE_STATUS: STATUS_UPDATE_FAILED})
             raise e
 
-        self.provider.set_node_tags(
-            self.node_id, {
-                TAG_RAY_NODE_STATUS: STATUS_UP_TO_DATE,
-                TAG_RAY_RUNTIME_CONFIG: self.runtime_hash
-            })
+        tags_to_set = {
+            TAG_RAY_NODE_STATUS: STATUS_UP_TO_DATE,
+            TAG_RAY_RUNTIME_CONFIG: self.runtime_hash,
+        }
+        if self.file_mounts_contents_hash is not None:
+            tags_to_set[TAG_RAY_FILE_MOUNTS_CONTENTS] = \
+                self.file_mounts_contents_hash
+        self.provider.set_node_tags(self.node_id, tags_to_set)
 
         self.exitcode = 0
 
     def sync_file_mounts(self, sync_cmd):
-        # Rsync file mounts
+        paths = []
         for remote_path, local_path in self.file_mounts.items():
             assert os.path.exists(local_path), local_path
             if os.path.isdir(local_path):
@@ -378,11 +386,18 @@ class NodeUpdater:
                     local_path += "/"
                 if not remote_path.endswith("/"):
                     remote_path += "/"
+            paths.append((local_path, remote_path))
+        if not paths:
+            return
+
+        # Create the parent directories of all mounts with a single command.
+        remote_dirs = sorted({os.path.dirname(remote) for _, remote in paths})
+        self.cmd_runner.run("mkdir -p {}".format(" ".join(remote_dirs)))
 
+        # Rsync file mounts
+        for local_path, remote_path in paths:
             with LogTimer(self.log_prefix +
                           "Synced {} to {}".format(local_path, remote_path)):
-                self.cmd_runner.run("mkdir -p {}".format(
-                    os.path.dirname(remote_path)))
                 sync_cmd(local_path, remote_path)
 
     def wait_ready(self, deadline):
@@ -413,8 +428,10 @@ class NodeUpdater:
     def do_update(self):
         self.provider.set_node_tags(
             self.node_id, {TAG_RAY_NODE_STATUS: STATUS_WAITING_FOR_SSH})
-        deadline = time.time() + NODE_START_WAIT_S
+        start = time.time()
+        deadline = start + NODE_START_WAIT_S
         self.wait_ready(deadline)
+        self.phase_times["wait_for_ssh"] = time.time() - start
 
         node_tags = self.provider.node_tags(self.node_id)
         logger.debug("Node tags: {}".format(str(node_tags)))
@@ -425,23 +442,36 @@ class NodeUpdater:
         else:
             self.provider.set_node_tags(
                 self.node_id, {TAG_RAY_NODE_STATUS: STATUS_SYNCING_FILES})
-            self.sync_file_mounts(self.rsync_up)
+            applied_contents = node_tags.get(TAG_RAY_FILE_MOUNTS_CONTENTS)
+            if self.file_mounts_contents_hash is not None and \
+                    applied_contents == self.file_mounts_contents_hash:
+                logger.info(self.log_prefix +
+                            "File mounts already up-to-date, skip syncing")
+            else:
+                with LogTimer(self.log_prefix + "Synced file mounts") as timer:
+                    self.sync_file_mounts(self.rsync_up)
+                self.phase_times["sync_files"] = timer.duration_s
 
             # Run init commands
             self.provider.set_node_tags(
                 self.node_id, {TAG_RAY_NODE_STATUS: STATUS_SETTING_UP})
             with LogTimer(self.log_prefix +
-                          "Initialization commands completed"):
+                          "Initialization commands completed") as timer:
                 for cmd in self.initialization_commands:
                     self.cmd_runner.run(cmd)
+            self.phase_times["initialization"] = timer.duration_s
 
-            with LogTimer(self.log_prefix + "Setup commands completed"):
+            with LogTimer(self.log_prefix +
+                          "Setup commands completed") as timer:
                 for cmd in self.setup_commands:
                     self.cmd_runner.run(cmd)
+            self.phase_times["setup"] = timer.duration_s
 
-        with LogTimer(self.log_prefix + "Ray start commands completed"):
+        with LogTimer(self.log_prefix +
+                      "Ray start commands completed") as timer:
             for cmd in self.ray_start_commands:
                 self.cmd_runner.run(cmd)
+        self.phase_times["ray_start"] = timer.duration_s
 
     def rsync_up(self, source, target):
         logger.info(self.log_prefix +
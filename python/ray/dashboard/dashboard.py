@@ -20,7 +20,7 @@ import yaml
 import uuid
 
 from base64 import b64decode
-from collections import defaultdict
+from collections import defaultdict, deque
 from operator import itemgetter
 from typing import Dict
 
@@ -43,6 +43,7 @@ from ray.dashboard.metrics_exporter.client import MetricsExportClient
 try:
     from ray.tune.result import DEFAULT_RESULTS_DIR
     from ray.tune import Analysis
+    from ray.tune.error import TuneError
     from tensorboard import program
 except ImportError:
     Analysis = None
@@ -570,6 +571,50 @@ class Dashboard:
         aiohttp.web.run_app(self.app, host=self.host, port=self.port)
 
 
+class BoundedLog:
+    """A ring buffer of the most recent log lines or errors of a worker.
+
+    Once the number of entries or their total size exceeds the bounds, the
+    oldest entries are evicted.
+
+    Attributes:
+        max_entries (int): The maximum number of entries to keep.
+        max_bytes (int): The maximum total size of the entries to keep.
+        num_bytes (int): The total size of the entries currently kept.
+        num_evicted (int): The number of entries evicted so far.
+    """
+
+    def __init__(self, max_entries, max_bytes=None, size_fn=len):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.num_bytes = 0
+        self.num_evicted = 0
+        self._size_fn = size_fn
+        self._entries = deque()
+
+    def extend(self, entries):
+        if len(entries) > self.max_entries:
+            self.num_evicted += len(entries) - self.max_entries
+            entries = entries[-self.max_entries:]
+        for entry in entries:
+            self._entries.append(entry)
+            self.num_bytes += self._size_fn(entry)
+        while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self.num_bytes > self.max_bytes
+                and len(self._entries) > 1):
+            self.num_bytes -= self._size_fn(self._entries.popleft())
+            self.num_evicted += 1
+
+    def append(self, entry):
+        self.extend([entry])
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+
 class NodeStats(threading.Thread):
     def __init__(self, redis_address, redis_password=None):
         self.redis_key = "{}.*".format(ray.gcs_utils.REPORTER_CHANNEL)
@@ -599,11 +644,20 @@ class NodeStats(threading.Thread):
             "usedResources": {},
         }
 
-        # Mapping from IP address to PID to list of log lines
-        self._logs = defaultdict(lambda: defaultdict(list))
+        # Mapping from IP address to PID to BoundedLog of log lines
+        self._logs = defaultdict(lambda: defaultdict(lambda: BoundedLog(
+            ray_constants.DASHBOARD_MAX_LOG_LINES_PER_WORKER,
+            ray_constants.DASHBOARD_MAX_LOG_BYTES_PER_WORKER)))
+
+        # Mapping from IP address to PID to BoundedLog of error messages
+        self._errors = defaultdict(lambda: defaultdict(lambda: BoundedLog(
+            ray_constants.DASHBOARD_MAX_ERRORS_PER_WORKER,
+            ray_constants.DASHBOARD_MAX_LOG_BYTES_PER_WORKER,
+            size_fn=lambda error: len(error["message"]))))
 
-        # Mapping from IP address to PID to list of error messages
-        self._errors = defaultdict(lambda: defaultdict(list))
+        # Mapping from IP address to PID to the last time the worker was
+        # known to be alive
+        self._worker_last_seen = defaultdict(dict)
 
         ray.state.state._initialize_global_state(
             redis_address=redis_address, redis_password=redis_password)
@@ -641,6 +695,29 @@ class NodeStats(threading.Thread):
             for k, v in self._node_stats.items() if current(v["now"], now)
         }
 
+    def _evict_dead_workers(self, node_stats):
+        """Drop the logs and errors of workers that exited a while ago.
+
+        Args:
+            node_stats: The stats published by the reporter of a node, which
+                include the workers that are currently alive on the node.
+        """
+        ip = node_stats["ip"]
+        now = time.time()
+        last_seen = self._worker_last_seen[ip]
+        for worker in node_stats.get("workers", []):
+            last_seen[str(worker["pid"])] = now
+
+        for pid in set(self._logs.get(ip, {})) | set(self._errors.get(ip, {})):
+            # Keep the logs of non-worker processes like the raylet.
+            if not pid.isdigit():
+                continue
+            if (now - last_seen.setdefault(pid, now) >
+                    ray_constants.DASHBOARD_DEAD_WORKER_RETENTION_S):
+                self._logs[ip].pop(pid, None)
+                self._errors[ip].pop(pid, None)
+                del last_seen[pid]
+
     def get_node_stats(self) -> Dict:
         with self._node_stats_lock:
             self._purge_outdated_stats()
@@ -714,18 +791,26 @@ class NodeStats(threading.Thread):
         return actor_tree["root"]["children"]
 
     def get_logs(self, hostname, pid):
-        ip = self._node_stats.get(hostname, {"ip": None})["ip"]
-        logs = self._logs.get(ip, {})
-        if pid:
-            logs = {pid: logs.get(pid, [])}
-        return logs
+        with self._node_stats_lock:
+            ip = self._node_stats.get(hostname, {"ip": None})["ip"]
+            logs = self._logs.get(ip, {})
+            if pid:
+                logs = {pid: logs[pid]} if pid in logs else {pid: []}
+            return {
+                pid: list(logs_for_pid)
+                for pid, logs_for_pid in logs.items()
+            }
 
     def get_errors(self, hostname, pid):
-        ip = self._node_stats.get(hostname, {"ip": None})["ip"]
-        errors = self._errors.get(ip, {})
-        if pid:
-            errors = {pid: errors.get(pid, [])}
-        return errors
+        with self._node_stats_lock:
+            ip = self._node_stats.get(hostname, {"ip": None})["ip"]
+            errors = self._errors.get(ip, {})
+            if pid:
+                errors = {pid: errors[pid]} if pid in errors else {pid: []}
+            return {
+                pid: list(errors_for_pid)
+                for pid, errors_for_pid in errors.items()
+            }
 
     def run(self):
         p = self.redis_client.pubsub(ignore_subscribe_messages=True)
@@ -767,10 +852,13 @@ class NodeStats(threading.Thread):
                     channel = ray.utils.decode(x["channel"])
                     data = x["data"]
                     if channel == log_channel:
-                        data = json.loads(ray.utils.decode(data))
-                        ip = data["ip"]
-                        pid = str(data["pid"])
-                        self._logs[ip][pid].extend(data["lines"])
+                        batch = json.loads(ray.utils.decode(data))
+                        if not isinstance(batch, list):
+                            batch = [batch]
+                        for data in batch:
+                            ip = data["ip"]
+                            pid = str(data["pid"])
+                            self._logs[ip][pid].extend(data["lines"])
                     elif channel == str(error_channel):
                         gcs_entry = ray.gcs_utils.GcsEntry.FromString(data)
                         error_data = ray.gcs_utils.ErrorTableData.FromString(
@@ -807,6 +895,7 @@ class NodeStats(threading.Thread):
                     else:
                         data = json.loads(ray.utils.decode(data))
                         self._node_stats[data["hostname"]] = data
+                        self._evict_dead_workers(data)
 
             except Exception:
                 logger.exception(traceback.format_exc())
@@ -958,6 +1047,7 @@ class TuneCollector(threading.Thread):
     def __init__(self, logdir, reload_interval):
         self._logdir = logdir
         self._trial_records = {}
+        self._analyses = {}
         self._data_lock = threading.Lock()
         self._reload_interval = reload_interval
         self._available = False
@@ -968,10 +1058,12 @@ class TuneCollector(threading.Thread):
         super().__init__()
 
     def get_stats(self):
+        # The records are never modified after they are published by collect,
+        # so they can be returned without copying them.
         with self._data_lock:
             return {
-                "trial_records": copy.deepcopy(self._trial_records),
-                "errors": copy.deepcopy(self._errors)
+                "trial_records": self._trial_records,
+                "errors": self._errors
             }
 
     def get_availability(self):
@@ -980,11 +1072,10 @@ class TuneCollector(threading.Thread):
 
     def run(self):
         while True:
-            with self._data_lock:
-                self.collect()
+            self.collect()
             time.sleep(self._reload_interval)
 
-    def collect_errors(self, job_name, df):
+    def collect_errors(self, job_name, df, trial_records, errors):
         sub_dirs = os.listdir(os.path.join(self._logdir, job_name))
         trial_names = filter(
             lambda d: os.path.isdir(os.path.join(self._logdir, job_name, d)),
@@ -996,7 +1087,7 @@ class TuneCollector(threading.Thread):
                 self._available = True
                 with open(error_path) as f:
                     text = f.read()
-                    self._errors[str(trial)] = {
+                    errors[str(trial)] = {
                         "text": text,
                         "job_id": job_name,
                         "trial_id": "No Trial ID"
@@ -1004,28 +1095,42 @@ class TuneCollector(threading.Thread):
                     other_data = df[df["logdir"].str.contains(trial)]
                     if len(other_data) > 0:
                         trial_id = other_data["trial_id"].values[0]
-                        self._errors[str(trial)]["trial_id"] = str(trial_id)
-                        if str(trial_id) in self._trial_records.keys():
-                            self._trial_records[str(trial_id)]["error"] = text
-                            self._trial_records[str(trial_id)][
-                                "status"] = "ERROR"
+                        errors[str(trial)]["trial_id"] = str(trial_id)
+                        if str(trial_id) in trial_records.keys():
+                            trial_records[str(trial_id)]["error"] = text
+                            trial_records[str(trial_id)]["status"] = "ERROR"
 
     def collect(self):
         """
         Collects and cleans data on the running Tune experiment from the
         Tune logs so that users can see this information in the front-end
         client
+
+        The Analysis of each job is kept across calls, so only the results
+        appended since the last call are read from the progress files.
         """
 
         sub_dirs = os.listdir(self._logdir)
         job_names = filter(
             lambda d: os.path.isdir(os.path.join(self._logdir, d)), sub_dirs)
 
-        self._trial_records = {}
+        trial_records = {}
+        with self._data_lock:
+            errors = dict(self._errors)
 
         # search through all the sub_directories in log directory
         for job_name in job_names:
-            analysis = Analysis(str(os.path.join(self._logdir, job_name)))
+            try:
+                if job_name in self._analyses:
+                    analysis = self._analyses[job_name]
+                    analysis.fetch_trial_dataframes()
+                else:
+                    analysis = Analysis(
+                        str(os.path.join(self._logdir, job_name)))
+                    self._analyses[job_name] = analysis
+            except TuneError:
+                # No trials have reported results for this job yet.
+                continue
             df = analysis.dataframe()
 
             if len(df) == 0 or "trial_id" not in df.columns:
@@ -1058,9 +1163,13 @@ class TuneCollector(threading.Thread):
             # clean data and update class attribute
             if len(trial_data) > 0:
                 trial_data = self.clean_trials(trial_data, job_name)
-                self._trial_records.update(trial_data)
+                trial_records.update(trial_data)
+
+            self.collect_errors(job_name, df, trial_records, errors)
 
-            self.collect_errors(job_name, df)
+        with self._data_lock:
+            self._trial_records = trial_records
+            self._errors = errors
 
     def clean_trials(self, trial_details, job_name):
         first_trial = trial_details[list(trial_details.keys())[0]]
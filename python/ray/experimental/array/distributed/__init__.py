@@ -1,11 +1,13 @@
 from . import random
 from . import linalg
-from .core import (BLOCK_SIZE, DistArray, assemble, zeros, ones, copy, eye,
-                   triu, tril, blockwise_dot, dot, transpose, add, subtract,
-                   numpy_to_dist, subblocks)
+from . import lazy
+from .core import (BLOCK_SIZE, DistArray, default_block_shape, assemble, zeros,
+                   ones, copy, eye, triu, tril, blockwise_dot, dot, transpose,
+                   add, subtract, numpy_to_dist, subblocks)
 
 __all__ = [
-    "random", "linalg", "BLOCK_SIZE", "DistArray", "assemble", "zeros", "ones",
-    "copy", "eye", "triu", "tril", "blockwise_dot", "dot", "transpose", "add",
-    "subtract", "numpy_to_dist", "subblocks"
+    "random", "linalg", "lazy", "BLOCK_SIZE", "DistArray",
+    "default_block_shape", "assemble", "zeros", "ones", "copy", "eye", "triu",
+    "tril", "blockwise_dot", "dot", "transpose", "add", "subtract",
+    "numpy_to_dist", "subblocks"
 ]
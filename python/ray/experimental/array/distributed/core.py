@@ -1,17 +1,46 @@
+import itertools
+
 import numpy as np
 import ray.experimental.array.remote as ra
 import ray
 
+# Default blocks are at least this long along each dimension.
 BLOCK_SIZE = 10
+# Default blocks hold about this many bytes of float64 values.
+TARGET_BLOCK_BYTES = 8 * 1024 * 1024
+
+
+def default_block_shape(shape):
+    """Returns the default block shape of an array of the given shape.
+
+    Blocks have the same length along each dimension, which is chosen so
+    that a block of float64 values holds about TARGET_BLOCK_BYTES. This only
+    depends on the number of dimensions, so that arrays of the same rank can
+    be combined blockwise. For example, a 10000x10000 matrix is split into
+    1024x1024 blocks.
+    """
+    if len(shape) == 0:
+        return []
+    elements = TARGET_BLOCK_BYTES // np.dtype("float64").itemsize
+    size = int(elements**(1.0 / len(shape)) + 1e-9)
+    # Round down to a power of 2.
+    size = max(BLOCK_SIZE, 2**int(np.log2(size)))
+    return [size] * len(shape)
 
 
 class DistArray:
-    def __init__(self, shape, objectids=None):
+    def __init__(self, shape, objectids=None, block_shape=None):
         self.shape = shape
         self.ndim = len(shape)
-        self.num_blocks = [
-            int(np.ceil(1.0 * a / BLOCK_SIZE)) for a in self.shape
-        ]
+        if block_shape is None:
+            block_shape = default_block_shape(shape)
+        self.block_shape = list(block_shape)
+        if len(self.block_shape) != self.ndim or min(
+                self.block_shape, default=1) < 1:
+            raise Exception("The field `block_shape` must have one positive "
+                            "entry per dimension, but `block_shape` is {} and "
+                            "`shape` is {}.".format(block_shape, shape))
+        self.num_blocks = DistArray.compute_num_blocks(shape, block_shape)
         if objectids is not None:
             self.objectids = objectids
         else:
@@ -23,51 +52,152 @@ class DistArray:
                                                   list(self.objectids.shape)))
 
     @staticmethod
-    def compute_block_lower(index, shape):
+    def compute_block_lower(index, shape, block_shape=None):
         if len(index) != len(shape):
             raise Exception("The fields `index` and `shape` must have the "
                             "same length, but `index` is {} and `shape` is "
                             "{}.".format(index, shape))
-        return [elem * BLOCK_SIZE for elem in index]
+        if block_shape is None:
+            block_shape = default_block_shape(shape)
+        return [elem * size for elem, size in zip(index, block_shape)]
 
     @staticmethod
-    def compute_block_upper(index, shape):
+    def compute_block_upper(index, shape, block_shape=None):
         if len(index) != len(shape):
             raise Exception("The fields `index` and `shape` must have the "
                             "same length, but `index` is {} and `shape` is "
                             "{}.".format(index, shape))
+        if block_shape is None:
+            block_shape = default_block_shape(shape)
         upper = []
         for i in range(len(shape)):
-            upper.append(min((index[i] + 1) * BLOCK_SIZE, shape[i]))
+            upper.append(min((index[i] + 1) * block_shape[i], shape[i]))
         return upper
 
     @staticmethod
-    def compute_block_shape(index, shape):
-        lower = DistArray.compute_block_lower(index, shape)
-        upper = DistArray.compute_block_upper(index, shape)
+    def compute_block_shape(index, shape, block_shape=None):
+        lower = DistArray.compute_block_lower(index, shape, block_shape)
+        upper = DistArray.compute_block_upper(index, shape, block_shape)
         return [u - l for (l, u) in zip(lower, upper)]
 
     @staticmethod
-    def compute_num_blocks(shape):
-        return [int(np.ceil(1.0 * a / BLOCK_SIZE)) for a in shape]
+    def compute_num_blocks(shape, block_shape=None):
+        if block_shape is None:
+            block_shape = default_block_shape(shape)
+        return [
+            int(np.ceil(1.0 * a / size))
+            for a, size in zip(shape, block_shape)
+        ]
+
+    def block_lower(self, index):
+        return DistArray.compute_block_lower(index, self.shape,
+                                             self.block_shape)
+
+    def block_upper(self, index):
+        return DistArray.compute_block_upper(index, self.shape,
+                                             self.block_shape)
+
+    def block_shape_at(self, index):
+        return DistArray.compute_block_shape(index, self.shape,
+                                             self.block_shape)
 
     def assemble(self):
         """Assemble an array from a distributed array of object IDs."""
-        first_block = ray.get(self.objectids[(0, ) * self.ndim])
-        dtype = first_block.dtype
-        result = np.zeros(self.shape, dtype=dtype)
-        for index in np.ndindex(*self.num_blocks):
-            lower = DistArray.compute_block_lower(index, self.shape)
-            upper = DistArray.compute_block_upper(index, self.shape)
-            value = ray.get(self.objectids[index])
+        indices = list(np.ndindex(*self.num_blocks))
+        blocks = ray.get([self.objectids[index] for index in indices])
+        result = np.zeros(self.shape, dtype=blocks[0].dtype)
+        for index, value in zip(indices, blocks):
+            lower = self.block_lower(index)
+            upper = self.block_upper(index)
             result[tuple(slice(l, u) for (l, u) in zip(lower, upper))] = value
         return result
 
     def __getitem__(self, sliced):
-        # TODO(rkn): Fix this, this is just a placeholder that should work but
-        # is inefficient.
-        a = self.assemble()
-        return a[sliced]
+        """Returns a slice of the array, only fetching the blocks it needs.
+
+        Integers and slices are supported. Other indices (e.g., arrays or
+        np.newaxis) fall back to slicing the assembled array.
+        """
+        if not isinstance(sliced, tuple):
+            sliced = (sliced, )
+        index_types = (slice, int, np.integer)
+        basic = all(
+            isinstance(s, index_types) and not isinstance(s, bool)
+            for s in sliced)
+        if len(sliced) > self.ndim or not basic:
+            return self.assemble()[sliced]
+        sliced = sliced + (slice(None), ) * (self.ndim - len(sliced))
+
+        # The selected indices of each dimension.
+        selections = []
+        for i, s in enumerate(sliced):
+            if isinstance(s, slice):
+                selections.append(np.arange(*s.indices(self.shape[i])))
+            else:
+                if not -self.shape[i] <= s < self.shape[i]:
+                    raise IndexError("index {} is out of bounds for axis {} "
+                                     "with size {}".format(
+                                         s, i, self.shape[i]))
+                selections.append(np.array([s % self.shape[i]]))
+
+        # The blocks intersecting with the selection along each dimension,
+        # and the positions of their elements in the result.
+        block_ranges = []
+        for selection, size in zip(selections, self.block_shape):
+            block_ids = selection // size
+            ranges = []
+            for block_id in np.unique(block_ids):
+                positions = np.flatnonzero(block_ids == block_id)
+                ranges.append((block_id, positions,
+                               selection[positions] - block_id * size))
+            block_ranges.append(ranges)
+
+        result_shape = [len(selection) for selection in selections]
+        if 0 in result_shape:
+            dtype = ray.get(self.objectids[(0, ) * self.ndim]).dtype
+            result = np.empty(result_shape, dtype=dtype)
+        else:
+            parts = list(itertools.product(*block_ranges))
+            blocks = ray.get([
+                self.objectids[tuple(block_id for block_id, _, _ in part)]
+                for part in parts
+            ])
+            result = np.empty(result_shape, dtype=blocks[0].dtype)
+            for part, block in zip(parts, blocks):
+                positions = np.ix_(*[p for _, p, _ in part])
+                local = np.ix_(*[l for _, _, l in part])
+                result[positions] = block[local]
+
+        # Integer indices remove their dimension.
+        return result[tuple(
+            0 if not isinstance(s, slice) else slice(None) for s in sliced)]
+
+
+def _same_blocks(size, block_size1, block_size2):
+    """Whether two block sizes split a dimension of `size` the same way."""
+    return block_size1 == block_size2 or min(block_size1, block_size2) >= size
+
+
+def _check_same_blocks(name, x1, x2):
+    if not all(
+            _same_blocks(size, b1, b2)
+            for size, b1, b2 in zip(x1.shape, x1.block_shape, x2.block_shape)):
+        raise Exception("{} expects arguments `x1` and `x2` to have the same "
+                        "blocks, but x1.block_shape = {}, and x2.block_shape "
+                        "= {}.".format(name, x1.block_shape, x2.block_shape))
+
+
+def _diagonal_offset(a, i, j):
+    """Returns the offset of the diagonal in block (i, j) of a matrix.
+
+    This is the `k` to pass to np.eye, np.triu, etc. for the block, or None
+    if the block does not intersect with the diagonal.
+    """
+    lower = a.block_lower([i, j])
+    upper = a.block_upper([i, j])
+    if max(lower) >= min(upper):
+        return None
+    return lower[0] - lower[1]
 
 
 @ray.remote
@@ -77,37 +207,37 @@ def assemble(a):
 
 # TODO(rkn): What should we call this method?
 @ray.remote
-def numpy_to_dist(a):
-    result = DistArray(a.shape)
+def numpy_to_dist(a, block_shape=None):
+    result = DistArray(a.shape, block_shape=block_shape)
     for index in np.ndindex(*result.num_blocks):
-        lower = DistArray.compute_block_lower(index, a.shape)
-        upper = DistArray.compute_block_upper(index, a.shape)
+        lower = result.block_lower(index)
+        upper = result.block_upper(index)
         idx = tuple(slice(l, u) for (l, u) in zip(lower, upper))
         result.objectids[index] = ray.put(a[idx])
     return result
 
 
 @ray.remote
-def zeros(shape, dtype_name="float"):
-    result = DistArray(shape)
+def zeros(shape, dtype_name="float", block_shape=None):
+    result = DistArray(shape, block_shape=block_shape)
     for index in np.ndindex(*result.num_blocks):
         result.objectids[index] = ra.zeros.remote(
-            DistArray.compute_block_shape(index, shape), dtype_name=dtype_name)
+            result.block_shape_at(index), dtype_name=dtype_name)
     return result
 
 
 @ray.remote
-def ones(shape, dtype_name="float"):
-    result = DistArray(shape)
+def ones(shape, dtype_name="float", block_shape=None):
+    result = DistArray(shape, block_shape=block_shape)
     for index in np.ndindex(*result.num_blocks):
         result.objectids[index] = ra.ones.remote(
-            DistArray.compute_block_shape(index, shape), dtype_name=dtype_name)
+            result.block_shape_at(index), dtype_name=dtype_name)
     return result
 
 
 @ray.remote
 def copy(a):
-    result = DistArray(a.shape)
+    result = DistArray(a.shape, block_shape=a.block_shape)
     for index in np.ndindex(*result.num_blocks):
         # We don't need to actually copy the objects because remote objects are
         # immutable.
@@ -116,15 +246,19 @@ def copy(a):
 
 
 @ray.remote
-def eye(dim1, dim2=-1, dtype_name="float"):
+def eye(dim1, dim2=-1, dtype_name="float", block_shape=None):
     dim2 = dim1 if dim2 == -1 else dim2
     shape = [dim1, dim2]
-    result = DistArray(shape)
+    result = DistArray(shape, block_shape=block_shape)
     for (i, j) in np.ndindex(*result.num_blocks):
-        block_shape = DistArray.compute_block_shape([i, j], shape)
-        if i == j:
+        block_shape = result.block_shape_at([i, j])
+        offset = _diagonal_offset(result, i, j)
+        if offset is not None:
             result.objectids[i, j] = ra.eye.remote(
-                block_shape[0], block_shape[1], dtype_name=dtype_name)
+                block_shape[0],
+                block_shape[1],
+                k=offset,
+                dtype_name=dtype_name)
         else:
             result.objectids[i, j] = ra.zeros.remote(
                 block_shape, dtype_name=dtype_name)
@@ -136,14 +270,19 @@ def triu(a):
     if a.ndim != 2:
         raise Exception("Input must have 2 dimensions, but a.ndim is "
                         "{}.".format(a.ndim))
-    result = DistArray(a.shape)
+    result = DistArray(a.shape, block_shape=a.block_shape)
     for (i, j) in np.ndindex(*result.num_blocks):
-        if i < j:
+        lower = result.block_lower([i, j])
+        upper = result.block_upper([i, j])
+        if lower[1] >= upper[0] - 1:
+            # The block is on or above the diagonal.
             result.objectids[i, j] = ra.copy.remote(a.objectids[i, j])
-        elif i == j:
-            result.objectids[i, j] = ra.triu.remote(a.objectids[i, j])
-        else:
+        elif upper[1] - 1 < lower[0]:
+            # The block is below the diagonal.
             result.objectids[i, j] = ra.zeros_like.remote(a.objectids[i, j])
+        else:
+            result.objectids[i, j] = ra.triu.remote(
+                a.objectids[i, j], k=lower[0] - lower[1])
     return result
 
 
@@ -152,14 +291,19 @@ def tril(a):
     if a.ndim != 2:
         raise Exception("Input must have 2 dimensions, but a.ndim is "
                         "{}.".format(a.ndim))
-    result = DistArray(a.shape)
+    result = DistArray(a.shape, block_shape=a.block_shape)
     for (i, j) in np.ndindex(*result.num_blocks):
-        if i > j:
+        lower = result.block_lower([i, j])
+        upper = result.block_upper([i, j])
+        if upper[1] - 1 <= lower[0]:
+            # The block is on or below the diagonal.
             result.objectids[i, j] = ra.copy.remote(a.objectids[i, j])
-        elif i == j:
-            result.objectids[i, j] = ra.tril.remote(a.objectids[i, j])
-        else:
+        elif lower[1] > upper[0] - 1:
+            # The block is above the diagonal.
             result.objectids[i, j] = ra.zeros_like.remote(a.objectids[i, j])
+        else:
+            result.objectids[i, j] = ra.tril.remote(
+                a.objectids[i, j], k=lower[0] - lower[1])
     return result
 
 
@@ -188,8 +332,12 @@ def dot(a, b):
         raise Exception("dot expects a.shape[1] to equal b.shape[0], but "
                         "a.shape = {} and b.shape = {}.".format(
                             a.shape, b.shape))
+    if not _same_blocks(a.shape[1], a.block_shape[1], b.block_shape[0]):
+        raise Exception("dot expects the blocks of a.shape[1] and b.shape[0] "
+                        "to match, but a.block_shape = {} and b.block_shape "
+                        "= {}.".format(a.block_shape, b.block_shape))
     shape = [a.shape[0], b.shape[1]]
-    result = DistArray(shape)
+    result = DistArray(shape, block_shape=[a.block_shape[0], b.block_shape[1]])
     for (i, j) in np.ndindex(*result.num_blocks):
         args = list(a.objectids[i, :]) + list(b.objectids[:, j])
         result.objectids[i, j] = blockwise_dot.remote(*args)
@@ -231,10 +379,10 @@ def subblocks(a, *ranges):
                             "the {}th range is {}, and a.num_blocks = {}."
                             .format(i, ranges[i], a.num_blocks))
     last_index = [r[-1] for r in ranges]
-    last_block_shape = DistArray.compute_block_shape(last_index, a.shape)
-    shape = [(len(ranges[i]) - 1) * BLOCK_SIZE + last_block_shape[i]
+    last_block_shape = a.block_shape_at(last_index)
+    shape = [(len(ranges[i]) - 1) * a.block_shape[i] + last_block_shape[i]
              for i in range(a.ndim)]
-    result = DistArray(shape)
+    result = DistArray(shape, block_shape=a.block_shape)
     for index in np.ndindex(*result.num_blocks):
         result.objectids[index] = a.objectids[tuple(
             ranges[i][index[i]] for i in range(a.ndim))]
@@ -247,7 +395,9 @@ def transpose(a):
         raise Exception("transpose expects its argument to be 2-dimensional, "
                         "but a.ndim = {}, a.shape = {}.".format(
                             a.ndim, a.shape))
-    result = DistArray([a.shape[1], a.shape[0]])
+    result = DistArray(
+        [a.shape[1], a.shape[0]],
+        block_shape=[a.block_shape[1], a.block_shape[0]])
     for i in range(result.num_blocks[0]):
         for j in range(result.num_blocks[1]):
             result.objectids[i, j] = ra.transpose.remote(a.objectids[j, i])
@@ -261,7 +411,8 @@ def add(x1, x2):
         raise Exception("add expects arguments `x1` and `x2` to have the same "
                         "shape, but x1.shape = {}, and x2.shape = {}.".format(
                             x1.shape, x2.shape))
-    result = DistArray(x1.shape)
+    _check_same_blocks("add", x1, x2)
+    result = DistArray(x1.shape, block_shape=x1.block_shape)
     for index in np.ndindex(*result.num_blocks):
         result.objectids[index] = ra.add.remote(x1.objectids[index],
                                                 x2.objectids[index])
@@ -275,7 +426,8 @@ def subtract(x1, x2):
         raise Exception("subtract expects arguments `x1` and `x2` to have the "
                         "same shape, but x1.shape = {}, and x2.shape = {}."
                         .format(x1.shape, x2.shape))
-    result = DistArray(x1.shape)
+    _check_same_blocks("subtract", x1, x2)
+    result = DistArray(x1.shape, block_shape=x1.block_shape)
     for index in np.ndindex(*result.num_blocks):
         result.objectids[index] = ra.subtract.remote(x1.objectids[index],
                                                      x2.objectids[index])
@@ -0,0 +1,215 @@
+"""Lazily evaluated expressions of distributed arrays.
+
+The functions in core.py launch one task per block for every operation, so
+an expression like add(transpose(a), subtract(b, c)) materializes the blocks
+of each intermediate array. The functions in this module instead build an
+expression graph, which is evaluated by compute(). Chains of blockwise
+operations are fused, so that each block of a result is computed by a
+single task, and intermediate arrays are only materialized when several
+tasks need their blocks.
+
+Examples:
+    >>> a = lazy.array(ray.get(da.random.normal.remote([100, 100])))
+    >>> b = lazy.add(lazy.transpose(a), a)
+    >>> c = lazy.dot(b, lazy.subtract(b, a))
+    >>> b_val, c_val = lazy.compute([b, c])
+"""
+
+import numpy as np
+import ray
+
+from .core import DistArray, _check_same_blocks, _same_blocks
+
+
+class LazyArray:
+    """A node of an expression graph of distributed arrays.
+
+    Leaves wrap a DistArray. Other nodes are the result of an operation on
+    other LazyArrays and are only evaluated by compute(), which stores the
+    resulting DistArray in `value`, so that it is reused by later calls.
+    """
+
+    def __init__(self, op, args, shape, block_shape, value=None):
+        self.op = op
+        self.args = args
+        self.shape = list(shape)
+        self.ndim = len(shape)
+        self.block_shape = list(block_shape)
+        self.num_blocks = DistArray.compute_num_blocks(shape, block_shape)
+        self.value = value
+
+
+def array(a):
+    """Returns a leaf of an expression graph for a DistArray.
+
+    Arguments:
+        a: A DistArray or an object ID of a DistArray.
+    """
+    if isinstance(a, ray.ObjectID):
+        a = ray.get(a)
+    return LazyArray("array", [], a.shape, a.block_shape, value=a)
+
+
+def add(x1, x2):
+    if x1.shape != x2.shape:
+        raise Exception("add expects arguments `x1` and `x2` to have the same "
+                        "shape, but x1.shape = {}, and x2.shape = {}.".format(
+                            x1.shape, x2.shape))
+    _check_same_blocks("add", x1, x2)
+    return LazyArray("add", [x1, x2], x1.shape, x1.block_shape)
+
+
+def subtract(x1, x2):
+    if x1.shape != x2.shape:
+        raise Exception("subtract expects arguments `x1` and `x2` to have the "
+                        "same shape, but x1.shape = {}, and x2.shape = {}."
+                        .format(x1.shape, x2.shape))
+    _check_same_blocks("subtract", x1, x2)
+    return LazyArray("subtract", [x1, x2], x1.shape, x1.block_shape)
+
+
+def transpose(a):
+    if a.ndim != 2:
+        raise Exception("transpose expects its argument to be 2-dimensional, "
+                        "but a.ndim = {}, a.shape = {}.".format(
+                            a.ndim, a.shape))
+    return LazyArray("transpose", [a], [a.shape[1], a.shape[0]],
+                     [a.block_shape[1], a.block_shape[0]])
+
+
+def dot(a, b):
+    if a.ndim != 2:
+        raise Exception("dot expects its arguments to be 2-dimensional, but "
+                        "a.ndim = {}.".format(a.ndim))
+    if b.ndim != 2:
+        raise Exception("dot expects its arguments to be 2-dimensional, but "
+                        "b.ndim = {}.".format(b.ndim))
+    if a.shape[1] != b.shape[0]:
+        raise Exception("dot expects a.shape[1] to equal b.shape[0], but "
+                        "a.shape = {} and b.shape = {}.".format(
+                            a.shape, b.shape))
+    if not _same_blocks(a.shape[1], a.block_shape[1], b.block_shape[0]):
+        raise Exception("dot expects the blocks of a.shape[1] and b.shape[0] "
+                        "to match, but a.block_shape = {} and b.block_shape "
+                        "= {}.".format(a.block_shape, b.block_shape))
+    return LazyArray("dot", [a, b], [a.shape[0], b.shape[1]],
+                     [a.block_shape[0], b.block_shape[1]])
+
+
+def compute(arrays):
+    """Evaluates one or more lazy arrays.
+
+    The blocks of all arrays are computed together, so that common
+    subexpressions are only evaluated once. An intermediate array is
+    materialized if it is used more than once (or is an operand of dot,
+    whose blocks are each used by several tasks), and fused into the tasks
+    of its user otherwise.
+
+    Arguments:
+        arrays: A LazyArray or a list of LazyArrays.
+
+    Returns:
+        A DistArray, or a list of DistArrays if a list was given.
+    """
+    is_list = isinstance(arrays, list)
+    if not is_list:
+        arrays = [arrays]
+
+    # Collect the nodes to evaluate, with their arguments before them.
+    order = []
+    num_uses = {}
+    stack = [(a, False) for a in reversed(arrays)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            order.append(node)
+            continue
+        if node.value is not None or id(node) in num_uses:
+            continue
+        num_uses[id(node)] = 0
+        stack.append((node, True))
+        stack.extend((arg, False) for arg in reversed(node.args))
+    for node in order:
+        for arg in node.args:
+            if arg.value is None:
+                num_uses[id(arg)] += 2 if node.op == "dot" else 1
+
+    outputs = {id(a) for a in arrays}
+    for node in order:
+        if id(node) in outputs or num_uses[id(node)] > 1:
+            _materialize(node)
+    return [a.value for a in arrays] if is_list else arrays[0].value
+
+
+def _materialize(node):
+    """Launches one task per block of the node, which must not be a leaf."""
+    result = DistArray(node.shape, block_shape=node.block_shape)
+    for index in np.ndindex(*result.num_blocks):
+        blocks = {}
+        expression = _block_expression(node, index, blocks)
+        object_ids = sorted(blocks, key=blocks.get)
+        result.objectids[index] = evaluate_block.remote(
+            expression, *object_ids)
+    node.value = result
+
+
+def _block_expression(node, index, blocks):
+    """Returns the expression that computes a block of the node.
+
+    Arguments:
+        node (LazyArray): The node to compute.
+        index (tuple): The index of the block.
+        blocks (dict): Map from the object IDs of the blocks the expression
+            depends on to their position in the arguments of the task. This
+            is updated with the blocks of this expression.
+    """
+    if node.value is not None:
+        object_id = node.value.objectids[index]
+        if object_id not in blocks:
+            blocks[object_id] = len(blocks)
+        return ("block", blocks[object_id])
+    if node.op in ["add", "subtract"]:
+        x1, x2 = node.args
+        return (node.op, _block_expression(x1, index, blocks),
+                _block_expression(x2, index, blocks))
+    if node.op == "transpose":
+        return ("transpose",
+                _block_expression(node.args[0], (index[1], index[0]), blocks))
+    if node.op == "dot":
+        a, b = node.args
+        i, j = index
+        products = [(_block_expression(a, (i, k), blocks),
+                     _block_expression(b, (k, j), blocks))
+                    for k in range(a.num_blocks[1])]
+        shape = DistArray.compute_block_shape(index, node.shape,
+                                              node.block_shape)
+        return ("dot", tuple(shape), products)
+    raise Exception("Unknown operation {}.".format(node.op))
+
+
+def _evaluate(expression, blocks):
+    op = expression[0]
+    if op == "block":
+        return blocks[expression[1]]
+    if op == "add":
+        return np.add(
+            _evaluate(expression[1], blocks), _evaluate(expression[2], blocks))
+    if op == "subtract":
+        return np.subtract(
+            _evaluate(expression[1], blocks), _evaluate(expression[2], blocks))
+    if op == "transpose":
+        return np.transpose(_evaluate(expression[1], blocks))
+    if op == "dot":
+        _, shape, products = expression
+        # This matches blockwise_dot in core.py.
+        result = np.zeros(shape)
+        for a, b in products:
+            result += np.dot(_evaluate(a, blocks), _evaluate(b, blocks))
+        return result
+    raise Exception("Unknown operation {}.".format(op))
+
+
+@ray.remote
+def evaluate_block(expression, *blocks):
+    """Computes a block of a fused expression from the blocks it uses."""
+    return _evaluate(expression, blocks)
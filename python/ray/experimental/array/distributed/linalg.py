@@ -29,6 +29,9 @@ def tsqr(a):
     if a.num_blocks[1] != 1:
         raise Exception("tsqr requires a.num_blocks[1] == 1, but a.num_blocks "
                         "is {}".format(a.num_blocks))
+    if a.num_blocks[0] > 1 and a.block_shape[0] < a.shape[1]:
+        raise Exception("tsqr requires blocks with at least a.shape[1] rows, "
+                        "but a.block_shape is {}".format(a.block_shape))
 
     num_blocks = a.num_blocks[0]
     K = int(np.ceil(np.log2(num_blocks))) + 1
@@ -56,9 +59,9 @@ def tsqr(a):
         q_shape = a.shape
     else:
         q_shape = [a.shape[0], a.shape[0]]
-    q_num_blocks = core.DistArray.compute_num_blocks(q_shape)
+    q_num_blocks = core.DistArray.compute_num_blocks(q_shape, a.block_shape)
     q_objectids = np.empty(q_num_blocks, dtype=object)
-    q_result = core.DistArray(q_shape, q_objectids)
+    q_result = core.DistArray(q_shape, q_objectids, a.block_shape)
 
     # reconstruct output
     for i in range(num_blocks):
@@ -67,10 +70,10 @@ def tsqr(a):
         for j in range(1, K):
             if np.mod(ith_index, 2) == 0:
                 lower = [0, 0]
-                upper = [a.shape[1], core.BLOCK_SIZE]
+                upper = [a.shape[1], a.shape[1]]
             else:
                 lower = [a.shape[1], 0]
-                upper = [2 * a.shape[1], core.BLOCK_SIZE]
+                upper = [2 * a.shape[1], a.shape[1]]
             ith_index //= 2
             q_block_current = ra.dot.remote(
                 q_block_current,
@@ -98,6 +101,7 @@ def modified_lu(q):
             and a a vector representing a diagonal matrix s such that
             q - s = l * u.
     """
+    block_shape = q.block_shape
     q = q.assemble()
     m, b = q.shape[0], q.shape[1]
     S = np.zeros(b)
@@ -118,7 +122,7 @@ def modified_lu(q):
         L[i, i] = 1
     U = np.triu(q_work)[:b, :]
     # TODO(rkn): Get rid of the put below.
-    return ray.get(core.numpy_to_dist.remote(ray.put(L))), U, S
+    return ray.get(core.numpy_to_dist.remote(ray.put(L), block_shape)), U, S
 
 
 @ray.remote(num_return_vals=2)
@@ -165,17 +169,20 @@ def qr(a):
 
     m, n = a.shape[0], a.shape[1]
     k = min(m, n)
+    if a.block_shape[0] != a.block_shape[1]:
+        raise Exception("qr requires square blocks, but a.block_shape is "
+                        "{}".format(a.block_shape))
 
     # we will store our scratch work in a_work
-    a_work = core.DistArray(a.shape, np.copy(a.objectids))
+    a_work = core.DistArray(a.shape, np.copy(a.objectids), a.block_shape)
 
     result_dtype = np.linalg.qr(ray.get(a.objectids[0, 0]))[0].dtype.name
     # TODO(rkn): It would be preferable not to get this right after creating
     # it.
-    r_res = ray.get(core.zeros.remote([k, n], result_dtype))
+    r_res = ray.get(core.zeros.remote([k, n], result_dtype, a.block_shape))
     # TODO(rkn): It would be preferable not to get this right after creating
     # it.
-    y_res = ray.get(core.zeros.remote([m, k], result_dtype))
+    y_res = ray.get(core.zeros.remote([m, k], result_dtype, a.block_shape))
     Ts = []
 
     # The for loop differs from the paper, which says
@@ -197,7 +204,7 @@ def qr(a):
             r_res.objectids[i, i] = ra.dot.remote(eye_temp, R)
         else:
             r_res.objectids[i, i] = R
-        Ts.append(core.numpy_to_dist.remote(t))
+        Ts.append(core.numpy_to_dist.remote(t, a.block_shape))
 
         for c in range(i + 1, a.num_blocks[1]):
             W_rcs = []
@@ -212,7 +219,8 @@ def qr(a):
             r_res.objectids[i, c] = a_work.objectids[i, c]
 
     # construct q_res from Ys and Ts
-    q = core.eye.remote(m, k, dtype_name=result_dtype)
+    q = core.eye.remote(
+        m, k, dtype_name=result_dtype, block_shape=a.block_shape)
     for i in range(len(Ts))[::-1]:
         y_col_block = core.subblocks.remote(y_res, [], [i])
         q = core.subtract.remote(
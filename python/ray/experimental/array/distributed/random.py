@@ -6,11 +6,11 @@ from .core import DistArray
 
 
 @ray.remote
-def normal(shape):
-    num_blocks = DistArray.compute_num_blocks(shape)
+def normal(shape, block_shape=None):
+    num_blocks = DistArray.compute_num_blocks(shape, block_shape)
     objectids = np.empty(num_blocks, dtype=object)
     for index in np.ndindex(*num_blocks):
         objectids[index] = ra.random.normal.remote(
-            DistArray.compute_block_shape(index, shape))
-    result = DistArray(shape, objectids)
+            DistArray.compute_block_shape(index, shape, block_shape))
+    result = DistArray(shape, objectids, block_shape)
     return result
@@ -59,6 +59,23 @@ def as_future(object_id):
     return handler.as_future(object_id)
 
 
+def as_futures(object_ids):
+    """Turn a list of object_ids into Future objects.
+
+    Unlike calling as_future on each object_id, this checks which objects
+    are ready with a single call.
+
+    Args:
+        object_ids: A list of Ray object_ids.
+
+    Returns:
+        A list of PlasmaObjectFutures that wait for the object_ids.
+    """
+    if handler is None:
+        init()
+    return handler.as_futures(object_ids)
+
+
 def shutdown():
     """Manually shutdown the async API.
 
@@ -1,4 +1,5 @@
 import asyncio
+import threading
 
 import ray
 from ray.services import logger
@@ -11,42 +12,61 @@ class PlasmaObjectFuture(asyncio.Future):
 
 
 class PlasmaEventHandler:
-    """This class is an event handler for Plasma."""
+    """This class is an event handler for Plasma.
+
+    Futures are only created and completed on the thread of the event loop.
+    Notifications of objects added to Plasma can arrive on any thread. They
+    are queued, and all queued objects are fetched with a single get from
+    one callback on the event loop.
+    """
 
     def __init__(self, loop, worker):
         super().__init__()
         self._loop = loop
         self._worker = worker
         self._waiting_dict = defaultdict(list)
+        # Object IDs that were added to Plasma but whose futures haven't been
+        # completed yet.
+        self._ready_ids = []
+        self._ready_lock = threading.Lock()
+
+    def notify_ready(self, object_id):
+        """Called from any thread when an object was added to Plasma."""
+        with self._ready_lock:
+            self._ready_ids.append(object_id)
+            # Only wake up the event loop once per batch.
+            schedule = len(self._ready_ids) == 1
+        if schedule:
+            self._loop.call_soon_threadsafe(self._complete_ready)
 
-    def _complete_future(self, ray_object_id):
-        # TODO(ilr): Consider race condition between popping from the
-        # waiting_dict and as_future appending to the waiting_dict's list.
-        logger.debug(
-            "Completing plasma futures for object id {}".format(ray_object_id))
-        if ray_object_id not in self._waiting_dict:
+    def _complete_ready(self):
+        with self._ready_lock:
+            object_ids, self._ready_ids = self._ready_ids, []
+        self._complete_futures(object_ids)
+
+    def _complete_futures(self, object_ids):
+        # Deduplicate the IDs and skip the ones no one is waiting for.
+        object_ids = [
+            object_id for object_id in dict.fromkeys(object_ids)
+            if object_id in self._waiting_dict
+        ]
+        if not object_ids:
             return
-        obj = self._worker.get_objects([ray_object_id], timeout=0)[0]
-        futures = self._waiting_dict.pop(ray_object_id)
-        for fut in futures:
-            try:
-                fut.set_result(obj)
-            except asyncio.InvalidStateError:
-                # Avoid issues where process_notifications
-                # and check_immediately both get executed
-                logger.debug("Failed to set result for future {}."
-                             "Most likely already set.".format(fut))
+        logger.debug("Completing plasma futures for {} object ids".format(
+            len(object_ids)))
+        objects = self._worker.get_objects(object_ids, timeout=0)
+        for object_id, obj in zip(object_ids, objects):
+            for fut in self._waiting_dict.pop(object_id):
+                # The future may have been cancelled by its user.
+                if not fut.done():
+                    fut.set_result(obj)
 
     def close(self):
         """Clean up this handler."""
         for futures in self._waiting_dict.values():
             for fut in futures:
                 fut.cancel()
-
-    def check_immediately(self, object_id):
-        ready, _ = ray.wait([object_id], timeout=0)
-        if ready:
-            self._complete_future(object_id)
+        self._waiting_dict.clear()
 
     def as_future(self, object_id, check_ready=True):
         """Turn an object_id into a Future object.
@@ -58,13 +78,40 @@ class PlasmaEventHandler:
         Returns:
             PlasmaObjectFuture: A future object that waits the object_id.
         """
-        if not isinstance(object_id, ray.ObjectID):
-            raise TypeError("Input should be a Ray ObjectID.")
-
-        future = PlasmaObjectFuture(loop=self._loop)
-        self._waiting_dict[object_id].append(future)
-        if not self.check_immediately(object_id) and len(
-                self._waiting_dict[object_id]) == 1:
-            # Only subscribe once
+        return self.as_futures([object_id], check_ready=check_ready)[0]
+
+    def as_futures(self, object_ids, check_ready=True):
+        """Turn a list of object_ids into Future objects.
+
+        This must be called from the thread of the event loop.
+
+        Args:
+            object_ids: A list of Ray object_ids.
+            check_ready (bool): If true, complete the futures of the
+                object_ids that are already ready.
+
+        Returns:
+            A list of PlasmaObjectFutures that wait for the object_ids.
+        """
+        for object_id in object_ids:
+            if not isinstance(object_id, ray.ObjectID):
+                raise TypeError("Input should be a Ray ObjectID.")
+
+        futures = []
+        new_ids = []
+        for object_id in object_ids:
+            if object_id not in self._waiting_dict:
+                new_ids.append(object_id)
+            future = PlasmaObjectFuture(loop=self._loop)
+            self._waiting_dict[object_id].append(future)
+            futures.append(future)
+        new_ids = list(dict.fromkeys(new_ids))
+
+        if check_ready and new_ids:
+            ready, new_ids = ray.wait(
+                new_ids, num_returns=len(new_ids), timeout=0)
+            self._complete_futures(ready)
+        # Only subscribe once per object.
+        for object_id in new_ids:
             self._worker.core_worker.subscribe_to_plasma_object(object_id)
-        return future
+        return futures
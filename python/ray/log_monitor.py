@@ -12,6 +12,11 @@ import ray.ray_constants as ray_constants
 import ray.services as services
 import ray.utils
 
+try:
+    import inotify_simple
+except ImportError:
+    inotify_simple = None
+
 # Logger for this module. It should be configured at the entry point
 # into the program using Ray. Ray provides a default configuration at
 # entry/init points.
@@ -31,6 +36,101 @@ class LogFileInfo:
         self.file_position = file_position
         self.file_handle = file_handle
         self.worker_pid = None
+        # Bytes at the end of the last chunk read that do not yet form a
+        # complete line.
+        self.partial_line = b""
+        # False if the last read reached the end of the file and we have not
+        # been notified of any changes to the file since.
+        self.may_have_new_lines = True
+
+
+class LogRateLimiter:
+    """A token bucket limiting the log output forwarded for a single worker.
+
+    Attributes:
+        max_lines_per_second (int): The number of lines allowed per second.
+            Not positive if lines are not limited.
+        max_bytes_per_second (int): The number of bytes allowed per second.
+            Not positive if bytes are not limited.
+        num_lines_dropped (int): The total number of lines dropped.
+        num_bytes_dropped (int): The total number of bytes dropped.
+        num_lines_dropped_unreported (int): The number of lines dropped since
+            the last time the drops were reported to the drivers.
+        last_report_time (float): The last time drops were reported.
+    """
+
+    def __init__(self, max_lines_per_second, max_bytes_per_second):
+        self.max_lines_per_second = max_lines_per_second
+        self.max_bytes_per_second = max_bytes_per_second
+        self.line_tokens = max_lines_per_second
+        self.byte_tokens = max_bytes_per_second
+        self.last_refill_time = time.time()
+        self.num_lines_dropped = 0
+        self.num_bytes_dropped = 0
+        self.num_lines_dropped_unreported = 0
+        self.last_report_time = 0
+
+    def _refill(self, now):
+        elapsed = max(now - self.last_refill_time, 0)
+        self.last_refill_time = now
+        if self.max_lines_per_second > 0:
+            self.line_tokens = min(
+                self.max_lines_per_second,
+                self.line_tokens + elapsed * self.max_lines_per_second)
+        if self.max_bytes_per_second > 0:
+            self.byte_tokens = min(
+                self.max_bytes_per_second,
+                self.byte_tokens + elapsed * self.max_bytes_per_second)
+
+    def admit(self, lines, now=None):
+        """Return the prefix of the lines that fits in the current budget.
+
+        The remaining lines are counted as dropped.
+
+        Args:
+            lines (list[str]): The new lines of the worker.
+            now (float): The current time. Defaults to time.time().
+
+        Returns:
+            The list of lines that may be forwarded.
+        """
+        self._refill(time.time() if now is None else now)
+        num_admitted = len(lines)
+        if self.max_lines_per_second > 0:
+            num_admitted = min(num_admitted, int(self.line_tokens))
+            self.line_tokens -= num_admitted
+        if self.max_bytes_per_second > 0:
+            num_bytes = 0
+            for i in range(num_admitted):
+                if num_bytes + len(lines[i]) > self.byte_tokens:
+                    num_admitted = i
+                    break
+                num_bytes += len(lines[i])
+            self.byte_tokens -= num_bytes
+        if num_admitted < len(lines):
+            dropped = lines[num_admitted:]
+            self.num_lines_dropped += len(dropped)
+            self.num_lines_dropped_unreported += len(dropped)
+            self.num_bytes_dropped += sum(len(line) for line in dropped)
+            return lines[:num_admitted]
+        return lines
+
+    def pop_unreported_drops(self, now=None, report_interval_s=1):
+        """Get the number of lines dropped since the last report.
+
+        Drops are reported at most once per report interval.
+
+        Returns:
+            The number of dropped lines to report, possibly 0.
+        """
+        now = time.time() if now is None else now
+        if (self.num_lines_dropped_unreported == 0
+                or now - self.last_report_time < report_interval_s):
+            return 0
+        num_lines_dropped = self.num_lines_dropped_unreported
+        self.num_lines_dropped_unreported = 0
+        self.last_report_time = now
+        return num_lines_dropped
 
 
 class LogMonitor:
@@ -49,7 +149,13 @@ class LogMonitor:
        lines (judged by an increase in file size since the last time the file
        was opened).
     4. Then we will loop through the open files and see if there are any new
-       lines in the file. If so, we will publish them to Redis.
+       lines in the file. If so, we will publish them to Redis. Files are read
+       in chunks of LOG_MONITOR_READ_CHUNK_BYTES and the new lines of all of
+       the files are published together in batches. The lines forwarded for
+       each worker are rate limited, see LogRateLimiter.
+
+    If the inotify_simple package is installed, inotify is used to find the
+    files that changed instead of checking every file in every cycle.
 
     Attributes:
         host (str): The hostname of this machine. Used to improve the log
@@ -63,9 +169,22 @@ class LogMonitor:
             files.
         can_open_more_files (bool): True if we can still open more files and
             false otherwise.
+        rate_limiters (dict): A mapping from worker PID to the LogRateLimiter
+            of the worker. Files without a known worker PID have their own
+            LogRateLimiter, keyed by filename.
+        inotify: The inotify_simple.INotify watching the log directory, or
+            None if the log files are polled.
+        modified_filenames (set): The files that inotify reported as modified
+            since they were last read.
+        new_files_created (bool): True if inotify reported that files were
+            added to the log directory since it was last scanned.
     """
 
-    def __init__(self, logs_dir, redis_address, redis_password=None):
+    def __init__(self,
+                 logs_dir,
+                 redis_address,
+                 redis_password=None,
+                 use_inotify=ray_constants.LOG_MONITOR_USE_INOTIFY):
         """Initialize the log monitor object."""
         self.ip = services.get_node_ip_address()
         self.logs_dir = logs_dir
@@ -75,6 +194,39 @@ class LogMonitor:
         self.open_file_infos = []
         self.closed_file_infos = []
         self.can_open_more_files = True
+        self.rate_limiters = {}
+        self.inotify = None
+        if use_inotify and inotify_simple is not None:
+            flags = inotify_simple.flags
+            self.inotify = inotify_simple.INotify()
+            self.inotify.add_watch(
+                logs_dir, flags.CREATE | flags.MODIFY
+                | flags.MOVED_TO)
+        self.modified_filenames = set()
+        self.new_files_created = True
+
+    def _may_have_new_lines(self, file_info):
+        """Whether a file may have lines that we have not read yet."""
+        return (self.inotify is None or file_info.may_have_new_lines
+                or file_info.filename in self.modified_filenames)
+
+    def poll_file_events(self, timeout):
+        """Wait for changes to the log files.
+
+        Without inotify this just sleeps for the timeout.
+
+        Args:
+            timeout (float): The maximum number of seconds to wait.
+        """
+        if self.inotify is None:
+            time.sleep(timeout)
+            return
+        flags = inotify_simple.flags
+        for event in self.inotify.read(timeout=int(timeout * 1000)):
+            if event.mask & (flags.CREATE | flags.MOVED_TO):
+                self.new_files_created = True
+            self.modified_filenames.add(
+                os.path.join(self.logs_dir, event.name))
 
     def close_all_files(self):
         """Close all open files (so that we can open more)."""
@@ -93,6 +245,7 @@ class LogMonitor:
                 # by it.
                 target = os.path.join(self.logs_dir, "old",
                                       os.path.basename(file_info.filename))
+                self.rate_limiters.pop(self._rate_limiter_key(file_info), None)
                 try:
                     shutil.move(file_info.filename, target)
                 except (IOError, OSError) as e:
@@ -107,6 +260,9 @@ class LogMonitor:
 
     def update_log_filenames(self):
         """Update the list of log files to monitor."""
+        if self.inotify is not None and not self.new_files_created:
+            return
+        self.new_files_created = False
         # output of user code is written here
         log_file_paths = glob.glob("{}/worker*[.out|.err]".format(
             self.logs_dir))
@@ -144,6 +300,9 @@ class LogMonitor:
 
             file_info = self.closed_file_infos.pop(0)
             assert file_info.file_handle is None
+            if not self._may_have_new_lines(file_info):
+                files_with_no_updates.append(file_info)
+                continue
             # Get the file size to see if it has gotten bigger since we last
             # opened it.
             try:
@@ -159,7 +318,7 @@ class LogMonitor:
 
             # If some new lines have been added to this file, try to reopen the
             # file.
-            if file_size > file_info.size_when_last_opened:
+            if file_size > file_info.file_position:
                 try:
                     f = open(file_info.filename, "rb")
                 except (IOError, OSError) as e:
@@ -172,69 +331,165 @@ class LogMonitor:
                         raise e
 
                 f.seek(file_info.file_position)
-                file_info.filesize_when_last_opened = file_size
+                file_info.size_when_last_opened = file_size
                 file_info.file_handle = f
                 self.open_file_infos.append(file_info)
             else:
+                file_info.may_have_new_lines = False
+                self.modified_filenames.discard(file_info.filename)
                 files_with_no_updates.append(file_info)
 
         # Add the files with no changes back to the list of closed files.
         self.closed_file_infos += files_with_no_updates
 
+    def _read_new_lines(self, file_info):
+        """Read the next chunk of a file and split it into lines.
+
+        Returns:
+            A list of the complete lines read from the file.
+        """
+        try:
+            chunk = file_info.file_handle.read(
+                ray_constants.LOG_MONITOR_READ_CHUNK_BYTES)
+        except Exception:
+            logger.error("Error: Reading file: {}, position: {} "
+                         "failed.".format(file_info.filename,
+                                          file_info.file_position))
+            raise
+        reached_end = len(chunk) < ray_constants.LOG_MONITOR_READ_CHUNK_BYTES
+        file_info.may_have_new_lines = not reached_end
+        self.modified_filenames.discard(file_info.filename)
+
+        data = file_info.partial_line + chunk
+        end = data.rfind(b"\n") + 1
+        if reached_end or (end == 0 and len(data) >=
+                           ray_constants.LOG_MONITOR_MAX_PUBLISH_BYTES):
+            # Return everything that was read like readline would, unless we
+            # only stopped in the middle of a line because of the chunk size.
+            complete, file_info.partial_line = data, b""
+        else:
+            complete, file_info.partial_line = data[:end], data[end:]
+        if len(complete) == 0:
+            return []
+
+        # Replace any characters not in UTF-8 with a replacement character,
+        # see https://stackoverflow.com/a/38565489/10891801
+        lines = complete.decode("utf-8", "replace").split("\n")
+        if lines[-1] == "":
+            lines.pop()
+        return lines
+
+    def _get_new_lines(self, file_info):
+        """Read the new lines of the file, without the worker pid line."""
+        # Check if the first line of the file is among the new lines.
+        is_start_of_file = (file_info.file_position == len(
+            file_info.partial_line))
+        lines = self._read_new_lines(file_info)
+
+        if is_start_of_file and len(lines) > 0:
+            if lines[0].startswith("Ray worker pid: "):
+                file_info.worker_pid = int(lines[0].split(" ")[-1])
+                lines = lines[1:]
+            elif "/raylet" in file_info.filename:
+                file_info.worker_pid = "raylet"
+
+        # Record the current position in the file.
+        file_info.file_position = file_info.file_handle.tell()
+        return lines
+
+    def _rate_limiter_key(self, file_info):
+        if file_info.worker_pid is None:
+            return file_info.filename
+        return file_info.worker_pid
+
+    def _rate_limit(self, file_info, lines):
+        """Apply the rate limit of the worker that wrote the lines."""
+        if (ray_constants.LOG_MONITOR_MAX_LINES_PER_SECOND <= 0
+                and ray_constants.LOG_MONITOR_MAX_BYTES_PER_SECOND <= 0):
+            return lines
+        key = self._rate_limiter_key(file_info)
+        if key not in self.rate_limiters:
+            self.rate_limiters[key] = LogRateLimiter(
+                ray_constants.LOG_MONITOR_MAX_LINES_PER_SECOND,
+                ray_constants.LOG_MONITOR_MAX_BYTES_PER_SECOND)
+        return self.rate_limiters[key].admit(lines)
+
+    def _report_drops(self, file_info):
+        """Get the lines reporting the lines dropped by the rate limit.
+
+        This is also called for files without new lines, so that the last
+        drops of a worker are reported even if it stopped printing.
+        """
+        rate_limiter = self.rate_limiters.get(
+            self._rate_limiter_key(file_info))
+        if rate_limiter is None:
+            return []
+        num_lines_dropped = rate_limiter.pop_unreported_drops()
+        if num_lines_dropped == 0:
+            return []
+        return [
+            "[Ray] Dropped {} lines of output because the worker "
+            "exceeded the log rate limit ({} lines/s, {} "
+            "bytes/s). The complete output is in {}.".format(
+                num_lines_dropped, rate_limiter.max_lines_per_second,
+                rate_limiter.max_bytes_per_second, file_info.filename)
+        ]
+
+    def _publish_batches(self, updates):
+        """Publish the new lines of several files to Redis.
+
+        Updates are grouped into JSON lists of at most roughly
+        LOG_MONITOR_MAX_PUBLISH_BYTES each.
+
+        Args:
+            updates (list[dict]): The new lines of each file, each in the
+                form {"ip": ..., "pid": ..., "lines": [...]}.
+        """
+        batches = []
+        batch, batch_size = [], 0
+        for update in updates:
+            update_size = sum(len(line) for line in update["lines"])
+            if (len(batch) > 0 and batch_size + update_size >
+                    ray_constants.LOG_MONITOR_MAX_PUBLISH_BYTES):
+                batches.append(batch)
+                batch, batch_size = [], 0
+            batch.append(update)
+            batch_size += update_size
+        if len(batch) > 0:
+            batches.append(batch)
+
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for batch in batches:
+            pipeline.publish(ray.gcs_utils.LOG_FILE_CHANNEL, json.dumps(batch))
+        pipeline.execute()
+
     def check_log_files_and_publish_updates(self):
         """Get any changes to the log files and push updates to Redis.
 
         Returns:
-            True if anything was published and false otherwise.
+            True if anything was published or if some files have more lines
+                to read, and false otherwise.
         """
-        anything_published = False
+        updates = []
         for file_info in self.open_file_infos:
             assert not file_info.file_handle.closed
-
             lines_to_publish = []
-            max_num_lines_to_read = 100
-            for _ in range(max_num_lines_to_read):
-                try:
-                    next_line = file_info.file_handle.readline()
-                    # Replace any characters not in UTF-8 with
-                    # a replacement character, see
-                    # https://stackoverflow.com/a/38565489/10891801
-                    next_line = next_line.decode("utf-8", "replace")
-                    if next_line == "":
-                        break
-                    if next_line[-1] == "\n":
-                        next_line = next_line[:-1]
-                    lines_to_publish.append(next_line)
-                except Exception:
-                    logger.error("Error: Reading file: {}, position: {} "
-                                 "failed.".format(
-                                     file_info.full_path,
-                                     file_info.file_info.file_handle.tell()))
-                    raise
-
-            if file_info.file_position == 0:
-                if (len(lines_to_publish) > 0 and
-                        lines_to_publish[0].startswith("Ray worker pid: ")):
-                    file_info.worker_pid = int(
-                        lines_to_publish[0].split(" ")[-1])
-                    lines_to_publish = lines_to_publish[1:]
-                elif "/raylet" in file_info.filename:
-                    file_info.worker_pid = "raylet"
-
-            # Record the current position in the file.
-            file_info.file_position = file_info.file_handle.tell()
-
+            if self._may_have_new_lines(file_info):
+                lines_to_publish = self._rate_limit(
+                    file_info, self._get_new_lines(file_info))
+            lines_to_publish += self._report_drops(file_info)
             if len(lines_to_publish) > 0:
-                self.redis_client.publish(
-                    ray.gcs_utils.LOG_FILE_CHANNEL,
-                    json.dumps({
-                        "ip": self.ip,
-                        "pid": file_info.worker_pid,
-                        "lines": lines_to_publish
-                    }))
-                anything_published = True
+                updates.append({
+                    "ip": self.ip,
+                    "pid": file_info.worker_pid,
+                    "lines": lines_to_publish
+                })
+
+        if len(updates) > 0:
+            self._publish_batches(updates)
 
-        return anything_published
+        return len(updates) > 0 or any(file_info.may_have_new_lines
+                                       for file_info in self.open_file_infos)
 
     def run(self):
         """Run the log monitor.
@@ -249,7 +504,9 @@ class LogMonitor:
             # If nothing was published, then wait a little bit before checking
             # for logs to avoid using too much CPU.
             if not anything_published:
-                time.sleep(0.05)
+                self.poll_file_events(0.05)
+            elif self.inotify is not None:
+                self.poll_file_events(0)
 
 
 if __name__ == "__main__":
@@ -135,6 +135,11 @@ AUTOSCALER_MAX_LAUNCH_BATCH = env_integer("AUTOSCALER_MAX_LAUNCH_BATCH", 5)
 AUTOSCALER_MAX_CONCURRENT_LAUNCHES = env_integer(
     "AUTOSCALER_MAX_CONCURRENT_LAUNCHES", 10)
 
+# Max number of nodes to update (sync files to and run the setup commands on)
+# at a time.
+AUTOSCALER_MAX_CONCURRENT_UPDATES = env_integer(
+    "AUTOSCALER_MAX_CONCURRENT_UPDATES", 50)
+
 # Interval at which to perform autoscaling updates.
 AUTOSCALER_UPDATE_INTERVAL_S = env_integer("AUTOSCALER_UPDATE_INTERVAL_S", 5)
 
@@ -179,6 +184,32 @@ PROCESS_TYPE_WEB_UI = "web_ui"
 PROCESS_TYPE_GCS_SERVER = "gcs_server"
 
 LOG_MONITOR_MAX_OPEN_FILES = 200
+# Bounds on the log lines and errors the dashboard keeps for each worker. Once
+# a bound is exceeded, the oldest entries are evicted.
+DASHBOARD_MAX_LOG_LINES_PER_WORKER = env_integer(
+    "RAY_DASHBOARD_MAX_LOG_LINES_PER_WORKER", 10000)
+DASHBOARD_MAX_LOG_BYTES_PER_WORKER = env_integer(
+    "RAY_DASHBOARD_MAX_LOG_BYTES_PER_WORKER", 1024 * 1024)
+DASHBOARD_MAX_ERRORS_PER_WORKER = env_integer(
+    "RAY_DASHBOARD_MAX_ERRORS_PER_WORKER", 100)
+# The number of seconds the dashboard keeps the logs and errors of a worker
+# after the worker exited.
+DASHBOARD_DEAD_WORKER_RETENTION_S = env_integer(
+    "RAY_DASHBOARD_DEAD_WORKER_RETENTION_S", 600)
+# The number of bytes the log monitor reads from a log file per cycle.
+LOG_MONITOR_READ_CHUNK_BYTES = 64 * 1024
+# The maximum size of a single batch of log lines published to Redis.
+LOG_MONITOR_MAX_PUBLISH_BYTES = 1024 * 1024
+# Per-worker limits on the log output forwarded to the drivers. Lines above
+# these limits are dropped (they remain in the log files). Values that are not
+# positive disable the limit.
+LOG_MONITOR_MAX_LINES_PER_SECOND = env_integer(
+    "RAY_LOG_MONITOR_MAX_LINES_PER_SECOND", 1000)
+LOG_MONITOR_MAX_BYTES_PER_SECOND = env_integer(
+    "RAY_LOG_MONITOR_MAX_BYTES_PER_SECOND", 1024 * 1024)
+# Whether the log monitor should use inotify (when the inotify_simple package
+# is installed) instead of polling the log files for changes.
+LOG_MONITOR_USE_INOTIFY = env_bool("RAY_LOG_MONITOR_USE_INOTIFY", True)
 
 # A constant used as object metadata to indicate the object is cross language.
 OBJECT_METADATA_TYPE_CROSS_LANGUAGE = b"XLANG"
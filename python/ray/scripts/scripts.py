@@ -920,15 +920,29 @@ def clusterbenchmark():
     required=False,
     type=str,
     help="Override the redis address to connect to.")
-def timeline(address):
+@click.option(
+    "--last",
+    required=False,
+    type=float,
+    help="Only include events from the last this many seconds.")
+@click.option(
+    "--sample-rate",
+    required=False,
+    type=float,
+    default=1.0,
+    help="The fraction of events to include in the timeline.")
+def timeline(address, last, sample_rate):
     if not address:
         address = services.find_redis_address_or_die()
     logger.info("Connecting to Ray instance at {}.".format(address))
     ray.init(address=address)
-    time = datetime.today().strftime("%Y-%m-%d_%H-%M-%S")
+    now = datetime.today()
+    time = now.strftime("%Y-%m-%d_%H-%M-%S")
     filename = os.path.join(ray.utils.get_user_temp_dir(),
                             "ray-timeline-{}.json".format(time))
-    ray.timeline(filename=filename)
+    start_time = now.timestamp() - last if last is not None else None
+    ray.timeline(
+        filename=filename, start_time=start_time, sample_rate=sample_rate)
     size = os.path.getsize(filename)
     logger.info("Trace file written to {} ({} bytes).".format(filename, size))
     logger.info(
@@ -501,23 +501,39 @@ class GlobalState:
 
         return profile_events
 
-    def profile_table(self):
-        self._check_connected()
+    def _profile_batch_ids(self):
+        """Get the identifiers of all batches in the profile table."""
         profile_table_keys = self._keys(gcs_utils.TablePrefix_PROFILE_string +
                                         "*")
-        batch_identifiers_binary = [
-            key[len(gcs_utils.TablePrefix_PROFILE_string):]
+        return [
+            binary_to_object_id(
+                key[len(gcs_utils.TablePrefix_PROFILE_string):])
             for key in profile_table_keys
         ]
 
-        result = defaultdict(list)
-        for batch_id in batch_identifiers_binary:
-            profile_data = self._profile_table(binary_to_object_id(batch_id))
+    def _iter_profile_table(self):
+        """Iterate over the profile table one batch at a time.
+
+        Unlike profile_table, this only holds a single batch of profile events
+        in memory at a time.
+
+        Yields:
+            Lists of profile events. All of the events in a list come from the
+                same component.
+        """
+        self._check_connected()
+        for batch_id in self._profile_batch_ids():
+            profile_data = self._profile_table(batch_id)
             # Note that if keys are being evicted from Redis, then it is
             # possible that the batch will be evicted before we get it.
             if len(profile_data) > 0:
-                component_id = profile_data[0]["component_id"]
-                result[component_id].extend(profile_data)
+                yield profile_data
+
+    def profile_table(self):
+        result = defaultdict(list)
+        for profile_data in self._iter_profile_table():
+            component_id = profile_data[0]["component_id"]
+            result[component_id].extend(profile_data)
 
         return dict(result)
 
@@ -582,39 +598,107 @@ class GlobalState:
         "cq_build_attempt_failed",
     ]
 
-    def chrome_tracing_dump(self, filename=None):
-        """Return a list of profiling events that can viewed as a timeline.
+    def _write_chrome_tracing_events(self, events, filename):
+        """Write chrome tracing events to a file as a single JSON list.
 
-        To view this information as a timeline, simply dump it as a json file
-        by passing in "filename" or using using json.dump, and then load go to
-        chrome://tracing in the Chrome web browser and load the dumped file.
-        Make sure to enable "Flow events" in the "View Options" menu.
+        The events are written one at a time, so only the event currently
+        being serialized has to be kept in memory.
 
         Args:
-            filename: If a filename is provided, the timeline is dumped to that
-                file.
+            events: An iterable of chrome tracing events.
+            filename: The file to write the events to.
+        """
+        with open(filename, "w") as outfile:
+            outfile.write("[")
+            separator = ""
+            for event in events:
+                outfile.write(separator)
+                outfile.write(json.dumps(event))
+                separator = ", "
+            outfile.write("]")
+
+    def _filter_profile_events(self,
+                               profile_events,
+                               start_time=None,
+                               end_time=None,
+                               event_types=None):
+        """Yield the profile events that overlap a window and match a type.
 
-        Returns:
-            If filename is not provided, this returns a list of profiling
-                events. Each profile event is a dictionary.
+        Args:
+            profile_events: An iterable of profile events.
+            start_time: If provided, drop events that ended before this time
+                (in seconds since the epoch).
+            end_time: If provided, drop events that started after this time
+                (in seconds since the epoch).
+            event_types: If provided, only keep events with one of these
+                event types.
         """
-        # TODO(rkn): Support including the task specification data in the
-        # timeline.
-        # TODO(rkn): This should support viewing just a window of time or a
-        # limited number of events.
+        for event in profile_events:
+            if start_time is not None and event["end_time"] < start_time:
+                continue
+            if end_time is not None and event["start_time"] > end_time:
+                continue
+            if (event_types is not None
+                    and event["event_type"] not in event_types):
+                continue
+            yield event
 
-        self._check_connected()
+    def _sample_events(self, events, sample_rate):
+        """Keep an evenly spaced fraction of the events.
+
+        Sampling is deterministic so that repeated dumps of the same profile
+        table produce the same timeline.
 
-        profile_table = self.profile_table()
-        all_events = []
+        Args:
+            events: An iterable of events.
+            sample_rate: The fraction of events to keep, in (0, 1].
+        """
+        if sample_rate == 1:
+            yield from events
+            return
+        credit = 0.0
+        for event in events:
+            credit += sample_rate
+            if credit >= 1:
+                credit -= 1
+                yield event
+
+    def _chrome_tracing_events(self,
+                               start_time=None,
+                               end_time=None,
+                               node_ip_addresses=None,
+                               worker_ids=None,
+                               event_types=None):
+        """Lazily generate the chrome tracing events for workers and drivers.
+
+        See chrome_tracing_dump for a description of the arguments.
+        """
+        if node_ip_addresses is not None:
+            node_ip_addresses = set(node_ip_addresses)
+        if worker_ids is not None:
+            worker_ids = {
+                worker_id
+                if isinstance(worker_id, str) else binary_to_hex(worker_id)
+                for worker_id in worker_ids
+            }
+        if event_types is not None:
+            event_types = set(event_types)
 
-        for component_id_hex, component_events in profile_table.items():
+        for component_events in self._iter_profile_table():
             # Only consider workers and drivers.
             component_type = component_events[0]["component_type"]
             if component_type not in ["worker", "driver"]:
                 continue
+            node_ip_address = component_events[0]["node_ip_address"]
+            if (node_ip_addresses is not None
+                    and node_ip_address not in node_ip_addresses):
+                continue
+            component_id = component_events[0]["component_id"]
+            if worker_ids is not None and component_id not in worker_ids:
+                continue
 
-            for event in component_events:
+            for event in self._filter_profile_events(
+                    component_events, start_time, end_time, event_types):
                 new_event = {
                     # The category of the event.
                     "cat": event["event_type"],
@@ -646,46 +730,89 @@ class GlobalState:
                 if "name" in event["extra_data"]:
                     new_event["name"] = event["extra_data"]["name"]
 
-                all_events.append(new_event)
+                yield new_event
 
-        if filename is not None:
-            with open(filename, "w") as outfile:
-                json.dump(all_events, outfile)
-        else:
-            return all_events
-
-    def chrome_tracing_object_transfer_dump(self, filename=None):
-        """Return a list of transfer events that can viewed as a timeline.
+    def chrome_tracing_dump(self,
+                            filename=None,
+                            start_time=None,
+                            end_time=None,
+                            node_ip_addresses=None,
+                            worker_ids=None,
+                            event_types=None,
+                            sample_rate=1.0):
+        """Return a list of profiling events that can viewed as a timeline.
 
         To view this information as a timeline, simply dump it as a json file
         by passing in "filename" or using using json.dump, and then load go to
         chrome://tracing in the Chrome web browser and load the dumped file.
         Make sure to enable "Flow events" in the "View Options" menu.
 
+        When a filename is provided, the profile table is read and written
+        one batch at a time, so the full timeline is never held in memory.
+
         Args:
             filename: If a filename is provided, the timeline is dumped to that
                 file.
+            start_time: If provided, only include events that end after this
+                time (in seconds since the epoch).
+            end_time: If provided, only include events that start before this
+                time (in seconds since the epoch).
+            node_ip_addresses: If provided, only include events from workers
+                and drivers on nodes with these IP addresses.
+            worker_ids: If provided, only include events from the workers and
+                drivers with these IDs (hex strings or binary IDs).
+            event_types: If provided, only include events of these types,
+                e.g., "task" or "ray.get".
+            sample_rate: The fraction of the matching events to include. This
+                can be used to get an overview of very long jobs.
 
         Returns:
             If filename is not provided, this returns a list of profiling
                 events. Each profile event is a dictionary.
         """
+        # TODO(rkn): Support including the task specification data in the
+        # timeline.
         self._check_connected()
 
+        if not 0 < sample_rate <= 1:
+            raise ValueError(
+                "sample_rate must be in (0, 1], got {}.".format(sample_rate))
+
+        events = self._sample_events(
+            self._chrome_tracing_events(
+                start_time=start_time,
+                end_time=end_time,
+                node_ip_addresses=node_ip_addresses,
+                worker_ids=worker_ids,
+                event_types=event_types), sample_rate)
+
+        if filename is not None:
+            self._write_chrome_tracing_events(events, filename)
+        else:
+            return list(events)
+
+    def _chrome_tracing_object_transfer_events(self,
+                                               start_time=None,
+                                               end_time=None):
+        """Lazily generate the chrome tracing events for object transfers.
+
+        See chrome_tracing_object_transfer_dump for a description of the
+        arguments.
+        """
         node_id_to_address = {}
         for node_info in self.client_table():
             node_id_to_address[node_info["NodeID"]] = "{}:{}".format(
                 node_info["NodeManagerAddress"],
                 node_info["ObjectManagerPort"])
 
-        all_events = []
-
-        for key, items in self.profile_table().items():
+        for items in self._iter_profile_table():
             # Only consider object manager events.
             if items[0]["component_type"] != "object_manager":
                 continue
+            key = items[0]["component_id"]
 
-            for event in items:
+            for event in self._filter_profile_events(items, start_time,
+                                                     end_time):
                 if event["event_type"] == "transfer_send":
                     object_id, remote_node_id, _, _ = event["extra_data"]
 
@@ -726,26 +853,53 @@ class GlobalState:
                     # The extra user-defined data.
                     "args": event["extra_data"],
                 }
-                all_events.append(new_event)
+                yield new_event
 
                 # Add another box with a color indicating whether it was a send
                 # or a receive event.
                 if event["event_type"] == "transfer_send":
                     additional_event = new_event.copy()
                     additional_event["cname"] = "black"
-                    all_events.append(additional_event)
+                    yield additional_event
                 elif event["event_type"] == "transfer_receive":
                     additional_event = new_event.copy()
                     additional_event["cname"] = "grey"
-                    all_events.append(additional_event)
+                    yield additional_event
                 else:
                     pass
 
+    def chrome_tracing_object_transfer_dump(self,
+                                            filename=None,
+                                            start_time=None,
+                                            end_time=None):
+        """Return a list of transfer events that can viewed as a timeline.
+
+        To view this information as a timeline, simply dump it as a json file
+        by passing in "filename" or using using json.dump, and then load go to
+        chrome://tracing in the Chrome web browser and load the dumped file.
+        Make sure to enable "Flow events" in the "View Options" menu.
+
+        Args:
+            filename: If a filename is provided, the timeline is dumped to that
+                file.
+            start_time: If provided, only include transfers that end after
+                this time (in seconds since the epoch).
+            end_time: If provided, only include transfers that start before
+                this time (in seconds since the epoch).
+
+        Returns:
+            If filename is not provided, this returns a list of profiling
+                events. Each profile event is a dictionary.
+        """
+        self._check_connected()
+
+        events = self._chrome_tracing_object_transfer_events(
+            start_time=start_time, end_time=end_time)
+
         if filename is not None:
-            with open(filename, "w") as outfile:
-                json.dump(all_events, outfile)
+            self._write_chrome_tracing_events(events, filename)
         else:
-            return all_events
+            return list(events)
 
     def workers(self):
         """Get a dictionary mapping worker ID to worker information."""
@@ -1066,25 +1220,51 @@ def objects(object_id=None):
     return state.object_table(object_id=object_id)
 
 
-def timeline(filename=None):
+def timeline(filename=None,
+             start_time=None,
+             end_time=None,
+             node_ip_addresses=None,
+             worker_ids=None,
+             event_types=None,
+             sample_rate=1.0):
     """Return a list of profiling events that can viewed as a timeline.
 
     To view this information as a timeline, simply dump it as a json file by
     passing in "filename" or using using json.dump, and then load go to
     chrome://tracing in the Chrome web browser and load the dumped file.
 
+    Passing in "filename" is recommended for long running jobs, since the
+    events are then streamed to the file instead of collected in memory.
+
     Args:
         filename: If a filename is provided, the timeline is dumped to that
             file.
+        start_time: If provided, only include events that end after this time
+            (in seconds since the epoch).
+        end_time: If provided, only include events that start before this
+            time (in seconds since the epoch).
+        node_ip_addresses: If provided, only include events from nodes with
+            these IP addresses.
+        worker_ids: If provided, only include events from the workers and
+            drivers with these IDs.
+        event_types: If provided, only include events of these types.
+        sample_rate: The fraction of the matching events to include.
 
     Returns:
         If filename is not provided, this returns a list of profiling events.
             Each profile event is a dictionary.
     """
-    return state.chrome_tracing_dump(filename=filename)
+    return state.chrome_tracing_dump(
+        filename=filename,
+        start_time=start_time,
+        end_time=end_time,
+        node_ip_addresses=node_ip_addresses,
+        worker_ids=worker_ids,
+        event_types=event_types,
+        sample_rate=sample_rate)
 
 
-def object_transfer_timeline(filename=None):
+def object_transfer_timeline(filename=None, start_time=None, end_time=None):
     """Return a list of transfer events that can viewed as a timeline.
 
     To view this information as a timeline, simply dump it as a json file by
@@ -1095,12 +1275,17 @@ def object_transfer_timeline(filename=None):
     Args:
         filename: If a filename is provided, the timeline is dumped to that
             file.
+        start_time: If provided, only include transfers that end after this
+            time (in seconds since the epoch).
+        end_time: If provided, only include transfers that start before this
+            time (in seconds since the epoch).
 
     Returns:
         If filename is not provided, this returns a list of profiling events.
             Each profile event is a dictionary.
     """
-    return state.chrome_tracing_object_transfer_dump(filename=filename)
+    return state.chrome_tracing_object_transfer_dump(
+        filename=filename, start_time=start_time, end_time=end_time)
 
 
 def cluster_resources():
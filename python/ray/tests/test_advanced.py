@@ -219,6 +219,42 @@ def test_profiling_api(ray_start_2_cpus):
         time.sleep(1.1)
 
 
+def test_profiling_api_filters(ray_start_2_cpus, tmp_path):
+    @ray.remote
+    def f():
+        with ray.profile("custom_event"):
+            pass
+
+    ray.get([f.remote() for _ in range(10)])
+
+    timeout_seconds = 20
+    start_time = time.time()
+    while True:
+        filename = str(tmp_path / "timeline.json")
+        ray.timeline(filename=filename, event_types=["custom_event"])
+        with open(filename) as timeline_file:
+            profile_data = json.load(timeline_file)
+        if len(profile_data) == 10:
+            break
+        if time.time() - start_time > timeout_seconds:
+            raise RayTestTimeoutException(
+                "Timed out while waiting for information in profile table.")
+        # The profiling information only flushes once every second.
+        time.sleep(1.1)
+
+    assert {event["cat"] for event in profile_data} == {"custom_event"}
+    assert len(ray.timeline(event_types=["custom_event"],
+                            sample_rate=0.5)) == 5
+    assert ray.timeline(start_time=time.time() + 1000) == []
+    assert ray.timeline(node_ip_addresses=["0.0.0.0"]) == []
+    worker_ids = {event["tid"].split(":")[1] for event in profile_data}
+    assert len(
+        ray.timeline(worker_ids=worker_ids,
+                     event_types=["custom_event"])) == 10
+    with pytest.raises(ValueError):
+        ray.timeline(sample_rate=0)
+
+
 def test_wait_cluster(ray_start_cluster):
     cluster = ray_start_cluster
     cluster.add_node(num_cpus=1, resources={"RemoteResource": 1})
@@ -47,7 +47,8 @@ def test_remote_array_methods(ray_start_2_cpus, reload_modules):
 def test_distributed_array_assemble(ray_start_2_cpus, reload_modules):
     a = ra.ones.remote([da.BLOCK_SIZE, da.BLOCK_SIZE])
     b = ra.zeros.remote([da.BLOCK_SIZE, da.BLOCK_SIZE])
-    x = da.DistArray([2 * da.BLOCK_SIZE, da.BLOCK_SIZE], np.array([[a], [b]]))
+    x = da.DistArray([2 * da.BLOCK_SIZE, da.BLOCK_SIZE], np.array([[a], [b]]),
+                     [da.BLOCK_SIZE, da.BLOCK_SIZE])
     assert_equal(
         x.assemble(),
         np.vstack([
@@ -56,6 +57,90 @@ def test_distributed_array_assemble(ray_start_2_cpus, reload_modules):
         ]))
 
 
+def test_distributed_array_blocks(ray_start_2_cpus, reload_modules):
+    assert da.DistArray([10000, 10000]).block_shape == [1024, 1024]
+    assert da.DistArray([10000, 10000]).num_blocks == [10, 10]
+
+    x = da.random.normal.remote([25, 49], block_shape=[7, 10])
+    x_val = ray.get(da.assemble.remote(x))
+    assert ray.get(x).num_blocks == [4, 5]
+    for y, expected in [(da.triu.remote(x),
+                         np.triu(x_val)), (da.tril.remote(x), np.tril(x_val)),
+                        (da.transpose.remote(x), x_val.T), (da.add.remote(
+                            x, x), x_val + x_val)]:
+        assert_equal(ray.get(da.assemble.remote(y)), expected)
+    x = da.eye.remote(25, 30, block_shape=[4, 6])
+    assert_equal(ray.get(da.assemble.remote(x)), np.eye(25, 30))
+
+    x = da.random.normal.remote([25, 49], block_shape=[7, 10])
+    y = da.random.normal.remote([49, 18], block_shape=[10, 4])
+    z = da.dot.remote(x, y)
+    assert_almost_equal(
+        ray.get(da.assemble.remote(z)),
+        np.dot(ray.get(da.assemble.remote(x)), ray.get(da.assemble.remote(y))))
+    with pytest.raises(Exception):
+        ray.get(da.dot.remote(x, da.random.normal.remote([49, 18])))
+
+    for d1, d2 in [(123, 10), (34, 35), (35, 34)]:
+        a = da.random.normal.remote([d1, d2], block_shape=[10, 10])
+        q, r = da.linalg.qr.remote(a)
+        a_val = ray.get(da.assemble.remote(a))
+        q_val = ray.get(da.assemble.remote(q))
+        r_val = ray.get(da.assemble.remote(r))
+        assert_almost_equal(np.dot(q_val.T, q_val), np.eye(min(d1, d2)))
+        assert_almost_equal(a_val, np.dot(q_val, r_val))
+
+
+def test_distributed_array_slicing(ray_start_2_cpus, reload_modules):
+    x = ray.get(da.random.normal.remote([25, 49, 3], block_shape=[7, 10, 2]))
+    x_val = x.assemble()
+    slices = [
+        0, -1, (3, 4, 1), np.s_[5:20, :, 1], np.s_[::-3, 2:45:7],
+        np.s_[6:8, 10:20, 0:2], np.s_[10:5], np.s_[..., 0], np.s_[[1, 2, 3]]
+    ]
+    for sliced in slices:
+        assert_equal(x[sliced], x_val[sliced])
+    with pytest.raises(IndexError):
+        x[25]
+
+
+def test_distributed_array_lazy(ray_start_2_cpus, reload_modules):
+    x_id = da.random.normal.remote([25, 35], block_shape=[10, 10])
+    y_id = da.random.normal.remote([35, 25], block_shape=[10, 10])
+    x = da.lazy.array(x_id)
+    y = da.lazy.array(y_id)
+    x_val = ray.get(x_id).assemble()
+    y_val = ray.get(y_id).assemble()
+
+    # The chain is fused into one task per block.
+    z = da.lazy.add(da.lazy.subtract(x, da.lazy.transpose(y)), x)
+    assert z.value is None
+    z_dist = da.lazy.compute(z)
+    assert_almost_equal(z_dist.assemble(), 2 * x_val - y_val.T)
+    assert z.value is z_dist
+
+    # Shared subexpressions and dot operands are materialized once.
+    w = da.lazy.add(x, da.lazy.transpose(y))
+    p = da.lazy.dot(w, da.lazy.transpose(w))
+    q = da.lazy.subtract(p, da.lazy.dot(w, da.lazy.transpose(x)))
+    p_dist, q_dist = da.lazy.compute([p, q])
+    w_val = x_val + y_val.T
+    assert_almost_equal(p_dist.assemble(), np.dot(w_val, w_val.T))
+    assert_almost_equal(q_dist.assemble(),
+                        np.dot(w_val, w_val.T) - np.dot(w_val, x_val.T))
+    assert w.value is not None
+    # Computed expressions are reused.
+    assert da.lazy.compute(p) is p_dist
+    assert_almost_equal(
+        da.lazy.compute(da.lazy.add(z, z)).assemble(),
+        2 * (2 * x_val - y_val.T))
+
+    with pytest.raises(Exception):
+        da.lazy.add(x, y)
+    with pytest.raises(Exception):
+        da.lazy.dot(x, x)
+
+
 @pytest.mark.parametrize(
     "ray_start_cluster_2_nodes",
     [{
@@ -135,11 +220,15 @@ def test_distributed_array_methods(ray_start_cluster_2_nodes, reload_modules):
         ray.get(da.assemble.remote(x)), ray.get(da.assemble.remote(z)))
     assert_equal(ray.get(y), ray.get(w))
 
+    # Use small blocks so that the linear algebra routines below operate on
+    # several blocks rather than on a single default-sized block.
+    block_shape = [da.BLOCK_SIZE, da.BLOCK_SIZE]
+
     # test da.tsqr
     for shape in [[123, da.BLOCK_SIZE], [7, da.BLOCK_SIZE],
                   [da.BLOCK_SIZE, da.BLOCK_SIZE], [da.BLOCK_SIZE, 7],
                   [10 * da.BLOCK_SIZE, da.BLOCK_SIZE]]:
-        x = da.random.normal.remote(shape)
+        x = da.random.normal.remote(shape, block_shape=block_shape)
         K = min(shape)
         q, r = da.linalg.tsqr.remote(x)
         x_val = ray.get(da.assemble.remote(x))
@@ -157,7 +246,8 @@ def test_distributed_array_methods(ray_start_cluster_2_nodes, reload_modules):
         assert d1 >= d2
         m = ra.random.normal.remote([d1, d2])
         q, r = ra.linalg.qr.remote(m)
-        l, u, s = da.linalg.modified_lu.remote(da.numpy_to_dist.remote(q))
+        l, u, s = da.linalg.modified_lu.remote(
+            da.numpy_to_dist.remote(q, block_shape))
         q_val = ray.get(q)
         ray.get(r)
         l_val = ray.get(da.assemble.remote(l))
@@ -180,7 +270,7 @@ def test_distributed_array_methods(ray_start_cluster_2_nodes, reload_modules):
     def test_dist_tsqr_hr(d1, d2):
         print("testing dist_tsqr_hr with d1 = " + str(d1) + ", d2 = " +
               str(d2))
-        a = da.random.normal.remote([d1, d2])
+        a = da.random.normal.remote([d1, d2], block_shape=block_shape)
         y, t, y_top, r = da.linalg.tsqr_hr.remote(a)
         a_val = ray.get(da.assemble.remote(a))
         y_val = ray.get(da.assemble.remote(y))
@@ -202,7 +292,7 @@ def test_distributed_array_methods(ray_start_cluster_2_nodes, reload_modules):
 
     def test_dist_qr(d1, d2):
         print("testing qr with d1 = {}, and d2 = {}.".format(d1, d2))
-        a = da.random.normal.remote([d1, d2])
+        a = da.random.normal.remote([d1, d2], block_shape=block_shape)
         K = min(d1, d2)
         q, r = da.linalg.qr.remote(a)
         a_val = ray.get(da.assemble.remote(a))
@@ -177,6 +177,51 @@ def test_asyncio_actor_async_get(ray_start_regular_shared):
     assert ray.get(getter.plasma_get.remote([plasma_object])) == 2
 
 
+@pytest.mark.asyncio
+async def test_asyncio_get_wait_batched(ray_start_regular_shared, event_loop):
+    loop = event_loop
+    asyncio.set_event_loop(loop)
+
+    from ray.experimental.async_api import _async_init
+    await _async_init()
+
+    @ray.remote
+    def task(i, delay=0):
+        import time
+        time.sleep(delay)
+        return i
+
+    @ray.remote
+    def task_throws():
+        1 / 0
+
+    # Plasma, direct call and already ready objects in one get.
+    object_ids = [task.remote(i) for i in range(20)]
+    object_ids.append(ray.put(20))
+    object_ids.append(ray.put("a" * (200 * 1024)))
+    results = await ray.get_async(object_ids)
+    assert results[:21] == list(range(21))
+    assert results[21] == "a" * (200 * 1024)
+    with pytest.raises(ZeroDivisionError):
+        await ray.get_async([task.remote(0), task_throws.remote()])
+
+    slow = task.remote(0, delay=5)
+    fast = [task.remote(i) for i in range(3)]
+    ready, remaining = await ray.wait_async(
+        [slow] + fast, num_returns=3, timeout=4)
+    assert ready == fast
+    assert remaining == [slow]
+    ready, remaining = await ray.wait_async([slow], timeout=0.1)
+    assert ready == []
+    assert remaining == [slow]
+
+    object_ids = [task.remote(i, delay=i * 0.5) for i in reversed(range(3))]
+    completed = []
+    async for object_id, value in ray.as_completed(object_ids):
+        completed.append((object_id, value))
+    assert completed == list(zip(reversed(object_ids), range(3)))
+
+
 if __name__ == "__main__":
     import pytest
     sys.exit(pytest.main(["-v", __file__]))
@@ -576,46 +576,134 @@ class AutoscalingTest(unittest.TestCase):
             update_interval_s=0)
         assert len(self.provider.non_terminated_nodes({})) == 0
 
-        # update() should launch a wave of 5 nodes (max_launch_batch)
-        # Force this first wave to block.
+        # update() should launch a batch of 5 nodes (max_launch_batch) and a
+        # batch of 3 nodes, as 5 + 3 = 8 = max_concurrent_launches.
+        # Force both batches to block.
         rtc1 = self.provider.ready_to_create
         rtc1.clear()
         autoscaler.update()
-        # Synchronization: wait for launchy thread to be blocked on rtc1
+        # Synchronization: wait for launchy threads to be blocked on rtc1
         if hasattr(rtc1, "_cond"):  # Python 3.5
             waiters = rtc1._cond._waiters
         else:  # Python 2.7
             waiters = rtc1._Event__cond._Condition__waiters
-        self.waitFor(lambda: len(waiters) == 1)
-        assert autoscaler.num_launches_pending.value == 5
+        self.waitFor(lambda: len(waiters) == 2)
+        assert autoscaler.num_launches_pending.value == 8
         assert len(self.provider.non_terminated_nodes({})) == 0
 
-        # Call update() to launch a second wave of 3 nodes,
-        # as 5 + 3 = 8 = max_concurrent_launches.
-        # Make this wave complete immediately.
-        rtc2 = threading.Event()
-        self.provider.ready_to_create = rtc2
-        rtc2.set()
+        # No more launches while max_concurrent_launches are pending
         autoscaler.update()
-        self.waitForNodes(3)
-        assert autoscaler.num_launches_pending.value == 5
+        assert autoscaler.num_launches_pending.value == 8
 
-        # The first wave of 5 will now tragically fail
+        # Both batches will now tragically fail
         self.provider.fail_creates = True
         rtc1.set()
         self.waitFor(lambda: autoscaler.num_launches_pending.value == 0)
-        assert len(self.provider.non_terminated_nodes({})) == 3
+        assert len(self.provider.non_terminated_nodes({})) == 0
 
-        # Retry the first wave, allowing it to succeed this time
+        # Retry both batches, allowing them to succeed this time
         self.provider.fail_creates = False
         autoscaler.update()
         self.waitForNodes(8)
         assert autoscaler.num_launches_pending.value == 0
 
-        # Final wave of 2 nodes
+        # Final batch of 2 nodes
         autoscaler.update()
         self.waitForNodes(10)
         assert autoscaler.num_launches_pending.value == 0
+        assert autoscaler.phase_times.summary()["launch"][0] == 5
+
+    def testLaunchBatchesConcurrently(self):
+        config = SMALL_CLUSTER.copy()
+        config["min_workers"] = 10
+        config["max_workers"] = 10
+        config_path = self.write_config(config)
+        self.provider = MockProvider()
+        runner = MockProcessRunner()
+        autoscaler = StandardAutoscaler(
+            config_path,
+            LoadMetrics(),
+            max_launch_batch=2,
+            max_concurrent_launches=10,
+            max_failures=0,
+            process_runner=runner,
+            update_interval_s=0)
+        rtc = self.provider.ready_to_create
+        rtc.clear()
+        autoscaler.update()
+        # All 5 batches of 2 nodes are created at the same time.
+        self.waitFor(lambda: len(rtc._cond._waiters) == 5)
+        assert autoscaler.num_launches_pending.value == 10
+        rtc.set()
+        self.waitForNodes(10)
+        self.waitFor(lambda: autoscaler.num_launches_pending.value == 0)
+
+    def testMaxConcurrentUpdates(self):
+        config = SMALL_CLUSTER.copy()
+        config["min_workers"] = 5
+        config["max_workers"] = 5
+        config_path = self.write_config(config)
+        self.provider = MockProvider()
+        runner = MockProcessRunner()
+        autoscaler = StandardAutoscaler(
+            config_path,
+            LoadMetrics(),
+            max_concurrent_updates=2,
+            max_failures=0,
+            process_runner=runner,
+            update_interval_s=0)
+        autoscaler.update()
+        self.waitForNodes(5)
+        self.provider.finish_starting_nodes()
+        autoscaler.update()
+        assert len(autoscaler.updaters) == 2
+        for _ in range(10):
+            time.sleep(0.1)
+            autoscaler.update()
+            assert len(autoscaler.updaters) <= 2
+        self.waitForNodes(
+            5, tag_filters={TAG_RAY_NODE_STATUS: STATUS_UP_TO_DATE})
+        summary = autoscaler.phase_times.summary()
+        for phase in ["wait_for_ssh", "initialization", "setup", "ray_start"]:
+            assert summary[phase][0] == 5
+
+    def testSkipsSyncOfUnchangedFileMounts(self):
+        config = SMALL_CLUSTER.copy()
+        config["file_mounts"] = {"/remote/dir": self.tmpdir}
+        config_path = self.write_config(config)
+        self.provider = MockProvider()
+        runner = MockProcessRunner()
+        autoscaler = StandardAutoscaler(
+            config_path,
+            LoadMetrics(),
+            max_failures=0,
+            process_runner=runner,
+            update_interval_s=0)
+        autoscaler.update()
+        self.waitForNodes(2)
+        self.provider.finish_starting_nodes()
+        autoscaler.update()
+        self.waitForNodes(
+            2, tag_filters={TAG_RAY_NODE_STATUS: STATUS_UP_TO_DATE})
+        runner.assert_has_call("172.0.0.0", "rsync")
+        runner.assert_has_call("172.0.0.0", "mkdir -p /remote")
+
+        # Only change the commands, so the file mounts are not synced again.
+        for _ in range(5):
+            if autoscaler.updaters:
+                time.sleep(0.05)
+                autoscaler.update()
+        assert not autoscaler.updaters
+        runner.clear_history()
+        new_config = copy.deepcopy(config)
+        new_config["worker_setup_commands"] = ["cmdX"]
+        self.write_config(new_config)
+        autoscaler.update()
+        assert len(autoscaler.updaters) == 2
+        self.waitFor(lambda: not any(
+            updater.is_alive() for updater in autoscaler.updaters.values()))
+        runner.assert_has_call("172.0.0.0", "cmdX")
+        runner.assert_not_has_call("172.0.0.0", "rsync")
 
     def testUpdateThrottling(self):
         config_path = self.write_config(SMALL_CLUSTER)
@@ -911,6 +999,45 @@ class AutoscalingTest(unittest.TestCase):
         autoscaler.update()
         self.waitFor(lambda: len(runner.calls) > num_calls, num_retries=150)
 
+    def testRecoverUnhealthyWorkersMaxConcurrentUpdates(self):
+        config = SMALL_CLUSTER.copy()
+        config["min_workers"] = 3
+        config["max_workers"] = 3
+        config_path = self.write_config(config)
+        self.provider = MockProvider()
+        runner = MockProcessRunner()
+        lm = LoadMetrics()
+        autoscaler = StandardAutoscaler(
+            config_path,
+            lm,
+            max_concurrent_updates=2,
+            max_failures=0,
+            process_runner=runner,
+            update_interval_s=0)
+        autoscaler.update()
+        self.waitForNodes(3)
+        self.provider.finish_starting_nodes()
+        for _ in range(10):
+            time.sleep(0.1)
+            autoscaler.update()
+        self.waitForNodes(
+            3, tag_filters={TAG_RAY_NODE_STATUS: STATUS_UP_TO_DATE})
+        for _ in range(5):
+            if autoscaler.updaters:
+                time.sleep(0.05)
+                autoscaler.update()
+        assert not autoscaler.updaters
+
+        # Mark all nodes as unhealthy, only two of them are recovered at once
+        for ip in ["172.0.0.0", "172.0.0.1", "172.0.0.2"]:
+            lm.last_heartbeat_time_by_ip[ip] = 0
+        autoscaler.update()
+        assert len(autoscaler.updaters) == 2
+        for _ in range(10):
+            time.sleep(0.1)
+            autoscaler.update()
+            assert len(autoscaler.updaters) <= 2
+
     def testExternalNodeScaler(self):
         config = SMALL_CLUSTER.copy()
         config["provider"] = {
@@ -1,4 +1,5 @@
 import joblib
+import pytest
 import sys
 import time
 
@@ -36,6 +37,36 @@ def test_ray_backend(shutdown_only):
         assert type(joblib.parallel.get_active_backend()[0]) == RayBackend
 
 
+def _first_plus(data, i):
+    return data[0] + i
+
+
+def _check_positive(i):
+    if i < 0:
+        raise ValueError("negative")
+    return i
+
+
+def test_ray_backend_batches(shutdown_only):
+    register_ray()
+    # Large enough to be put in the object store once.
+    data = np.zeros(100000)
+    with joblib.parallel_backend("ray"):
+        with joblib.Parallel() as parallel:
+            results = parallel(
+                joblib.delayed(_first_plus)(data, i) for i in range(1000))
+            # The calls are fast, so they are batched automatically.
+            assert parallel._backend.compute_batch_size() > 1
+        with pytest.raises(ValueError):
+            joblib.Parallel(n_jobs=2)(
+                joblib.delayed(_check_positive)(i) for i in range(-1, 10))
+        results_with_timeout = joblib.Parallel(
+            n_jobs=2,
+            timeout=60)(joblib.delayed(_check_positive)(i) for i in range(10))
+    assert results == list(range(1000))
+    assert results_with_timeout == list(range(10))
+
+
 def test_svm_single_node(shutdown_only):
     digits = load_digits()
     param_space = {
@@ -163,5 +194,4 @@ def test_cross_validation(shutdown_only):
 
 
 if __name__ == "__main__":
-    import pytest
     sys.exit(pytest.main(["-v", __file__]))
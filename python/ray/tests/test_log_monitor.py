@@ -0,0 +1,159 @@
+import json
+import os
+
+import pytest
+
+import ray
+import ray.ray_constants as ray_constants
+from ray.log_monitor import LogMonitor, LogRateLimiter
+
+
+class FakeRedisPipeline:
+    def __init__(self, published):
+        self.published = published
+
+    def publish(self, channel, message):
+        self.published.append((channel, message))
+
+    def execute(self):
+        pass
+
+
+class FakeRedisClient:
+    def __init__(self):
+        self.published = []
+
+    def pipeline(self, transaction=True):
+        return FakeRedisPipeline(self.published)
+
+
+@pytest.fixture
+def log_monitor(tmp_path, monkeypatch):
+    redis_client = FakeRedisClient()
+    monkeypatch.setattr(ray.services, "create_redis_client",
+                        lambda *args, **kwargs: redis_client)
+    return LogMonitor(str(tmp_path), "fake_address", use_inotify=False)
+
+
+def published_updates(log_monitor):
+    updates = []
+    for channel, message in log_monitor.redis_client.published:
+        assert channel == ray.gcs_utils.LOG_FILE_CHANNEL
+        updates.extend(json.loads(message))
+    return updates
+
+
+def run_once(log_monitor):
+    log_monitor.update_log_filenames()
+    log_monitor.open_closed_files()
+    return log_monitor.check_log_files_and_publish_updates()
+
+
+def test_log_monitor_batches_files(log_monitor):
+    for pid in [1, 2]:
+        path = os.path.join(log_monitor.logs_dir, "worker-{}.out".format(pid))
+        with open(path, "w") as f:
+            f.write("Ray worker pid: {}\nhello\nworld\n".format(pid))
+
+    assert run_once(log_monitor)
+    assert len(log_monitor.redis_client.published) == 1
+    updates = published_updates(log_monitor)
+    assert sorted(update["pid"] for update in updates) == [1, 2]
+    for update in updates:
+        assert update["lines"] == ["hello", "world"]
+
+    log_monitor.redis_client.published.clear()
+    assert not run_once(log_monitor)
+    assert log_monitor.redis_client.published == []
+
+
+def test_log_monitor_partial_lines(log_monitor, monkeypatch):
+    monkeypatch.setattr(ray_constants, "LOG_MONITOR_READ_CHUNK_BYTES", 8)
+    path = os.path.join(log_monitor.logs_dir, "worker-1.out")
+    with open(path, "w") as f:
+        f.write("Ray worker pid: 1\nabc\ndefghij\nklm")
+
+    while run_once(log_monitor):
+        pass
+    lines = [
+        line for update in published_updates(log_monitor)
+        for line in update["lines"]
+    ]
+    assert lines == ["abc", "defghij", "klm"]
+
+
+def test_log_monitor_reports_drops_of_quiet_worker(log_monitor, monkeypatch):
+    monkeypatch.setattr(ray_constants, "LOG_MONITOR_MAX_LINES_PER_SECOND", 10)
+    path = os.path.join(log_monitor.logs_dir, "worker-1.out")
+    with open(path, "w") as f:
+        f.write("Ray worker pid: 1\n" + "x\n" * 15)
+    run_once(log_monitor)
+    lines = published_updates(log_monitor)[0]["lines"]
+    assert lines[:10] == ["x"] * 10
+    assert lines[10].startswith("[Ray] Dropped 5 lines")
+
+    # The next drops are reported after the report interval, even if the
+    # worker doesn't print anything else.
+    log_monitor.redis_client.published.clear()
+    with open(path, "a") as f:
+        f.write("y\n" * 15)
+    run_once(log_monitor)
+    assert not any(
+        line.startswith("[Ray]") for update in published_updates(log_monitor)
+        for line in update["lines"])
+    num_lines_dropped = log_monitor.rate_limiters[1].num_lines_dropped - 5
+    assert num_lines_dropped > 0
+
+    log_monitor.redis_client.published.clear()
+    log_monitor.rate_limiters[1].last_report_time -= 1
+    # As with inotify, the file is not read again if it didn't change.
+    monkeypatch.setattr(log_monitor, "_may_have_new_lines",
+                        lambda file_info: False)
+    run_once(log_monitor)
+    lines = published_updates(log_monitor)[0]["lines"]
+    assert len(lines) == 1
+    assert lines[0].startswith(
+        "[Ray] Dropped {} lines".format(num_lines_dropped))
+
+
+def test_log_monitor_removes_rate_limiters_of_dead_workers(
+        log_monitor, monkeypatch):
+    os.makedirs(os.path.join(log_monitor.logs_dir, "old"))
+    for name, contents in [("worker-1.out", "Ray worker pid: 1\nhello\n"),
+                           ("worker-unknown.out", "hello\n")]:
+        with open(os.path.join(log_monitor.logs_dir, name), "w") as f:
+            f.write(contents)
+    run_once(log_monitor)
+    assert len(log_monitor.rate_limiters) == 2
+
+    def kill(pid, signal):
+        raise OSError("No such process")
+
+    monkeypatch.setattr(os, "kill", kill)
+    log_monitor.close_all_files()
+    assert log_monitor.rate_limiters == {}
+
+
+def test_log_rate_limiter():
+    rate_limiter = LogRateLimiter(
+        max_lines_per_second=10, max_bytes_per_second=1000)
+    now = rate_limiter.last_refill_time
+    lines = ["x" * 10] * 15
+    assert rate_limiter.admit(lines, now=now) == lines[:10]
+    assert rate_limiter.num_lines_dropped == 5
+    assert rate_limiter.num_bytes_dropped == 50
+    assert rate_limiter.pop_unreported_drops(now=now) == 5
+    assert rate_limiter.pop_unreported_drops(now=now) == 0
+
+    # Half a second refills half of the line budget.
+    assert rate_limiter.admit(lines, now=now + 0.5) == lines[:5]
+
+    rate_limiter = LogRateLimiter(
+        max_lines_per_second=0, max_bytes_per_second=25)
+    now = rate_limiter.last_refill_time
+    assert rate_limiter.admit(lines, now=now) == lines[:2]
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(pytest.main(["-v", __file__]))
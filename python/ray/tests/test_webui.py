@@ -44,6 +44,22 @@ def test_get_webui(shutdown_only):
     assert isinstance(node_info["timestamp"], float)
 
 
+def test_dashboard_bounded_log():
+    from ray.dashboard.dashboard import BoundedLog
+
+    log = BoundedLog(max_entries=3, max_bytes=10)
+    log.extend(["a", "b", "c", "d"])
+    assert list(log) == ["b", "c", "d"]
+    assert log.num_evicted == 1
+    log.append("x" * 8)
+    assert list(log) == ["d", "x" * 8]
+    assert log.num_bytes == 9
+    # A single entry larger than the byte bound is still kept.
+    log.append("y" * 20)
+    assert list(log) == ["y" * 20]
+    assert len(log) == 1
+
+
 if __name__ == "__main__":
     import pytest
     import sys
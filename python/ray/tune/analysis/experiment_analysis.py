@@ -1,3 +1,4 @@
+import io
 import json
 import logging
 import os
@@ -8,6 +9,7 @@ except ImportError:
     pd = None
 
 from ray.tune.error import TuneError
+from ray.tune.experiment_journal import load_experiment_state
 from ray.tune.result import EXPR_PROGRESS_FILE, EXPR_PARAM_FILE,\
     CONFIG_PREFIX, TRAINING_ITERATION
 from ray.tune.trial import Trial
@@ -16,6 +18,74 @@ from ray.tune.trainable import TrainableUtil
 logger = logging.getLogger(__name__)
 
 
+class TrialProgressReader:
+    """Incrementally reads the progress file of a trial.
+
+    The reader remembers how far it has read the file, so every call to
+    `update` only parses the rows appended since the previous call. The parsed
+    rows are kept as a list of dataframe chunks that are only concatenated
+    when the full dataframe is requested.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._offset = 0
+        self._header = None
+        self._chunks = []
+        self._num_rows = 0
+
+    def update(self):
+        """Parses the rows appended to the file since the last update.
+
+        Returns:
+            bool: True if new rows were read.
+        """
+        size = os.path.getsize(self.path)
+        if size < self._offset:
+            # The file was truncated or replaced, start over.
+            self.__init__(self.path)
+        if size == self._offset:
+            return False
+
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read(size - self._offset)
+        # Only consume complete lines, the rest is read in the next update.
+        end = data.rfind(b"\n") + 1
+        data = data[:end]
+        header = self._header
+        if header is None:
+            header_end = data.find(b"\n") + 1
+            if header_end == 0:
+                return False
+            header, data = data[:header_end], data[header_end:]
+        if len(data) > 0:
+            chunk = pd.read_csv(io.BytesIO(header + data))
+            if self._num_rows > 0:
+                chunk.index += self._num_rows
+            self._chunks.append(chunk)
+            self._num_rows += len(chunk)
+        self._header = header
+        self._offset += end
+        return len(data) > 0
+
+    @property
+    def num_rows(self):
+        return self._num_rows
+
+    def dataframe(self):
+        """Returns all rows read so far as a single dataframe."""
+        if len(self._chunks) > 1:
+            self._chunks = [pd.concat(self._chunks)]
+        elif not self._chunks:
+            return pd.DataFrame()
+        return self._chunks[0]
+
+    def last_row(self):
+        """Returns the last row read so far as a dict."""
+        return self._chunks[-1].iloc[-1].to_dict()
+
+
 class Analysis:
     """Analyze all results from a directory of experiments.
 
@@ -29,7 +99,8 @@ class Analysis:
                 "{} is not a valid directory.".format(experiment_dir))
         self._experiment_dir = experiment_dir
         self._configs = {}
-        self._trial_dataframes = {}
+        self._config_mtimes = {}
+        self._progress_readers = {}
 
         if not pd:
             logger.warning(
@@ -84,11 +155,18 @@ class Analysis:
             return df.iloc[df[metric].idxmin()].logdir
 
     def fetch_trial_dataframes(self):
+        """Reads the results of the trials.
+
+        This can be called repeatedly to pick up new results. Only the rows
+        appended to each progress file since the previous call are parsed.
+        """
         fail_count = 0
         for path in self._get_trial_paths():
-            try:
-                self.trial_dataframes[path] = pd.read_csv(
+            if path not in self._progress_readers:
+                self._progress_readers[path] = TrialProgressReader(
                     os.path.join(path, EXPR_PROGRESS_FILE))
+            try:
+                self._progress_readers[path].update()
             except Exception:
                 fail_count += 1
 
@@ -110,12 +188,18 @@ class Analysis:
         fail_count = 0
         for path in self._get_trial_paths():
             try:
-                with open(os.path.join(path, EXPR_PARAM_FILE)) as f:
+                config_path = os.path.join(path, EXPR_PARAM_FILE)
+                # Only reread configs that changed since they were last read.
+                mtime = os.path.getmtime(config_path)
+                if self._config_mtimes.get(path) == (mtime, prefix):
+                    continue
+                with open(config_path) as f:
                     config = json.load(f)
                     if prefix:
                         for k in list(config):
                             config[CONFIG_PREFIX + k] = config.pop(k)
                     self._configs[path] = config
+                    self._config_mtimes[path] = (mtime, prefix)
             except Exception:
                 fail_count += 1
 
@@ -154,14 +238,19 @@ class Analysis:
     def _retrieve_rows(self, metric=None, mode=None):
         assert mode is None or mode in ["max", "min"]
         rows = {}
-        for path, df in self.trial_dataframes.items():
+        for path, reader in self._progress_readers.items():
+            if reader.num_rows == 0:
+                continue
+            if mode is None:
+                # Avoid assembling the whole dataframe of the trial.
+                rows[path] = reader.last_row()
+                continue
+            df = reader.dataframe()
             if mode == "max":
                 idx = df[metric].idxmax()
-            elif mode == "min":
-                idx = df[metric].idxmin()
             else:
-                idx = -1
-            rows[path] = df.iloc[idx].to_dict()
+                idx = df[metric].idxmin()
+            rows[path] = df.loc[idx].to_dict()
 
         return rows
 
@@ -179,7 +268,11 @@ class Analysis:
     @property
     def trial_dataframes(self):
         """List of all dataframes of the trials."""
-        return self._trial_dataframes
+        return {
+            path: reader.dataframe()
+            for path, reader in self._progress_readers.items()
+            if reader.num_rows > 0
+        }
 
 
 class ExperimentAnalysis(Analysis):
@@ -201,9 +294,8 @@ class ExperimentAnalysis(Analysis):
     """
 
     def __init__(self, experiment_checkpoint_path, trials=None):
-        with open(experiment_checkpoint_path) as f:
-            _experiment_state = json.load(f)
-            self._experiment_state = _experiment_state
+        _experiment_state = load_experiment_state(experiment_checkpoint_path)
+        self._experiment_state = _experiment_state
 
         if "checkpoints" not in _experiment_state:
             raise TuneError("Experiment state invalid; no checkpoints found.")
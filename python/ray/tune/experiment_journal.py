@@ -0,0 +1,111 @@
+import json
+import logging
+import os
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_SUFFIX = ".journal"
+
+
+def get_journal_path(checkpoint_path):
+    """Returns the path of the journal belonging to an experiment checkpoint.
+
+    Args:
+        checkpoint_path (str): Path to the experiment_state json file.
+    """
+    return os.path.splitext(checkpoint_path)[0] + JOURNAL_SUFFIX
+
+
+class ExperimentJournal:
+    """Append-only journal of the changes to an experiment checkpoint.
+
+    Between full experiment checkpoints, the TrialRunner only appends the
+    metadata of the trials that changed and its own state to the journal, so
+    the cost of a checkpoint does not grow with the number of trials. Every
+    entry has a sequence number. A full checkpoint records the last sequence
+    number it includes, so that entries already contained in it are skipped
+    when the journal is replayed.
+
+    Args:
+        path (str): Path of the journal file. Existing contents are
+            discarded.
+        start_seq (int): The sequence number of the last entry contained in
+            the corresponding full checkpoint.
+        encoder_cls (json.JSONEncoder): Encoder used to serialize entries.
+    """
+
+    def __init__(self, path, start_seq=0, encoder_cls=None):
+        self.path = path
+        self.seq = start_seq
+        self.num_bytes = 0
+        self._encoder_cls = encoder_cls
+        self._file = open(path, "w")
+
+    def _entry(self, **fields):
+        self.seq += 1
+        return json.dumps(dict(seq=self.seq, **fields), cls=self._encoder_cls)
+
+    def append(self, trial_checkpoints, runner_data, stats):
+        """Appends the updated trial metadata and the runner state.
+
+        Args:
+            trial_checkpoints (list): Metadata of the trials that changed
+                since the last append.
+            runner_data (dict): State of the TrialRunner.
+            stats (dict): Experiment statistics.
+        """
+        lines = [self._entry(trial=state) for state in trial_checkpoints]
+        lines.append(self._entry(runner_data=runner_data, stats=stats))
+        data = "\n".join(lines) + "\n"
+        self._file.write(data)
+        self._file.flush()
+        self.num_bytes += len(data)
+
+    def close(self):
+        self._file.close()
+
+
+def load_experiment_state(checkpoint_path, decoder_cls=None):
+    """Loads an experiment checkpoint and replays its journal on top.
+
+    Args:
+        checkpoint_path (str): Path to the experiment_state json file.
+        decoder_cls (json.JSONDecoder): Decoder used to deserialize the
+            checkpoint and the journal entries.
+
+    Returns:
+        Dict with the same format as the experiment checkpoint, up to date
+            with the last complete journal entry. Its journal_seq is the
+            sequence number of that entry.
+    """
+    with open(checkpoint_path, "r") as f:
+        state = json.load(f, cls=decoder_cls)
+
+    journal_path = get_journal_path(checkpoint_path)
+    if not os.path.exists(journal_path):
+        return state
+
+    snapshot_seq = state.get("journal_seq", 0)
+    checkpoints = OrderedDict((trial_state["trial_id"], trial_state)
+                              for trial_state in state["checkpoints"])
+    with open(journal_path, "r") as f:
+        for line in f:
+            try:
+                entry = json.loads(line, cls=decoder_cls)
+            except ValueError:
+                # The runner may have been interrupted while appending.
+                logger.warning(
+                    "Ignoring incomplete entry at the end of "
+                    "experiment journal %s.", journal_path)
+                break
+            if entry["seq"] <= snapshot_seq:
+                continue
+            state["journal_seq"] = entry["seq"]
+            if "trial" in entry:
+                checkpoints[entry["trial"]["trial_id"]] = entry["trial"]
+            else:
+                state["runner_data"] = entry["runner_data"]
+                state["stats"] = entry["stats"]
+    state["checkpoints"] = list(checkpoints.values())
+    return state
@@ -241,6 +241,14 @@ class FunctionRunner(Trainable):
         self._last_result = result
         return result
 
+    def reset(self, new_config, logger_creator=None, restoring=False):
+        if self._runner.is_alive():
+            # The function of the previous trial cannot be interrupted, so
+            # the actor cannot be reused while it is still running.
+            return False
+        return super(FunctionRunner, self).reset(
+            new_config, logger_creator=logger_creator, restoring=restoring)
+
     def _stop(self):
         # If everything stayed in synch properly, this should never happen.
         if not self._results_queue.empty():
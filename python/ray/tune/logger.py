@@ -4,6 +4,10 @@ import logging
 import os
 import yaml
 import numbers
+import queue
+import threading
+import time
+import weakref
 import numpy as np
 
 import ray.cloudpickle as cloudpickle
@@ -20,6 +24,17 @@ logger = logging.getLogger(__name__)
 tf = None
 VALID_SUMMARY_TYPES = [int, float, np.float32, np.float64, np.int32]
 
+# Results are written through buffered files that are flushed at most this
+# often, or when the buffer is full. Loggers run by AsyncLogger are also
+# flushed after this interval if no new results arrive.
+LOGGER_FLUSH_INTERVAL_S = float(
+    os.environ.get("TUNE_LOGGER_FLUSH_INTERVAL_S", 5))
+LOGGER_BUFFER_BYTES = 64 * 1024
+# Whether the loggers of trials run on a background thread of the driver.
+ASYNC_LOGGING = bool(int(os.environ.get("TUNE_ASYNC_LOGGING", 1)))
+# Maximum number of queued logger calls before on_result blocks.
+ASYNC_LOGGER_MAX_QUEUE_SIZE = 10000
+
 
 class Logger:
     """Logging interface for ray.tune.
@@ -63,6 +78,14 @@ class Logger:
 
         pass
 
+    def flush_if_needed(self):
+        """Flushes writes that were buffered for LOGGER_FLUSH_INTERVAL_S.
+
+        This is called periodically for loggers run by AsyncLogger.
+        """
+
+        pass
+
 
 class NoopLogger(Logger):
     def on_result(self, result):
@@ -108,18 +131,28 @@ class JsonLogger(Logger):
     def _init(self):
         self.update_config(self.config)
         local_file = os.path.join(self.logdir, EXPR_RESULT_FILE)
-        self.local_out = open(local_file, "a")
+        self.local_out = open(local_file, "a", buffering=LOGGER_BUFFER_BYTES)
+        self._last_flush_time = time.time()
+        self._unflushed = False
 
     def on_result(self, result):
         json.dump(result, self, cls=_SafeFallbackEncoder)
         self.write("\n")
-        self.local_out.flush()
+        self._unflushed = True
+        self.flush_if_needed()
 
     def write(self, b):
         self.local_out.write(b)
 
     def flush(self):
         self.local_out.flush()
+        self._last_flush_time = time.time()
+        self._unflushed = False
+
+    def flush_if_needed(self):
+        if self._unflushed and (time.time() - self._last_flush_time >=
+                                LOGGER_FLUSH_INTERVAL_S):
+            self.flush()
 
     def close(self):
         self.local_out.close()
@@ -153,8 +186,10 @@ class CSVLogger(Logger):
         """CSV outputted with Headers as first set of results."""
         progress_file = os.path.join(self.logdir, EXPR_PROGRESS_FILE)
         self._continuing = os.path.exists(progress_file)
-        self._file = open(progress_file, "a")
+        self._file = open(progress_file, "a", buffering=LOGGER_BUFFER_BYTES)
         self._csv_out = None
+        self._last_flush_time = time.time()
+        self._unflushed = False
 
     def on_result(self, result):
         tmp = result.copy()
@@ -168,10 +203,18 @@ class CSVLogger(Logger):
         self._csv_out.writerow(
             {k: v
              for k, v in result.items() if k in self._csv_out.fieldnames})
-        self._file.flush()
+        self._unflushed = True
+        self.flush_if_needed()
 
     def flush(self):
         self._file.flush()
+        self._last_flush_time = time.time()
+        self._unflushed = False
+
+    def flush_if_needed(self):
+        if self._unflushed and (time.time() - self._last_flush_time >=
+                                LOGGER_FLUSH_INTERVAL_S):
+            self.flush()
 
     def close(self):
         self._file.close()
@@ -230,7 +273,6 @@ class TBXLogger(Logger):
                                              type(self).__name__))
 
         self.last_result = valid_result
-        self._file_writer.flush()
 
     def flush(self):
         if self._file_writer is not None:
@@ -266,6 +308,116 @@ class TBXLogger(Logger):
 DEFAULT_LOGGERS = (JsonLogger, CSVLogger, TBXLogger)
 
 
+class _LoggerThread(threading.Thread):
+    """Background thread running the logger calls queued by AsyncLoggers.
+
+    All AsyncLoggers of a process share one thread, so that the calls to a
+    logger run in the order they were made. The thread also flushes the
+    loggers periodically, so that the results of trials that are slow or
+    paused are not kept in the buffers.
+    """
+
+    def __init__(self):
+        super(_LoggerThread, self).__init__(name="TuneLoggerThread")
+        self.daemon = True
+        self._queue = queue.Queue(maxsize=ASYNC_LOGGER_MAX_QUEUE_SIZE)
+        # Loggers to flush periodically. Only accessed by this thread.
+        self._loggers = weakref.WeakSet()
+        self._last_flush_check = time.time()
+
+    def submit(self, fn, *args, wait=False):
+        """Queues a call to fn, optionally waiting until it has run."""
+        done = threading.Event() if wait else None
+        self._queue.put((fn, args, done))
+        if done:
+            done.wait()
+
+    def add_logger(self, wrapped):
+        """Flushes the logger periodically until remove_logger is called."""
+        self.submit(self._loggers.add, wrapped)
+
+    def remove_logger(self, wrapped):
+        self.submit(self._loggers.discard, wrapped)
+
+    def run(self):
+        while True:
+            timeout = max(
+                0.0,
+                self._last_flush_check + LOGGER_FLUSH_INTERVAL_S - time.time())
+            try:
+                fn, args, done = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                pass
+            else:
+                try:
+                    fn(*args)
+                except Exception:
+                    logger.exception("Error running Tune logger call %s.", fn)
+                finally:
+                    if done:
+                        done.set()
+            if time.time() - self._last_flush_check >= LOGGER_FLUSH_INTERVAL_S:
+                self._flush_loggers()
+
+    def _flush_loggers(self):
+        self._last_flush_check = time.time()
+        for wrapped in list(self._loggers):
+            try:
+                wrapped.flush_if_needed()
+            except Exception:
+                logger.exception("Error flushing Tune logger %s.", wrapped)
+
+
+_logger_thread = None
+_logger_thread_lock = threading.Lock()
+
+
+def _get_logger_thread():
+    global _logger_thread
+    with _logger_thread_lock:
+        # The thread does not survive a fork.
+        if _logger_thread is None or not _logger_thread.is_alive():
+            _logger_thread = _LoggerThread()
+            _logger_thread.start()
+        return _logger_thread
+
+
+class AsyncLogger(Logger):
+    """Runs the calls to a logger on a background thread.
+
+    Results and config updates are queued and written in order by a thread
+    shared by all AsyncLoggers, so that slow writes (e.g. on network file
+    systems) do not block the caller. flush() and close() block until all
+    previously queued calls have been written. Results that were buffered by
+    the logger are flushed after LOGGER_FLUSH_INTERVAL_S, even if no new
+    results arrive.
+
+    Arguments:
+        wrapped (Logger): Logger to run in the background.
+    """
+
+    def __init__(self, wrapped):
+        self._wrapped = wrapped
+        self._thread = _get_logger_thread()
+        self._thread.add_logger(wrapped)
+        super(AsyncLogger, self).__init__(wrapped.config, wrapped.logdir,
+                                          wrapped.trial)
+
+    def on_result(self, result):
+        self._thread.submit(self._wrapped.on_result, result.copy())
+
+    def update_config(self, config):
+        self.config = config
+        self._thread.submit(self._wrapped.update_config, config)
+
+    def flush(self):
+        self._thread.submit(self._wrapped.flush, wait=True)
+
+    def close(self):
+        self._thread.remove_logger(self._wrapped)
+        self._thread.submit(self._wrapped.close, wait=True)
+
+
 class UnifiedLogger(Logger):
     """Unified result logger for TensorBoard, rllab/viskit, plain json.
 
@@ -276,6 +428,8 @@ class UnifiedLogger(Logger):
             and JSON loggers.
         sync_function (func|str): Optional function for syncer to run.
             See ray/python/ray/tune/syncer.py
+        async_logging (bool): Whether to run the loggers on a background
+            thread. See AsyncLogger.
     """
 
     def __init__(self,
@@ -283,7 +437,8 @@ class UnifiedLogger(Logger):
                  logdir,
                  trial=None,
                  loggers=None,
-                 sync_function=None):
+                 sync_function=None,
+                 async_logging=False):
         if loggers is None:
             self._logger_cls_list = DEFAULT_LOGGERS
         else:
@@ -294,6 +449,7 @@ class UnifiedLogger(Logger):
                     "JsonLogger not provided. The ExperimentAnalysis tool is "
                     "disabled.")
         self._sync_function = sync_function
+        self._async_logging = async_logging
         self._log_syncer = None
 
         super(UnifiedLogger, self).__init__(config, logdir, trial)
@@ -302,10 +458,14 @@ class UnifiedLogger(Logger):
         self._loggers = []
         for cls in self._logger_cls_list:
             try:
-                self._loggers.append(cls(self.config, self.logdir, self.trial))
+                _logger = cls(self.config, self.logdir, self.trial)
             except Exception as exc:
                 logger.warning("Could not instantiate %s: %s.", cls.__name__,
                                str(exc))
+                continue
+            if self._async_logging:
+                _logger = AsyncLogger(_logger)
+            self._loggers.append(_logger)
         self._log_syncer = get_node_syncer(
             self.logdir,
             remote_dir=self.logdir,
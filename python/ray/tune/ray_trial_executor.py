@@ -14,9 +14,9 @@ from ray.resource_spec import ResourceSpec
 from ray.tune.durable_trainable import DurableTrainable
 from ray.tune.error import AbortTrialExecution, TuneError
 from ray.tune.logger import NoopLogger
-from ray.tune.result import TRIAL_INFO
+from ray.tune.result import TIME_THIS_ITER_S, TRIAL_INFO
 from ray.tune.resources import Resources
-from ray.tune.trainable import TrainableUtil
+from ray.tune.trainable import Trainable, TrainableUtil
 from ray.tune.trial import Trial, Checkpoint, Location, TrialInfo
 from ray.tune.trial_executor import TrialExecutor
 from ray.tune.utils import warn_if_slow
@@ -88,14 +88,96 @@ class _TrialCleanup:
                 del self._cleanup_map[done]
 
 
+class _ActorPool:
+    """Idle trainable actors that are kept warm for the next trials.
+
+    An actor can only run trials of the same trainable that request the same
+    resources, so idle actors are keyed by trainable and resource shape. The
+    pool also tracks how long new actors take to start, in order to estimate
+    the startup time saved by reusing actors.
+    """
+
+    def __init__(self):
+        self._idle = {}
+        self._startup_times = {}
+        self.num_reused = 0
+        self.startup_time_saved = 0.0
+
+    @staticmethod
+    def key(trial):
+        resources = trial.resources
+        return (trial.trainable_name, resources.cpu, resources.gpu,
+                resources.memory, resources.object_store_memory,
+                tuple(sorted(resources.custom_resources.items())))
+
+    def __len__(self):
+        return sum(len(actors) for actors in self._idle.values())
+
+    def put(self, trial, actor):
+        """Adds the idle actor that last ran the given trial."""
+        self._idle.setdefault(self.key(trial), []).append((trial, actor))
+
+    def pop(self, trial):
+        """Returns an idle actor that can run the trial, or None."""
+        actors = self._idle.get(self.key(trial))
+        if not actors:
+            return None
+        return actors.pop()[1]
+
+    def pop_all(self):
+        """Removes all idle actors and returns them as (trial, actor)."""
+        idle = [item for actors in self._idle.values() for item in actors]
+        self._idle.clear()
+        return idle
+
+    def record_startup(self, trial, startup_time):
+        """Records the time a new actor took to start for the trial."""
+        key = self.key(trial)
+        count, total = self._startup_times.get(key, (0, 0.0))
+        self._startup_times[key] = (count + 1, total + startup_time)
+
+    def record_reuse(self, trial, reset_time):
+        """Records that the trial reused an idle actor."""
+        self.num_reused += 1
+        count, total = self._startup_times.get(self.key(trial), (0, 0.0))
+        if count:
+            self.startup_time_saved += max(0.0, total / count - reset_time)
+
+
+def _is_reusable(trainable_cls):
+    """Returns whether actors of the trainable can run other trials.
+
+    See ``Trainable.reset`` for when a trainable can be reset.
+    """
+    if issubclass(trainable_cls, DurableTrainable):
+        # The remote checkpoint dir is passed to the constructor.
+        return False
+    return (trainable_cls.__init__ is Trainable.__init__
+            or trainable_cls.reset_config is not Trainable.reset_config)
+
+
 class RayTrialExecutor(TrialExecutor):
-    """An implementation of TrialExecutor based on Ray."""
+    """An implementation of TrialExecutor based on Ray.
+
+    Args:
+        queue_trials (bool): Whether to queue trials when the cluster does
+            not currently have enough resources to launch one.
+        reuse_actors (bool): Whether to keep the actors of stopped trials
+            in a pool and reuse them for new trials of the same trainable
+            and resource shape. See ``Trainable.reset``.
+        ray_auto_init (bool): Whether to initialize Ray if necessary.
+        refresh_period (float): Minimum time between resource refreshes.
+        prestart_actors (bool): Whether to start an idle actor ahead of
+            demand when resources are left free, so that the next trial can
+            reuse it. Only applies if ``reuse_actors`` is True.
+    """
 
     def __init__(self,
                  queue_trials=False,
                  reuse_actors=False,
                  ray_auto_init=False,
-                 refresh_period=RESOURCE_REFRESH_PERIOD):
+                 refresh_period=RESOURCE_REFRESH_PERIOD,
+                 prestart_actors=False):
         super(RayTrialExecutor, self).__init__(queue_trials)
         # Check for if we are launching a trial without resources in kick off
         # autoscaler.
@@ -108,7 +190,10 @@ class RayTrialExecutor(TrialExecutor):
 
         self._trial_cleanup = _TrialCleanup()
         self._reuse_actors = reuse_actors
-        self._cached_actor = None
+        self._prestart_actors = prestart_actors
+        self._actor_pool = _ActorPool()
+        self._actor_start_times = {}
+        self._last_started_trial = None
 
         self._avail_resources = Resources(cpu=0, gpu=0)
         self._committed_resources = Resources(cpu=0, gpu=0)
@@ -125,40 +210,12 @@ class RayTrialExecutor(TrialExecutor):
         if ray.is_initialized():
             self._update_avail_resources()
 
-    def _setup_remote_runner(self, trial, reuse_allowed):
+    def _setup_remote_runner(self, trial, restoring):
         trial.init_logger()
         # We checkpoint metadata here to try mitigating logdir duplication
         self.try_checkpoint_metadata(trial)
         remote_logdir = trial.logdir
 
-        if (self._reuse_actors and reuse_allowed
-                and self._cached_actor is not None):
-            logger.debug("Trial %s: Reusing cached runner %s", trial,
-                         self._cached_actor)
-            existing_runner = self._cached_actor
-            self._cached_actor = None
-            trial.set_runner(existing_runner)
-            if not self.reset_trial(trial, trial.config, trial.experiment_tag):
-                raise AbortTrialExecution(
-                    "Trainable runner reuse requires reset_config() to be "
-                    "implemented and return True.")
-            return existing_runner
-
-        if self._cached_actor:
-            logger.debug("Cannot reuse cached runner {} for new trial".format(
-                self._cached_actor))
-            with self._change_working_directory(trial):
-                self._trial_cleanup.add(trial, actor=self._cached_actor)
-            self._cached_actor = None
-
-        cls = ray.remote(
-            num_cpus=trial.resources.cpu,
-            num_gpus=trial.resources.gpu,
-            memory=trial.resources.memory,
-            object_store_memory=trial.resources.object_store_memory,
-            resources=trial.resources.custom_resources)(
-                trial.get_trainable_cls())
-
         def logger_creator(config):
             # Set the working dir in the remote process, for user file writes
             os.makedirs(remote_logdir, exist_ok=True)
@@ -166,23 +223,102 @@ class RayTrialExecutor(TrialExecutor):
                 os.chdir(remote_logdir)
             return NoopLogger(config, remote_logdir)
 
-        # Clear the Trial's location (to be updated later on result)
-        # since we don't know where the remote runner is placed.
-        trial.set_location(Location())
-        logger.debug("Trial %s: Setting up new remote runner.", trial)
         # Logging for trials is handled centrally by TrialRunner, so
         # configure the remote runner to use a noop-logger.
         trial_config = copy.deepcopy(trial.config)
         trial_config[TRIAL_INFO] = TrialInfo(trial)
+
+        if self._reuse_actors:
+            existing_runner = self._actor_pool.pop(trial)
+            if existing_runner is not None:
+                logger.debug("Trial %s: Reusing cached runner %s", trial,
+                             existing_runner)
+                start = time.time()
+                with self._change_working_directory(trial):
+                    with warn_if_slow("reset"):
+                        try:
+                            reset_val = ray.get(
+                                existing_runner.reset.remote(
+                                    trial_config, logger_creator, restoring),
+                                DEFAULT_GET_TIMEOUT)
+                        except Exception:
+                            logger.exception(
+                                "Trial %s: Error resetting cached runner.",
+                                trial)
+                            reset_val = False
+                if reset_val:
+                    self._actor_pool.record_reuse(trial, time.time() - start)
+                    return existing_runner
+                logger.debug("Trial %s: Cannot reset cached runner %s", trial,
+                             existing_runner)
+                with self._change_working_directory(trial):
+                    self._trial_cleanup.add(trial, actor=existing_runner)
+
+        # Idle actors hold on to their resources, which may be needed by the
+        # new runner.
+        for idle_trial, actor in self._actor_pool.pop_all():
+            logger.debug(
+                "Cannot reuse cached runner {} for new trial".format(actor))
+            with self._change_working_directory(idle_trial):
+                self._trial_cleanup.add(idle_trial, actor=actor)
+
+        # Clear the Trial's location (to be updated later on result)
+        # since we don't know where the remote runner is placed.
+        trial.set_location(Location())
+        logger.debug("Trial %s: Setting up new remote runner.", trial)
+        self._actor_start_times[trial] = time.time()
+        with self._change_working_directory(trial):
+            return self._create_remote_runner(trial, trial_config,
+                                              logger_creator)
+
+    def _create_remote_runner(self, trial, trial_config, logger_creator):
         kwargs = {
             "config": trial_config,
             "logger_creator": logger_creator,
         }
         if issubclass(trial.get_trainable_cls(), DurableTrainable):
             kwargs["remote_checkpoint_dir"] = trial.remote_checkpoint_dir
+        cls = ray.remote(
+            num_cpus=trial.resources.cpu,
+            num_gpus=trial.resources.gpu,
+            memory=trial.resources.memory,
+            object_store_memory=trial.resources.object_store_memory,
+            resources=trial.resources.custom_resources)(
+                trial.get_trainable_cls())
+        return cls.remote(**kwargs)
 
-        with self._change_working_directory(trial):
-            return cls.remote(**kwargs)
+    def _prestart_actor(self, trial_runner):
+        """Starts an idle actor ahead of demand if resources are left free.
+
+        Pending trials are started as soon as there are enough resources, so
+        resources are only left free if no trial waits to run, e.g. because the
+        search algorithm waits for results before suggesting new trials. In
+        that case, an actor for the trainable and resource shape of the last
+        started trial is started, so that the process startup and imports are
+        done by the time the next trial arrives.
+        """
+        template = self._last_started_trial
+        if (template is None or not _is_reusable(template.get_trainable_cls())
+                or len(self._actor_pool)
+                or ray.worker._mode() == ray.worker.LOCAL_MODE
+                or trial_runner.search_alg.is_finished()
+                or not self._has_space(template.resources)
+                or any(t.status in [Trial.PENDING, Trial.PAUSED]
+                       for t in trial_runner.get_trials())):
+            return
+
+        # The logger of the actor is replaced when it is reset for a trial,
+        # so don't create a directory for it.
+        local_dir = template.local_dir
+
+        def logger_creator(config):
+            return NoopLogger(config, local_dir)
+
+        logger.debug("Prestarting runner for trials like %s.", template)
+        config = copy.deepcopy(template.config)
+        config[TRIAL_INFO] = TrialInfo(template)
+        actor = self._create_remote_runner(template, config, logger_creator)
+        self._actor_pool.put(template, actor)
 
     def _train(self, trial):
         """Start one iteration of training and save remote id."""
@@ -228,8 +364,9 @@ class RayTrialExecutor(TrialExecutor):
         """
         prior_status = trial.status
         if runner is None:
-            reuse_allowed = checkpoint is not None or trial.has_checkpoint()
-            runner = self._setup_remote_runner(trial, reuse_allowed)
+            restoring = checkpoint is not None or trial.has_checkpoint()
+            runner = self._setup_remote_runner(trial, restoring)
+            self._last_started_trial = trial
         trial.set_runner(runner)
         self.restore(trial, checkpoint)
         self.set_status(trial, Trial.RUNNING)
@@ -260,14 +397,15 @@ class RayTrialExecutor(TrialExecutor):
 
         self.set_status(trial, Trial.ERROR if error else Trial.TERMINATED)
         trial.set_location(Location())
+        self._actor_start_times.pop(trial, None)
 
         try:
             trial.write_error_log(error_msg)
             if hasattr(trial, "runner") and trial.runner:
                 if (not error and self._reuse_actors
-                        and self._cached_actor is None):
+                        and _is_reusable(trial.get_trainable_cls())):
                     logger.debug("Reusing actor for %s", trial.runner)
-                    self._cached_actor = trial.runner
+                    self._actor_pool.put(trial, trial.runner)
                 else:
                     logger.debug("Trial %s: Destroying actor.", trial)
                     with self._change_working_directory(trial):
@@ -396,6 +534,9 @@ class RayTrialExecutor(TrialExecutor):
         return None
 
     def get_next_available_trial(self):
+        return self.get_next_available_trials()[0]
+
+    def get_next_available_trials(self, max_trials=1):
         shuffled_results = list(self._running.keys())
         random.shuffle(shuffled_results)
         # Note: We shuffle the results because `ray.wait` by default returns
@@ -403,7 +544,7 @@ class RayTrialExecutor(TrialExecutor):
         # trials (i.e. trials that run remotely) also get fairly reported.
         # See https://github.com/ray-project/ray/issues/4211 for details.
         start = time.time()
-        [result_id], _ = ray.wait(shuffled_results)
+        ready, not_ready = ray.wait(shuffled_results)
         wait_time = time.time() - start
         if wait_time > NONTRIVIAL_WAIT_TIME_THRESHOLD_S:
             self._last_nontrivial_wait = time.time()
@@ -415,7 +556,14 @@ class RayTrialExecutor(TrialExecutor):
                     BOTTLENECK_WARN_PERIOD_S))
 
             self._last_nontrivial_wait = time.time()
-        return self._running[result_id]
+        if max_trials > 1 and not_ready:
+            # Also collect any other results that are already available.
+            more_ready, _ = ray.wait(
+                not_ready,
+                num_returns=min(max_trials - 1, len(not_ready)),
+                timeout=0)
+            ready += more_ready
+        return [self._running[result_id] for result_id in ready]
 
     def fetch_result(self, trial):
         """Fetches one result of the running trials.
@@ -433,6 +581,12 @@ class RayTrialExecutor(TrialExecutor):
         # For local mode
         if isinstance(result, _LocalWrapper):
             result = result.unwrap()
+
+        start_time = self._actor_start_times.pop(trial, None)
+        if (start_time is not None and isinstance(result, dict)
+                and TIME_THIS_ITER_S in result):
+            startup_time = time.time() - start_time - result[TIME_THIS_ITER_S]
+            self._actor_pool.record_startup(trial, max(0.0, startup_time))
         return result
 
     def _commit_resources(self, resources):
@@ -525,19 +679,7 @@ class RayTrialExecutor(TrialExecutor):
         if time.time() - self._last_resource_refresh > self._refresh_period:
             self._update_avail_resources()
 
-        currently_available = Resources.subtract(self._avail_resources,
-                                                 self._committed_resources)
-
-        have_space = (
-            resources.cpu_total() <= currently_available.cpu
-            and resources.gpu_total() <= currently_available.gpu
-            and resources.memory_total() <= currently_available.memory
-            and resources.object_store_memory_total() <=
-            currently_available.object_store_memory and all(
-                resources.get_res_total(res) <= currently_available.get(res)
-                for res in resources.custom_resources))
-
-        if have_space:
+        if self._has_space(resources):
             # The assumption right now is that we block all trials if one
             # trial is queued.
             self._trial_queued = False
@@ -557,6 +699,19 @@ class RayTrialExecutor(TrialExecutor):
 
         return False
 
+    def _has_space(self, resources):
+        currently_available = Resources.subtract(self._avail_resources,
+                                                 self._committed_resources)
+
+        return (
+            resources.cpu_total() <= currently_available.cpu
+            and resources.gpu_total() <= currently_available.gpu
+            and resources.memory_total() <= currently_available.memory
+            and resources.object_store_memory_total() <=
+            currently_available.object_store_memory and all(
+                resources.get_res_total(res) <= currently_available.get(res)
+                for res in resources.custom_resources))
+
     def debug_string(self):
         """Returns a human readable message for printing to the console."""
         if self._resources_initialized:
@@ -580,6 +735,11 @@ class RayTrialExecutor(TrialExecutor):
             ])
             if customs:
                 status += " ({})".format(customs)
+            if self._actor_pool.num_reused:
+                status += ("\nReused actors for {} trials, saving an "
+                           "estimated {:.1f}s of actor startup".format(
+                               self._actor_pool.num_reused,
+                               self._actor_pool.startup_time_saved))
             return status
         else:
             return "Resources requested: ?"
@@ -606,6 +766,8 @@ class RayTrialExecutor(TrialExecutor):
     def on_step_begin(self, trial_runner):
         """Before step() called, update the available resources."""
         self._update_avail_resources()
+        if self._reuse_actors and self._prestart_actors:
+            self._prestart_actor(trial_runner)
 
     def save(self, trial, storage=Checkpoint.PERSISTENT, result=None):
         """Saves the trial's state to a checkpoint asynchronously.
@@ -702,6 +864,14 @@ class RayTrialExecutor(TrialExecutor):
             return self._avail_resources.gpu > 0
 
     def cleanup(self):
+        for trial, actor in self._actor_pool.pop_all():
+            with self._change_working_directory(trial):
+                self._trial_cleanup.add(trial, actor=actor)
+        if self._actor_pool.num_reused:
+            logger.info(
+                "Reused actors for %s trials, saving an estimated %.1fs of "
+                "actor startup.", self._actor_pool.num_reused,
+                self._actor_pool.startup_time_saved)
         self._trial_cleanup.cleanup(partial=False)
 
     @contextmanager
@@ -1,3 +1,4 @@
+import bisect
 import collections
 import logging
 import numpy as np
@@ -8,6 +9,38 @@ from ray.tune.schedulers.trial_scheduler import FIFOScheduler, TrialScheduler
 logger = logging.getLogger(__name__)
 
 
+class _TrialResults:
+    """Results of a trial, indexed to compute running means in O(log n).
+
+    Results are kept sorted by time. A trial restored from a checkpoint
+    reports times again, which replace the results reported at or after them.
+    """
+
+    def __init__(self):
+        self.times = []
+        # metric_sums[i] is the sum of the metric over the first i results.
+        self.metric_sums = [0.0]
+        self.best = None
+
+    def append(self, time, value, compare_op):
+        start = bisect.bisect_left(self.times, time)
+        del self.times[start:]
+        del self.metric_sums[start + 1:]
+        self.times.append(time)
+        self.metric_sums.append(self.metric_sums[-1] + value)
+        self.best = value if self.best is None else compare_op(
+            self.best, value)
+
+    def mean(self, start_time, end_time):
+        """Returns the mean metric of the results in [start_time, end_time]."""
+        start = bisect.bisect_left(self.times, start_time)
+        end = bisect.bisect_right(self.times, end_time)
+        if end <= start:
+            return float("nan")
+        return (self.metric_sums[end] - self.metric_sums[start]) / (
+            end - start)
+
+
 class MedianStoppingRule(FIFOScheduler):
     """Implements the median stopping rule as described in the Vizier paper:
 
@@ -67,7 +100,12 @@ class MedianStoppingRule(FIFOScheduler):
         self._hard_stop = hard_stop
         self._trial_state = {}
         self._last_pause = collections.defaultdict(lambda: float("-inf"))
-        self._results = collections.defaultdict(list)
+        self._results = {}
+        # Sorted (time of the last result, trial index) pairs of all trials,
+        # to find the trials beyond a point in time by bisection.
+        self._last_times = []
+        self._trial_indices = {}
+        self._trials_by_index = []
 
     def on_trial_result(self, trial_runner, trial, result):
         """Callback for early stopping.
@@ -85,7 +123,7 @@ class MedianStoppingRule(FIFOScheduler):
             return TrialScheduler.CONTINUE
 
         time = result[self._time_attr]
-        self._results[trial].append(result)
+        self._add_result(trial, result)
 
         if time < self._grace_period:
             return TrialScheduler.CONTINUE
@@ -122,7 +160,8 @@ class MedianStoppingRule(FIFOScheduler):
             return TrialScheduler.CONTINUE
 
     def on_trial_complete(self, trial_runner, trial, result):
-        self._results[trial].append(result)
+        if result and self._time_attr in result and self._metric in result:
+            self._add_result(trial, result)
 
     def debug_string(self):
         return "Using MedianStoppingRule: num_stopped={}.".format(
@@ -136,26 +175,36 @@ class MedianStoppingRule(FIFOScheduler):
         ]
         return TrialScheduler.PAUSE if pause else TrialScheduler.CONTINUE
 
+    def _add_result(self, trial, result):
+        time = result[self._time_attr]
+        if trial in self._results:
+            index = self._trial_indices[trial]
+            last_time = self._results[trial].times[-1]
+            del self._last_times[bisect.bisect_left(self._last_times,
+                                                    (last_time, index))]
+        else:
+            index = len(self._trials_by_index)
+            self._trial_indices[trial] = index
+            self._trials_by_index.append(trial)
+            self._results[trial] = _TrialResults()
+        self._results[trial].append(time, result[self._metric],
+                                    self._compare_op)
+        bisect.insort(self._last_times, (time, index))
+
     def _trials_beyond_time(self, time):
-        trials = [
-            trial for trial in self._results
-            if self._results[trial][-1][self._time_attr] >= time
+        start = bisect.bisect_left(self._last_times, (time, -1))
+        return [
+            self._trials_by_index[index]
+            for _, index in self._last_times[start:]
         ]
-        return trials
 
     def _median_result(self, trials, time):
         return np.median([self._running_mean(trial, time) for trial in trials])
 
     def _running_mean(self, trial, time):
-        results = self._results[trial]
         # TODO(ekl) we could do interpolation to be more precise, but for now
         # assume len(results) is large and the time diffs are roughly equal
-        scoped_results = [
-            r for r in results
-            if self._grace_period <= r[self._time_attr] <= time
-        ]
-        return np.mean([r[self._metric] for r in scoped_results])
+        return self._results[trial].mean(self._grace_period, time)
 
     def _best_result(self, trial):
-        results = self._results[trial]
-        return self._compare_op([r[self._metric] for r in results])
+        return self._results[trial].best
@@ -1,3 +1,4 @@
+import bisect
 import copy
 import logging
 import json
@@ -19,8 +20,10 @@ logger = logging.getLogger(__name__)
 class PBTTrialState:
     """Internal PBT state tracked per-trial."""
 
-    def __init__(self, trial):
+    def __init__(self, trial, index=0):
         self.orig_tag = trial.experiment_tag
+        # Order in which the trial was added, breaks ties between scores.
+        self.index = index
         self.last_score = None
         self.last_checkpoint = None
         self.last_perturbation_time = 0
@@ -220,6 +223,11 @@ class PopulationBasedTraining(FIFOScheduler):
         self._quantile_fraction = quantile_fraction
         self._resample_probability = resample_probability
         self._trial_state = {}
+        # Sorted (last score, trial index) pairs of the unfinished trials
+        # with a score, to find the quantiles without sorting all trials.
+        self._ranking = []
+        self._trials_by_index = []
+        self._errored_trials = set()
         self._custom_explore_fn = custom_explore_fn
         self._log_config = log_config
 
@@ -228,7 +236,20 @@ class PopulationBasedTraining(FIFOScheduler):
         self._num_perturbations = 0
 
     def on_trial_add(self, trial_runner, trial):
-        self._trial_state[trial] = PBTTrialState(trial)
+        self._trial_state[trial] = PBTTrialState(
+            trial, index=len(self._trials_by_index))
+        self._trials_by_index.append(trial)
+
+    def on_trial_error(self, trial_runner, trial):
+        # The trial may be requeued, so only check whether it finished the
+        # next time the quantiles are computed.
+        self._errored_trials.add(trial)
+
+    def on_trial_complete(self, trial_runner, trial, result):
+        self._unrank(trial)
+
+    def on_trial_remove(self, trial_runner, trial):
+        self._unrank(trial)
 
     def on_trial_result(self, trial_runner, trial, result):
         if self._time_attr not in result or self._metric not in result:
@@ -240,11 +261,15 @@ class PopulationBasedTraining(FIFOScheduler):
             return TrialScheduler.CONTINUE  # avoid checkpoint overhead
 
         score = self._metric_op * result[self._metric]
+        self._unrank(trial)
         state.last_score = score
+        bisect.insort(self._ranking, (score, state.index))
         state.last_perturbation_time = time
-        lower_quantile, upper_quantile = self._quantiles()
+        num_trials_in_quantile = self._quantile_size()
+        num_ranked = len(self._ranking)
+        rank = bisect.bisect_left(self._ranking, (score, state.index))
 
-        if trial in upper_quantile:
+        if rank >= num_ranked - num_trials_in_quantile:
             # The trial last result is only updated after the scheduler
             # callback. So, we override with the current result.
             state.last_checkpoint = trial_runner.trial_executor.save(
@@ -253,8 +278,10 @@ class PopulationBasedTraining(FIFOScheduler):
         else:
             state.last_checkpoint = None  # not a top trial
 
-        if trial in lower_quantile:
-            trial_to_clone = random.choice(upper_quantile)
+        if rank < num_trials_in_quantile:
+            _, clone_index = self._ranking[random.randrange(
+                num_ranked - num_trials_in_quantile, num_ranked)]
+            trial_to_clone = self._trials_by_index[clone_index]
             assert trial is not trial_to_clone
             self._exploit(trial_runner.trial_executor, trial, trial_to_clone)
 
@@ -338,6 +365,38 @@ class PopulationBasedTraining(FIFOScheduler):
         # Transfer over the last perturbation time as well
         trial_state.last_perturbation_time = new_state.last_perturbation_time
 
+    def _unrank(self, trial):
+        """Removes the trial from the ranking of scores, if present."""
+        state = self._trial_state[trial]
+        if state.last_score is None:
+            return
+        key = (state.last_score, state.index)
+        i = bisect.bisect_left(self._ranking, key)
+        if i < len(self._ranking) and self._ranking[i] == key:
+            del self._ranking[i]
+
+    def _quantile_size(self):
+        """Returns the number of trials in each quantile of the population.
+
+        Trials are removed from the ranking by the scheduler callbacks when
+        they finish. Errored trials may be requeued, so they are only
+        removed here once they turn out to be finished.
+        """
+
+        for trial in self._errored_trials:
+            if trial.is_finished():
+                self._unrank(trial)
+        self._errored_trials.clear()
+
+        num_ranked = len(self._ranking)
+        if num_ranked <= 1:
+            return 0
+        num_trials_in_quantile = int(
+            math.ceil(num_ranked * self._quantile_fraction))
+        if num_trials_in_quantile > num_ranked / 2:
+            num_trials_in_quantile = int(math.floor(num_ranked / 2))
+        return num_trials_in_quantile
+
     def _quantiles(self):
         """Returns trials in the lower and upper `quantile` of the population.
 
@@ -345,21 +404,16 @@ class PopulationBasedTraining(FIFOScheduler):
 
         """
 
-        trials = []
-        for trial, state in self._trial_state.items():
-            if state.last_score is not None and not trial.is_finished():
-                trials.append(trial)
-        trials.sort(key=lambda t: self._trial_state[t].last_score)
-
-        if len(trials) <= 1:
+        num_trials_in_quantile = self._quantile_size()
+        if not num_trials_in_quantile:
             return [], []
-        else:
-            num_trials_in_quantile = int(
-                math.ceil(len(trials) * self._quantile_fraction))
-            if num_trials_in_quantile > len(trials) / 2:
-                num_trials_in_quantile = int(math.floor(len(trials) / 2))
-            return (trials[:num_trials_in_quantile],
-                    trials[-num_trials_in_quantile:])
+        return ([
+            self._trials_by_index[index]
+            for _, index in self._ranking[:num_trials_in_quantile]
+        ], [
+            self._trials_by_index[index]
+            for _, index in self._ranking[-num_trials_in_quantile:]
+        ])
 
     def choose_trial_to_run(self, trial_runner):
         """Ensures all trials get fair share of time (as defined by time_attr).
@@ -369,14 +423,16 @@ class PopulationBasedTraining(FIFOScheduler):
 
         """
 
-        candidates = []
+        candidate = None
+        candidate_time = None
         for trial in trial_runner.get_trials():
-            if trial.status in [Trial.PENDING, Trial.PAUSED] and \
-                    trial_runner.has_resources(trial.resources):
-                candidates.append(trial)
-        candidates.sort(
-            key=lambda trial: self._trial_state[trial].last_perturbation_time)
-        return candidates[0] if candidates else None
+            if trial.status in [Trial.PENDING, Trial.PAUSED]:
+                time = self._trial_state[trial].last_perturbation_time
+                if candidate is None or time < candidate_time:
+                    if trial_runner.has_resources(trial.resources):
+                        candidate = trial
+                        candidate_time = time
+        return candidate
 
     def reset_stats(self):
         self._num_perturbations = 0
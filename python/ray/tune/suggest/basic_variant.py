@@ -15,8 +15,16 @@ class BasicVariantGenerator(SearchAlgorithm):
     See also: `ray.tune.suggest.variant_generator`.
 
 
+    Trials are generated lazily, at most `max_batch_size` per call to
+    `next_trials`, so that large grid searches do not have to be expanded
+    up front. The TrialRunner only asks for more trials when few of the
+    generated ones are still pending.
+
     Parameters:
-        shuffle (bool): Shuffles the generated list of configurations.
+        shuffle (bool): Shuffles the generated list of configurations. This
+            generates all trials when `next_trials` is first called.
+        max_batch_size (int): Maximum number of trials returned by a call
+            to `next_trials`. If None, all trials are returned at once.
 
     User API:
 
@@ -37,18 +45,22 @@ class BasicVariantGenerator(SearchAlgorithm):
         searcher = BasicVariantGenerator()
         searcher.add_configurations({"experiment": { ... }})
         list_of_trials = searcher.next_trials()
-        searcher.is_finished == True
+        while not searcher.is_finished():
+            list_of_trials += searcher.next_trials()
     """
 
-    def __init__(self, shuffle=False):
+    def __init__(self, shuffle=False, max_batch_size=1000):
         """Initializes the Variant Generator.
 
         """
         self._parser = make_parser()
-        self._trial_generator = []
+        self._trial_generator = iter([])
         self._counter = 0
+        self._num_skipped = 0
         self._finished = False
         self._shuffle = shuffle
+        self._shuffled = False
+        self._max_batch_size = max_batch_size
 
     def add_configurations(self, experiments):
         """Chains generator given experiment specifications.
@@ -68,19 +80,37 @@ class BasicVariantGenerator(SearchAlgorithm):
         """Provides Trial objects to be queued into the TrialRunner.
 
         Returns:
-            trials (list): Returns a list of trials.
+            trials (list): Returns a list of at most `max_batch_size` trials.
         """
-        trials = list(self._trial_generator)
-        if self._shuffle:
+        if self._shuffle and not self._shuffled:
+            trials = list(self._trial_generator)
             random.shuffle(trials)
-        self.set_finished()
+            self._trial_generator = iter(trials)
+            self._shuffled = True
+        trials = list(
+            itertools.islice(self._trial_generator, self._max_batch_size))
+        if self._max_batch_size is None or len(trials) < self._max_batch_size:
+            self.set_finished()
         return trials
 
+    @property
+    def num_generated_trials(self):
+        """Number of trials generated so far, including skipped ones."""
+        return self._counter
+
+    def skip_generated_trials(self, num_trials):
+        """Skips the first `num_trials` trials of the configurations.
+
+        Used when resuming an experiment, whose first trials were already
+        generated before it was checkpointed.
+        """
+        self._num_skipped = num_trials
+
     def _generate_trials(self, num_samples, unresolved_spec, output_path=""):
         """Generates Trial objects with the variant generation process.
 
-        Uses a fixed point iteration to resolve variants. All trials
-        should be able to be generated at once.
+        Uses a fixed point iteration to resolve variants. Variants are only
+        resolved as the trials are consumed.
 
         See also: `ray.tune.suggest.variant_generator`.
 
@@ -92,6 +122,9 @@ class BasicVariantGenerator(SearchAlgorithm):
             raise TuneError("Must specify `run` in {}".format(unresolved_spec))
         for _ in range(num_samples):
             for resolved_vars, spec in generate_variants(unresolved_spec):
+                if self._counter < self._num_skipped:
+                    self._counter += 1
+                    continue
                 trial_id = "%05d" % self._counter
                 experiment_tag = str(self._counter)
                 if resolved_vars:
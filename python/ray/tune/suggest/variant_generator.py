@@ -115,8 +115,9 @@ def _clean_value(value):
         return str(value).replace("/", "_")
 
 
-def _generate_variants(spec):
-    spec = copy.deepcopy(spec)
+def _generate_variants(spec, copy_spec=True):
+    if copy_spec:
+        spec = copy.deepcopy(spec)
     unresolved = _unresolved_values(spec)
     if not unresolved:
         yield {}, spec
@@ -134,7 +135,9 @@ def _generate_variants(spec):
     grid_search = _grid_search_generator(spec, grid_vars)
     for resolved_spec in grid_search:
         resolved_vars = _resolve_lambda_vars(resolved_spec, lambda_vars)
-        for resolved, spec in _generate_variants(resolved_spec):
+        # The grid search generator already yields copies of the spec.
+        for resolved, spec in _generate_variants(
+                resolved_spec, copy_spec=not grid_vars):
             for path, value in grid_vars:
                 resolved_vars[path] = _get_value(spec, path)
             for k, v in resolved.items():
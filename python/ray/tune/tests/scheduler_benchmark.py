@@ -0,0 +1,112 @@
+"""Micro-benchmark of the scheduler decision time with many trials.
+
+Feeds synthetic results for a large population of trials directly to the
+schedulers, without Ray or a TrialRunner, and reports the mean time spent in
+`on_trial_result` and `choose_trial_to_run`.
+
+    python scheduler_benchmark.py --num-trials 10000 --num-results 20
+"""
+
+import argparse
+import random
+import time
+
+from ray.tune.schedulers import (MedianStoppingRule, PopulationBasedTraining,
+                                 TrialScheduler)
+from ray.tune.trial import Trial
+
+
+class _BenchmarkTrial:
+    def __init__(self, i):
+        self.trial_id = str(i)
+        self.experiment_tag = str(i)
+        self.config = {"lr": 0.01}
+        self.resources = None
+        self.status = Trial.RUNNING
+
+    def is_finished(self):
+        return self.status in [Trial.TERMINATED, Trial.ERROR]
+
+
+class _BenchmarkTrialExecutor:
+    def save(self, trial, storage, result=None):
+        return None
+
+    def reset_trial(self, trial, new_config, new_experiment_tag):
+        return True
+
+    def restore(self, trial, checkpoint=None):
+        pass
+
+
+class _BenchmarkTrialRunner:
+    def __init__(self, trials):
+        self.trials = trials
+        self.trial_executor = _BenchmarkTrialExecutor()
+
+    def get_trials(self):
+        return self.trials
+
+    def has_resources(self, resources):
+        return True
+
+
+def benchmark(name, scheduler, num_trials, num_results):
+    random.seed(0)
+    trials = [_BenchmarkTrial(i) for i in range(num_trials)]
+    runner = _BenchmarkTrialRunner(trials)
+    for trial in trials:
+        scheduler.on_trial_add(runner, trial)
+
+    num_decisions = 0
+    decision_time = 0
+    for i in range(num_results):
+        for trial in trials:
+            if trial.is_finished():
+                continue
+            result = {
+                "training_iteration": i + 1,
+                "episode_reward_mean": random.gauss(i, 1),
+            }
+            start = time.time()
+            action = scheduler.on_trial_result(runner, trial, result)
+            decision_time += time.time() - start
+            num_decisions += 1
+            if action == TrialScheduler.STOP:
+                trial.status = Trial.TERMINATED
+                scheduler.on_trial_complete(runner, trial, result)
+
+    # Half of the trials wait for resources.
+    for trial in trials[::2]:
+        if not trial.is_finished():
+            trial.status = Trial.PAUSED
+    start = time.time()
+    for _ in range(10):
+        scheduler.choose_trial_to_run(runner)
+    choose_time = (time.time() - start) / 10
+
+    print("{}: {} trials, {} decisions, {:.1f} us per on_trial_result, "
+          "{:.1f} ms per choose_trial_to_run".format(
+              name, num_trials, num_decisions,
+              decision_time / max(num_decisions, 1) * 1e6, choose_time * 1e3))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-trials", type=int, default=10000)
+    parser.add_argument("--num-results", type=int, default=20)
+    args = parser.parse_args()
+
+    benchmark(
+        "MedianStoppingRule",
+        MedianStoppingRule(
+            time_attr="training_iteration",
+            grace_period=5,
+            min_samples_required=3), args.num_trials, args.num_results)
+    benchmark(
+        "PopulationBasedTraining",
+        PopulationBasedTraining(
+            time_attr="training_iteration",
+            perturbation_interval=5,
+            hyperparam_mutations={"lr": [0.01, 0.001]},
+            log_config=False), args.num_trials, args.num_results)
@@ -1,8 +1,10 @@
+import os
 import unittest
 
 import ray
 from ray.tune import Trainable, run_experiments
-from ray.tune.error import TuneError
+from ray.tune.ray_trial_executor import _ActorPool
+from ray.tune.resources import Resources
 from ray.tune.schedulers.trial_scheduler import FIFOScheduler, TrialScheduler
 
 
@@ -20,7 +22,11 @@ def create_resettable_class():
 
         def _train(self):
             self.iter += 1
-            return {"num_resets": self.num_resets, "done": self.iter > 1}
+            return {
+                "num_resets": self.num_resets,
+                "pid": os.getpid(),
+                "done": self.iter > 1
+            }
 
         def _save(self, chkpt_dir):
             return {"iter": self.iter}
@@ -72,23 +78,93 @@ class ActorReuseTest(unittest.TestCase):
         self.assertEqual([t.last_result["num_resets"] for t in trials],
                          [1, 2, 3, 4])
 
-    def testTrialReuseEnabledError(self):
-        def run():
-            run_experiments(
-                {
-                    "foo": {
-                        "run": create_resettable_class(),
-                        "max_failures": 1,
-                        "num_samples": 4,
-                        "config": {
-                            "fake_reset_not_supported": True
-                        },
-                    }
-                },
-                reuse_actors=True,
-                scheduler=FrequentPausesScheduler())
-
-        self.assertRaises(TuneError, lambda: run())
+    def testTrialReuseGenericReset(self):
+        trials = run_experiments(
+            {
+                "foo": {
+                    "run": create_resettable_class(),
+                    "num_samples": 4,
+                    "config": {
+                        "fake_reset_not_supported": True
+                    },
+                }
+            },
+            reuse_actors=True,
+            scheduler=FrequentPausesScheduler())
+        # Without reset_config, the trainable is set up again on reuse.
+        self.assertEqual([t.last_result["num_resets"] for t in trials],
+                         [0, 0, 0, 0])
+        self.assertEqual(len({t.last_result["pid"] for t in trials}), 1)
+
+    def testTrialReuseEnabledNotReusable(self):
+        class NotReusable(Trainable):
+            def __init__(self, *args, **kwargs):
+                self.iter = 0
+                super(NotReusable, self).__init__(*args, **kwargs)
+
+            def _train(self):
+                self.iter += 1
+                return {"pid": os.getpid(), "done": self.iter > 1}
+
+            def _save(self, chkpt_dir):
+                return {"iter": self.iter}
+
+            def _restore(self, item):
+                self.iter = item["iter"]
+
+        trials = run_experiments(
+            {
+                "foo": {
+                    "run": NotReusable,
+                    "num_samples": 4,
+                }
+            },
+            reuse_actors=True,
+            scheduler=FrequentPausesScheduler())
+        # Trainables that override __init__ and not reset_config get a new
+        # actor for every trial, and no actors are started ahead of demand.
+        self.assertTrue(all(t.status == t.TERMINATED for t in trials))
+        self.assertEqual(len({t.last_result["pid"] for t in trials}), 4)
+
+
+class ActorPoolTest(unittest.TestCase):
+    class MockTrial:
+        def __init__(self, trainable_name, resources):
+            self.trainable_name = trainable_name
+            self.resources = resources
+
+    def testKeyedByTrainableAndResources(self):
+        pool = _ActorPool()
+        cpu_trial = self.MockTrial("foo", Resources(cpu=1, gpu=0))
+        gpu_trial = self.MockTrial("foo", Resources(cpu=1, gpu=1))
+        other_trial = self.MockTrial("bar", Resources(cpu=1, gpu=0))
+        pool.put(cpu_trial, "actor")
+        self.assertIsNone(pool.pop(gpu_trial))
+        self.assertIsNone(pool.pop(other_trial))
+        self.assertEqual(
+            pool.pop(self.MockTrial("foo", Resources(cpu=1, gpu=0))), "actor")
+        self.assertIsNone(pool.pop(cpu_trial))
+
+        pool.put(cpu_trial, "actor")
+        pool.put(gpu_trial, "gpu_actor")
+        self.assertEqual(len(pool), 2)
+        self.assertEqual(
+            sorted(actor for _, actor in pool.pop_all()),
+            ["actor", "gpu_actor"])
+        self.assertEqual(len(pool), 0)
+
+    def testStartupTimeSaved(self):
+        pool = _ActorPool()
+        trial = self.MockTrial("foo", Resources(cpu=1, gpu=0))
+        pool.record_reuse(trial, reset_time=0.5)
+        self.assertEqual(pool.num_reused, 1)
+        self.assertEqual(pool.startup_time_saved, 0)
+
+        pool.record_startup(trial, 4)
+        pool.record_startup(trial, 6)
+        pool.record_reuse(trial, reset_time=1)
+        self.assertEqual(pool.num_reused, 2)
+        self.assertEqual(pool.startup_time_saved, 4)
 
 
 if __name__ == "__main__":
@@ -6,6 +6,8 @@ import time
 import unittest
 from unittest.mock import patch
 
+import numpy as np
+
 import ray
 from ray.rllib import _register_all
 
@@ -839,6 +841,39 @@ class TrainableFunctionApiTest(unittest.TestCase):
             self.assertEqual(trial.status, Trial.TERMINATED)
             self.assertTrue(trial.has_checkpoint())
 
+    def testCheckpointDictObjectStore(self):
+        class TestTrain(Trainable):
+            def _setup(self, config):
+                self.state = {"weights": np.zeros(1000)}
+
+            def _train(self):
+                self.state["weights"] += 1
+                return {"timesteps_this_iter": 1}
+
+            def _save(self, path):
+                return self.state
+
+            def _restore(self, state):
+                self.state = state
+
+        trainable_1 = ray.remote(TestTrain).remote()
+        trainable_2 = ray.remote(TestTrain).remote()
+        for _ in range(3):
+            ray.get(trainable_1.train.remote())
+        obj = ray.get(trainable_1.save_to_object.remote())
+        # Dict checkpoints are kept in memory instead of as pickled files.
+        self.assertIsInstance(obj, dict)
+        self.assertEqual(obj["metadata"]["iteration"], 3)
+
+        # The target trial fetches the checkpoint from the object store.
+        ray.get(
+            trainable_2.restore_from_object.remote(
+                trainable_1.save_to_object.remote()))
+        result = ray.get(trainable_2.train.remote())
+        self.assertEqual(result[TRAINING_ITERATION], 4)
+        state = ray.get(trainable_2.save_to_object.remote())["state"]
+        np.testing.assert_array_equal(state["weights"], np.ones(1000) * 4)
+
     def testMultipleCheckpoints(self):
         class TestTrain(Trainable):
             def _setup(self, config):
@@ -1,4 +1,6 @@
 import unittest
+import json
+import os
 import shutil
 import tempfile
 import random
@@ -7,6 +9,7 @@ import pandas as pd
 import ray
 from ray.tune import run, Trainable, sample_from, Analysis, grid_search
 from ray.tune.examples.async_hyperband_example import MyTrainableClass
+from ray.tune.result import EXPR_PARAM_FILE, EXPR_PROGRESS_FILE
 
 
 class ExperimentAnalysisInMemorySuite(unittest.TestCase):
@@ -114,6 +117,41 @@ class AnalysisSuite(unittest.TestCase):
             self.assertEquals(analysis.get_all_configs()[logdir], best_config)
 
 
+class AnalysisIncrementalSuite(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.trial_dir = os.path.join(self.test_dir, "trial_0")
+        os.makedirs(self.trial_dir)
+        with open(os.path.join(self.trial_dir, EXPR_PARAM_FILE), "w") as f:
+            json.dump({"lr": 0.1}, f)
+        self.progress_file = os.path.join(self.trial_dir, EXPR_PROGRESS_FILE)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def append(self, text):
+        with open(self.progress_file, "a") as f:
+            f.write(text)
+
+    def testIncrementalResults(self):
+        # The second row is incomplete and should not be read yet.
+        self.append("score,training_iteration\n3,1\n5,")
+        analysis = Analysis(self.test_dir)
+        df = analysis.dataframe()
+        self.assertEqual(df.shape[0], 1)
+        self.assertEqual(df["score"][0], 3)
+        self.assertEqual(df["config/lr"][0], 0.1)
+
+        self.append("2\n1,3\n")
+        analysis.fetch_trial_dataframes()
+        trial_df = analysis.trial_dataframes[self.trial_dir]
+        self.assertEqual(list(trial_df["score"]), [3, 5, 1])
+        self.assertEqual(list(trial_df.index), [0, 1, 2])
+        self.assertEqual(analysis.dataframe()["score"][0], 1)
+        self.assertEqual(
+            analysis.dataframe(metric="score", mode="max")["score"][0], 5)
+
+
 if __name__ == "__main__":
     import pytest
     import sys
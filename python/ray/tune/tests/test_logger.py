@@ -1,9 +1,15 @@
 from collections import namedtuple
+import json
+import os
 import unittest
 import tempfile
+import time
 import shutil
 
-from ray.tune.logger import JsonLogger, CSVLogger, TBXLogger
+from ray.tune import logger as tune_logger
+from ray.tune.logger import (AsyncLogger, JsonLogger, CSVLogger, TBXLogger,
+                             UnifiedLogger)
+from ray.tune.result import EXPR_PROGRESS_FILE, EXPR_RESULT_FILE
 
 Trial = namedtuple("MockTrial", ["evaluated_params", "trial_id"])
 
@@ -54,6 +60,71 @@ class LoggerSuite(unittest.TestCase):
         logger.on_result(result(2, 4, score=[1, 2, 3], hello={"world": 1}))
         logger.close()
 
+    def testBufferedWrites(self):
+        config = {"a": 2}
+        t = Trial(evaluated_params=config, trial_id="csv")
+        logger = CSVLogger(config=config, logdir=self.test_dir, trial=t)
+        progress_file = os.path.join(self.test_dir, EXPR_PROGRESS_FILE)
+        logger.on_result(result(0, 4))
+        logger.on_result(result(1, 4))
+        # Results are only written out periodically or when flushed.
+        self.assertEqual(os.path.getsize(progress_file), 0)
+        logger.flush()
+        with open(progress_file) as f:
+            self.assertEqual(len(f.readlines()), 3)
+        logger.close()
+
+    def testAsyncLogger(self):
+        config = {"a": 2}
+        t = Trial(evaluated_params=config, trial_id="json")
+        logger = AsyncLogger(
+            JsonLogger(config=config, logdir=self.test_dir, trial=t))
+        for i in range(100):
+            logger.on_result(result(i, 4))
+        logger.flush()
+        with open(os.path.join(self.test_dir, EXPR_RESULT_FILE)) as f:
+            iterations = [json.loads(line)["training_iteration"] for line in f]
+        self.assertEqual(iterations, list(range(100)))
+        logger.close()
+
+    def testAsyncLoggerFlushesIdleLogger(self):
+        config = {"a": 2}
+        t = Trial(evaluated_params=config, trial_id="csv")
+        flush_interval_s = tune_logger.LOGGER_FLUSH_INTERVAL_S
+        tune_logger.LOGGER_FLUSH_INTERVAL_S = 0.2
+        try:
+            logger = AsyncLogger(
+                CSVLogger(config=config, logdir=self.test_dir, trial=t))
+            logger.on_result(result(0, 4))
+            # The result is written out without another result or a flush.
+            progress_file = os.path.join(self.test_dir, EXPR_PROGRESS_FILE)
+            for _ in range(50):
+                if os.path.getsize(progress_file) > 0:
+                    break
+                time.sleep(0.1)
+            with open(progress_file) as f:
+                self.assertEqual(len(f.readlines()), 2)
+            logger.close()
+        finally:
+            tune_logger.LOGGER_FLUSH_INTERVAL_S = flush_interval_s
+
+    def testUnifiedAsyncLogger(self):
+        config = {"a": 2}
+        t = Trial(evaluated_params=config, trial_id="unified")
+        logger = UnifiedLogger(
+            config=config,
+            logdir=self.test_dir,
+            trial=t,
+            loggers=[JsonLogger, CSVLogger],
+            async_logging=True)
+        logger.on_result(result(0, 4))
+        logger.on_result(result(1, 4))
+        logger.close()
+        with open(os.path.join(self.test_dir, EXPR_RESULT_FILE)) as f:
+            self.assertEqual(len(f.readlines()), 2)
+        with open(os.path.join(self.test_dir, EXPR_PROGRESS_FILE)) as f:
+            self.assertEqual(len(f.readlines()), 3)
+
 
 if __name__ == "__main__":
     import pytest
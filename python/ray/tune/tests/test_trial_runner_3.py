@@ -1,3 +1,4 @@
+import json
 import os
 import shutil
 import sys
@@ -10,9 +11,12 @@ from ray.rllib import _register_all
 from ray.tune import TuneError
 from ray.tune.schedulers import TrialScheduler, FIFOScheduler
 from ray.tune.experiment import Experiment
+from ray.tune.experiment_journal import (get_journal_path,
+                                         load_experiment_state)
 from ray.tune.trial import Trial
 from ray.tune.trial_runner import TrialRunner
 from ray.tune.resources import Resources, json_to_resources, resources_to_json
+from ray.tune.suggest import BasicVariantGenerator
 from ray.tune.suggest.repeater import Repeater
 from ray.tune.suggest.suggestion import (_MockSuggestionAlgorithm,
                                          SuggestionAlgorithm)
@@ -96,6 +100,50 @@ class TrialRunnerTest3(unittest.TestCase):
         self.assertEqual(trials[2].status, Trial.RUNNING)
         self.assertEqual(trials[-1].status, Trial.TERMINATED)
 
+    def testBatchedResults(self):
+        ray.init(num_cpus=4)
+        runner = TrialRunner(max_results_per_step=4)
+        kwargs = {
+            "stopping_criterion": {
+                "training_iteration": 3
+            },
+            "resources": Resources(cpu=1, gpu=0),
+        }
+        trials = [Trial("__fake", **kwargs) for _ in range(4)]
+        for t in trials:
+            runner.add_trial(t)
+        while not runner.is_finished():
+            runner.step()
+        for t in trials:
+            self.assertEqual(t.status, Trial.TERMINATED)
+            self.assertEqual(t.last_result["training_iteration"], 3)
+
+        stats = runner.step_stats()
+        self.assertEqual(stats["num_results"], 12)
+        self.assertLessEqual(stats["num_steps"], 4 + 12)
+
+    def testMaxPendingTrials(self):
+        ray.init(num_cpus=1)
+        experiment = Experiment(
+            "test", "__fake", num_samples=10, stop={"training_iteration": 1})
+        runner = TrialRunner(
+            search_alg=BasicVariantGenerator(max_batch_size=2),
+            max_pending_trials=2)
+        runner.add_experiment(experiment)
+        runner.step()
+        self.assertEqual(len(runner.get_trials()), 2)
+        max_pending = 0
+        while not runner.is_finished():
+            runner.step()
+            max_pending = max(max_pending,
+                              [t.status for t in runner.get_trials()].count(
+                                  Trial.PENDING))
+        self.assertLessEqual(max_pending, 3)
+        trials = runner.get_trials()
+        self.assertEqual(len(trials), 10)
+        for t in trials:
+            self.assertEqual(t.status, Trial.TERMINATED)
+
     def testSearchAlgNotification(self):
         """Checks notification of trial to the Search Algorithm."""
         ray.init(num_cpus=4, num_gpus=2)
@@ -442,6 +490,51 @@ class TrialRunnerTest3(unittest.TestCase):
         self.assertEquals(count_checkpoints(tmpdir), 2)
         shutil.rmtree(tmpdir)
 
+    def testCheckpointJournal(self):
+        ray.init(num_cpus=3)
+        tmpdir = tempfile.mkdtemp()
+        runner = TrialRunner(local_checkpoint_dir=tmpdir, checkpoint_period=0)
+        runner.add_trial(Trial("__fake", config={"user_checkpoint_freq": 2}))
+        runner.add_trial(Trial("__fake"))
+        for i in range(4):
+            runner.step()
+        journal_path = get_journal_path(runner.checkpoint_file)
+        # Only the first checkpoint of the session writes the full state.
+        self.assertGreater(os.path.getsize(journal_path), 0)
+        with open(runner.checkpoint_file) as f:
+            self.assertEqual(json.load(f)["journal_seq"], 0)
+
+        state = load_experiment_state(runner.checkpoint_file)
+        self.assertEqual(len(state["checkpoints"]), 2)
+        # The runner checkpoints before it counts the step.
+        self.assertEqual(state["runner_data"]["_iteration"],
+                         runner._iteration - 1)
+
+        # A forced checkpoint compacts the journal.
+        runner.checkpoint(force=True)
+        with open(runner.checkpoint_file) as f:
+            full_state = json.load(f)
+        self.assertGreater(full_state["journal_seq"], 0)
+        self.assertEqual(os.path.getsize(journal_path), 0)
+        self.assertEqual(
+            load_experiment_state(runner.checkpoint_file)["runner_data"],
+            full_state["runner_data"])
+
+        runner.step()
+        runner2 = TrialRunner(resume="LOCAL", local_checkpoint_dir=tmpdir)
+        self.assertEqual(runner2._iteration, runner._iteration - 1)
+        self.assertEqual(
+            sorted(t.trial_id for t in runner2.get_trials()),
+            sorted(t.trial_id for t in runner.get_trials()))
+
+        # The resumed session continues the sequence numbers of the journal.
+        journal_seq = runner2._journal_seq
+        self.assertGreater(journal_seq, full_state["journal_seq"])
+        runner2.checkpoint(force=True)
+        with open(runner2.checkpoint_file) as f:
+            self.assertEqual(json.load(f)["journal_seq"], journal_seq)
+        shutil.rmtree(tmpdir)
+
     def testUserCheckpoint(self):
         ray.init(num_cpus=3)
         tmpdir = tempfile.mkdtemp()
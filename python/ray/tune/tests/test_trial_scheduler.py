@@ -101,6 +101,20 @@ class EarlyStoppingSuite(unittest.TestCase):
             rule.on_trial_result(runner, t3, result(3, 10)),
             TrialScheduler.STOP)
 
+    def testMedianStoppingRestoredTrial(self):
+        rule = MedianStoppingRule(grace_period=0, min_samples_required=1)
+        t1, t2 = self.basicSetup(rule)
+        runner = mock_trial_runner()
+        # t1 is restored from a checkpoint at time 4 and reports again.
+        for i in range(5, 10):
+            rule.on_trial_result(runner, t1, result(i, 0))
+        rule.on_trial_complete(runner, t1, result(10, 0))
+        self.assertAlmostEqual(rule._running_mean(t1, 10), 1000 / 11)
+        t3 = Trial("PPO")
+        self.assertEqual(
+            rule.on_trial_result(runner, t3, result(10, 100)),
+            TrialScheduler.CONTINUE)
+
     def testMedianStoppingMinSamples(self):
         rule = MedianStoppingRule(grace_period=0, min_samples_required=2)
         t1, t2 = self.basicSetup(rule)
@@ -146,6 +160,35 @@ class EarlyStoppingSuite(unittest.TestCase):
             rule.on_trial_result(runner, t3, result(2, 260)),
             TrialScheduler.PAUSE)
 
+    def testMedianStoppingManyTrials(self):
+        rule = MedianStoppingRule(grace_period=3, min_samples_required=1)
+        runner = mock_trial_runner()
+        results = {}
+        for i in range(20):
+            trial = Trial("PPO")
+            num_results = random.randint(1, 10)
+            results[trial] = [
+                result(t, random.random()) for t in range(num_results)
+            ]
+            for r in results[trial]:
+                rule.on_trial_result(runner, trial, r)
+
+        for time in [3, 5, 9]:
+            trials = [t for t in results if len(results[t]) > time]
+            self.assertEqual(set(rule._trials_beyond_time(time)), set(trials))
+            expected_means = [
+                np.mean([
+                    r["episode_reward_mean"] for r in results[t]
+                    if 3 <= r["time_total_s"] <= time
+                ]) for t in trials
+            ]
+            self.assertAlmostEqual(
+                rule._median_result(trials, time), np.median(expected_means))
+        for trial in results:
+            self.assertEqual(
+                rule._best_result(trial),
+                max(r["episode_reward_mean"] for r in results[trial]))
+
     def _test_metrics(self, result_func, metric, mode):
         rule = MedianStoppingRule(
             grace_period=0,
@@ -1069,6 +1112,26 @@ class PopulationBasedTestingSuite(unittest.TestCase):
                 check_policy(json.loads(line))
         shutil.rmtree(tmpdir)
 
+    def testQuantilesIgnoreFinishedTrials(self):
+        pbt, runner = self.basicSetup()
+        trials = runner.get_trials()
+        self.assertEqual(pbt._quantiles(),
+                         ([trials[0], trials[1]], [trials[3], trials[4]]))
+
+        trials[4].status = Trial.TERMINATED
+        pbt.on_trial_complete(runner, trials[4], result(10, 200))
+        self.assertEqual(pbt._quantiles(), ([trials[0]], [trials[3]]))
+
+        pbt.on_trial_remove(runner, trials[3])
+        self.assertEqual(pbt._quantiles(), ([trials[0]], [trials[2]]))
+
+        # Errored trials that are requeued are still ranked.
+        pbt.on_trial_error(runner, trials[0])
+        self.assertEqual(pbt._quantiles(), ([trials[0]], [trials[2]]))
+        trials[0].status = Trial.ERROR
+        pbt.on_trial_error(runner, trials[0])
+        self.assertEqual(pbt._quantiles(), ([trials[1]], [trials[2]]))
+
     def testPostprocessingHook(self):
         def explore(new_config):
             new_config["id_factor"] = 42
@@ -50,6 +50,34 @@ class VariantGeneratorTest(unittest.TestCase):
                          os.path.join(DEFAULT_RESULTS_DIR, "tune-pong"))
         self.assertEqual(trials[1].experiment_tag, "1")
 
+    def testLazyBatches(self):
+        spec = {
+            "run": "PPO",
+            "config": {
+                "x": grid_search(list(range(10))),
+                "y": grid_search(list(range(10))),
+            },
+        }
+        suggester = BasicVariantGenerator(max_batch_size=30)
+        suggester.add_configurations({"lazy": spec})
+        batches = []
+        while not suggester.is_finished():
+            batches.append(suggester.next_trials())
+        self.assertEqual([len(batch) for batch in batches], [30, 30, 30, 10])
+        self.assertEqual(suggester.num_generated_trials, 100)
+        trials = sum(batches, [])
+        self.assertEqual([t.trial_id for t in trials],
+                         ["%05d" % i for i in range(100)])
+
+        # Resuming only generates the trials that were not generated yet.
+        suggester = BasicVariantGenerator(max_batch_size=30)
+        suggester.skip_generated_trials(60)
+        suggester.add_configurations({"lazy": spec})
+        resumed = suggester.next_trials() + suggester.next_trials()
+        self.assertTrue(suggester.is_finished())
+        self.assertEqual([t.experiment_tag for t in resumed],
+                         [t.experiment_tag for t in trials[60:]])
+
     def testEval(self):
         trials = self.generate_trials({
             "run": "PPO",
@@ -340,6 +340,10 @@ class Trainable:
                                       "checkpoint_{}".format(self._iteration))
         TrainableUtil.make_checkpoint_dir(checkpoint_dir)
         checkpoint = self._save(checkpoint_dir)
+        return self._write_checkpoint(checkpoint_dir, checkpoint)
+
+    def _write_checkpoint(self, checkpoint_dir, checkpoint):
+        """Writes the return value of ``_save()`` and the metadata to disk."""
         saved_as_dict = False
         if isinstance(checkpoint, string_types):
             if not checkpoint.startswith(checkpoint_dir):
@@ -362,27 +366,47 @@ class Trainable:
                              "Expected str or dict.".format(type(checkpoint)))
 
         with open(checkpoint_path + ".tune_metadata", "wb") as f:
-            pickle.dump({
-                "experiment_id": self._experiment_id,
-                "iteration": self._iteration,
-                "timesteps_total": self._timesteps_total,
-                "time_total": self._time_total,
-                "episodes_total": self._episodes_total,
-                "saved_as_dict": saved_as_dict,
-                "ray_version": ray.__version__,
-            }, f)
+            pickle.dump(self._checkpoint_metadata(saved_as_dict), f)
         return checkpoint_path
 
+    def _checkpoint_metadata(self, saved_as_dict):
+        return {
+            "experiment_id": self._experiment_id,
+            "iteration": self._iteration,
+            "timesteps_total": self._timesteps_total,
+            "time_total": self._time_total,
+            "episodes_total": self._episodes_total,
+            "saved_as_dict": saved_as_dict,
+            "ray_version": ray.__version__,
+        }
+
     def save_to_object(self):
         """Saves the current model state to a Python object.
 
-        It also saves to disk but does not return the checkpoint path.
+        If ``_save()`` returns a dict and writes no files, the dict is
+        returned as is instead of being written to disk. When the object is
+        put in the object store, numpy arrays in the dict are stored without
+        being pickled, so they can be restored without writing them to disk.
+        Otherwise, the checkpoint is saved to disk and its files are read
+        into the returned object.
 
         Returns:
             Object holding checkpoint data.
         """
         tmpdir = tempfile.mkdtemp("save_to_object", dir=self.logdir)
-        checkpoint_path = self.save(tmpdir)
+        checkpoint_dir = os.path.join(tmpdir,
+                                      "checkpoint_{}".format(self._iteration))
+        TrainableUtil.make_checkpoint_dir(checkpoint_dir)
+        checkpoint = self._save(checkpoint_dir)
+        if isinstance(checkpoint, dict) and os.listdir(checkpoint_dir) == [
+                ".is_checkpoint"
+        ]:
+            shutil.rmtree(tmpdir)
+            return {
+                "metadata": self._checkpoint_metadata(saved_as_dict=True),
+                "state": checkpoint,
+            }
+        checkpoint_path = self._write_checkpoint(checkpoint_dir, checkpoint)
         # Save all files in subtree.
         data_dict = TrainableUtil.pickle_checkpoint(checkpoint_path)
         out = io.BytesIO()
@@ -402,25 +426,27 @@ class Trainable:
         """
         with open(checkpoint_path + ".tune_metadata", "rb") as f:
             metadata = pickle.load(f)
+        if metadata["saved_as_dict"]:
+            with open(checkpoint_path, "rb") as loaded_state:
+                checkpoint_dict = pickle.load(loaded_state)
+            checkpoint_dict.update(tune_checkpoint_path=checkpoint_path)
+            self._restore_with_metadata(checkpoint_dict, metadata)
+        else:
+            self._restore_with_metadata(checkpoint_path, metadata)
+        logger.info("Restored on %s from checkpoint: %s",
+                    self.get_current_ip(), checkpoint_path)
+
+    def _restore_with_metadata(self, checkpoint, metadata):
         self._experiment_id = metadata["experiment_id"]
         self._iteration = metadata["iteration"]
         self._timesteps_total = metadata["timesteps_total"]
         self._time_total = metadata["time_total"]
         self._episodes_total = metadata["episodes_total"]
-        saved_as_dict = metadata["saved_as_dict"]
-        if saved_as_dict:
-            with open(checkpoint_path, "rb") as loaded_state:
-                checkpoint_dict = pickle.load(loaded_state)
-            checkpoint_dict.update(tune_checkpoint_path=checkpoint_path)
-            self._restore(checkpoint_dict)
-        else:
-            self._restore(checkpoint_path)
+        self._restore(checkpoint)
         self._time_since_restore = 0.0
         self._timesteps_since_restore = 0
         self._iterations_since_restore = 0
         self._restored = True
-        logger.info("Restored on %s from checkpoint: %s",
-                    self.get_current_ip(), checkpoint_path)
         state = {
             "_iteration": self._iteration,
             "_timesteps_total": self._timesteps_total,
@@ -433,7 +459,19 @@ class Trainable:
         """Restores training state from a checkpoint object.
 
         These checkpoints are returned from calls to save_to_object().
+        Checkpoints of dicts returned by ``_save()`` are restored without
+        writing them to disk.
         """
+        if isinstance(obj, dict):
+            # Numpy arrays fetched from the object store are read-only, so
+            # copy them in case the trainable updates its state in place.
+            checkpoint_dict = dict(
+                copy.deepcopy(obj["state"]), tune_checkpoint_path=None)
+            self._restore_with_metadata(checkpoint_dict, obj["metadata"])
+            logger.info("Restored on %s from checkpoint object.",
+                        self.get_current_ip())
+            return
+
         info = pickle.loads(obj)
         data = info["data"]
         tmpdir = tempfile.mkdtemp("restore_from_object", dir=self.logdir)
@@ -503,6 +541,57 @@ class Trainable:
         """
         return False
 
+    def reset(self, new_config, logger_creator=None, restoring=False):
+        """Resets the trainable so that its actor can run a new trial.
+
+        If the new trial is restored from a checkpoint right after, all state
+        other than the configuration is overwritten anyway, so
+        ``reset_config()`` is tried first. Otherwise the trainable is reset
+        generically, by calling ``_stop()`` and ``_setup()`` again. This
+        keeps the process and the imported modules warm, but discards all
+        other state. The generic reset is only done for trainables that do
+        not override ``__init__()``, since these may keep state outside of
+        ``_setup()``.
+
+        Args:
+            new_config (dict): Configuration of the new trial.
+            logger_creator (func): Function that creates the logger of the
+                new trial. If unspecified, the current logger is kept.
+            restoring (bool): Whether the new trial is restored from a
+                checkpoint after the reset.
+
+        Returns:
+            True if reset was successful else False.
+        """
+        new_config = dict(new_config)
+        trial_info = new_config.pop(TRIAL_INFO, None)
+        setup_required = not (restoring and self.reset_config(new_config))
+        if setup_required:
+            if type(self).__init__ is not Trainable.__init__:
+                return False
+            self._stop()
+        self.config = new_config
+
+        if logger_creator:
+            self._result_logger.flush()
+            self._result_logger.close()
+            self._result_logger = logger_creator(self.config)
+            self._logdir = self._result_logger.logdir
+        self._experiment_id = uuid.uuid4().hex
+        self._iteration = 0
+        self._time_total = 0.0
+        self._timesteps_total = None
+        self._episodes_total = None
+        self._time_since_restore = 0.0
+        self._timesteps_since_restore = 0
+        self._iterations_since_restore = 0
+        self._restored = False
+        self._trial_info = trial_info
+
+        if setup_required:
+            self._setup(copy.deepcopy(self.config))
+        return True
+
     def stop(self):
         """Releases all resources used by this trainable."""
         self._result_logger.flush()
@@ -649,7 +738,9 @@ class Trainable:
                 returned by `_save`. If a string, then it is a checkpoint path
                 that may have a different prefix than that returned by `_save`.
                 The directory structure underneath the `checkpoint_dir`
-                `_save` is preserved.
+                `_save` is preserved. The `tune_checkpoint_path` of a dict
+                restored from the object store (e.g. when PBT clones a trial)
+                is None.
         """
 
         raise NotImplementedError
@@ -11,7 +11,7 @@ from numbers import Number
 from ray.tune import TuneError
 from ray.tune.checkpoint_manager import Checkpoint, CheckpointManager
 from ray.tune.durable_trainable import DurableTrainable
-from ray.tune.logger import pretty_print, UnifiedLogger
+from ray.tune.logger import ASYNC_LOGGING, pretty_print, UnifiedLogger
 # NOTE(rkn): We import ray.tune.registry here instead of importing the names we
 # need because there are cyclic imports that may cause specific names to not
 # have been defined yet. See https://github.com/ray-project/ray/issues/1716.
@@ -318,7 +318,8 @@ class Trial:
                 self.logdir,
                 trial=self,
                 loggers=self.loggers,
-                sync_function=self.sync_to_driver_fn)
+                sync_function=self.sync_to_driver_fn,
+                async_logging=ASYNC_LOGGING)
 
     def update_resources(self, cpu, gpu, **kwargs):
         """EXPERIMENTAL: Updates the resource requirements.
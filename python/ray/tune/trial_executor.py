@@ -25,6 +25,7 @@ class TrialExecutor:
         """
         self._queue_trials = queue_trials
         self._cached_trial_state = {}
+        self._updated_trial_ids = set()
 
     def set_status(self, trial, status):
         """Sets status and checkpoints metadata if needed.
@@ -59,6 +60,7 @@ class TrialExecutor:
         try:
             logger.debug("Trial %s: Saving trial metadata.", trial)
             self._cached_trial_state[trial.trial_id] = trial.__getstate__()
+            self._updated_trial_ids.add(trial.trial_id)
         except Exception:
             logger.exception("Trial %s: Error checkpointing trial metadata.",
                              trial)
@@ -67,6 +69,20 @@ class TrialExecutor:
         """Returns a copy of mapping of the trial ID to pickled metadata."""
         return self._cached_trial_state.copy()
 
+    def pop_updated_checkpoints(self):
+        """Returns the metadata that changed since the last call.
+
+        Returns:
+            Mapping of the trial ID to pickled metadata for the trials whose
+                metadata was checkpointed since this was last called.
+        """
+        updated = {
+            trial_id: self._cached_trial_state[trial_id]
+            for trial_id in self._updated_trial_ids
+        }
+        self._updated_trial_ids = set()
+        return updated
+
     def has_resources(self, resources):
         """Returns whether this runner has at least the specified resources."""
         raise NotImplementedError("Subclasses of TrialExecutor must provide "
@@ -184,6 +200,17 @@ class TrialExecutor:
         """
         raise NotImplementedError
 
+    def get_next_available_trials(self, max_trials=1):
+        """Blocking call that waits until at least one result is ready.
+
+        Args:
+            max_trials (int): The maximum number of trials to return.
+
+        Returns:
+            List of Trial objects that are ready for intermediate processing.
+        """
+        return [self.get_next_available_trial()]
+
     def get_next_failed_trial(self):
         """Non-blocking call that detects and returns one failed trial.
 
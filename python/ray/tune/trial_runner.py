@@ -10,6 +10,8 @@ import types
 import ray.cloudpickle as cloudpickle
 from ray.tune import TuneError
 from ray.tune.stopper import NoopStopper
+from ray.tune.experiment_journal import (ExperimentJournal, get_journal_path,
+                                         load_experiment_state)
 from ray.tune.progress_reporter import trial_progress_str
 from ray.tune.ray_trial_executor import RayTrialExecutor
 from ray.tune.result import (TIME_THIS_ITER_S, RESULT_DUPLICATE,
@@ -23,6 +25,14 @@ from ray.tune.web_server import TuneServer
 from ray.utils import binary_to_hex, hex_to_binary
 
 MAX_DEBUG_TRIALS = 20
+# The maximum number of ready results `tune.run` processes in one step of
+# the event loop.
+DEFAULT_MAX_RESULTS_PER_STEP = int(
+    os.environ.get("TUNE_MAX_RESULTS_PER_STEP", 32))
+# New trials are only requested from the search algorithm when fewer trials
+# than this are pending.
+DEFAULT_MAX_PENDING_TRIALS = int(
+    os.environ.get("TUNE_MAX_PENDING_TRIALS", 1000))
 
 logger = logging.getLogger(__name__)
 
@@ -110,9 +120,16 @@ class TrialRunner:
         checkpoint_period (int): Trial runner checkpoint periodicity in
             seconds. Defaults to 10.
         trial_executor (TrialExecutor): Defaults to RayTrialExecutor.
+        max_results_per_step (int): The maximum number of ready results
+            processed in one step. Processing several results per step
+            amortizes the experiment checkpoint and the other per-step work
+            across them. Defaults to 1.
     """
 
     CKPT_FILE_TMPL = "experiment_state-{}.json"
+    # The experiment journal is compacted once it is larger than both the
+    # last full checkpoint and this size.
+    MIN_JOURNAL_COMPACTION_BYTES = 1024 * 1024
     VALID_RESUME_TYPES = [True, "LOCAL", "REMOTE", "PROMPT"]
 
     def __init__(self,
@@ -128,7 +145,9 @@ class TrialRunner:
                  fail_fast=False,
                  verbose=True,
                  checkpoint_period=10,
-                 trial_executor=None):
+                 trial_executor=None,
+                 max_results_per_step=1,
+                 max_pending_trials=None):
         self._search_alg = search_alg or BasicVariantGenerator()
         self._scheduler_alg = scheduler or FIFOScheduler()
         self.trial_executor = trial_executor or RayTrialExecutor()
@@ -142,6 +161,17 @@ class TrialRunner:
         self._has_errored = False
         self._fail_fast = fail_fast
         self._verbose = verbose
+        self._max_results_per_step = max_results_per_step
+        self._max_pending_trials = max_pending_trials
+        # Set when resuming with a BasicVariantGenerator.
+        self._num_generated_trials = None
+        self._step_stats = {
+            "num_steps": 0,
+            "num_results": 0,
+            "step_time_s": 0.0,
+            "process_results_time_s": 0.0,
+            "checkpoint_time_s": 0.0,
+        }
 
         self._server = None
         self._server_port = server_port
@@ -153,6 +183,10 @@ class TrialRunner:
         self._stop_queue = []
         self._should_stop_experiment = False  # used by TuneServer
         self._local_checkpoint_dir = local_checkpoint_dir
+        self._journal = None
+        # Sequence number of the last journal entry of a resumed experiment.
+        self._journal_seq = 0
+        self._last_full_checkpoint_size = 0
 
         if self._local_checkpoint_dir:
             os.makedirs(self._local_checkpoint_dir, exist_ok=True)
@@ -189,6 +223,10 @@ class TrialRunner:
     def scheduler_alg(self):
         return self._scheduler_alg
 
+    @property
+    def search_alg(self):
+        return self._search_alg
+
     def _validate_resume(self, resume_type):
         """Checks whether to resume experiment.
 
@@ -242,6 +280,14 @@ class TrialRunner:
     def add_experiment(self, experiment):
         if not self._resumed:
             self._search_alg.add_configurations([experiment])
+        elif (isinstance(self._search_alg, BasicVariantGenerator)
+              and self._num_generated_trials is not None):
+            # Trials are generated lazily, so the checkpoint may not contain
+            # all trials of the experiment. Generate the remaining ones.
+            logger.info("TrialRunner resumed, generating the trials not "
+                        "generated before the checkpoint.")
+            self._search_alg.skip_generated_trials(self._num_generated_trials)
+            self._search_alg.add_configurations([experiment])
         else:
             logger.info("TrialRunner resumed, ignoring new add_experiment.")
 
@@ -251,8 +297,14 @@ class TrialRunner:
         Overwrites the current session checkpoint, which starts when self
         is instantiated. Throttle depends on self._checkpoint_period.
 
+        Only the trials that changed since the last checkpoint and the
+        runner state are appended to the session's experiment journal. The
+        whole experiment state is rewritten (compacting the journal) on the
+        first checkpoint of the session, when forced, and when the journal
+        has grown larger than the last full checkpoint.
+
         Args:
-            force (bool): Forces a checkpoint despite checkpoint_period.
+            force (bool): Forces a full checkpoint despite checkpoint_period.
         """
         if not self._local_checkpoint_dir:
             return
@@ -261,26 +313,56 @@ class TrialRunner:
                 not force):
             return
         self._last_checkpoint_time = now
+        updated_checkpoints = self.trial_executor.pop_updated_checkpoints()
+        runner_data = self.__getstate__()
+        stats = {
+            "start_time": self._start_time,
+            "timestamp": self._last_checkpoint_time,
+            "step_stats": self.step_stats(),
+        }
+        if (force or self._journal is None or self._journal.num_bytes > max(
+                self._last_full_checkpoint_size,
+                self.MIN_JOURNAL_COMPACTION_BYTES)):
+            self._write_full_checkpoint(runner_data, stats)
+        else:
+            self._journal.append(
+                list(updated_checkpoints.values()), runner_data, stats)
+
+        if force:
+            self._syncer.sync_up()
+        else:
+            self._syncer.sync_up_if_needed()
+        return self._local_checkpoint_dir
+
+    def _write_full_checkpoint(self, runner_data, stats):
+        """Writes the whole experiment state and starts a new journal."""
+        journal_seq = self._journal.seq if self._journal else self._journal_seq
         runner_state = {
             "checkpoints": list(
                 self.trial_executor.get_checkpoints().values()),
-            "runner_data": self.__getstate__(),
-            "stats": {
-                "start_time": self._start_time,
-                "timestamp": self._last_checkpoint_time
-            }
+            "runner_data": runner_data,
+            "stats": stats,
+            "journal_seq": journal_seq,
         }
         tmp_file_name = os.path.join(self._local_checkpoint_dir,
                                      ".tmp_checkpoint")
         with open(tmp_file_name, "w") as f:
             json.dump(runner_state, f, indent=2, cls=_TuneFunctionEncoder)
 
+        # The entries of the old journal are all part of the checkpoint now.
+        # Remove it before replacing the checkpoint, so that they are never
+        # replayed on top of the new checkpoint.
+        if self._journal:
+            self._journal.close()
+        journal_path = get_journal_path(self.checkpoint_file)
+        if os.path.exists(journal_path):
+            os.remove(journal_path)
         os.rename(tmp_file_name, self.checkpoint_file)
-        if force:
-            self._syncer.sync_up()
-        else:
-            self._syncer.sync_up_if_needed()
-        return self._local_checkpoint_dir
+        self._last_full_checkpoint_size = os.path.getsize(self.checkpoint_file)
+        self._journal = ExperimentJournal(
+            journal_path,
+            start_seq=journal_seq,
+            encoder_cls=_TuneFunctionEncoder)
 
     def resume(self):
         """Resumes all checkpointed trials from previous run.
@@ -289,9 +371,10 @@ class TrialRunner:
         all ongoing trials.
         """
         newest_ckpt_path = _find_newest_ckpt(self._local_checkpoint_dir)
-        with open(newest_ckpt_path, "r") as f:
-            runner_state = json.load(f, cls=_TuneFunctionDecoder)
-            self.checkpoint_file = newest_ckpt_path
+        runner_state = load_experiment_state(
+            newest_ckpt_path, decoder_cls=_TuneFunctionDecoder)
+        self.checkpoint_file = newest_ckpt_path
+        self._journal_seq = runner_state.get("journal_seq", 0)
 
         logger.warning("".join([
             "Attempting to resume experiment from {}. ".format(
@@ -329,25 +412,29 @@ class TrialRunner:
         """
         if self.is_finished():
             raise TuneError("Called step when all trials finished?")
+        step_start = time.time()
         with warn_if_slow("on_step_begin"):
             self.trial_executor.on_step_begin(self)
         next_trial = self._get_next_trial()  # blocking
+        num_results = 0
         if next_trial is not None:
             with warn_if_slow("start_trial"):
                 self.trial_executor.start_trial(next_trial)
         elif self.trial_executor.get_running_trials():
-            self._process_events()  # blocking
+            num_results = self._process_events()  # blocking
         else:
             self.trial_executor.on_no_available_trials(self)
 
         self._stop_experiment_if_needed()
 
+        checkpoint_start = time.time()
         try:
             with warn_if_slow("experiment_checkpoint"):
                 self.checkpoint()
         except Exception:
             logger.exception("Trial Runner checkpointing failed.")
         self._iteration += 1
+        self._step_stats["checkpoint_time_s"] += time.time() - checkpoint_start
 
         if self._server:
             with warn_if_slow("server"):
@@ -357,6 +444,25 @@ class TrialRunner:
                 self._server.shutdown()
         with warn_if_slow("on_step_end"):
             self.trial_executor.on_step_end(self)
+        self._step_stats["num_steps"] += 1
+        self._step_stats["num_results"] += num_results
+        self._step_stats["step_time_s"] += time.time() - step_start
+
+    def step_stats(self):
+        """Returns statistics about the overhead of the event loop.
+
+        Returns:
+            Dict with the number of steps and results processed so far, and
+            the time spent in steps, in processing results and in experiment
+            checkpoints. The overhead is the step time not spent processing
+            results.
+        """
+        stats = self._step_stats.copy()
+        num_steps = max(stats["num_steps"], 1)
+        stats["mean_results_per_step"] = stats["num_results"] / num_steps
+        stats["mean_step_overhead_s"] = (
+            stats["step_time_s"] - stats["process_results_time_s"]) / num_steps
+        return stats
 
     def get_trial(self, tid):
         trial = [t for t in self._trials if t.trial_id == tid]
@@ -420,6 +526,14 @@ class TrialRunner:
         return trial
 
     def _process_events(self):
+        """Processes the failed trial or the ready results of the trials.
+
+        Blocks until at least one result is ready. Up to
+        `max_results_per_step` ready results are processed together.
+
+        Returns:
+            The number of results processed.
+        """
         failed_trial = self.trial_executor.get_next_failed_trial()
         if failed_trial:
             error_msg = (
@@ -428,28 +542,45 @@ class TrialRunner:
             logger.info(error_msg)
             with warn_if_slow("process_failed_trial"):
                 self._process_trial_failure(failed_trial, error_msg=error_msg)
+            return 0
+
+        # TODO(ujvl): Consider combining get_next_available_trial and
+        #  fetch_result functionality so that we don't timeout on fetch.
+        trials = self.trial_executor.get_next_available_trials(
+            self._max_results_per_step)  # blocking
+        process_start = time.time()
+        num_results = 0
+        for trial in trials:
+            # Processing an earlier result of the batch (e.g., a scheduler
+            # decision) may have stopped or paused this trial.
+            if trial.status != Trial.RUNNING:
+                continue
+            self._process_trial_event(trial)
+            num_results += 1
+        self._step_stats["process_results_time_s"] += (
+            time.time() - process_start)
+        return num_results
+
+    def _process_trial_event(self, trial):
+        """Processes the ready result, save or restore of a trial."""
+        if trial.is_restoring:
+            with warn_if_slow("process_trial_restore"):
+                self._process_trial_restore(trial)
+        elif trial.is_saving:
+            with warn_if_slow("process_trial_save") as profile:
+                self._process_trial_save(trial)
+            if profile.too_slow and trial.sync_on_checkpoint:
+                # TODO(ujvl): Suggest using DurableTrainable once
+                #  API has converged.
+                logger.warning(
+                    "Consider turning off forced head-worker trial "
+                    "checkpoint syncs by setting sync_on_checkpoint=False"
+                    ". Note that this may result in faulty trial "
+                    "restoration if a failure occurs while the checkpoint "
+                    "is being synced from the worker to the head node.")
         else:
-            # TODO(ujvl): Consider combining get_next_available_trial and
-            #  fetch_result functionality so that we don't timeout on fetch.
-            trial = self.trial_executor.get_next_available_trial()  # blocking
-            if trial.is_restoring:
-                with warn_if_slow("process_trial_restore"):
-                    self._process_trial_restore(trial)
-            elif trial.is_saving:
-                with warn_if_slow("process_trial_save") as profile:
-                    self._process_trial_save(trial)
-                if profile.too_slow and trial.sync_on_checkpoint:
-                    # TODO(ujvl): Suggest using DurableTrainable once
-                    #  API has converged.
-                    logger.warning(
-                        "Consider turning off forced head-worker trial "
-                        "checkpoint syncs by setting sync_on_checkpoint=False"
-                        ". Note that this may result in faulty trial "
-                        "restoration if a failure occurs while the checkpoint "
-                        "is being synced from the worker to the head node.")
-            else:
-                with warn_if_slow("process_trial"):
-                    self._process_trial(trial)
+            with warn_if_slow("process_trial"):
+                self._process_trial(trial)
 
     def _process_trial(self, trial):
         """Processes a trial result.
@@ -680,6 +811,11 @@ class TrialRunner:
                 or is_finished (timeout or search algorithm finishes).
             timeout (int): Seconds before blocking times out.
         """
+        if not blocking and self._max_pending_trials is not None:
+            num_pending = sum(
+                1 for trial in self._trials if trial.status == Trial.PENDING)
+            if num_pending >= self._max_pending_trials:
+                return
         trials = self._search_alg.next_trials()
         if blocking and not trials:
             start = time.time()
@@ -758,9 +894,14 @@ class TrialRunner:
                 "_scheduler_alg",
                 "trial_executor",
                 "_syncer",
+                "_journal",
+                "_journal_seq",
         ]:
             del state[k]
         state["launch_web_server"] = bool(self._server)
+        if isinstance(self._search_alg, BasicVariantGenerator):
+            state["_num_generated_trials"] = (
+                self._search_alg.num_generated_trials)
         return state
 
     def __setstate__(self, state):
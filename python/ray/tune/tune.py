@@ -9,7 +9,8 @@ from ray.tune.trainable import Trainable
 from ray.tune.ray_trial_executor import RayTrialExecutor
 from ray.tune.registry import get_trainable_cls
 from ray.tune.syncer import wait_for_sync
-from ray.tune.trial_runner import TrialRunner
+from ray.tune.trial_runner import (TrialRunner, DEFAULT_MAX_PENDING_TRIALS,
+                                   DEFAULT_MAX_RESULTS_PER_STEP)
 from ray.tune.progress_reporter import CLIReporter, JupyterNotebookReporter
 from ray.tune.schedulers import (HyperBandScheduler, AsyncHyperBandScheduler,
                                  FIFOScheduler, MedianStoppingRule)
@@ -94,7 +95,7 @@ def run(run_or_experiment,
         progress_reporter=None,
         resume=False,
         queue_trials=False,
-        reuse_actors=False,
+        reuse_actors=True,
         trial_executor=None,
         raise_on_failed_trial=True,
         return_trials=False,
@@ -203,8 +204,11 @@ def run(run_or_experiment,
             automatic scale-up.
         reuse_actors (bool): Whether to reuse actors between different trials
             when possible. This can drastically speed up experiments that start
-            and stop actors often (e.g., PBT in time-multiplexing mode). This
-            requires trials to have the same resource requirements.
+            and stop actors often (e.g., PBT in time-multiplexing mode). Only
+            trials of the same trainable with the same resource requirements
+            share actors, and an idle actor is started ahead of demand when
+            resources are left free. See ``Trainable.reset`` for how actors
+            are reset between trials. Defaults to True.
         trial_executor (TrialExecutor): Manage the execution of trials.
         raise_on_failed_trial (bool): Raise TuneError if there exists failed
             trial (of ERROR state) when the experiments complete.
@@ -221,7 +225,7 @@ def run(run_or_experiment,
     Examples:
         >>> tune.run(mytrainable, scheduler=PopulationBasedTraining())
 
-        >>> tune.run(mytrainable, num_samples=5, reuse_actors=True)
+        >>> tune.run(mytrainable, num_samples=5, reuse_actors=False)
 
         >>> tune.run(
         >>>     "PG",
@@ -235,7 +239,8 @@ def run(run_or_experiment,
     trial_executor = trial_executor or RayTrialExecutor(
         queue_trials=queue_trials,
         reuse_actors=reuse_actors,
-        ray_auto_init=ray_auto_init)
+        ray_auto_init=ray_auto_init,
+        prestart_actors=reuse_actors)
     if isinstance(run_or_experiment, list):
         experiments = run_or_experiment
     else:
@@ -288,7 +293,9 @@ def run(run_or_experiment,
         server_port=server_port,
         verbose=bool(verbose > 1),
         fail_fast=fail_fast,
-        trial_executor=trial_executor)
+        trial_executor=trial_executor,
+        max_results_per_step=DEFAULT_MAX_RESULTS_PER_STEP,
+        max_pending_trials=DEFAULT_MAX_PENDING_TRIALS)
 
     for exp in experiments:
         runner.add_experiment(exp)
@@ -359,7 +366,7 @@ def run_experiments(experiments,
                     progress_reporter=None,
                     resume=False,
                     queue_trials=False,
-                    reuse_actors=False,
+                    reuse_actors=True,
                     trial_executor=None,
                     raise_on_failed_trial=True,
                     concurrent=True):
@@ -209,7 +209,7 @@ def RunnerHandler(runner):
             """Add trial by invoking TrialRunner."""
             resource = {}
             resource["trials"] = []
-            trial_generator = BasicVariantGenerator()
+            trial_generator = BasicVariantGenerator(max_batch_size=None)
             trial_generator.add_configurations({name: spec})
             for trial in trial_generator.next_trials():
                 runner.add_trial(trial)
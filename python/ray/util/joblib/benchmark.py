@@ -0,0 +1,73 @@
+"""Benchmark of joblib backends on a grid search with many fast fits.
+
+This compares the ray backend with joblib's local loky backend, and with
+the previous ray backend, which ran joblib's multiprocessing backend on a
+ray.util.multiprocessing Pool.
+
+    python -m ray.util.joblib.benchmark --address=auto
+"""
+
+import argparse
+import time
+
+import joblib
+from joblib._parallel_backends import MultiprocessingBackend
+from joblib.pool import PicklingPool
+import numpy as np
+from sklearn.datasets import load_digits
+from sklearn.model_selection import GridSearchCV
+from sklearn.tree import DecisionTreeClassifier
+
+import ray
+from ray.util.joblib import register_ray
+from ray.util.multiprocessing.pool import Pool
+
+
+class RayPoolBackend(MultiprocessingBackend):
+    """The previous ray backend, which runs batches on a ray Pool."""
+
+    def configure(self, n_jobs=1, parallel=None, **backend_args):
+        PicklingPool.__bases__ = (Pool, )
+        if n_jobs == -1:
+            n_jobs = int(ray.state.cluster_resources()["CPU"])
+        return super(RayPoolBackend, self).configure(n_jobs, parallel,
+                                                     **backend_args)
+
+
+def grid_search(backend, num_candidates, cv):
+    digits = load_digits()
+    param_grid = {
+        "max_depth": list(range(1, num_candidates + 1)),
+    }
+    search = GridSearchCV(
+        DecisionTreeClassifier(random_state=0), param_grid, cv=cv)
+    start = time.time()
+    with joblib.parallel_backend(backend, n_jobs=-1):
+        search.fit(digits.data, digits.target)
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--address", type=str, default=None)
+    parser.add_argument("--num-candidates", type=int, default=200)
+    parser.add_argument("--cv", type=int, default=5)
+    parser.add_argument("--num-trials", type=int, default=3)
+    args = parser.parse_args()
+
+    ray.init(address=args.address)
+    register_ray()
+    joblib.register_parallel_backend("ray_pool", RayPoolBackend)
+
+    num_fits = args.num_candidates * args.cv
+    for backend in ["loky", "ray", "ray_pool"]:
+        durations = [
+            grid_search(backend, args.num_candidates, args.cv)
+            for _ in range(args.num_trials)
+        ]
+        print("{}: {} fits in {:.2f}s (min {:.2f}s)".format(
+            backend, num_fits, np.mean(durations), np.min(durations)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,58 +1,271 @@
-from joblib._parallel_backends import MultiprocessingBackend
-from joblib.pool import PicklingPool
+from joblib._parallel_backends import AutoBatchingMixin, ParallelBackendBase
+from multiprocessing import TimeoutError
+import itertools
 import logging
+import os
+import queue
+import threading
+import time
 
-from ray.util.multiprocessing.pool import Pool
 import ray
 
 RAY_ADDRESS_ENV = "RAY_ADDRESS"
 
+# Arguments of at least this many bytes (e.g., the training data of a grid
+# search) are put in the object store once per call to Parallel, instead of
+# being serialized with every batch.
+SHARED_ARGUMENT_MIN_BYTES = 100 * 1024
+
 logger = logging.getLogger(__name__)
 
 
-class RayBackend(MultiprocessingBackend):
+def _smooth(average, value):
+    """Exponentially weighted average, like in AutoBatchingMixin."""
+    return value if average == 0.0 else 0.8 * average + 0.2 * value
+
+
+def _map_arguments(items, fn):
+    """Applies fn to the arguments of (func, args, kwargs) calls."""
+    mapped = []
+    for func, args, kwargs in items:
+        args = [fn(arg) for arg in args]
+        kwargs = {k: fn(v) for k, v in kwargs.items()}
+        mapped.append((func, args, kwargs))
+    return mapped
+
+
+class _SharedArgument:
+    """Placeholder for an argument that was put in the object store."""
+
+    def __init__(self, object_id):
+        self.object_id = object_id
+
+
+@ray.remote
+def _run_batch(batch):
+    """Runs a joblib BatchedCalls and returns its duration and results."""
+    start = time.time()
+    object_ids = list({
+        value.object_id: None
+        for _, args, kwargs in batch.items
+        for value in itertools.chain(args, kwargs.values())
+        if isinstance(value, _SharedArgument)
+    })
+    values = dict(zip(object_ids, ray.get(object_ids)))
+
+    def resolve(value):
+        if isinstance(value, _SharedArgument):
+            return values[value.object_id]
+        return value
+
+    batch.items = _map_arguments(batch.items, resolve)
+    results = batch()
+    return time.time() - start, results
+
+
+class _BatchResult:
+    """The result of a batch, as returned by RayBackend.apply_async."""
+
+    def __init__(self, object_id, callback):
+        self.object_id = object_id
+        self._callback = callback
+        self._ready = threading.Event()
+        self._results = None
+        self._error = None
+
+    def _set(self, results=None, error=None):
+        self._results = results
+        self._error = error
+        if error is None and self._callback is not None:
+            try:
+                self._callback(results)
+            except Exception as e:
+                self._error = e
+        self._ready.set()
+
+    def get(self, timeout=None):
+        if not self._ready.wait(timeout):
+            raise TimeoutError
+        if self._error is not None:
+            raise self._error
+        return self._results
+
+
+class _ResultThread(threading.Thread):
+    """Thread that fetches the results of batches as they finish."""
+
+    def __init__(self, backend):
+        threading.Thread.__init__(self, daemon=True)
+        self._backend = backend
+        # Thread-safe queue of _BatchResults to wait for. None stops the
+        # thread.
+        self._new_results = queue.Queue()
+
+    def add_result(self, result):
+        self._new_results.put(result)
+
+    def stop(self):
+        self._new_results.put(None)
+
+    def run(self):
+        pending = {}
+        while True:
+            # Get as many new results from the queue as possible without
+            # blocking, unless we have nothing to wait on, in which case we
+            # block.
+            while True:
+                try:
+                    result = self._new_results.get(block=len(pending) == 0)
+                except queue.Empty:
+                    break
+                if result is None:
+                    return
+                pending[result.object_id] = result
+
+            # Use a timeout so that new batches are picked up while waiting
+            # for long running ones.
+            ready, _ = ray.wait(list(pending), num_returns=1, timeout=0.1)
+            for object_id in ready:
+                result = pending.pop(object_id)
+                start = time.time()
+                try:
+                    duration, results = ray.get(object_id)
+                except Exception as e:
+                    result._set(error=e)
+                    continue
+                self._backend._record_batch(duration, time.time() - start)
+                result._set(results)
+
+
+class RayBackend(AutoBatchingMixin, ParallelBackendBase):
     """Ray backend uses ray, a system for scalable distributed computing.
     More info about Ray is available here: https://docs.ray.io.
+
+    Each batch of calls is run as a Ray task. Large arguments that are
+    shared by the calls, like the data of a grid search, are put in the
+    object store once. The batch size is tuned based on how long batches
+    take to run on the workers, and how long the driver spends to submit
+    batches and fetch their results.
     """
 
+    supports_timeout = True
+
+    # Batches should run on the workers for at least this many seconds.
+    MIN_IDEAL_BATCH_DURATION = 0.1
+    # Batches should also run long enough that submitting and fetching them
+    # takes at most 1 / ROUND_TRIP_FACTOR of the time on the driver.
+    ROUND_TRIP_FACTOR = 20
+
+    def __init__(self, **kwargs):
+        super(RayBackend, self).__init__(**kwargs)
+        self._lock = threading.Lock()
+        self._result_thread = None
+        # Map from the id() of shared arguments to the argument (to keep its
+        # id() from being reused) and its object ID.
+        self._shared_arguments = {}
+        # Smoothed time the driver spends to submit a batch and to fetch its
+        # results.
+        self._submit_duration = 0.0
+        self._fetch_duration = 0.0
+        # Time the last completed batch ran on its worker.
+        self._batch_duration = 0.0
+
     def configure(self,
                   n_jobs=1,
                   parallel=None,
                   prefer=None,
                   require=None,
-                  **memmappingpool_args):
-        """Make Ray Pool the father class of PicklingPool. PicklingPool is a
-        father class that inherits Pool from multiprocessing.pool. The next
-        line is a patch, which changes the inheritance of Pool to be from
-        ray.util.multiprocessing.pool.
+                  **backend_args):
+        """Connect to or start Ray. Use all available resources when
+        n_jobs == -1. Must set RAY_ADDRESS variable in the environment or run
+        ray.init(address=..) to run on multiple nodes.
         """
-        PicklingPool.__bases__ = (Pool, )
-        """Use all available resources when n_jobs == -1. Must set RAY_ADDRESS
-        variable in the environment or run ray.init(address=..) to run on
-        multiple nodes.
-        """
-        if n_jobs == -1:
-            if not ray.is_initialized():
-                import os
-                if RAY_ADDRESS_ENV in os.environ:
-                    ray_address = os.environ[RAY_ADDRESS_ENV]
-                    logger.info(
-                        "Connecting to ray cluster at address='{}'".format(
-                            ray_address))
-                    ray.init(address=ray_address)
-                else:
-                    logger.info("Starting local ray cluster")
-                    ray.init()
-            ray_cpus = int(ray.state.cluster_resources()["CPU"])
-            n_jobs = ray_cpus
-
-        eff_n_jobs = super(RayBackend, self).configure(
-            n_jobs, parallel, prefer, require, **memmappingpool_args)
-        return eff_n_jobs
+        if n_jobs == 0:
+            raise ValueError("n_jobs == 0 in Parallel has no meaning")
+        if not ray.is_initialized():
+            if RAY_ADDRESS_ENV in os.environ:
+                ray_address = os.environ[RAY_ADDRESS_ENV]
+                logger.info("Connecting to ray cluster at address='{}'".format(
+                    ray_address))
+                ray.init(address=ray_address)
+            else:
+                logger.info("Starting local ray cluster")
+                num_cpus = n_jobs if n_jobs is not None and n_jobs > 0 \
+                    else None
+                ray.init(num_cpus=num_cpus)
+        self.parallel = parallel
+        return self.effective_n_jobs(n_jobs)
 
     def effective_n_jobs(self, n_jobs):
-        eff_n_jobs = super(RayBackend, self).effective_n_jobs(n_jobs)
-        if n_jobs == -1:
+        if n_jobs == 0:
+            raise ValueError("n_jobs == 0 in Parallel has no meaning")
+        if n_jobs is None:
+            return 1
+        if n_jobs < 0:
             ray_cpus = int(ray.state.cluster_resources()["CPU"])
-            eff_n_jobs = ray_cpus
-        return eff_n_jobs
+            n_jobs = max(ray_cpus + 1 + n_jobs, 1)
+        return n_jobs
+
+    def apply_async(self, func, callback=None):
+        """Run a batch of calls as a Ray task."""
+        start = time.time()
+        func.items = _map_arguments(func.items, self._share)
+        result = _BatchResult(_run_batch.remote(func), callback)
+        with self._lock:
+            self._submit_duration = _smooth(self._submit_duration,
+                                            time.time() - start)
+            if self._result_thread is None:
+                self._result_thread = _ResultThread(self)
+                self._result_thread.start()
+            self._result_thread.add_result(result)
+        return result
+
+    def _share(self, value):
+        if getattr(value, "nbytes", 0) < SHARED_ARGUMENT_MIN_BYTES:
+            return value
+        if id(value) not in self._shared_arguments:
+            self._shared_arguments[id(value)] = (value, ray.put(value))
+        return _SharedArgument(self._shared_arguments[id(value)][1])
+
+    def _record_batch(self, duration, fetch_duration):
+        # Called by the result thread before the batch's callback, which
+        # calls batch_completed.
+        with self._lock:
+            self._batch_duration = duration
+            self._fetch_duration = _smooth(self._fetch_duration,
+                                           fetch_duration)
+
+    def compute_batch_size(self):
+        with self._lock:
+            round_trip = self._submit_duration + self._fetch_duration
+        # Set on the instance, where AutoBatchingMixin looks them up.
+        self.MIN_IDEAL_BATCH_DURATION = max(
+            type(self).MIN_IDEAL_BATCH_DURATION,
+            self.ROUND_TRIP_FACTOR * round_trip)
+        self.MAX_IDEAL_BATCH_DURATION = max(
+            type(self).MAX_IDEAL_BATCH_DURATION,
+            2 * self.MIN_IDEAL_BATCH_DURATION)
+        return super(RayBackend, self).compute_batch_size()
+
+    def batch_completed(self, batch_size, duration):
+        # Use how long the batch ran on its worker, instead of the time since
+        # it was dispatched, which includes the time it waited for a CPU.
+        with self._lock:
+            duration = self._batch_duration
+        super(RayBackend, self).batch_completed(batch_size, duration)
+
+    def stop_call(self):
+        # Release the shared arguments of this call.
+        self._shared_arguments = {}
+
+    def abort_everything(self, ensure_ready=True):
+        # Running tasks can't be cancelled, but their results are dropped.
+        self.terminate()
+
+    def terminate(self):
+        with self._lock:
+            if self._result_thread is not None:
+                self._result_thread.stop()
+                self._result_thread = None
+        self._shared_arguments = {}
+        self.reset_batch_stats()
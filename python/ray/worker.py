@@ -952,7 +952,11 @@ def print_logs(redis_client, threads_stopped):
                 continue
             num_consecutive_messages_received += 1
 
-            data = json.loads(ray.utils.decode(msg["data"]))
+            batch = json.loads(ray.utils.decode(msg["data"]))
+            # The log monitor publishes the new lines of several workers
+            # together in a list.
+            if not isinstance(batch, list):
+                batch = [batch]
 
             def color_for(data):
                 if data["pid"] == "raylet":
@@ -960,16 +964,17 @@ def print_logs(redis_client, threads_stopped):
                 else:
                     return colorama.Fore.CYAN
 
-            if data["ip"] == localhost:
-                for line in data["lines"]:
-                    print("{}{}(pid={}){} {}".format(
-                        colorama.Style.DIM, color_for(data), data["pid"],
-                        colorama.Style.RESET_ALL, line))
-            else:
-                for line in data["lines"]:
-                    print("{}{}(pid={}, ip={}){} {}".format(
-                        colorama.Style.DIM, color_for(data), data["pid"],
-                        data["ip"], colorama.Style.RESET_ALL, line))
+            for data in batch:
+                if data["ip"] == localhost:
+                    for line in data["lines"]:
+                        print("{}{}(pid={}){} {}".format(
+                            colorama.Style.DIM, color_for(data), data["pid"],
+                            colorama.Style.RESET_ALL, line))
+                else:
+                    for line in data["lines"]:
+                        print("{}{}(pid={}, ip={}){} {}".format(
+                            colorama.Style.DIM, color_for(data), data["pid"],
+                            data["ip"], colorama.Style.RESET_ALL, line))
 
             if (num_consecutive_messages_received % 100 == 0
                     and num_consecutive_messages_received > 0):
@@ -1451,8 +1456,7 @@ def get(object_ids, timeout=None):
     corresponding to each object in the list will be returned.
 
     This method will issue a warning if it's running inside async context,
-    you can use ``await object_id`` instead of ``ray.get(object_id)``. For
-    a list of object ids, you can use ``await asyncio.gather(*object_ids)``.
+    you can use ``await ray.get_async(object_ids)`` instead.
 
     Args:
         object_ids: Object ID of the object to get or a list of object IDs to
@@ -1478,9 +1482,9 @@ def get(object_ids, timeout=None):
         global blocking_get_inside_async_warned
         if not blocking_get_inside_async_warned:
             logger.debug("Using blocking ray.get inside async actor. "
-                         "This blocks the event loop. Please use `await` "
-                         "on object id with asyncio.gather if you want to "
-                         "yield execution to the event loop instead.")
+                         "This blocks the event loop. Please use `await "
+                         "ray.get_async(object_ids)` if you want to yield "
+                         "execution to the event loop instead.")
             blocking_get_inside_async_warned = True
 
     with profiling.profile("ray.get"):
@@ -1566,7 +1570,7 @@ def wait(object_ids, num_returns=1, timeout=None):
 
     This method will issue a warning if it's running inside an async context.
     Instead of ``ray.wait(object_ids)``, you can use
-    ``await asyncio.wait(object_ids)``.
+    ``await ray.wait_async(object_ids)``.
 
     Args:
         object_ids (List[ObjectID]): List of object IDs for objects that may or
@@ -1587,8 +1591,8 @@ def wait(object_ids, num_returns=1, timeout=None):
         global blocking_wait_inside_async_warned
         if not blocking_wait_inside_async_warned:
             logger.debug("Using blocking ray.wait inside async method. "
-                         "This blocks the event loop. Please use `await` "
-                         "on object id with asyncio.wait. ")
+                         "This blocks the event loop. Please use `await "
+                         "ray.wait_async(object_ids)` instead.")
             blocking_wait_inside_async_warned = True
 
     if isinstance(object_ids, ObjectID):
@@ -8,6 +8,7 @@ APEX_DDPG_DEFAULT_CONFIG = DDPGTrainer.merge_trainer_configs(
         "optimizer": {
             "max_weight_sync_delay": 400,
             "num_replay_buffer_shards": 4,
+            "replay_prefetch_depth": 2,
             "debug": False
         },
         "exploration_config": {
@@ -24,6 +24,7 @@ APEX_DEFAULT_CONFIG = merge_dicts(
             DQN_CONFIG["optimizer"], {
                 "max_weight_sync_delay": 400,
                 "num_replay_buffer_shards": 4,
+                "replay_prefetch_depth": 2,
                 "debug": False
             }),
         "n_step": 3,
@@ -55,7 +56,8 @@ def make_async_optimizer(workers, config):
     extra_config = config["optimizer"].copy()
     for key in [
             "prioritized_replay", "prioritized_replay_alpha",
-            "prioritized_replay_beta", "prioritized_replay_eps"
+            "prioritized_replay_beta", "prioritized_replay_eps",
+            "replay_stacked_frames"
     ]:
         if key in config:
             extra_config[key] = config[key]
@@ -96,6 +98,8 @@ def execution_plan(workers, config):
         config["prioritized_replay_alpha"],
         config["prioritized_replay_beta"],
         config["prioritized_replay_eps"],
+        config.get("replay_stacked_frames", 0),
+        config["optimizer"]["replay_prefetch_depth"],
     ], num_replay_buffer_shards)
 
     # Update experience priorities post learning.
@@ -83,6 +83,10 @@ DEFAULT_CONFIG = with_common_config({
     "prioritized_replay_eps": 1e-6,
     # Whether to LZ4 compress observations
     "compress_observations": False,
+    # If > 0, observations are stacks of this many frames along the last axis
+    # (e.g., 4 for Atari with framestack). Each distinct frame is then stored
+    # only once in the replay buffer instead of once per stacked observation.
+    "replay_stacked_frames": 0,
 
     # === Optimization ===
     # Learning rate for adam optimizer
@@ -149,6 +153,8 @@ def make_policy_optimizer(workers, config):
                 "final_prioritized_replay_beta"],
             "prioritized_replay_eps": config["prioritized_replay_eps"],
         })
+    if "replay_stacked_frames" in config:
+        kwargs["replay_stacked_frames"] = config["replay_stacked_frames"]
 
     return SyncReplayOptimizer(
         workers,
@@ -297,7 +303,9 @@ def update_target_if_needed(trainer, fetches):
 
 # Experimental distributed execution impl; enable with "use_exec_api": True.
 def execution_plan(workers, config):
-    local_replay_buffer = ReplayBuffer(config["buffer_size"])
+    local_replay_buffer = ReplayBuffer(
+        config["buffer_size"],
+        num_stacked_frames=config.get("replay_stacked_frames", 0))
     rollouts = ParallelRollouts(workers, mode="bulk_sync")
 
     # We execute the following steps concurrently:
@@ -40,6 +40,9 @@ DEFAULT_CONFIG = with_common_config({
     "buffer_size": 50000,
     # Whether to LZ4 compress observations
     "compress_observations": True,
+    # Number of frames stacked in observations, to store each frame once in
+    # the replay buffer (0 to store observations as they are).
+    "replay_stacked_frames": 0,
 
     # === Optimization ===
     # Learning rate for adam optimizer
@@ -244,6 +244,12 @@ COMMON_CONFIG = {
     "collect_metrics_timeout": 180,
     # Smooth metrics over this many episodes.
     "metrics_smoothing_episodes": 100,
+    # Whether workers should aggregate the metrics of their episodes, and only
+    # send compact summaries (count, sum, min, max and histograms) to the
+    # driver. This reduces the cost of metrics collection with many workers
+    # or short episodes. Histograms in `hist_stats` are then approximate, and
+    # metrics are smoothed over whole iterations.
+    "aggregate_metrics_on_workers": False,
     # If using num_envs_per_worker > 1, whether to create those new envs in
     # remote processes instead of in the same worker. This adds overheads, but
     # can make sense if your envs can take much time to step / reset
@@ -254,6 +260,23 @@ COMMON_CONFIG = {
     # but optimal value could be obtained by measuring your environment
     # step / reset and model inference perf.
     "remote_env_batch_wait_ms": 0,
+    # Number of remote worker envs hosted by each env actor. The envs of an
+    # actor are stepped together with a single actor call, which amortizes
+    # the call overhead for lightweight envs.
+    "remote_envs_per_actor": 1,
+    # Synchronization of the weights of remote workers with the local worker.
+    # Weights are versioned, so unchanged weights are not sent again.
+    "weight_sync": {
+        # Only send the tensors that changed since the last full update.
+        "delta": False,
+        # Send float32 tensors as float16. This is lossy, but halves the size
+        # of weight updates.
+        "fp16": False,
+        # If > 0, relay weight updates through a tree of workers with this
+        # fanout, instead of sending them to all workers from the driver.
+        # This helps with many workers and large models.
+        "relay_fanout": 0,
+    },
     # Minimum time per train iteration (frequency of metrics reporting).
     "min_iter_time_s": 0,
     # Minimum env steps to optimize for per train call. This value does
@@ -884,7 +907,8 @@ class Trainer(Trainable):
         return self.optimizer.collect_metrics(
             self.config["collect_metrics_timeout"],
             min_history=self.config["metrics_smoothing_episodes"],
-            selected_workers=selected_workers)
+            selected_workers=selected_workers,
+            aggregate_on_workers=self.config["aggregate_metrics_on_workers"])
 
     @classmethod
     def resource_help(cls, config):
@@ -77,7 +77,8 @@ class BaseEnv:
                     make_env=None,
                     num_envs=1,
                     remote_envs=False,
-                    remote_env_batch_wait_ms=0):
+                    remote_env_batch_wait_ms=0,
+                    remote_envs_per_actor=1):
         """Wraps any env type as needed to expose the async interface."""
 
         from ray.rllib.env.remote_vector_env import RemoteVectorEnv
@@ -93,7 +94,8 @@ class BaseEnv:
                         make_env,
                         num_envs,
                         multiagent=True,
-                        remote_env_batch_wait_ms=remote_env_batch_wait_ms)
+                        remote_env_batch_wait_ms=remote_env_batch_wait_ms,
+                        num_envs_per_actor=remote_envs_per_actor)
                 else:
                     env = _MultiAgentEnvToBaseEnv(
                         make_env=make_env,
@@ -118,7 +120,8 @@ class BaseEnv:
                         make_env,
                         num_envs,
                         multiagent=False,
-                        remote_env_batch_wait_ms=remote_env_batch_wait_ms)
+                        remote_env_batch_wait_ms=remote_env_batch_wait_ms,
+                        num_envs_per_actor=remote_envs_per_actor)
                 else:
                     env = VectorEnv.wrap(
                         make_env=make_env,
@@ -119,6 +119,18 @@ class ExternalEnv(threading.Thread):
         episode = self._get(episode_id)
         return episode.wait_for_action(observation)
 
+    def _get_actions(self, episode_ids, observations):
+        """Records observations of several episodes and gets their actions.
+
+        All observations are recorded at once before waiting for any of the
+        actions, so that they are computed in a single batch.
+        """
+        episodes = [self._get(episode_id) for episode_id in episode_ids]
+        with self._results_avail_condition:
+            for episode, observation in zip(episodes, observations):
+                episode.send_observation(observation)
+        return [episode.next_action() for episode in episodes]
+
     @PublicAPI
     def log_action(self, episode_id, observation, action):
         """Record an observation and (off-policy) action taken.
@@ -220,11 +232,17 @@ class _ExternalEnvEpisode:
         self.action_queue.get(True, timeout=60.0)
 
     def wait_for_action(self, observation):
+        self.send_observation(observation)
+        return self.next_action()
+
+    def send_observation(self, observation):
         if self.multiagent:
             self.new_observation_dict = observation
         else:
             self.new_observation = observation
         self._send()
+
+    def next_action(self):
         return self.action_queue.get(True, timeout=60.0)
 
     def done(self, observation):
@@ -40,9 +40,15 @@ class PolicyClient:
     LOG_ACTION = "LOG_ACTION"
     LOG_RETURNS = "LOG_RETURNS"
     END_EPISODE = "END_EPISODE"
+    # Runs a list of the above commands with a single request.
+    BATCH = "BATCH"
 
     @PublicAPI
-    def __init__(self, address, inference_mode="local", update_interval=10.0):
+    def __init__(self,
+                 address,
+                 inference_mode="local",
+                 update_interval=10.0,
+                 buffer_updates=False):
         """Create a PolicyClient instance.
 
         Args:
@@ -51,8 +57,20 @@ class PolicyClient:
                 inference for computing actions.
             update_interval (float): If using 'local' inference mode, the
                 policy is refreshed after this many seconds have passed.
+            buffer_updates (bool): If using 'remote' inference mode, whether
+                to buffer calls that do not return anything (start_episode()
+                with an episode id, log_action(), log_returns() and
+                end_episode()) and send them along with the next request
+                that does, instead of making a request for each of them.
+                Call flush() to send the buffered calls right away.
         """
         self.address = address
+        self.buffer_updates = buffer_updates
+        self._buffered = []
+        self._buffer_lock = threading.Lock()
+        # Requests are made with one session (i.e., pool of persistent
+        # connections) per thread, as sessions are not thread-safe.
+        self._thread_local = threading.local()
         if inference_mode == "local":
             self.local = True
             self._setup_local_rollout_worker(update_interval)
@@ -80,11 +98,15 @@ class PolicyClient:
             self._update_local_policy()
             return self.env.start_episode(episode_id, training_enabled)
 
-        return self._send({
+        command = {
             "episode_id": episode_id,
             "command": PolicyClient.START_EPISODE,
             "training_enabled": training_enabled,
-        })["episode_id"]
+        }
+        if episode_id is not None and self.buffer_updates:
+            self._buffer(command)
+            return episode_id
+        return self._request(command)["episode_id"]
 
     @PublicAPI
     def get_action(self, episode_id, observation):
@@ -102,12 +124,44 @@ class PolicyClient:
             self._update_local_policy()
             return self.env.get_action(episode_id, observation)
 
-        return self._send({
+        return self._request({
             "command": PolicyClient.GET_ACTION,
             "observation": observation,
             "episode_id": episode_id,
         })["action"]
 
+    @PublicAPI
+    def get_actions(self, episode_ids, observations):
+        """Record observations of several episodes and get their actions.
+
+        This is like calling get_action() for each of the episodes, but the
+        actions are computed in a single batch (and in remote inference mode,
+        with a single request).
+
+        Arguments:
+            episode_ids (list): Episode ids returned from start_episode().
+            observations (list): Current environment observation of each of
+                the episodes.
+
+        Returns:
+            actions (list): Action from the env action space for each of the
+                episodes.
+        """
+
+        if self.local:
+            self._update_local_policy()
+            return self.env._get_actions(episode_ids, observations)
+
+        commands = [{
+            "command": PolicyClient.GET_ACTION,
+            "observation": observation,
+            "episode_id": episode_id,
+        } for episode_id, observation in zip(episode_ids, observations)]
+        if not commands:
+            return []
+        responses = self._send_batch(commands)
+        return [r["action"] for r in responses[-len(commands):]]
+
     @PublicAPI
     def log_action(self, episode_id, observation, action):
         """Record an observation and (off-policy) action taken.
@@ -122,7 +176,7 @@ class PolicyClient:
             self._update_local_policy()
             return self.env.log_action(episode_id, observation, action)
 
-        self._send({
+        self._buffer({
             "command": PolicyClient.LOG_ACTION,
             "observation": observation,
             "action": action,
@@ -146,7 +200,7 @@ class PolicyClient:
             self._update_local_policy()
             return self.env.log_returns(episode_id, reward, info)
 
-        self._send({
+        self._buffer({
             "command": PolicyClient.LOG_RETURNS,
             "reward": reward,
             "info": info,
@@ -166,15 +220,54 @@ class PolicyClient:
             self._update_local_policy()
             return self.env.end_episode(episode_id, observation)
 
-        self._send({
+        self._buffer({
             "command": PolicyClient.END_EPISODE,
             "observation": observation,
             "episode_id": episode_id,
         })
 
+    @PublicAPI
+    def flush(self):
+        """Send any calls buffered due to `buffer_updates` to the server."""
+
+        with self._buffer_lock:
+            commands, self._buffered = self._buffered, []
+        if commands:
+            self._send({"command": PolicyClient.BATCH, "commands": commands})
+
+    def _buffer(self, command):
+        """Sends a command, or buffers it if buffer_updates is enabled."""
+        if self.buffer_updates:
+            with self._buffer_lock:
+                self._buffered.append(command)
+        else:
+            self._send(command)
+
+    def _request(self, command):
+        """Sends a command along with any buffered ones.
+
+        Returns:
+            dict: The response to the command.
+        """
+        if not self._buffered:
+            return self._send(command)
+        return self._send_batch([command])[-1]
+
+    def _send_batch(self, commands):
+        with self._buffer_lock:
+            commands, self._buffered = self._buffered + commands, []
+        return self._send({
+            "command": PolicyClient.BATCH,
+            "commands": commands,
+        })["responses"]
+
     def _send(self, data):
         payload = pickle.dumps(data)
-        response = requests.post(self.address, data=payload)
+        session = getattr(self._thread_local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._thread_local.session = session
+        response = session.post(self.address, data=payload)
         if response.status_code != 200:
             logger.error("Request failed {}: {}".format(response.text, data))
         response.raise_for_status()
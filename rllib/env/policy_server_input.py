@@ -105,6 +105,7 @@ def _make_handler(rollout_worker, samples_queue, metrics_queue):
     child_rollout_worker = None
     inference_thread = None
     lock = threading.Lock()
+    action_batcher = _ActionBatcher(lambda: child_rollout_worker.env)
 
     def setup_child_rollout_worker():
         nonlocal lock
@@ -132,6 +133,12 @@ def _make_handler(rollout_worker, samples_queue, metrics_queue):
                                              rollout_worker.get_global_vars())
 
     class Handler(SimpleHTTPRequestHandler):
+        # Keep connections open for further requests from the same client.
+        protocol_version = "HTTP/1.1"
+        # Responses are written in two parts (headers and body), which must
+        # not be delayed on persistent connections.
+        disable_nagle_algorithm = True
+
         def __init__(self, *a, **kw):
             super().__init__(*a, **kw)
 
@@ -140,12 +147,40 @@ def _make_handler(rollout_worker, samples_queue, metrics_queue):
             raw_body = self.rfile.read(content_len)
             parsed_input = pickle.loads(raw_body)
             try:
-                response = self.execute_command(parsed_input)
+                response = pickle.dumps(self.execute_command(parsed_input))
                 self.send_response(200)
+                self.send_header("Content-Length", str(len(response)))
                 self.end_headers()
-                self.wfile.write(pickle.dumps(response))
+                self.wfile.write(response)
             except Exception:
-                self.send_error(500, traceback.format_exc())
+                self.send_error(500, explain=traceback.format_exc())
+
+        def execute_batch(self, commands):
+            """Executes commands in order, returning their responses.
+
+            Consecutive GET_ACTION commands are executed as a single batch.
+            """
+            responses = []
+            i = 0
+            while i < len(commands):
+                j = i
+                episode_ids = set()
+                while (j < len(commands)
+                       and commands[j]["command"] == PolicyClient.GET_ACTION
+                       and commands[j]["episode_id"] not in episode_ids):
+                    episode_ids.add(commands[j]["episode_id"])
+                    j += 1
+                if j == i:
+                    responses.append(self.execute_command(commands[i]))
+                    i += 1
+                    continue
+                assert inference_thread.is_alive()
+                actions = action_batcher.get_actions(
+                    [c["episode_id"] for c in commands[i:j]],
+                    [c["observation"] for c in commands[i:j]])
+                responses.extend({"action": a} for a in actions)
+                i = j
+            return responses
 
         def execute_command(self, args):
             command = args["command"]
@@ -171,8 +206,8 @@ def _make_handler(rollout_worker, samples_queue, metrics_queue):
                         args["episode_id"], args["training_enabled"]))
             elif command == PolicyClient.GET_ACTION:
                 assert inference_thread.is_alive()
-                response["action"] = child_rollout_worker.env.get_action(
-                    args["episode_id"], args["observation"])
+                response["action"] = action_batcher.get_actions(
+                    [args["episode_id"]], [args["observation"]])[0]
             elif command == PolicyClient.LOG_ACTION:
                 assert inference_thread.is_alive()
                 child_rollout_worker.env.log_action(
@@ -185,8 +220,82 @@ def _make_handler(rollout_worker, samples_queue, metrics_queue):
                 assert inference_thread.is_alive()
                 child_rollout_worker.env.end_episode(args["episode_id"],
                                                      args["observation"])
+            elif command == PolicyClient.BATCH:
+                response["responses"] = self.execute_batch(args["commands"])
             else:
                 raise ValueError("Unknown command: {}".format(command))
             return response
 
     return Handler
+
+
+class _ActionBatcher:
+    """Batches get_action() calls from concurrent requests.
+
+    While the actions for one batch of observations are computed, requests
+    arriving in the meantime queue up, and are then submitted together as the
+    next batch. This way, a single compute_actions() call serves many
+    clients, without delaying requests when there is no concurrency.
+    """
+
+    def __init__(self, get_env):
+        self.get_env = get_env
+        self.cond = threading.Condition()
+        self.pending = []
+        self.busy = False
+
+    def get_actions(self, episode_ids, observations):
+        request = _ActionRequest(episode_ids, observations)
+        with self.cond:
+            self.pending.append(request)
+            while self.busy and not request.done:
+                self.cond.wait()
+            if request.done:
+                return request.result()
+            # Lead the next batch, which contains this request.
+            self.busy = True
+            batch, self.pending = self.pending, []
+        try:
+            self._compute_actions(batch)
+        finally:
+            with self.cond:
+                self.busy = False
+                self.cond.notify_all()
+        return request.result()
+
+    def _compute_actions(self, batch):
+        env = self.get_env()
+        valid = []
+        for request in batch:
+            try:
+                for episode_id in request.episode_ids:
+                    env._get(episode_id)
+                valid.append(request)
+            except Exception as e:
+                request.error = e
+        try:
+            actions = env._get_actions(
+                [eid for r in valid for eid in r.episode_ids],
+                [obs for r in valid for obs in r.observations])
+            for request in valid:
+                request.actions = actions[:len(request.episode_ids)]
+                actions = actions[len(request.episode_ids):]
+        except Exception as e:
+            for request in valid:
+                request.error = e
+        for request in batch:
+            request.done = True
+
+
+class _ActionRequest:
+    def __init__(self, episode_ids, observations):
+        self.episode_ids = episode_ids
+        self.observations = observations
+        self.actions = None
+        self.error = None
+        self.done = False
+
+    def result(self):
+        if self.error is not None:
+            raise self.error
+        return self.actions
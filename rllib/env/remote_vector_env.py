@@ -13,32 +13,61 @@ class RemoteVectorEnv(BaseEnv):
     This provides dynamic batching of inference as observations are returned
     from the remote simulator actors. Both single and multi-agent child envs
     are supported, and envs can be stepped synchronously or async.
+
+    Each actor hosts a group of `num_envs_per_actor` envs, which are stepped
+    (and reset) together with a single actor call. For lightweight envs, this
+    amortizes the overhead of actor calls over the group.
     """
 
-    def __init__(self, make_env, num_envs, multiagent,
-                 remote_env_batch_wait_ms):
+    def __init__(self,
+                 make_env,
+                 num_envs,
+                 multiagent,
+                 remote_env_batch_wait_ms,
+                 num_envs_per_actor=1):
         self.make_local_env = make_env
         self.num_envs = num_envs
         self.multiagent = multiagent
         self.poll_timeout = remote_env_batch_wait_ms / 1000
+        self.num_envs_per_actor = max(1, num_envs_per_actor)
 
         self.actors = None  # lazy init
         self.pending = None  # lazy init
+        # Env ids hosted by each actor, and the actor index of each env id.
+        self.actor_env_ids = [
+            list(range(i, min(i + self.num_envs_per_actor, num_envs)))
+            for i in range(0, num_envs, self.num_envs_per_actor)
+        ]
+        self.env_to_actor = {
+            env_id: actor_index
+            for actor_index, env_ids in enumerate(self.actor_env_ids)
+            for env_id in env_ids
+        }
+        # Env ids to reset with the next call to their actors.
+        self.pending_resets = {}
 
     def poll(self):
         if self.actors is None:
 
-            def make_remote_env(i):
-                logger.info("Launching env {} in remote actor".format(i))
-                if self.multiagent:
-                    return _RemoteMultiAgentEnv.remote(self.make_local_env, i)
-                else:
-                    return _RemoteSingleAgentEnv.remote(self.make_local_env, i)
+            def make_remote_env(env_ids):
+                logger.info(
+                    "Launching envs {} in remote actor".format(env_ids))
+                return _RemoteEnvGroup.remote(self.make_local_env, env_ids,
+                                              self.multiagent)
 
-            self.actors = [make_remote_env(i) for i in range(self.num_envs)]
+            self.actors = [
+                make_remote_env(env_ids) for env_ids in self.actor_env_ids
+            ]
 
         if self.pending is None:
-            self.pending = {a.reset.remote(): a for a in self.actors}
+            self.pending = {
+                a.reset.remote(): actor_index
+                for actor_index, a in enumerate(self.actors)
+            }
+
+        # Resets that were not sent along with actions yet.
+        if self.pending_resets:
+            self._send({})
 
         # each keyed by env_id in [0, num_remote_envs)
         obs, rewards, dones, infos = {}, {}, {}, {}
@@ -52,30 +81,28 @@ class RemoteVectorEnv(BaseEnv):
                 timeout=self.poll_timeout)
 
         # Get and return observations for each of the ready envs
-        env_ids = set()
         for obj_id in ready:
-            actor = self.pending.pop(obj_id)
-            env_id = self.actors.index(actor)
-            env_ids.add(env_id)
-            ob, rew, done, info = ray_get_and_free(obj_id)
-            obs[env_id] = ob
-            rewards[env_id] = rew
-            dones[env_id] = done
-            infos[env_id] = info
-
-        logger.debug("Got obs batch for actors {}".format(env_ids))
+            self.pending.pop(obj_id)
+        env_ids = set()
+        for results in ray_get_and_free(ready):
+            for env_id, (ob, rew, done, info) in results.items():
+                env_ids.add(env_id)
+                obs[env_id] = ob
+                rewards[env_id] = rew
+                dones[env_id] = done
+                infos[env_id] = info
+
+        logger.debug("Got obs batch for envs {}".format(env_ids))
         return obs, rewards, dones, infos, {}
 
     def send_actions(self, action_dict):
-        for env_id, actions in action_dict.items():
-            actor = self.actors[env_id]
-            obj_id = actor.step.remote(actions)
-            self.pending[obj_id] = actor
+        self._send(action_dict)
 
     def try_reset(self, env_id):
-        actor = self.actors[env_id]
-        obj_id = actor.reset.remote()
-        self.pending[obj_id] = actor
+        # The reset is sent with the next call to the actor of the env, so
+        # that all envs of an actor are stepped and reset with a single call.
+        actor_index = self.env_to_actor[env_id]
+        self.pending_resets.setdefault(actor_index, []).append(env_id)
         return ASYNC_RESET_RETURN
 
     def stop(self):
@@ -83,13 +110,50 @@ class RemoteVectorEnv(BaseEnv):
             for actor in self.actors:
                 actor.__ray_terminate__.remote()
 
+    def _send(self, action_dict):
+        actions_by_actor = {}
+        for env_id, actions in action_dict.items():
+            actor_index = self.env_to_actor[env_id]
+            actions_by_actor.setdefault(actor_index, {})[env_id] = actions
+        for actor_index in self.pending_resets:
+            actions_by_actor.setdefault(actor_index, {})
+        for actor_index, actions in actions_by_actor.items():
+            obj_id = self.actors[actor_index].step.remote(
+                actions, self.pending_resets.pop(actor_index, []))
+            self.pending[obj_id] = actor_index
+
 
 @ray.remote(num_cpus=0)
-class _RemoteMultiAgentEnv:
-    """Wrapper class for making a multi-agent env a remote actor."""
+class _RemoteEnvGroup:
+    """Actor that hosts a group of envs, which are stepped as a batch."""
+
+    def __init__(self, make_env, env_ids, multiagent):
+        if multiagent:
+            self.envs = {i: _MultiAgentEnvRunner(make_env(i)) for i in env_ids}
+        else:
+            self.envs = {
+                i: _SingleAgentEnvRunner(make_env(i))
+                for i in env_ids
+            }
+
+    def reset(self):
+        return {env_id: env.reset() for env_id, env in self.envs.items()}
+
+    def step(self, action_dict, reset_env_ids):
+        results = {
+            env_id: self.envs[env_id].step(actions)
+            for env_id, actions in action_dict.items()
+        }
+        for env_id in reset_env_ids:
+            results[env_id] = self.envs[env_id].reset()
+        return results
 
-    def __init__(self, make_env, i):
-        self.env = make_env(i)
+
+class _MultiAgentEnvRunner:
+    """Wrapper of a multi-agent env in a remote actor."""
+
+    def __init__(self, env):
+        self.env = env
 
     def reset(self):
         obs = self.env.reset()
@@ -103,12 +167,11 @@ class _RemoteMultiAgentEnv:
         return self.env.step(action_dict)
 
 
-@ray.remote(num_cpus=0)
-class _RemoteSingleAgentEnv:
-    """Wrapper class for making a gym env a remote actor."""
+class _SingleAgentEnvRunner:
+    """Wrapper of a gym env in a remote actor."""
 
-    def __init__(self, make_env, i):
-        self.env = make_env(i)
+    def __init__(self, env):
+        self.env = env
 
     def reset(self):
         obs = {_DUMMY_AGENT_ID: self.env.reset()}
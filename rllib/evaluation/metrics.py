@@ -3,6 +3,7 @@ import numpy as np
 import collections
 
 import ray
+from ray.rllib.evaluation.metrics_summary import MetricsSummary
 from ray.rllib.evaluation.rollout_metrics import RolloutMetrics
 from ray.rllib.policy.sample_batch import DEFAULT_POLICY_ID
 from ray.rllib.offline.off_policy_estimator import OffPolicyEstimate
@@ -59,9 +60,8 @@ def collect_episodes(local_worker=None,
     """Gathers new episodes metrics tuples from the given evaluators."""
 
     if remote_workers:
-        pending = [
-            a.apply.remote(lambda ev: ev.get_metrics()) for a in remote_workers
-        ] + to_be_collected
+        pending = [a.get_metrics.remote()
+                   for a in remote_workers] + to_be_collected
         collected, to_be_collected = ray.wait(
             pending, num_returns=len(pending), timeout=timeout_seconds * 1.0)
         if pending and len(collected) == 0:
@@ -80,6 +80,136 @@ def collect_episodes(local_worker=None,
     return episodes, to_be_collected
 
 
+@DeveloperAPI
+def collect_summary(local_worker=None,
+                    remote_workers=[],
+                    to_be_collected=[],
+                    timeout_seconds=180,
+                    include_episodes=False):
+    """Gathers a MetricsSummary of new episodes from the given workers.
+
+    Unlike collect_episodes, the workers aggregate the metrics of their
+    episodes, and only the compact summaries are merged on the driver.
+
+    Arguments:
+        include_episodes (bool): Whether to also fetch the metrics of each
+            episode, e.g., for debugging.
+    """
+
+    if remote_workers:
+        pending = [
+            a.get_metrics_summary.remote(include_episodes)
+            for a in remote_workers
+        ] + to_be_collected
+        collected, to_be_collected = ray.wait(
+            pending, num_returns=len(pending), timeout=timeout_seconds * 1.0)
+        if pending and len(collected) == 0:
+            logger.warning(
+                "WARNING: collected no metrics in {} seconds".format(
+                    timeout_seconds))
+        summaries = ray_get_and_free(collected)
+    else:
+        summaries = []
+
+    if local_worker:
+        summaries.append(local_worker.get_metrics_summary(include_episodes))
+    summary = MetricsSummary()
+    if include_episodes:
+        summary.episodes = []
+    for s in summaries:
+        summary.merge(s)
+    return summary, to_be_collected
+
+
+@DeveloperAPI
+def smooth_summary(summary, summary_history, min_history=100):
+    """Merges the summaries of previous iterations into a new summary.
+
+    Like the episode history of PolicyOptimizer.collect_metrics, but at the
+    granularity of whole training iterations: the most recent summaries are
+    merged until at least `min_history` episodes are covered.
+
+    Arguments:
+        summary (MetricsSummary): Summary of the new episodes.
+        summary_history (list): Summaries of previous iterations, oldest
+            first. The new summary is appended, and summaries that are no
+            longer needed are dropped from the list.
+        min_history (int): Min number of episodes to smooth results over.
+
+    Returns:
+        MetricsSummary: The smoothed summary.
+    """
+
+    smoothed = summary.copy()
+    num_used = 0
+    for prev in reversed(summary_history):
+        if smoothed.num_episodes >= min_history:
+            break
+        smoothed.merge(prev)
+        num_used += 1
+    del summary_history[:len(summary_history) - num_used]
+    summary_history.append(summary)
+    return smoothed
+
+
+@DeveloperAPI
+def summarize_metrics(summary, num_new_episodes=None):
+    """Summarizes a MetricsSummary into the same result as summarize_episodes.
+
+    If the summary includes the metrics of each episode, these are used, so
+    the results are exact. Otherwise, `hist_stats` are approximated by the
+    values of histogram buckets.
+
+    Arguments:
+        summary (MetricsSummary): Smoothed summary of episodes including
+            historical ones.
+        num_new_episodes (int): Number of new episodes in this iteration. If
+            None, assumes all episodes are new.
+    """
+
+    if num_new_episodes is None:
+        num_new_episodes = summary.num_episodes
+
+    if summary.episodes is not None:
+        result = summarize_episodes(summary.episodes + summary.estimates)
+        result["episodes_this_iter"] = num_new_episodes
+        return result
+
+    policy_reward_min = {}
+    policy_reward_mean = {}
+    policy_reward_max = {}
+    for policy_id in summary.keys("policy"):
+        key = ("policy", policy_id)
+        policy_reward_min[policy_id] = summary.min(key)
+        policy_reward_mean[policy_id] = summary.mean(key)
+        policy_reward_max[policy_id] = summary.max(key)
+
+    custom_metrics = {}
+    for k in summary.keys("custom"):
+        key = ("custom", k)
+        custom_metrics[k + "_mean"] = summary.mean(key)
+        custom_metrics[k + "_min"] = summary.min(key)
+        custom_metrics[k + "_max"] = summary.max(key)
+
+    perf_stats = {k: summary.mean(("perf", k)) for k in summary.keys("perf")}
+
+    hist_stats = {k: summary.histogram_values(k) for k in summary.histograms}
+
+    return dict(
+        episode_reward_max=summary.max(("episode", "reward")),
+        episode_reward_min=summary.min(("episode", "reward")),
+        episode_reward_mean=summary.mean(("episode", "reward")),
+        episode_len_mean=summary.mean(("episode", "len")),
+        episodes_this_iter=num_new_episodes,
+        policy_reward_min=policy_reward_min,
+        policy_reward_max=policy_reward_max,
+        policy_reward_mean=policy_reward_mean,
+        custom_metrics=custom_metrics,
+        hist_stats=hist_stats,
+        sampler_perf=perf_stats,
+        off_policy_estimator=_summarize_estimates(summary.estimates))
+
+
 @DeveloperAPI
 def summarize_episodes(episodes, new_episodes=None):
     """Summarizes a set of episode metrics tuples.
@@ -156,16 +286,6 @@ def summarize_episodes(episodes, new_episodes=None):
     for k, v_list in perf_stats.copy().items():
         perf_stats[k] = np.mean(v_list)
 
-    estimators = collections.defaultdict(lambda: collections.defaultdict(list))
-    for e in estimates:
-        acc = estimators[e.estimator_name]
-        for k, v in e.metrics.items():
-            acc[k].append(v)
-    for name, metrics in estimators.items():
-        for k, v_list in metrics.items():
-            metrics[k] = np.mean(v_list)
-        estimators[name] = dict(metrics)
-
     return dict(
         episode_reward_max=max_reward,
         episode_reward_min=min_reward,
@@ -178,7 +298,22 @@ def summarize_episodes(episodes, new_episodes=None):
         custom_metrics=dict(custom_metrics),
         hist_stats=dict(hist_stats),
         sampler_perf=dict(perf_stats),
-        off_policy_estimator=dict(estimators))
+        off_policy_estimator=_summarize_estimates(estimates))
+
+
+def _summarize_estimates(estimates):
+    """Averages the metrics of each off-policy estimator."""
+
+    estimators = collections.defaultdict(lambda: collections.defaultdict(list))
+    for e in estimates:
+        acc = estimators[e.estimator_name]
+        for k, v in e.metrics.items():
+            acc[k].append(v)
+    for name, metrics in estimators.items():
+        for k, v_list in metrics.items():
+            metrics[k] = np.mean(v_list)
+        estimators[name] = dict(metrics)
+    return dict(estimators)
 
 
 def _partition(episodes):
@@ -0,0 +1,176 @@
+import numpy as np
+
+from ray.rllib.evaluation.rollout_metrics import RolloutMetrics
+from ray.rllib.offline.off_policy_estimator import OffPolicyEstimate
+from ray.rllib.policy.sample_batch import DEFAULT_POLICY_ID
+from ray.rllib.utils.annotations import DeveloperAPI
+
+# Number of histogram buckets per power of two. The bucket boundaries are
+# fixed, so that histograms of different workers can be merged. With 16
+# buckets per octave, values are within 2.2% of their bucket's value.
+HISTOGRAM_BUCKETS_PER_OCTAVE = 16
+# Values with a smaller magnitude than this fall into the zero bucket.
+HISTOGRAM_MIN_MAGNITUDE = 2.0**-30
+
+_BUCKET_OFFSET = 1 - int(
+    np.log2(HISTOGRAM_MIN_MAGNITUDE) * HISTOGRAM_BUCKETS_PER_OCTAVE)
+
+
+def _to_buckets(values):
+    """Returns the fixed histogram bucket of each (finite) value."""
+    values = np.asarray(values, dtype=np.float64).ravel()
+    values = values[np.isfinite(values)]
+    magnitudes = np.maximum(np.abs(values), HISTOGRAM_MIN_MAGNITUDE)
+    buckets = np.floor(np.log2(magnitudes) * HISTOGRAM_BUCKETS_PER_OCTAVE)
+    buckets = buckets.astype(np.int64) + _BUCKET_OFFSET
+    buckets[np.abs(values) < HISTOGRAM_MIN_MAGNITUDE] = 0
+    return np.sign(values).astype(np.int64) * buckets
+
+
+def _from_buckets(buckets):
+    """Returns the value represented by each histogram bucket."""
+    buckets = np.asarray(buckets, dtype=np.int64)
+    exponents = (np.abs(buckets) - _BUCKET_OFFSET + 0.5) / \
+        HISTOGRAM_BUCKETS_PER_OCTAVE
+    return np.where(buckets == 0, 0.0, np.sign(buckets) * 2.0**exponents)
+
+
+@DeveloperAPI
+class MetricsSummary:
+    """Running aggregates of episode metrics that can be merged.
+
+    Instead of the RolloutMetrics of each episode, this keeps the count, sum,
+    min and max of episode rewards and lengths, per-policy rewards, custom
+    metrics and sampler perf stats, and fixed-bucket histograms for the
+    `hist_stats` of the result. Summaries of different workers and training
+    iterations are merged associatively, so their size does not depend on
+    the number of episodes.
+
+    Examples:
+        >>> summary = MetricsSummary.from_metrics(worker.get_metrics())
+        >>> summary.merge(other_summary)
+        >>> print(summarize_metrics(summary))
+        {"episode_reward_max": ..., "episode_reward_mean": ..., ...}
+    """
+
+    def __init__(self):
+        self.num_episodes = 0
+        # Map of (kind, name) to [count, sum, min, max].
+        self.stats = {}
+        # Map of hist_stats key to {bucket: count}.
+        self.histograms = {}
+        # Off-policy estimates are only created once per sample batch, so
+        # they are kept as they are.
+        self.estimates = []
+        # The metrics of each episode, if kept for details.
+        self.episodes = None
+
+    @staticmethod
+    def from_metrics(metrics, include_episodes=False):
+        """Summarizes a list of RolloutMetrics and OffPolicyEstimates.
+
+        Arguments:
+            metrics (list): Metrics as returned by RolloutWorker.get_metrics.
+            include_episodes (bool): Whether to also keep the RolloutMetrics
+                of each episode in the summary.
+        """
+        summary = MetricsSummary()
+        hist_values = {"episode_reward": [], "episode_lengths": []}
+        for m in metrics:
+            if isinstance(m, OffPolicyEstimate):
+                summary.estimates.append(m)
+                continue
+            if not isinstance(m, RolloutMetrics):
+                raise ValueError("Unknown metric type: {}".format(m))
+            summary.num_episodes += 1
+            summary._add(("episode", "reward"), m.episode_reward)
+            summary._add(("episode", "len"), m.episode_length)
+            hist_values["episode_reward"].append(m.episode_reward)
+            hist_values["episode_lengths"].append(m.episode_length)
+            for k, v in m.custom_metrics.items():
+                summary._add(("custom", k), v)
+            for k, v in m.perf_stats.items():
+                summary._add(("perf", k), v)
+            for (_, policy_id), reward in m.agent_rewards.items():
+                if policy_id != DEFAULT_POLICY_ID:
+                    summary._add(("policy", policy_id), reward)
+                    hist_values.setdefault(
+                        "policy_{}_reward".format(policy_id),
+                        []).append(reward)
+            for k, v in m.hist_data.items():
+                hist_values.setdefault(k, []).extend(v)
+        for k, values in hist_values.items():
+            buckets, counts = np.unique(
+                _to_buckets(values), return_counts=True)
+            summary.histograms[k] = dict(
+                zip(buckets.tolist(), counts.tolist()))
+        if include_episodes:
+            summary.episodes = [
+                m for m in metrics if isinstance(m, RolloutMetrics)
+            ]
+        return summary
+
+    def merge(self, other):
+        """Adds the metrics of another summary to this one."""
+        self.num_episodes += other.num_episodes
+        for key, (count, total, low, high) in other.stats.items():
+            stat = self.stats.get(key)
+            if stat is None:
+                self.stats[key] = [count, total, low, high]
+            else:
+                stat[0] += count
+                stat[1] += total
+                stat[2] = min(stat[2], low)
+                stat[3] = max(stat[3], high)
+        for k, histogram in other.histograms.items():
+            merged = self.histograms.setdefault(k, {})
+            for bucket, count in histogram.items():
+                merged[bucket] = merged.get(bucket, 0) + count
+        self.estimates.extend(other.estimates)
+        # Details are only kept if both summaries have them.
+        if self.episodes is not None and other.episodes is not None:
+            self.episodes = self.episodes + other.episodes
+        else:
+            self.episodes = None
+        return self
+
+    def copy(self):
+        """Returns a copy of this summary that can be merged into."""
+        summary = MetricsSummary()
+        if self.episodes is not None:
+            summary.episodes = []
+        return summary.merge(self)
+
+    def count(self, key):
+        return self.stats[key][0] if key in self.stats else 0
+
+    def mean(self, key):
+        count, total, _, _ = self.stats.get(key, (0, 0.0, None, None))
+        return total / count if count else float("nan")
+
+    def min(self, key):
+        return self.stats[key][2] if self.count(key) else float("nan")
+
+    def max(self, key):
+        return self.stats[key][3] if self.count(key) else float("nan")
+
+    def keys(self, kind):
+        """Returns the names of all stats of the given kind."""
+        return [name for k, name in self.stats if k == kind]
+
+    def histogram_values(self, key):
+        """Returns the sorted values of a histogram, as bucket values."""
+        buckets = sorted(self.histograms.get(key, {}).items())
+        values = _from_buckets([b for b, _ in buckets])
+        return np.repeat(values, [count for _, count in buckets]).tolist()
+
+    def _add(self, key, value):
+        stat = self.stats.get(key)
+        if stat is None:
+            stat = self.stats[key] = [0, 0.0, float("inf"), float("-inf")]
+        # NaN values (e.g., of custom metrics) are ignored.
+        if value == value:
+            stat[0] += 1
+            stat[1] += value
+            stat[2] = min(stat[2], value)
+            stat[3] = max(stat[3], value)
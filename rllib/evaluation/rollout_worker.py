@@ -6,6 +6,7 @@ import pickle
 import os
 
 import ray
+from ray.exceptions import RayError
 from ray.util.debug import log_once, disable_log_once_globally, \
     enable_periodic_logging
 from ray.util.iter import ParallelIteratorWorker
@@ -17,6 +18,7 @@ from ray.rllib.env.multi_agent_env import MultiAgentEnv
 from ray.rllib.env.external_multi_agent_env import ExternalMultiAgentEnv
 from ray.rllib.env.vector_env import VectorEnv
 from ray.rllib.evaluation.interface import EvaluatorInterface
+from ray.rllib.evaluation.metrics_summary import MetricsSummary
 from ray.rllib.evaluation.sampler import AsyncSampler, SyncSampler
 from ray.rllib.policy.sample_batch import MultiAgentBatch, DEFAULT_POLICY_ID
 from ray.rllib.policy.policy import Policy
@@ -33,6 +35,8 @@ from ray.rllib.utils.debug import summarize
 from ray.rllib.utils.filter import get_filter
 from ray.rllib.utils.sgd import do_minibatch_sgd
 from ray.rllib.utils.tf_run_builder import TFRunBuilder
+from ray.rllib.utils.weight_sync import merge_weight_update, \
+    send_weight_update
 from ray.rllib.utils import try_import_tf, try_import_torch
 
 tf = try_import_tf()
@@ -144,6 +148,7 @@ class RolloutWorker(EvaluatorInterface, ParallelIteratorWorker):
                  output_creator=lambda ioctx: NoopOutput(),
                  remote_worker_envs=False,
                  remote_env_batch_wait_ms=0,
+                 remote_envs_per_actor=1,
                  soft_horizon=False,
                  no_done_at_end=False,
                  seed=None,
@@ -234,6 +239,8 @@ class RolloutWorker(EvaluatorInterface, ParallelIteratorWorker):
                 least one env is ready) is a reasonable default, but optimal
                 value could be obtained by measuring your environment
                 step / reset and model inference perf.
+            remote_envs_per_actor (int): Number of remote worker envs hosted
+                by each env actor, which are stepped with a single call.
             soft_horizon (bool): Calculate rewards but don't reset the
                 environment when the horizon is hit.
             no_done_at_end (bool): Ignore the done=True at the end of the
@@ -298,6 +305,8 @@ class RolloutWorker(EvaluatorInterface, ParallelIteratorWorker):
         self.preprocessing_enabled = True
         self.last_batch = None
         self.global_vars = None
+        # Version of the last weight update received from a broadcaster.
+        self.weights_version = 0
         self._fake_sampler = _fake_sampler
 
         self.env = _validate_env(env_creator(env_context))
@@ -415,7 +424,8 @@ class RolloutWorker(EvaluatorInterface, ParallelIteratorWorker):
             make_env=make_env,
             num_envs=num_envs,
             remote_envs=remote_worker_envs,
-            remote_env_batch_wait_ms=remote_env_batch_wait_ms)
+            remote_env_batch_wait_ms=remote_env_batch_wait_ms,
+            remote_envs_per_actor=remote_envs_per_actor)
         self.num_envs = num_envs
 
         if self.batch_mode == "truncate_episodes":
@@ -572,6 +582,54 @@ class RolloutWorker(EvaluatorInterface, ParallelIteratorWorker):
         if global_vars:
             self.set_global_vars(global_vars)
 
+    @DeveloperAPI
+    def apply_weight_update(self,
+                            update,
+                            global_vars=None,
+                            relay_to=None,
+                            relay_fanout=0):
+        """Applies a versioned weight update from a WeightBroadcaster.
+
+        Arguments:
+            update (dict): The weight update.
+            global_vars (dict): Optional global vars to set.
+            relay_to (list): Remote workers to forward the update to.
+            relay_fanout (int): Fanout of the relay tree.
+
+        Returns:
+            list: The weights versions of this worker and the relay_to
+                workers after the update, None for workers that failed.
+        """
+        relayed = []
+        if relay_to:
+            relayed = send_weight_update(update, relay_to, global_vars,
+                                         relay_fanout)
+        # Updates may arrive more than once, or after newer ones.
+        if update["version"] > self.weights_version:
+            if (update["base_version"] is not None
+                    and self.weights_version < update["base_version"]):
+                logger.warning(
+                    "Ignoring weight update {} based on version {}, since "
+                    "this worker only has version {}.".format(
+                        update["version"], update["base_version"],
+                        self.weights_version))
+            else:
+                weights = merge_weight_update(
+                    update, lambda pid: self.policy_map[pid].get_weights())
+                self.set_weights(weights)
+                self.weights_version = update["version"]
+        if global_vars:
+            self.set_global_vars(global_vars)
+        versions = [self.weights_version]
+        for versions_id, workers in relayed:
+            try:
+                versions.extend(ray.get(versions_id))
+            except RayError as e:
+                logger.warning("Relaying weight update {} failed: {}".format(
+                    update["version"], e))
+                versions.extend([None] * len(workers))
+        return versions
+
     @override(EvaluatorInterface)
     def compute_gradients(self, samples):
         if log_once("compute_gradients"):
@@ -691,6 +749,18 @@ class RolloutWorker(EvaluatorInterface, ParallelIteratorWorker):
             out.extend(m.get_metrics())
         return out
 
+    @DeveloperAPI
+    def get_metrics_summary(self, include_episodes=False):
+        """Returns a MetricsSummary of the new metrics from evaluation.
+
+        Arguments:
+            include_episodes (bool): Whether to also include the
+                RolloutMetrics of each new episode in the summary.
+        """
+
+        return MetricsSummary.from_metrics(self.get_metrics(),
+                                           include_episodes)
+
     @DeveloperAPI
     def foreach_env(self, func):
         """Apply the given function to each underlying env instance."""
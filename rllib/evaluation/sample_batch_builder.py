@@ -62,6 +62,85 @@ class SampleBatchBuilder:
         return batch
 
 
+@DeveloperAPI
+class VectorSampleBatchBuilder:
+    """Util to build the SampleBatches of a vector of envs in column form.
+
+    Each call to add_step() adds the values of one time step for all envs at
+    once, as arrays whose first dimension is the env index. These are written
+    into preallocated time-major columns, from which the current trajectory
+    of a single env is cut with build_trajectory(). The columns grow as
+    needed, and rows that no trajectory refers to anymore are dropped.
+    """
+
+    def __init__(self, num_envs, initial_capacity=64):
+        self.num_envs = num_envs
+        self.columns = {}
+        self.capacity = initial_capacity
+        # Number of buffered time steps.
+        self.size = 0
+        # Number of time steps dropped from the front of the columns.
+        self.offset = 0
+        # Time step at which the current trajectory of each env starts.
+        self.starts = np.zeros(num_envs, dtype=np.int64)
+
+    def add_step(self, **values):
+        """Add the given dictionary of per-env value vectors."""
+
+        if self.size == self.capacity:
+            self._make_space()
+        for k, v in values.items():
+            column = self.columns.get(k)
+            if column is None:
+                v = to_float_array(v)
+                column = np.empty((self.capacity, ) + v.shape, dtype=v.dtype)
+                self.columns[k] = column
+            column[self.size] = v
+        self.size += 1
+
+    def count(self, env_index):
+        """Returns the number of steps in the trajectory of the env."""
+
+        return self.offset + self.size - self.starts[env_index]
+
+    def build_trajectory(self, env_index, mask_column=None):
+        """Returns the current trajectory of the env as a SampleBatch.
+
+        Arguments:
+            env_index (int): Index of the env.
+            mask_column (str): Optional boolean column. Steps for which it is
+                False are left out, and the column itself is not returned.
+        """
+
+        start = self.starts[env_index] - self.offset
+        data = {
+            k: column[start:self.size, env_index].copy()
+            for k, column in self.columns.items()
+        }
+        if mask_column is not None:
+            mask = data.pop(mask_column)
+            if not mask.all():
+                data = {k: v[mask] for k, v in data.items()}
+        self.starts[env_index] = self.offset + self.size
+        return SampleBatch(data)
+
+    def _make_space(self):
+        # Drop the steps that are not part of any current trajectory.
+        unused = int(self.starts.min()) - self.offset
+        if unused > self.capacity // 2:
+            for column in self.columns.values():
+                column[:self.size - unused] = column[unused:self.size]
+            self.size -= unused
+            self.offset += unused
+        else:
+            self.capacity *= 2
+            for k, column in self.columns.items():
+                grown = np.empty(
+                    (self.capacity, ) + column.shape[1:], dtype=column.dtype)
+                grown[:self.size] = column[:self.size]
+                self.columns[k] = grown
+
+
 @DeveloperAPI
 class MultiAgentSampleBatchBuilder:
     """Util to build SampleBatches for each policy in a multi-agent env.
@@ -1,4 +1,5 @@
 from collections import defaultdict, namedtuple
+import gym
 import logging
 import numpy as np
 import queue
@@ -9,10 +10,12 @@ from ray.util.debug import log_once
 from ray.rllib.evaluation.episode import MultiAgentEpisode, _flatten_action
 from ray.rllib.evaluation.rollout_metrics import RolloutMetrics
 from ray.rllib.evaluation.sample_batch_builder import \
-    MultiAgentSampleBatchBuilder
+    MultiAgentSampleBatchBuilder, VectorSampleBatchBuilder, to_float_array
 from ray.rllib.policy.policy import clip_action
+from ray.rllib.policy.sample_batch import SampleBatch, MultiAgentBatch
 from ray.rllib.policy.tf_policy import TFPolicy
-from ray.rllib.env.base_env import BaseEnv, ASYNC_RESET_RETURN
+from ray.rllib.env.base_env import BaseEnv, ASYNC_RESET_RETURN, \
+    _DUMMY_AGENT_ID, _VectorEnvToBaseEnv
 from ray.rllib.env.atari_wrappers import get_wrapper_by_cls, MonitorEnv
 from ray.rllib.offline import InputReader
 from ray.rllib.utils.annotations import override
@@ -27,6 +30,10 @@ PolicyEvalData = namedtuple("PolicyEvalData", [
     "prev_reward"
 ])
 
+# Column of the vectorized sampler that masks out steps with
+# `training_enabled=False` in their info.
+_TRAINING_ENABLED = "training_enabled"
+
 
 class PerfStats:
     """Sampler perf stats that will be included in rollout metrics."""
@@ -296,6 +303,14 @@ def _env_runner(worker, base_env, extra_batch_callback, policies,
         horizon = float("inf")
         logger.debug("No episode horizon specified, assuming inf.")
 
+    if _can_run_vectorized(base_env, policies, policy_mapping_fn):
+        yield from _env_runner_vectorized(
+            worker, base_env, extra_batch_callback, policies,
+            policy_mapping_fn, rollout_fragment_length, horizon, preprocessors,
+            obs_filters, clip_rewards, clip_actions, pack, callbacks, tf_sess,
+            perf_stats, soft_horizon, no_done_at_end)
+        return
+
     # Pool of batch builders, which can be shared across episodes to pack
     # trajectory data.
     batch_builder_pool = []
@@ -389,6 +404,10 @@ def _process_observations(worker, base_env, policies, batch_builder_pool,
     large_batch_threshold = max(1000, rollout_fragment_length * 10) if \
         rollout_fragment_length != float("inf") else 5000
 
+    # Preprocess the observations of running episodes in batches
+    prep_obs_batch = _preprocess_observations(active_episodes, unfiltered_obs,
+                                              preprocessors)
+
     # For each environment
     for env_id, agent_obs in unfiltered_obs.items():
         new_episode = env_id not in active_episodes
@@ -400,20 +419,8 @@ def _process_observations(worker, base_env, policies, batch_builder_pool,
 
         if (episode.batch_builder.total() > large_batch_threshold
                 and log_once("large_batch_warning")):
-            logger.warning(
-                "More than {} observations for {} env steps ".format(
-                    episode.batch_builder.total(),
-                    episode.batch_builder.count) + "are buffered in "
-                "the sampler. If this is more than you expected, check that "
-                "that you set a horizon on your environment correctly and that"
-                " it terminates at some point. "
-                "Note: In multi-agent environments, `rollout_fragment_length` "
-                "sets the batch size based on environment steps, not the "
-                "steps of "
-                "individual agents, which can result in unexpectedly large "
-                "batches. Also, you may be in evaluation waiting for your Env "
-                "to terminate (batch_mode=`complete_episodes`). Make sure it "
-                "does at some point.")
+            _warn_large_batch(episode.batch_builder.total(),
+                              episode.batch_builder.count)
 
         # Check episode termination conditions
         if dones[env_id]["__all__"] or episode.length >= horizon:
@@ -439,8 +446,11 @@ def _process_observations(worker, base_env, policies, batch_builder_pool,
         # For each agent in the environment.
         for agent_id, raw_obs in agent_obs.items():
             policy_id = episode.policy_for(agent_id)
-            prep_obs = _get_or_raise(preprocessors,
-                                     policy_id).transform(raw_obs)
+            if new_episode:
+                prep_obs = _get_or_raise(preprocessors,
+                                         policy_id).transform(raw_obs)
+            else:
+                prep_obs = prep_obs_batch[(env_id, agent_id)]
             if log_once("prep_obs"):
                 logger.info("Preprocessed obs: {}".format(summarize(prep_obs)))
 
@@ -551,6 +561,402 @@ def _process_observations(worker, base_env, policies, batch_builder_pool,
     return active_envs, to_eval, outputs
 
 
+def _preprocess_observations(active_episodes, unfiltered_obs, preprocessors):
+    """Preprocesses the observations of running episodes for each policy.
+
+    Returns:
+        prep_obs: map of (env_id, agent_id) to the preprocessed observation
+    """
+
+    keys = defaultdict(list)
+    raw_obs = defaultdict(list)
+    for env_id, agent_obs in unfiltered_obs.items():
+        # New episodes are created (and preprocessed) later, in order
+        if env_id not in active_episodes:
+            continue
+        episode = active_episodes[env_id]
+        for agent_id, o in agent_obs.items():
+            policy_id = episode.policy_for(agent_id)
+            keys[policy_id].append((env_id, agent_id))
+            raw_obs[policy_id].append(o)
+
+    prep_obs = {}
+    for policy_id, obs_batch in raw_obs.items():
+        prep_obs_batch = _get_or_raise(preprocessors,
+                                       policy_id).transform_batch(obs_batch)
+        prep_obs.update(zip(keys[policy_id], prep_obs_batch))
+    return prep_obs
+
+
+def _can_run_vectorized(base_env, policies, policy_mapping_fn):
+    """Returns whether _env_runner_vectorized() can sample from base_env.
+
+    This is the case for a single policy acting in a VectorEnv (e.g., the
+    vectorized gym envs of single-agent training), except for tuple action
+    spaces.
+    """
+
+    if type(base_env) is not _VectorEnvToBaseEnv or len(policies) != 1:
+        return False
+    policy_id, policy = next(iter(policies.items()))
+    if isinstance(policy.action_space, gym.spaces.Tuple):
+        return False
+    return policy_mapping_fn(_DUMMY_AGENT_ID) == policy_id
+
+
+def _env_runner_vectorized(worker, base_env, extra_batch_callback, policies,
+                           policy_mapping_fn, rollout_fragment_length, horizon,
+                           preprocessors, obs_filters, clip_rewards,
+                           clip_actions, pack, callbacks, tf_sess, perf_stats,
+                           soft_horizon, no_done_at_end):
+    """Experience collection for a single policy acting in a VectorEnv.
+
+    This produces the same batches as the general loop of _env_runner(), but
+    steps the VectorEnv directly instead of through the per-agent dicts of
+    BaseEnv. Observations, actions, rewards and RNN states of all envs are
+    kept in arrays that are fed to the policy as a whole, and each time step
+    of all envs is written into a VectorSampleBatchBuilder at once.
+
+    Args and yields are the same as for _env_runner(). The horizon has to be
+    resolved already.
+    """
+
+    vector_env = base_env.vector_env
+    num_envs = vector_env.num_envs
+    policy_id, policy = next(iter(policies.items()))
+    preprocessor = _get_or_raise(preprocessors, policy_id)
+    obs_filter = _get_or_raise(obs_filters, policy_id)
+    use_run_builder = tf_sess and (policy.compute_actions.__code__ is
+                                   TFPolicy.compute_actions.__code__)
+    large_batch_threshold = max(1000, rollout_fragment_length * 10) if \
+        rollout_fragment_length != float("inf") else 5000
+
+    sample_builder = VectorSampleBatchBuilder(num_envs)
+
+    # Pool of per-episode output batches, which can be shared across
+    # episodes to pack trajectory data.
+    episode_batches_pool = []
+
+    def get_batch_builder():
+        return MultiAgentSampleBatchBuilder(policies, clip_rewards, callbacks)
+
+    def new_episode():
+        episode = MultiAgentEpisode(policies, policy_mapping_fn,
+                                    get_batch_builder, extra_batch_callback)
+        if episode_batches_pool:
+            episode.batch_builder = episode_batches_pool.pop()
+        else:
+            episode.batch_builder = _EpisodeBatches(policy_id, policies,
+                                                    clip_rewards, callbacks)
+        for p in policies.values():
+            p.exploration.on_episode_start(
+                policy=p,
+                environment=base_env,
+                episode=episode,
+                tf_sess=getattr(p, "_sess", None))
+        callbacks.on_episode_start(
+            worker=worker,
+            base_env=base_env,
+            policies=policies,
+            episode=episode)
+        return episode
+
+    def filter_obs(prep_obs):
+        if log_once("prep_obs"):
+            logger.info("Preprocessed obs: {}".format(summarize(prep_obs)))
+        filtered_obs = obs_filter(prep_obs)
+        if log_once("filtered_obs"):
+            logger.info("Filtered obs: {}".format(summarize(filtered_obs)))
+        return filtered_obs
+
+    zero_action = np.zeros_like(_flatten_action(policy.action_space.sample()))
+    initial_state = [np.asarray(s) for s in policy.get_initial_state()]
+    last_actions = np.repeat(zero_action[np.newaxis], num_envs, axis=0)
+    # Envs after a soft reset are fed zero actions, but keep their last
+    # action as the prev action recorded for the next step.
+    input_actions = last_actions
+    last_rewards = np.zeros(num_envs, dtype=np.float32)
+    states = [
+        np.repeat(s[np.newaxis], num_envs, axis=0) for s in initial_state
+    ]
+
+    t0 = time.time()
+    raw_obs = vector_env.vector_reset()
+    perf_stats.env_wait_time += time.time() - t0
+    episodes = []
+    obs = [filter_obs(o) for o in preprocessor.transform_batch(raw_obs)]
+    infos = [{} for _ in range(num_envs)]
+    for i in range(num_envs):
+        episode = new_episode()
+        episode._set_last_observation(_DUMMY_AGENT_ID, obs[i])
+        episode._set_last_raw_obs(_DUMMY_AGENT_ID, raw_obs[i])
+        callbacks.on_episode_step(
+            worker=worker, base_env=base_env, episode=episode)
+        episodes.append(episode)
+
+    while True:
+        perf_stats.iters += 1
+
+        # Do batched policy eval
+        t1 = time.time()
+        obs_batch = np.stack(obs)
+        if log_once("compute_actions_input"):
+            logger.info("Inputs to compute_actions():\n\n{}\n".format(
+                summarize(obs_batch)))
+        if use_run_builder:
+            builder = TFRunBuilder(tf_sess, "policy_eval")
+            fetches = policy._build_compute_actions(
+                builder,
+                obs_batch=obs_batch,
+                state_batches=states,
+                prev_action_batch=input_actions,
+                prev_reward_batch=last_rewards,
+                timestep=policy.global_timestep)
+            actions, state_out, pi_info = builder.get(fetches)
+        else:
+            actions, state_out, pi_info = policy.compute_actions(
+                obs_batch,
+                state_batches=states,
+                prev_action_batch=input_actions,
+                prev_reward_batch=last_rewards,
+                info_batch=infos,
+                episodes=episodes,
+                timestep=policy.global_timestep)
+        if log_once("compute_actions_result"):
+            logger.info("Outputs of compute_actions():\n\n{}\n".format(
+                summarize((actions, state_out, pi_info))))
+        perf_stats.inference_time += time.time() - t1
+
+        # Process results and update episode state
+        t2 = time.time()
+        actions = np.asarray(actions)
+        state_out = [np.asarray(s) for s in state_out]
+        if len(states) != len(state_out):
+            raise ValueError("Length of RNN in did not match RNN out, got: "
+                             "{} vs {}".format(states, state_out))
+        for i, episode in enumerate(episodes):
+            episode._set_rnn_state(_DUMMY_AGENT_ID, [s[i] for s in state_out])
+            episode._set_last_pi_info(_DUMMY_AGENT_ID,
+                                      {k: v[i]
+                                       for k, v in pi_info.items()})
+            episode._set_last_action(_DUMMY_AGENT_ID, actions[i])
+        if clip_actions:
+            actions_to_send = clip_action(actions, policy.action_space)
+        else:
+            actions_to_send = actions
+        perf_stats.processing_time += time.time() - t2
+
+        t3 = time.time()
+        raw_obs, rewards, dones, new_infos = vector_env.vector_step(
+            list(actions_to_send))
+        perf_stats.env_wait_time += time.time() - t3
+
+        if log_once("env_returns"):
+            logger.info("Raw obs from env: {}".format(summarize(raw_obs)))
+            logger.info("Info return from env: {}".format(
+                summarize(new_infos)))
+
+        # Record the new step of all envs
+        t4 = time.time()
+        new_obs = [
+            filter_obs(o) for o in preprocessor.transform_batch(raw_obs)
+        ]
+        all_done = np.zeros(num_envs, dtype=np.bool_)
+        hit_horizon = np.zeros(num_envs, dtype=np.bool_)
+        for i, episode in enumerate(episodes):
+            episode.length += 1
+            episode.batch_builder.count += 1
+            episode._add_agent_rewards({_DUMMY_AGENT_ID: rewards[i]})
+            all_done[i] = dones[i] or episode.length >= horizon
+            hit_horizon[i] = episode.length >= horizon and not dones[i]
+            episode._set_last_observation(_DUMMY_AGENT_ID, new_obs[i])
+            episode._set_last_raw_obs(_DUMMY_AGENT_ID, raw_obs[i])
+            episode._set_last_info(_DUMMY_AGENT_ID, new_infos[i])
+        if no_done_at_end:
+            recorded_dones = np.zeros(num_envs, dtype=np.bool_)
+        elif soft_horizon:
+            recorded_dones = all_done & ~hit_horizon
+        else:
+            recorded_dones = all_done
+        info_column = np.empty(num_envs, dtype=object)
+        info_column[:] = new_infos
+        state_columns = {}
+        for j, (s_in, s_out) in enumerate(zip(states, state_out)):
+            state_columns["state_in_{}".format(j)] = s_in
+            state_columns["state_out_{}".format(j)] = s_out
+        sample_builder.add_step(
+            t=np.array([e.length - 1 for e in episodes], dtype=np.int64),
+            eps_id=np.array([e.episode_id for e in episodes], dtype=np.int64),
+            agent_index=np.zeros(num_envs, dtype=np.int64),
+            obs=obs_batch,
+            actions=actions,
+            rewards=np.asarray(rewards, dtype=np.float32),
+            prev_actions=last_actions,
+            prev_rewards=last_rewards,
+            dones=recorded_dones,
+            infos=info_column,
+            new_obs=np.stack(new_obs),
+            **{
+                _TRAINING_ENABLED: [
+                    info.get("training_enabled", True) for info in new_infos
+                ]
+            },
+            **pi_info,
+            **state_columns)
+
+        last_actions = input_actions = np.array(actions)
+        last_rewards = np.array(rewards, dtype=np.float32)
+        states = [np.array(s) for s in state_out]
+        infos = list(new_infos)
+
+        outputs = []
+        for i, episode in enumerate(episodes):
+            if (sample_builder.count(i) > large_batch_threshold
+                    and log_once("large_batch_warning")):
+                _warn_large_batch(
+                    sample_builder.count(i), episode.batch_builder.count)
+
+            # Invoke the step callback after the step is logged to the episode
+            callbacks.on_episode_step(
+                worker=worker, base_env=base_env, episode=episode)
+
+            if all_done[i]:
+                atari_metrics = _fetch_atari_metrics(base_env)
+                if atari_metrics is not None:
+                    for m in atari_metrics:
+                        outputs.append(
+                            m._replace(custom_metrics=episode.custom_metrics))
+                else:
+                    outputs.append(
+                        RolloutMetrics(episode.length, episode.total_reward,
+                                       dict(episode.agent_rewards),
+                                       episode.custom_metrics, {},
+                                       episode.hist_data))
+
+            # Cut the batch if we're not packing multiple episodes into one,
+            # or if we've exceeded the requested batch size.
+            batches = episode.batch_builder
+            if all_done[i] or batches.count >= rollout_fragment_length:
+                # Make sure postprocessor stays within one episode
+                batches.postprocess_trajectory(
+                    sample_builder.build_trajectory(i, _TRAINING_ENABLED),
+                    episode)
+                if batches.has_data() and (
+                    (all_done[i] and not pack)
+                        or batches.count >= rollout_fragment_length):
+                    outputs.append(batches.build_and_reset())
+
+            if not all_done[i]:
+                continue
+
+            # Handle episode termination
+            for p in policies.values():
+                p.exploration.on_episode_end(
+                    policy=p,
+                    environment=base_env,
+                    episode=episode,
+                    tf_sess=getattr(p, "_sess", None))
+            callbacks.on_episode_end(
+                worker=worker,
+                base_env=base_env,
+                policies=policies,
+                episode=episode)
+            if hit_horizon[i] and soft_horizon:
+                episode.soft_reset()
+                resetted_obs = raw_obs[i]
+                if input_actions is last_actions:
+                    input_actions = last_actions.copy()
+            else:
+                episode_batches_pool.append(batches)
+                resetted_obs = vector_env.reset_at(i)
+                episode = new_episode()
+                episodes[i] = episode
+                for s, s_init in zip(states, initial_state):
+                    s[i] = s_init
+                last_actions[i] = zero_action
+                infos[i] = {}
+            new_obs[i] = filter_obs(preprocessor.transform(resetted_obs))
+            episode._set_last_observation(_DUMMY_AGENT_ID, new_obs[i])
+            input_actions[i] = zero_action
+            last_rewards[i] = 0.0
+
+        obs = new_obs
+        perf_stats.processing_time += time.time() - t4
+        for o in outputs:
+            yield o
+
+
+class _EpisodeBatches:
+    """Postprocessed trajectories of a single policy for the output batch.
+
+    This takes the place of the MultiAgentSampleBatchBuilder of an episode in
+    _env_runner_vectorized(), where the raw trajectories are kept in a shared
+    VectorSampleBatchBuilder.
+    """
+
+    def __init__(self, policy_id, policies, clip_rewards, callbacks):
+        self.policy_id = policy_id
+        self.policy_map = policies
+        self.clip_rewards = clip_rewards
+        self.callbacks = callbacks
+        self.batches = []
+        self.count = 0
+        self.unroll_id = 0
+
+    def has_data(self):
+        return len(self.batches) > 0
+
+    def postprocess_trajectory(self, pre_batch, episode):
+        """Applies the policy postprocessor to a single trajectory."""
+
+        if pre_batch.count == 0:
+            return
+        if self.clip_rewards:
+            pre_batch["rewards"] = np.sign(pre_batch["rewards"])
+        if any(pre_batch["dones"][:-1]) or len(set(pre_batch["eps_id"])) > 1:
+            raise ValueError(
+                "Batches sent to postprocessing must only contain steps "
+                "from a single trajectory.", pre_batch)
+        policy = self.policy_map[self.policy_id]
+        post_batch = policy.postprocess_trajectory(pre_batch, {}, episode)
+        # Call the Policy's Exploration's postprocess method.
+        policy.exploration.postprocess_trajectory(
+            policy, post_batch, getattr(policy, "_sess", None))
+
+        if log_once("after_post"):
+            logger.info(
+                "Trajectory fragment after postprocess_trajectory():\n\n{}\n".
+                format(summarize({
+                    _DUMMY_AGENT_ID: post_batch
+                })))
+
+        from ray.rllib.evaluation.rollout_worker import get_global_worker
+        self.callbacks.on_postprocess_trajectory(
+            worker=get_global_worker(),
+            episode=episode,
+            agent_id=_DUMMY_AGENT_ID,
+            policy_id=self.policy_id,
+            policies=self.policy_map,
+            postprocessed_batch=post_batch,
+            original_batches={_DUMMY_AGENT_ID: (policy, pre_batch)})
+        self.batches.append(post_batch)
+
+    def build_and_reset(self):
+        """Returns the postprocessed trajectories as a single batch."""
+
+        batch = SampleBatch.concat_samples(self.batches)
+        batch = SampleBatch({k: to_float_array(v) for k, v in batch.items()})
+        batch.data[SampleBatch.UNROLL_ID] = np.repeat(self.unroll_id,
+                                                      batch.count)
+        old_count = self.count
+        self.batches = []
+        self.count = 0
+        self.unroll_id += 1
+        return MultiAgentBatch.wrap_as_needed({
+            self.policy_id: batch
+        }, old_count)
+
+
 def _do_policy_eval(tf_sess, to_eval, policies, active_episodes):
     """Call compute actions on observation batches to get next actions.
 
@@ -673,6 +1079,22 @@ def _process_policy_eval_results(to_eval, eval_results, active_episodes,
     return actions_to_send
 
 
+def _warn_large_batch(total, count):
+    logger.warning(
+        "More than {} observations for {} env steps ".format(total, count) +
+        "are buffered in "
+        "the sampler. If this is more than you expected, check that "
+        "that you set a horizon on your environment correctly and that"
+        " it terminates at some point. "
+        "Note: In multi-agent environments, `rollout_fragment_length` "
+        "sets the batch size based on environment steps, not the "
+        "steps of "
+        "individual agents, which can result in unexpectedly large "
+        "batches. Also, you may be in evaluation waiting for your Env "
+        "to terminate (batch_mode=`complete_episodes`). Make sure it "
+        "does at some point.")
+
+
 def _fetch_atari_metrics(base_env):
     """Atari games have multiple logical episodes, one per life.
 
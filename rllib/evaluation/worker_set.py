@@ -1,7 +1,6 @@
 import logging
 from types import FunctionType
 
-import ray
 from ray.rllib.utils.annotations import DeveloperAPI
 from ray.rllib.evaluation.rollout_worker import RolloutWorker, \
     _validate_multiagent_config
@@ -10,6 +9,7 @@ from ray.rllib.offline import NoopOutput, JsonReader, MixedInput, JsonWriter, \
     ShuffledInput
 from ray.rllib.utils import merge_dicts, try_import_tf
 from ray.rllib.utils.memory import ray_get_and_free
+from ray.rllib.utils.weight_sync import WeightBroadcaster
 
 tf = try_import_tf()
 
@@ -51,6 +51,8 @@ class WorkerSet:
         self._remote_config = trainer_config
         self._num_workers = num_workers
         self._logdir = logdir
+        self._weight_broadcaster = WeightBroadcaster(
+            **trainer_config.get("weight_sync", {}))
 
         if _setup:
             self._local_config = merge_dicts(
@@ -73,12 +75,20 @@ class WorkerSet:
         """Return a list of remote rollout workers."""
         return self._remote_workers
 
-    def sync_weights(self):
-        """Syncs weights of remote workers with the local worker."""
+    def sync_weights(self, global_vars=None):
+        """Syncs weights of remote workers with the local worker.
+
+        Only workers that do not have the current version of the weights
+        receive an update. See ``WeightBroadcaster``.
+
+        Arguments:
+            global_vars (dict): Optional global vars to set on all remote
+                workers.
+        """
         if self.remote_workers():
-            weights = ray.put(self.local_worker().get_weights())
-            for e in self.remote_workers():
-                e.set_weights.remote(weights)
+            self._weight_broadcaster.broadcast(
+                self.local_worker().get_weights(), self.remote_workers(),
+                global_vars)
 
     def add_workers(self, num_workers):
         """Creates and add a number of remote workers to this worker set.
@@ -105,6 +115,7 @@ class WorkerSet:
     def reset(self, new_remote_workers):
         """Called to change the set of remote workers."""
         self._remote_workers = new_remote_workers
+        self._weight_broadcaster.forget_workers(new_remote_workers)
 
     def stop(self):
         """Stop all rollout workers."""
@@ -181,6 +192,14 @@ class WorkerSet:
         workers = WorkerSet(None, None, {}, _setup=False)
         workers._local_worker = local_worker
         workers._remote_workers = remote_workers or []
+        if workers._remote_workers:
+            # The workers may already hold weights versioned by another
+            # WorkerSet, so continue from the newest of their versions.
+            versions = ray_get_and_free([
+                w.apply.remote(lambda w: w.weights_version)
+                for w in workers._remote_workers
+            ])
+            workers._weight_broadcaster.version = max(versions)
         return workers
 
     def _make_worker(self, cls, env_creator, policy, worker_index, config):
@@ -272,6 +291,7 @@ class WorkerSet:
             output_creator=output_creator,
             remote_worker_envs=config["remote_worker_envs"],
             remote_env_batch_wait_ms=config["remote_env_batch_wait_ms"],
+            remote_envs_per_actor=config["remote_envs_per_actor"],
             soft_horizon=config["soft_horizon"],
             no_done_at_end=config["no_done_at_end"],
             seed=(config["seed"] + worker_index)
@@ -2,7 +2,8 @@ from typing import Any
 import time
 
 from ray.util.iter import LocalIterator
-from ray.rllib.evaluation.metrics import collect_episodes, summarize_episodes
+from ray.rllib.evaluation.metrics import collect_episodes, \
+    collect_summary, smooth_summary, summarize_episodes, summarize_metrics
 from ray.rllib.execution.common import STEPS_SAMPLED_COUNTER
 from ray.rllib.evaluation.worker_set import WorkerSet
 
@@ -28,11 +29,13 @@ def StandardMetricsReporting(train_op: LocalIterator[Any], workers: WorkerSet,
         {"episode_reward_max": ..., "episode_reward_mean": ..., ...}
     """
 
+    aggregate_on_workers = config.get("aggregate_metrics_on_workers", False)
     output_op = train_op \
         .filter(OncePerTimeInterval(max(2, config["min_iter_time_s"]))) \
         .for_each(CollectMetrics(
             workers, min_history=config["metrics_smoothing_episodes"],
-            timeout_seconds=config["collect_metrics_timeout"]))
+            timeout_seconds=config["collect_metrics_timeout"],
+            aggregate_on_workers=aggregate_on_workers))
     return output_op
 
 
@@ -50,28 +53,25 @@ class CollectMetrics:
         {"episode_reward_max": ..., "episode_reward_mean": ..., ...}
     """
 
-    def __init__(self, workers, min_history=100, timeout_seconds=180):
+    def __init__(self,
+                 workers,
+                 min_history=100,
+                 timeout_seconds=180,
+                 aggregate_on_workers=False):
         self.workers = workers
         self.episode_history = []
+        self.summary_history = []
         self.to_be_collected = []
         self.min_history = min_history
         self.timeout_seconds = timeout_seconds
+        self.aggregate_on_workers = aggregate_on_workers
 
     def __call__(self, _):
         # Collect worker metrics.
-        episodes, self.to_be_collected = collect_episodes(
-            self.workers.local_worker(),
-            self.workers.remote_workers(),
-            self.to_be_collected,
-            timeout_seconds=self.timeout_seconds)
-        orig_episodes = list(episodes)
-        missing = self.min_history - len(episodes)
-        if missing > 0:
-            episodes.extend(self.episode_history[-missing:])
-            assert len(episodes) <= self.min_history
-        self.episode_history.extend(orig_episodes)
-        self.episode_history = self.episode_history[-self.min_history:]
-        res = summarize_episodes(episodes, orig_episodes)
+        if self.aggregate_on_workers:
+            res = self._collect_summary()
+        else:
+            res = self._collect_episodes()
 
         # Add in iterator metrics.
         metrics = LocalIterator.get_metrics()
@@ -95,6 +95,31 @@ class CollectMetrics:
         res["info"].update(counters)
         return res
 
+    def _collect_episodes(self):
+        episodes, self.to_be_collected = collect_episodes(
+            self.workers.local_worker(),
+            self.workers.remote_workers(),
+            self.to_be_collected,
+            timeout_seconds=self.timeout_seconds)
+        orig_episodes = list(episodes)
+        missing = self.min_history - len(episodes)
+        if missing > 0:
+            episodes.extend(self.episode_history[-missing:])
+            assert len(episodes) <= self.min_history
+        self.episode_history.extend(orig_episodes)
+        self.episode_history = self.episode_history[-self.min_history:]
+        return summarize_episodes(episodes, orig_episodes)
+
+    def _collect_summary(self):
+        summary, self.to_be_collected = collect_summary(
+            self.workers.local_worker(),
+            self.workers.remote_workers(),
+            self.to_be_collected,
+            timeout_seconds=self.timeout_seconds)
+        smoothed = smooth_summary(summary, self.summary_history,
+                                  self.min_history)
+        return summarize_metrics(smoothed, summary.num_episodes)
+
 
 class OncePerTimeInterval:
     """Callable that returns True once per given interval.
@@ -36,14 +36,15 @@ class StoreToReplayBuffer:
             batch = MultiAgentBatch({DEFAULT_POLICY_ID: batch}, batch.count)
 
         for policy_id, s in batch.policy_batches.items():
-            for row in s.rows():
-                self.replay_buffers[policy_id].add(
-                    pack_if_needed(row["obs"]),
-                    row["actions"],
-                    row["rewards"],
-                    pack_if_needed(row["new_obs"]),
-                    row["dones"],
-                    weight=None)
+            obs = [pack_if_needed(o) for o in s["obs"]]
+            new_obs = [pack_if_needed(o) for o in s["new_obs"]]
+            self.replay_buffers[policy_id].add_batch(
+                obs,
+                s["actions"],
+                s["rewards"],
+                new_obs,
+                s["dones"],
+                weights=None)
         return batch
 
 
@@ -1,7 +1,6 @@
 import logging
 from typing import List
 
-import ray
 from ray.util.iter import LocalIterator
 from ray.rllib.evaluation.metrics import get_learner_stats
 from ray.rllib.evaluation.worker_set import WorkerSet
@@ -43,9 +42,7 @@ class TrainOneStep:
         metrics.info[LEARNER_INFO] = get_learner_stats(info)
         if self.workers.remote_workers():
             with metrics.timers[WORKER_UPDATE_TIMER]:
-                weights = ray.put(self.workers.local_worker().get_weights())
-                for e in self.workers.remote_workers():
-                    e.set_weights.remote(weights, _get_global_vars())
+                self.workers.sync_weights(global_vars=_get_global_vars())
         # Also update global vars of the local worker.
         self.workers.local_worker().set_global_vars(_get_global_vars())
         return info
@@ -121,10 +118,7 @@ class ApplyGradients:
         if self.update_all:
             if self.workers.remote_workers():
                 with metrics.timers[WORKER_UPDATE_TIMER]:
-                    weights = ray.put(
-                        self.workers.local_worker().get_weights())
-                    for e in self.workers.remote_workers():
-                        e.set_weights.remote(weights, _get_global_vars())
+                    self.workers.sync_weights(global_vars=_get_global_vars())
         else:
             if metrics.current_actor is None:
                 raise ValueError(
@@ -9,6 +9,8 @@ from ray.rllib.utils.annotations import override, PublicAPI
 ATARI_OBS_SHAPE = (210, 160, 3)
 ATARI_RAM_OBS_SHAPE = (128, )
 VALIDATION_INTERVAL = 100
+# Max number of channels of images resized by cv2 (CV_CN_MAX).
+CV2_MAX_CHANNELS = 512
 
 logger = logging.getLogger(__name__)
 
@@ -44,27 +46,52 @@ class Preprocessor:
         """Returns the preprocessed observation."""
         raise NotImplementedError
 
+    @PublicAPI
+    def transform_batch(self, observations):
+        """Returns the preprocessed observations, of shape [N] + self.shape.
+
+        Subclasses should override this to process all observations at once.
+        """
+        return np.array([self.transform(o) for o in observations])
+
     def write(self, observation, array, offset):
         """Alternative to transform for more efficient flattening."""
         array[offset:offset + self._size] = self.transform(observation)
 
+    def write_batch(self, observations, array, offset):
+        """Alternative to transform_batch for more efficient flattening.
+
+        The observations are written into `array[:, offset:offset + size]`.
+        """
+        array[:, offset:offset + self._size] = np.reshape(
+            self.transform_batch(observations), (-1, self._size))
+
     def check_shape(self, observation):
         """Checks the shape of the given observation."""
         if self._i % VALIDATION_INTERVAL == 0:
-            if type(observation) is list and isinstance(
-                    self._obs_space, gym.spaces.Box):
-                observation = np.array(observation)
-            try:
-                if not self._obs_space.contains(observation):
-                    raise ValueError(
-                        "Observation outside expected value range",
-                        self._obs_space, observation)
-            except AttributeError:
-                raise ValueError(
-                    "Observation for a Box/MultiBinary/MultiDiscrete space "
-                    "should be an np.array, not a Python list.", observation)
+            self._validate(observation)
         self._i += 1
 
+    def check_shape_batch(self, observations):
+        """Checks the shapes of observations, as check_shape for each."""
+        start = -self._i % VALIDATION_INTERVAL
+        for observation in observations[start::VALIDATION_INTERVAL]:
+            self._validate(observation)
+        self._i += len(observations)
+
+    def _validate(self, observation):
+        if type(observation) is list and isinstance(self._obs_space,
+                                                    gym.spaces.Box):
+            observation = np.array(observation)
+        try:
+            if not self._obs_space.contains(observation):
+                raise ValueError("Observation outside expected value range",
+                                 self._obs_space, observation)
+        except AttributeError:
+            raise ValueError(
+                "Observation for a Box/MultiBinary/MultiDiscrete space "
+                "should be an np.array, not a Python list.", observation)
+
     @property
     @PublicAPI
     def size(self):
@@ -123,6 +150,35 @@ class GenericPixelPreprocessor(Preprocessor):
             scaled *= 1.0 / 255.0
         return scaled
 
+    @override(Preprocessor)
+    def transform_batch(self, observations):
+        self.check_shape_batch(observations)
+        images = np.asarray(observations)[:, 25:-25, :, :]
+        num_images, height, width, channels = images.shape
+        # cv2 resizes each channel separately, so images are resized in
+        # groups, stacked as the channels of a single image.
+        group_size = max(1, CV2_MAX_CHANNELS // channels)
+        groups = []
+        for i in range(0, num_images, group_size):
+            group = images[i:i + group_size]
+            stacked = group.transpose(1, 2, 0, 3).reshape(height, width, -1)
+            if self._dim < 84:
+                stacked = cv2.resize(stacked, (84, 84))
+            stacked = cv2.resize(stacked, (self._dim, self._dim))
+            stacked = stacked.reshape(self._dim, self._dim, len(group),
+                                      channels)
+            groups.append(stacked.transpose(2, 0, 1, 3))
+        scaled = np.concatenate(groups)
+        if self._grayscale:
+            scaled = scaled.mean(3)
+            scaled = scaled.astype(np.float32)
+            scaled = np.reshape(scaled, [num_images, self._dim, self._dim, 1])
+        if self._zero_mean:
+            scaled = (scaled - 128) / 128
+        else:
+            scaled *= 1.0 / 255.0
+        return scaled
+
 
 class AtariRamPreprocessor(Preprocessor):
     @override(Preprocessor)
@@ -134,6 +190,11 @@ class AtariRamPreprocessor(Preprocessor):
         self.check_shape(observation)
         return (observation - 128) / 128
 
+    @override(Preprocessor)
+    def transform_batch(self, observations):
+        self.check_shape_batch(observations)
+        return (np.asarray(observations) - 128) / 128
+
 
 class OneHotPreprocessor(Preprocessor):
     @override(Preprocessor)
@@ -147,10 +208,23 @@ class OneHotPreprocessor(Preprocessor):
         arr[observation] = 1
         return arr
 
+    @override(Preprocessor)
+    def transform_batch(self, observations):
+        self.check_shape_batch(observations)
+        arr = np.zeros(
+            (len(observations), self._obs_space.n), dtype=np.float32)
+        arr[np.arange(len(observations)), observations] = 1
+        return arr
+
     @override(Preprocessor)
     def write(self, observation, array, offset):
         array[offset + observation] = 1
 
+    @override(Preprocessor)
+    def write_batch(self, observations, array, offset):
+        array[np.arange(len(observations)), offset +
+              np.asarray(observations)] = 1
+
 
 class NoPreprocessor(Preprocessor):
     @override(Preprocessor)
@@ -162,11 +236,21 @@ class NoPreprocessor(Preprocessor):
         self.check_shape(observation)
         return observation
 
+    @override(Preprocessor)
+    def transform_batch(self, observations):
+        self.check_shape_batch(observations)
+        return np.asarray(observations)
+
     @override(Preprocessor)
     def write(self, observation, array, offset):
         array[offset:offset + self._size] = np.array(
             observation, copy=False).ravel()
 
+    @override(Preprocessor)
+    def write_batch(self, observations, array, offset):
+        array[:, offset:offset + self._size] = np.reshape(
+            observations, (len(observations), self._size))
+
     @property
     @override(Preprocessor)
     def observation_space(self):
@@ -199,6 +283,13 @@ class TupleFlatteningPreprocessor(Preprocessor):
         self.write(observation, array, 0)
         return array
 
+    @override(Preprocessor)
+    def transform_batch(self, observations):
+        self.check_shape_batch(observations)
+        array = np.zeros((len(observations), ) + self.shape)
+        self.write_batch(observations, array, 0)
+        return array
+
     @override(Preprocessor)
     def write(self, observation, array, offset):
         assert len(observation) == len(self.preprocessors), observation
@@ -206,6 +297,14 @@ class TupleFlatteningPreprocessor(Preprocessor):
             p.write(o, array, offset)
             offset += p.size
 
+    @override(Preprocessor)
+    def write_batch(self, observations, array, offset):
+        for observation in observations:
+            assert len(observation) == len(self.preprocessors), observation
+        for i, p in enumerate(self.preprocessors):
+            p.write_batch([o[i] for o in observations], array, offset)
+            offset += p.size
+
 
 class DictFlatteningPreprocessor(Preprocessor):
     """Preprocesses each dict value, then flattens it all into a vector.
@@ -232,6 +331,13 @@ class DictFlatteningPreprocessor(Preprocessor):
         self.write(observation, array, 0)
         return array
 
+    @override(Preprocessor)
+    def transform_batch(self, observations):
+        self.check_shape_batch(observations)
+        array = np.zeros((len(observations), ) + self.shape)
+        self.write_batch(observations, array, 0)
+        return array
+
     @override(Preprocessor)
     def write(self, observation, array, offset):
         if not isinstance(observation, OrderedDict):
@@ -242,6 +348,20 @@ class DictFlatteningPreprocessor(Preprocessor):
             p.write(o, array, offset)
             offset += p.size
 
+    @override(Preprocessor)
+    def write_batch(self, observations, array, offset):
+        values = []
+        for observation in observations:
+            if isinstance(observation, OrderedDict):
+                values.append(list(observation.values()))
+            else:
+                values.append([observation[k] for k in sorted(observation)])
+            assert len(values[-1]) == len(self.preprocessors), \
+                (len(values[-1]), len(self.preprocessors))
+        for i, p in enumerate(self.preprocessors):
+            p.write_batch([v[i] for v in values], array, offset)
+            offset += p.size
+
 
 @PublicAPI
 def get_preprocessor(space):
@@ -61,7 +61,9 @@ class AsyncReplayOptimizer(PolicyOptimizer):
                  num_replay_buffer_shards=1,
                  max_weight_sync_delay=400,
                  debug=False,
-                 batch_replay=False):
+                 batch_replay=False,
+                 replay_stacked_frames=0,
+                 replay_prefetch_depth=0):
         """Initialize an async replay optimizer.
 
         Arguments:
@@ -83,9 +85,22 @@ class AsyncReplayOptimizer(PolicyOptimizer):
             debug (bool): return extra debug stats
             batch_replay (bool): replay entire sequential batches of
                 experiences instead of sampling steps individually
+            replay_stacked_frames (int): if > 0, observations are stacks of
+                this many frames, and each distinct frame is only stored once
+                in the replay buffers (not supported with batch_replay)
+            replay_prefetch_depth (int): number of train batches each replay
+                actor samples ahead of time on a background thread (not
+                supported with batch_replay)
         """
         PolicyOptimizer.__init__(self, workers)
 
+        if batch_replay and replay_stacked_frames:
+            raise ValueError(
+                "replay_stacked_frames is not supported with batch_replay")
+        if batch_replay and replay_prefetch_depth:
+            raise ValueError(
+                "replay_prefetch_depth is not supported with batch_replay")
+
         self.debug = debug
         self.batch_replay = batch_replay
         self.replay_starts = learning_starts
@@ -96,11 +111,7 @@ class AsyncReplayOptimizer(PolicyOptimizer):
         self.learner = LearnerThread(self.workers.local_worker())
         self.learner.start()
 
-        if self.batch_replay:
-            replay_cls = BatchReplayActor
-        else:
-            replay_cls = ReplayActor
-        self.replay_actors = create_colocated(replay_cls, [
+        replay_args = [
             num_replay_buffer_shards,
             learning_starts,
             buffer_size,
@@ -108,7 +119,14 @@ class AsyncReplayOptimizer(PolicyOptimizer):
             prioritized_replay_alpha,
             prioritized_replay_beta,
             prioritized_replay_eps,
-        ], num_replay_buffer_shards)
+        ]
+        if self.batch_replay:
+            replay_cls = BatchReplayActor
+        else:
+            replay_cls = ReplayActor
+            replay_args += [replay_stacked_frames, replay_prefetch_depth]
+        self.replay_actors = create_colocated(replay_cls, replay_args,
+                                              num_replay_buffer_shards)
 
         # Stats
         self.timers = {
@@ -290,11 +308,24 @@ class ReplayActor(ParallelIteratorWorker):
     """A replay buffer shard.
 
     Ray actors are single-threaded, so for scalability multiple replay actors
-    may be created to increase parallelism."""
+    may be created to increase parallelism.
 
-    def __init__(self, num_shards, learning_starts, buffer_size,
-                 train_batch_size, prioritized_replay_alpha,
-                 prioritized_replay_beta, prioritized_replay_eps):
+    If prefetch_depth > 0, train batches are sampled ahead of time on a
+    background thread, so that replay() can return one immediately. Adding
+    samples, updating priorities and sampling hold a lock, so priority
+    updates take effect for all batches sampled after they are received,
+    and at most prefetch_depth batches are sampled with stale priorities."""
+
+    def __init__(self,
+                 num_shards,
+                 learning_starts,
+                 buffer_size,
+                 train_batch_size,
+                 prioritized_replay_alpha,
+                 prioritized_replay_beta,
+                 prioritized_replay_eps,
+                 replay_stacked_frames=0,
+                 prefetch_depth=0):
         self.replay_starts = learning_starts // num_shards
         self.buffer_size = buffer_size // num_shards
         self.train_batch_size = train_batch_size
@@ -309,16 +340,28 @@ class ReplayActor(ParallelIteratorWorker):
 
         def new_buffer():
             return PrioritizedReplayBuffer(
-                self.buffer_size, alpha=prioritized_replay_alpha)
+                self.buffer_size,
+                alpha=prioritized_replay_alpha,
+                num_stacked_frames=replay_stacked_frames)
 
         self.replay_buffers = collections.defaultdict(new_buffer)
+        self.buffer_lock = threading.Lock()
 
         # Metrics
         self.add_batch_timer = TimerStat()
         self.replay_timer = TimerStat()
+        self.prefetch_wait_timer = TimerStat()
         self.update_priorities_timer = TimerStat()
         self.num_added = 0
 
+        self.prefetch_queue = None
+        if prefetch_depth > 0:
+            self.prefetch_queue = queue.Queue(maxsize=prefetch_depth)
+            self.replay_started = threading.Event()
+            self.prefetch_thread = threading.Thread(
+                target=self._prefetch_loop, daemon=True)
+            self.prefetch_thread.start()
+
     def get_host(self):
         return os.uname()[1]
 
@@ -326,19 +369,53 @@ class ReplayActor(ParallelIteratorWorker):
         # Handle everything as if multiagent
         if isinstance(batch, SampleBatch):
             batch = MultiAgentBatch({DEFAULT_POLICY_ID: batch}, batch.count)
-        with self.add_batch_timer:
+        with self.add_batch_timer, self.buffer_lock:
             for policy_id, s in batch.policy_batches.items():
-                for row in s.rows():
-                    self.replay_buffers[policy_id].add(
-                        row["obs"], row["actions"], row["rewards"],
-                        row["new_obs"], row["dones"], row["weights"])
-        self.num_added += batch.count
+                self.replay_buffers[policy_id].add_batch(
+                    s["obs"], s["actions"], s["rewards"], s["new_obs"],
+                    s["dones"], s["weights"])
+            self.num_added += batch.count
+        if (self.prefetch_queue is not None
+                and self.num_added >= self.replay_starts):
+            self.replay_started.set()
 
     def replay(self):
         if self.num_added < self.replay_starts:
             return None
+        if self.prefetch_queue is None:
+            return self._sample()
+        with self.prefetch_wait_timer:
+            return self.prefetch_queue.get()
+
+    def update_priorities(self, prio_dict):
+        with self.update_priorities_timer, self.buffer_lock:
+            for policy_id, (batch_indexes, td_errors) in prio_dict.items():
+                new_priorities = (
+                    np.abs(td_errors) + self.prioritized_replay_eps)
+                self.replay_buffers[policy_id].update_priorities(
+                    batch_indexes, new_priorities)
 
-        with self.replay_timer:
+    def stats(self, debug=False):
+        stat = {
+            "add_batch_time_ms": round(1000 * self.add_batch_timer.mean, 3),
+            "replay_time_ms": round(1000 * self.replay_timer.mean, 3),
+            "update_priorities_time_ms": round(
+                1000 * self.update_priorities_timer.mean, 3),
+        }
+        if self.prefetch_queue is not None:
+            stat["prefetch_wait_time_ms"] = round(
+                1000 * self.prefetch_wait_timer.mean, 3)
+            stat["prefetch_queue_size"] = self.prefetch_queue.qsize()
+        with self.buffer_lock:
+            for policy_id, replay_buffer in self.replay_buffers.items():
+                stat.update({
+                    "policy_{}".format(policy_id): replay_buffer.stats(
+                        debug=debug)
+                })
+        return stat
+
+    def _sample(self):
+        with self.replay_timer, self.buffer_lock:
             samples = {}
             for policy_id, replay_buffer in self.replay_buffers.items():
                 (obses_t, actions, rewards, obses_tp1, dones, weights,
@@ -355,26 +432,11 @@ class ReplayActor(ParallelIteratorWorker):
                 })
             return MultiAgentBatch(samples, self.train_batch_size)
 
-    def update_priorities(self, prio_dict):
-        with self.update_priorities_timer:
-            for policy_id, (batch_indexes, td_errors) in prio_dict.items():
-                new_priorities = (
-                    np.abs(td_errors) + self.prioritized_replay_eps)
-                self.replay_buffers[policy_id].update_priorities(
-                    batch_indexes, new_priorities)
-
-    def stats(self, debug=False):
-        stat = {
-            "add_batch_time_ms": round(1000 * self.add_batch_timer.mean, 3),
-            "replay_time_ms": round(1000 * self.replay_timer.mean, 3),
-            "update_priorities_time_ms": round(
-                1000 * self.update_priorities_timer.mean, 3),
-        }
-        for policy_id, replay_buffer in self.replay_buffers.items():
-            stat.update({
-                "policy_{}".format(policy_id): replay_buffer.stats(debug=debug)
-            })
-        return stat
+    def _prefetch_loop(self):
+        self.replay_started.wait()
+        while True:
+            # Blocks while the queue is full.
+            self.prefetch_queue.put(self._sample())
 
 
 # note: we set num_cpus=0 to avoid failing to create replay actors when
@@ -1,7 +1,8 @@
 import logging
 
 from ray.rllib.utils.annotations import DeveloperAPI
-from ray.rllib.evaluation.metrics import collect_episodes, summarize_episodes
+from ray.rllib.evaluation.metrics import collect_episodes, \
+    collect_summary, smooth_summary, summarize_episodes, summarize_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,7 @@ class PolicyOptimizer:
         """
         self.workers = workers
         self.episode_history = []
+        self.summary_history = []
         self.to_be_collected = []
 
         # Counters that should be updated by sub-classes
@@ -83,7 +85,8 @@ class PolicyOptimizer:
     def collect_metrics(self,
                         timeout_seconds,
                         min_history=100,
-                        selected_workers=None):
+                        selected_workers=None,
+                        aggregate_on_workers=False):
         """Returns worker and optimizer stats.
 
         Arguments:
@@ -92,11 +95,25 @@ class PolicyOptimizer:
             min_history (int): Min history length to smooth results over.
             selected_workers (list): Override the list of remote workers
                 to collect metrics from.
+            aggregate_on_workers (bool): Whether to collect MetricsSummaries
+                aggregated on the workers instead of the metrics of each
+                episode.
 
         Returns:
             res (dict): A training result dict from worker metrics with
                 `info` replaced with stats from self.
         """
+        if aggregate_on_workers:
+            summary, self.to_be_collected = collect_summary(
+                self.workers.local_worker(),
+                selected_workers or self.workers.remote_workers(),
+                self.to_be_collected,
+                timeout_seconds=timeout_seconds)
+            smoothed = smooth_summary(summary, self.summary_history,
+                                      min_history)
+            res = summarize_metrics(smoothed, summary.num_episodes)
+            res.update(info=self.stats())
+            return res
         episodes, self.to_be_collected = collect_episodes(
             self.workers.local_worker(),
             selected_workers or self.workers.remote_workers(),
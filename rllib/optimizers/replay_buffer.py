@@ -7,11 +7,120 @@ from ray.rllib.utils.annotations import DeveloperAPI
 from ray.rllib.utils.compression import unpack_if_needed
 from ray.rllib.utils.window_stat import WindowStat
 
+# Number of frames per chunk of frame storage.
+FRAME_CHUNK_SIZE = 4096
+
+
+class _FrameStore:
+    """Stores the frames of stacked observations only once.
+
+    Observations are stacks of `num_frames` frames along the last axis, as
+    output by the FrameStack Atari wrapper. Consecutive observations of an
+    episode (and the obs and new_obs of a transition) share all but one
+    frame, so frames are deduplicated by content and referenced by index.
+    Frames are reference counted, and their slots reused once no stored
+    observation refers to them anymore.
+    """
+
+    def __init__(self, num_frames):
+        self.num_frames = num_frames
+        self.frame_shape = None
+        self.dtype = None
+        self.num_frames_stored = 0
+        self._chunks = []
+        self._refcounts = []
+        self._hashes = []
+        self._free_slots = []
+        self._slot_by_hash = {}
+
+    @property
+    def nbytes(self):
+        return sum(chunk.nbytes for chunk in self._chunks)
+
+    def add(self, obs):
+        """Stores the frames of an observation, returning their indices."""
+
+        obs = np.asarray(obs)
+        if self.frame_shape is None:
+            if obs.shape[-1] % self.num_frames != 0:
+                raise ValueError(
+                    "Observation of shape {} is not a stack of {} frames "
+                    "along the last axis.".format(obs.shape, self.num_frames))
+            self.frame_shape = obs.shape[:-1] + (
+                obs.shape[-1] // self.num_frames, )
+            self.dtype = obs.dtype
+        if obs.shape[:-1] + (obs.shape[-1] // self.num_frames, ) != \
+                self.frame_shape:
+            raise ValueError(
+                "Observation of shape {} does not match the stored frames of "
+                "shape {}.".format(obs.shape, self.frame_shape))
+        return np.array(
+            [
+                self._add_frame(frame)
+                for frame in np.split(obs, self.num_frames, axis=-1)
+            ],
+            dtype=np.int64)
+
+    def release(self, slots):
+        """Drops a reference to each of the given frames."""
+
+        for slot in slots:
+            self._refcounts[slot] -= 1
+            if self._refcounts[slot] == 0:
+                key = self._hashes[slot]
+                if key is not None:
+                    del self._slot_by_hash[key]
+                    self._hashes[slot] = None
+                self._free_slots.append(slot)
+                self.num_frames_stored -= 1
+
+    def get(self, slots):
+        """Returns the observations for a batch of frame indices."""
+
+        slots = np.asarray(slots, dtype=np.int64).reshape(-1, self.num_frames)
+        chunk_ids, offsets = np.divmod(slots, FRAME_CHUNK_SIZE)
+        frames = np.empty(slots.shape + self.frame_shape, dtype=self.dtype)
+        for chunk_id in np.unique(chunk_ids):
+            mask = chunk_ids == chunk_id
+            frames[mask] = self._chunks[chunk_id][offsets[mask]]
+        # [batch, frame, ..., channel] -> [batch, ..., frame * channel]
+        frames = np.moveaxis(frames, 1, -2)
+        return frames.reshape(frames.shape[:-2] + (-1, ))
+
+    def _add_frame(self, frame):
+        key = hash(frame.tobytes())
+        slot = self._slot_by_hash.get(key)
+        if slot is not None and np.array_equal(self._frame(slot), frame):
+            self._refcounts[slot] += 1
+            return slot
+
+        if not self._free_slots:
+            self._chunks.append(
+                np.empty(
+                    (FRAME_CHUNK_SIZE, ) + self.frame_shape, dtype=self.dtype))
+            self._refcounts.extend([0] * FRAME_CHUNK_SIZE)
+            self._hashes.extend([None] * FRAME_CHUNK_SIZE)
+            start = (len(self._chunks) - 1) * FRAME_CHUNK_SIZE
+            self._free_slots.extend(
+                range(start + FRAME_CHUNK_SIZE - 1, start - 1, -1))
+        new_slot = self._free_slots.pop()
+        self._frame(new_slot)[...] = frame
+        self._refcounts[new_slot] = 1
+        # On a hash collision, the frame is stored without being indexed.
+        if slot is None:
+            self._slot_by_hash[key] = new_slot
+            self._hashes[new_slot] = key
+        self.num_frames_stored += 1
+        return new_slot
+
+    def _frame(self, slot):
+        return self._chunks[slot // FRAME_CHUNK_SIZE][slot % FRAME_CHUNK_SIZE]
+
 
 @DeveloperAPI
 class ReplayBuffer:
     @DeveloperAPI
-    def __init__(self, size):
+    def __init__(self, size, num_stacked_frames=0):
         """Create Prioritized Replay buffer.
 
         Parameters
@@ -19,8 +128,15 @@ class ReplayBuffer:
         size: int
           Max number of transitions to store in the buffer. When the buffer
           overflows the old memories are dropped.
+        num_stacked_frames: int
+          If > 0, observations are stacks of this many frames along the last
+          axis (e.g., from the FrameStack Atari wrapper). Each distinct frame
+          is then stored only once, instead of once per observation it is
+          part of, and observations are rebuilt from the frames when sampled.
         """
         self._storage = []
+        self._frames = (_FrameStore(num_stacked_frames)
+                        if num_stacked_frames else None)
         self._maxsize = size
         self._next_idx = 0
         self._hit_count = np.zeros(size)
@@ -35,6 +151,54 @@ class ReplayBuffer:
 
     @DeveloperAPI
     def add(self, obs_t, action, reward, obs_tp1, done, weight):
+        self._add_transition(obs_t, action, reward, obs_tp1, done)
+
+    @DeveloperAPI
+    def add_batch(self, obs_t, actions, rewards, obs_tp1, dones, weights):
+        """Adds a batch of transitions, given as columns of equal length.
+
+        This is equivalent to calling `add` for each transition, e.g., with
+        the columns of a SampleBatch, but stores the transitions in slices
+        of the storage at once.
+        """
+        if self._frames is not None:
+            # The frames of each observation are deduplicated one by one.
+            for data in zip(obs_t, actions, rewards, obs_tp1, dones):
+                self._add_transition(*data)
+            return
+
+        rows = list(zip(obs_t, actions, rewards, obs_tp1, dones))
+        self._num_added += len(rows)
+        start = 0
+        while start < len(rows):
+            idx = self._next_idx
+            end = min(idx + len(rows) - start, self._maxsize)
+            chunk = rows[start:end - idx + start]
+            start += len(chunk)
+            if idx >= len(self._storage):
+                self._storage.extend(chunk)
+                self._est_size_bytes += sum(
+                    sys.getsizeof(d) for data in chunk for d in data)
+            else:
+                self._storage[idx:end] = chunk
+            # The hit counts of the slots that are overwritten next.
+            if self._eviction_started:
+                evicted = np.arange(idx + 1, end + 1) % self._maxsize
+            elif end >= self._maxsize:
+                evicted = np.array([0])
+            else:
+                evicted = np.array([], dtype=np.int64)
+            if end >= self._maxsize:
+                self._eviction_started = True
+            self._next_idx = end % self._maxsize
+            for hit_count in self._hit_count[evicted]:
+                self._evicted_hit_stats.push(hit_count)
+            self._hit_count[evicted] = 0
+
+    def _add_transition(self, obs_t, action, reward, obs_tp1, done):
+        if self._frames is not None:
+            obs_t = self._frames.add(unpack_if_needed(obs_t))
+            obs_tp1 = self._frames.add(unpack_if_needed(obs_tp1))
         data = (obs_t, action, reward, obs_tp1, done)
         self._num_added += 1
 
@@ -42,6 +206,10 @@ class ReplayBuffer:
             self._storage.append(data)
             self._est_size_bytes += sum(sys.getsizeof(d) for d in data)
         else:
+            if self._frames is not None:
+                evicted = self._storage[self._next_idx]
+                self._frames.release(evicted[0])
+                self._frames.release(evicted[3])
             self._storage[self._next_idx] = data
         if self._next_idx + 1 >= self._maxsize:
             self._eviction_started = True
@@ -55,14 +223,23 @@ class ReplayBuffer:
         for i in idxes:
             data = self._storage[i]
             obs_t, action, reward, obs_tp1, done = data
-            obses_t.append(np.array(unpack_if_needed(obs_t), copy=False))
+            if self._frames is None:
+                obs_t = np.array(unpack_if_needed(obs_t), copy=False)
+                obs_tp1 = np.array(unpack_if_needed(obs_tp1), copy=False)
+            obses_t.append(obs_t)
             actions.append(np.array(action, copy=False))
             rewards.append(reward)
-            obses_tp1.append(np.array(unpack_if_needed(obs_tp1), copy=False))
+            obses_tp1.append(obs_tp1)
             dones.append(done)
             self._hit_count[i] += 1
-        return (np.array(obses_t), np.array(actions), np.array(rewards),
-                np.array(obses_tp1), np.array(dones))
+        if self._frames is not None:
+            obses_t = self._frames.get(obses_t)
+            obses_tp1 = self._frames.get(obses_tp1)
+        else:
+            obses_t = np.array(obses_t)
+            obses_tp1 = np.array(obses_tp1)
+        return (obses_t, np.array(actions), np.array(rewards), obses_tp1,
+                np.array(dones))
 
     @DeveloperAPI
     def sample_idxes(self, batch_size):
@@ -111,6 +288,9 @@ class ReplayBuffer:
             "est_size_bytes": self._est_size_bytes,
             "num_entries": len(self._storage),
         }
+        if self._frames is not None:
+            data["est_size_bytes"] += self._frames.nbytes
+            data["num_stored_frames"] = self._frames.num_frames_stored
         if debug:
             data.update(self._evicted_hit_stats.stats())
         return data
@@ -119,7 +299,7 @@ class ReplayBuffer:
 @DeveloperAPI
 class PrioritizedReplayBuffer(ReplayBuffer):
     @DeveloperAPI
-    def __init__(self, size, alpha):
+    def __init__(self, size, alpha, num_stacked_frames=0):
         """Create Prioritized Replay buffer.
 
         Parameters
@@ -130,12 +310,14 @@ class PrioritizedReplayBuffer(ReplayBuffer):
         alpha: float
           how much prioritization is used
           (0 - no prioritization, 1 - full prioritization)
+        num_stacked_frames: int
+          If > 0, store the frames of stacked observations only once.
 
         See Also
         --------
         ReplayBuffer.__init__
         """
-        super(PrioritizedReplayBuffer, self).__init__(size)
+        super(PrioritizedReplayBuffer, self).__init__(size, num_stacked_frames)
         assert alpha > 0
         self._alpha = alpha
 
@@ -160,6 +342,19 @@ class PrioritizedReplayBuffer(ReplayBuffer):
         self._it_sum[idx] = weight**self._alpha
         self._it_min[idx] = weight**self._alpha
 
+    @DeveloperAPI
+    def add_batch(self, obs_t, actions, rewards, obs_tp1, dones, weights):
+        """See ReplayBuffer.add_batch"""
+
+        idxes = (self._next_idx + np.arange(len(dones))) % self._maxsize
+        super(PrioritizedReplayBuffer, self).add_batch(obs_t, actions, rewards,
+                                                       obs_tp1, dones, weights)
+        if weights is None:
+            weights = np.full(len(idxes), self._max_priority)
+        priorities = np.asarray(weights, dtype=np.float64)**self._alpha
+        self._it_sum.set_values(idxes, priorities)
+        self._it_min.set_values(idxes, priorities)
+
     def _sample_proportional(self, batch_size):
         res = []
         for _ in range(batch_size):
@@ -261,15 +456,16 @@ class PrioritizedReplayBuffer(ReplayBuffer):
           variable `idxes`.
         """
         assert len(idxes) == len(priorities)
+        new_priorities = []
         for idx, priority in zip(idxes, priorities):
             assert priority > 0
             assert 0 <= idx < len(self._storage)
-            delta = priority**self._alpha - self._it_sum[idx]
-            self._prio_change_stats.push(delta)
-            self._it_sum[idx] = priority**self._alpha
-            self._it_min[idx] = priority**self._alpha
-
+            new_priority = priority**self._alpha
+            self._prio_change_stats.push(new_priority - self._it_sum[idx])
+            new_priorities.append(new_priority)
             self._max_priority = max(self._max_priority, priority)
+        self._it_sum.set_values(idxes, new_priorities)
+        self._it_min.set_values(idxes, new_priorities)
 
     @DeveloperAPI
     def stats(self, debug=False):
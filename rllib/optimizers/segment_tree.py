@@ -151,6 +151,35 @@ class SegmentTree:
         assert 0 <= idx < self.capacity
         return self.value[idx + self.capacity]
 
+    def set_values(self, idxes, vals):
+        """Inserts/overwrites multiple values in/into the tree.
+
+        This is equivalent to setting the values one by one (later values
+        win for duplicate indices), but each affected reduction value is only
+        recalculated once.
+
+        Args:
+            idxes (List[int]): The indices to insert to.
+            vals (List[float]): The values to insert.
+        """
+        nodes = set()
+        for idx, val in zip(idxes, vals):
+            assert 0 <= idx < self.capacity
+            idx = int(idx) + self.capacity
+            self.value[idx] = val
+            nodes.add(idx >> 1)
+
+        # All leaves are on the same level, so recalculate the reduction
+        # values level by level, up to the root.
+        while nodes and 0 not in nodes:
+            parents = set()
+            for idx in nodes:
+                update_idx = 2 * idx
+                self.value[idx] = self.operation(self.value[update_idx],
+                                                 self.value[update_idx + 1])
+                parents.add(idx >> 1)
+            nodes = parents
+
 
 class SumSegmentTree(SegmentTree):
     """A SegmentTree with the reduction `operation`=operator.add."""
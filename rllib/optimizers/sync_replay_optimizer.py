@@ -39,6 +39,7 @@ class SyncReplayOptimizer(PolicyOptimizer):
             before_learn_on_batch=None,
             synchronize_sampling=False,
             prioritized_replay_beta_annealing_timesteps=100000 * 0.2,
+            replay_stacked_frames=0,
     ):
         """Initialize an sync replay optimizer.
 
@@ -59,6 +60,9 @@ class SyncReplayOptimizer(PolicyOptimizer):
                 all policies with the same indices (used in MADDPG).
             prioritized_replay_beta_annealing_timesteps (int): The timestep at
                 which PR-beta annealing should end.
+            replay_stacked_frames (int): if > 0, observations are stacks of
+                this many frames (along the last axis), and each distinct
+                frame is only stored once in the replay buffer.
         """
         PolicyOptimizer.__init__(self, workers)
 
@@ -76,6 +80,7 @@ class SyncReplayOptimizer(PolicyOptimizer):
         self.train_batch_size = train_batch_size
         self.before_learn_on_batch = before_learn_on_batch
         self.synchronize_sampling = synchronize_sampling
+        self.replay_stacked_frames = replay_stacked_frames
 
         # Stats
         self.update_weights_timer = TimerStat()
@@ -89,11 +94,14 @@ class SyncReplayOptimizer(PolicyOptimizer):
 
             def new_buffer():
                 return PrioritizedReplayBuffer(
-                    buffer_size, alpha=prioritized_replay_alpha)
+                    buffer_size,
+                    alpha=prioritized_replay_alpha,
+                    num_stacked_frames=replay_stacked_frames)
         else:
 
             def new_buffer():
-                return ReplayBuffer(buffer_size)
+                return ReplayBuffer(
+                    buffer_size, num_stacked_frames=replay_stacked_frames)
 
         self.replay_buffers = collections.defaultdict(new_buffer)
 
@@ -132,15 +140,20 @@ class SyncReplayOptimizer(PolicyOptimizer):
                     DEFAULT_POLICY_ID: batch
                 }, batch.count)
 
+            # Frames are deduplicated by the replay buffer, so compressing
+            # the observations would only cost time.
+            pack = (lambda x: x) if self.replay_stacked_frames else \
+                pack_if_needed
             for policy_id, s in batch.policy_batches.items():
-                for row in s.rows():
-                    self.replay_buffers[policy_id].add(
-                        pack_if_needed(row["obs"]),
-                        row["actions"],
-                        row["rewards"],
-                        pack_if_needed(row["new_obs"]),
-                        row["dones"],
-                        weight=None)
+                obs = [pack(o) for o in s["obs"]]
+                new_obs = [pack(o) for o in s["new_obs"]]
+                self.replay_buffers[policy_id].add_batch(
+                    obs,
+                    s["actions"],
+                    s["rewards"],
+                    new_obs,
+                    s["dones"],
+                    weights=None)
 
         if self.num_steps_sampled >= self.replay_starts:
             self._optimize()
@@ -10,6 +10,7 @@ from ray.rllib.evaluation.rollout_worker import RolloutWorker
 from ray.rllib.evaluation.worker_set import WorkerSet
 from ray.rllib.optimizers import AsyncGradientsOptimizer, AsyncSamplesOptimizer
 from ray.rllib.optimizers.aso_tree_aggregator import TreeAggregator
+from ray.rllib.optimizers.async_replay_optimizer import ReplayActor
 from ray.rllib.policy.sample_batch import SampleBatch
 from ray.rllib.tests.mock_worker import _MockWorker
 from ray.rllib.utils import try_import_tf
@@ -102,6 +103,51 @@ class PPOCollectTest(unittest.TestCase):
         ppo.stop()
 
 
+class ReplayActorTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        ray.init(num_cpus=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        ray.shutdown()
+
+    def make_batch(self, n):
+        return SampleBatch({
+            "obs": np.random.random((n, 4)),
+            "actions": np.random.randint(0, 2, n),
+            "rewards": np.ones(n),
+            "new_obs": np.random.random((n, 4)),
+            "dones": np.zeros(n, dtype=np.bool_),
+            "weights": np.ones(n),
+        })
+
+    def test_prefetch(self):
+        for prefetch_depth in [0, 2]:
+            actor = ReplayActor.remote(1, 100, 1000, 32, 0.6, 0.4, 1e-6, 0,
+                                       prefetch_depth)
+            # Nothing is replayed before learning starts.
+            actor.add_batch.remote(self.make_batch(50))
+            self.assertIsNone(ray.get(actor.replay.remote()))
+
+            actor.add_batch.remote(self.make_batch(50))
+            for _ in range(5):
+                batch = ray.get(actor.replay.remote())
+                self.assertEqual(batch.count, 32)
+                samples = batch.policy_batches["default_policy"]
+                self.assertEqual(samples["obs"].shape, (32, 4))
+                actor.update_priorities.remote({
+                    "default_policy": (samples["batch_indexes"],
+                                       np.random.random(32))
+                })
+            stats = ray.get(actor.stats.remote())
+            self.assertEqual(stats["policy_default_policy"]["added_count"],
+                             100)
+            self.assertEqual("prefetch_queue_size" in stats,
+                             prefetch_depth > 0)
+            ray.kill(actor)
+
+
 class SampleBatchTest(unittest.TestCase):
     def test_concat(self):
         b1 = SampleBatch({"a": np.array([1, 2, 3]), "b": np.array([4, 5, 6])})
@@ -149,6 +149,29 @@ class TestPrioritizedReplayBuffer(unittest.TestCase):
             counts[9] >= counts[8] >= counts[7] >= counts[6] >= counts[5] >=
             counts[4] >= counts[3] >= counts[2] >= counts[1] >= counts[0])
 
+    def test_add_batch(self):
+        # Adding a batch must be equivalent to adding the rows one by one.
+        memory = PrioritizedReplayBuffer(size=self.capacity, alpha=0.5)
+        memory_rows = PrioritizedReplayBuffer(size=self.capacity, alpha=0.5)
+        memory.add(*self._generate_data(), weight=4.0)
+        memory_rows.add(*memory._storage[0], weight=4.0)
+
+        # Wraps around the end of the buffer.
+        rows = [self._generate_data() for _ in range(12)]
+        weights = np.random.random(12) + 0.1
+        memory.add_batch(*[list(c) for c in zip(*rows)], weights=weights)
+        for row, weight in zip(rows, weights):
+            memory_rows.add(*row, weight=weight)
+        self.assertEqual(len(memory), self.capacity)
+        self.assertEqual(memory._next_idx, memory_rows._next_idx)
+        self.assertEqual(memory._storage, memory_rows._storage)
+        check(memory._it_sum.value, memory_rows._it_sum.value)
+        check(memory._it_min.value, memory_rows._it_min.value)
+
+        # Without weights, the max priority is used.
+        memory.add_batch(*[list(c) for c in zip(*rows[:3])], weights=None)
+        check(memory._it_sum[5], memory._max_priority**0.5)
+
     def test_alpha_parameter(self):
         # Test sampling from a PR with a very small alpha (should behave just
         # like a regular ReplayBuffer).
@@ -0,0 +1,104 @@
+from collections import deque
+import numpy as np
+import unittest
+
+from ray.rllib.optimizers.replay_buffer import PrioritizedReplayBuffer, \
+    ReplayBuffer
+from ray.rllib.utils.test_utils import check
+
+
+def stacked_episode(length, k=4, shape=(6, 6, 1)):
+    """Returns the transitions of an episode with FrameStack observations."""
+    frames = deque(maxlen=k)
+    first = np.random.randint(0, 256, size=shape, dtype=np.uint8)
+    for _ in range(k):
+        frames.append(first)
+    obs = np.concatenate(frames, axis=2)
+    transitions = []
+    for i in range(length):
+        frames.append(np.random.randint(0, 256, size=shape, dtype=np.uint8))
+        new_obs = np.concatenate(frames, axis=2)
+        transitions.append((obs, i % 2, float(i), new_obs, i == length - 1))
+        obs = new_obs
+    return transitions
+
+
+class TestReplayBufferFrameStorage(unittest.TestCase):
+    def test_frames_stored_once(self):
+        buf = ReplayBuffer(100, num_stacked_frames=4)
+        transitions = stacked_episode(10) + stacked_episode(5)
+        for t in transitions:
+            buf.add(*t, weight=None)
+        # One initial frame plus one new frame per step for each episode.
+        self.assertEqual(buf.stats()["num_stored_frames"], 11 + 6)
+
+        obs, actions, rewards, new_obs, dones = buf.sample_with_idxes(
+            list(range(len(transitions))))
+        self.assertEqual(obs.dtype, np.uint8)
+        check(obs, np.stack([t[0] for t in transitions]))
+        check(new_obs, np.stack([t[3] for t in transitions]))
+        check(actions, [t[1] for t in transitions])
+        check(dones, [t[4] for t in transitions])
+
+    def test_evicted_frames_are_released(self):
+        buf = ReplayBuffer(8, num_stacked_frames=4)
+        transitions = []
+        for _ in range(10):
+            episode = stacked_episode(6)
+            transitions.extend(episode)
+            for t in episode:
+                buf.add(*t, weight=None)
+        self.assertEqual(len(buf), 8)
+        # The 8 newest transitions are the last 2 of the 9th episode, which
+        # refer to its 6 new frames, and all of the last episode.
+        self.assertEqual(buf.stats()["num_stored_frames"], 6 + 7)
+        # The ring of transitions wrapped around at index 4.
+        obs, _, _, new_obs, _ = buf.sample_with_idxes([4, 5, 6, 7, 0, 1, 2, 3])
+        check(obs, np.stack([t[0] for t in transitions[-8:]]))
+        check(new_obs, np.stack([t[3] for t in transitions[-8:]]))
+
+    def test_unstacked_observations(self):
+        buf = PrioritizedReplayBuffer(10, alpha=1.0, num_stacked_frames=1)
+        obs = [np.random.random(3) for _ in range(6)]
+        for i in range(5):
+            buf.add(obs[i], 0, 1.0, obs[i + 1], False, weight=None)
+        # obs and new_obs of consecutive transitions are shared.
+        self.assertEqual(buf.stats()["num_stored_frames"], 6)
+        samples = buf.sample(4, beta=1.0)
+        for o, new_o in zip(samples[0], samples[3]):
+            i = [j for j in range(5) if np.array_equal(obs[j], o)][0]
+            check(new_o, obs[i + 1])
+
+    def test_invalid_stack(self):
+        buf = ReplayBuffer(10, num_stacked_frames=4)
+        with self.assertRaises(ValueError):
+            buf.add(
+                np.zeros((2, 2, 3)), 0, 0.0, np.zeros((2, 2, 3)), False, None)
+
+
+class TestReplayBufferAddBatch(unittest.TestCase):
+    def test_add_batch(self):
+        # Adding a batch must be equivalent to adding the rows one by one.
+        buf = ReplayBuffer(10)
+        buf_rows = ReplayBuffer(10)
+        rows = [(float(i), i % 3, float(-i), float(i + 1), i % 5 == 0)
+                for i in range(40)]
+        for batch in [rows[:3], rows[3:10], rows[10:15], rows[15:40]]:
+            buf.add_batch(*[list(c) for c in zip(*batch)], weights=None)
+            for row in batch:
+                buf_rows.add(*row, weight=None)
+            self.assertEqual(buf._storage, buf_rows._storage)
+            self.assertEqual(buf._next_idx, buf_rows._next_idx)
+            self.assertEqual(buf.stats(), buf_rows.stats())
+            self.assertEqual(buf._evicted_hit_stats.items,
+                             buf_rows._evicted_hit_stats.items)
+            check(buf._hit_count, buf_rows._hit_count)
+            idxes = np.random.randint(0, len(buf), 8)
+            buf.sample_with_idxes(idxes)
+            buf_rows.sample_with_idxes(idxes)
+
+
+if __name__ == "__main__":
+    import pytest
+    import sys
+    sys.exit(pytest.main(["-v", __file__]))
@@ -33,6 +33,24 @@ class TestSegmentTree(unittest.TestCase):
         assert np.isclose(tree.sum(2), 3.0)
         assert np.isclose(tree.sum(1, 2), 0.0)
 
+    def test_tree_set_values(self):
+        tree = SumSegmentTree(8)
+        tree_one_by_one = SumSegmentTree(8)
+        min_tree = MinSegmentTree(8)
+
+        idxes = [2, 7, 3, 2, 0]
+        vals = [1.0, 2.0, 3.0, 4.0, 0.5]
+        tree.set_values(idxes, vals)
+        min_tree.set_values(idxes, vals)
+        for idx, val in zip(idxes, vals):
+            tree_one_by_one[idx] = val
+
+        assert tree.value == tree_one_by_one.value
+        assert np.isclose(tree.sum(), 9.5)
+        assert np.isclose(tree.sum(2, 4), 7.0)
+        assert np.isclose(min_tree.min(), 0.5)
+        assert np.isclose(min_tree.min(1, 4), 3.0)
+
     def test_prefixsum_idx(self):
         tree = SumSegmentTree(4)
 
@@ -198,51 +198,43 @@ def chop_into_sequences(episode_ids,
         [2, 3, 1]
     """
 
-    prev_id = None
-    seq_lens = []
-    seq_len = 0
     unique_ids = np.add(
         np.add(episode_ids, agent_indices),
         np.array(unroll_ids) << 32)
-    for uid in unique_ids:
-        if (prev_id is not None and uid != prev_id) or \
-                seq_len >= max_seq_len:
-            seq_lens.append(seq_len)
-            seq_len = 0
-        seq_len += 1
-        prev_id = uid
-    if seq_len:
-        seq_lens.append(seq_len)
-    assert sum(seq_lens) == len(unique_ids)
-    seq_lens = np.array(seq_lens)
+    num_steps = len(unique_ids)
+
+    # Sequences start where the unique id changes, and every max_seq_len
+    # steps within runs of the same id.
+    new_run = np.ones(num_steps, dtype=bool)
+    new_run[1:] = unique_ids[1:] != unique_ids[:-1]
+    run_starts = np.flatnonzero(new_run)
+    steps = np.arange(num_steps)
+    run_offsets = steps - run_starts[np.cumsum(new_run) - 1]
+    new_seq = run_offsets % max_seq_len == 0
+    seq_starts = np.flatnonzero(new_seq)
+    seq_lens = np.diff(np.append(seq_starts, num_steps))
+    assert sum(seq_lens) == num_steps
 
     # Dynamically shrink max len as needed to optimize memory usage
     if dynamic_max:
         max_seq_len = max(seq_lens) + _extra_padding
 
+    # Index of each step in the padded [NUM_SEQUENCES * MAX_SEQ_LEN] arrays.
+    seq_indices = np.cumsum(new_seq) - 1
+    padded_indices = (
+        seq_indices * max_seq_len + steps - seq_starts[seq_indices])
+
     feature_sequences = []
     for f in feature_columns:
-        f = np.array(f)
+        f = np.asarray(f)
+        assert len(f) == num_steps, f
         f_pad = np.zeros((len(seq_lens) * max_seq_len, ) + np.shape(f)[1:])
-        seq_base = 0
-        i = 0
-        for l in seq_lens:
-            for seq_offset in range(l):
-                f_pad[seq_base + seq_offset] = f[i]
-                i += 1
-            seq_base += max_seq_len
-        assert i == len(unique_ids), f
+        f_pad[padded_indices] = f
         feature_sequences.append(f_pad)
 
     initial_states = []
     for s in state_columns:
-        s = np.array(s)
-        s_init = []
-        i = 0
-        for l in seq_lens:
-            s_init.append(s[i])
-            i += l
-        initial_states.append(np.array(s_init))
+        initial_states.append(np.asarray(s)[seq_starts])
 
     if shuffle:
         permutation = np.random.permutation(len(seq_lens))
@@ -1,5 +1,5 @@
 import gym
-from gym.spaces import Box, Discrete, Tuple
+from gym.spaces import Box, Dict, Discrete, Tuple
 import numpy as np
 import unittest
 
@@ -13,6 +13,7 @@ from ray.rllib.models.tf.fcnet_v1 import FullyConnectedNetwork
 from ray.rllib.models.tf.visionnet_v1 import VisionNetwork
 from ray.rllib.utils.annotations import override
 from ray.rllib.utils.framework import try_import_tf
+from ray.rllib.utils.test_utils import check
 
 tf = try_import_tf()
 
@@ -85,6 +86,21 @@ class ModelCatalogTest(unittest.TestCase):
             list(p1.transform((0, np.array([1, 2, 3])))),
             [float(x) for x in [1, 0, 0, 0, 0, 1, 2, 3]])
 
+    def test_batched_preprocessors(self):
+        space = Dict({
+            "a": Discrete(5),
+            "b": Tuple([
+                Box(0, 5, shape=(2, 3), dtype=np.float32),
+                Discrete(2),
+            ]),
+            "c": Box(0, 255, shape=(128, ), dtype=np.float32),
+        })
+        for s in [space, space["a"], space["b"], space["c"]]:
+            p = ModelCatalog.get_preprocessor_for_space(s)
+            observations = [s.sample() for _ in range(10)]
+            expected = np.array([p.transform(o) for o in observations])
+            check(p.transform_batch(observations), expected)
+
     def test_custom_preprocessor(self):
         ray.init(object_store_memory=1000 * 1024 * 1024)
         ModelCatalog.register_custom_preprocessor("foo", CustomPreprocessor)
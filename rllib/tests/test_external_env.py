@@ -113,6 +113,37 @@ class MultiServing(ExternalEnv):
                     del cur_obs[i]
 
 
+class BatchedServing(ExternalEnv):
+    def __init__(self, env_creator, num_episodes):
+        self.env_creator = env_creator
+        self.env = env_creator()
+        self.num_episodes = num_episodes
+        ExternalEnv.__init__(self, self.env.action_space,
+                             self.env.observation_space)
+
+    def run(self):
+        envs = [self.env_creator() for _ in range(self.num_episodes)]
+        while True:
+            eids = [self.start_episode() for _ in envs]
+            obs = [env.reset() for env in envs]
+            done = False
+            while not done:
+                actions = self._get_actions(eids, obs)
+                for i, (env, action) in enumerate(zip(envs, actions)):
+                    obs[i], reward, done, _ = env.step(action)
+                    self.log_returns(eids[i], reward)
+            for eid, ob in zip(eids, obs):
+                self.end_episode(eid, ob)
+
+
+class BatchSizePolicy(MockPolicy):
+    batch_sizes = []
+
+    def compute_actions(self, obs_batch, *args, **kwargs):
+        BatchSizePolicy.batch_sizes.append(len(obs_batch))
+        return MockPolicy.compute_actions(self, obs_batch, *args, **kwargs)
+
+
 class TestExternalEnv(unittest.TestCase):
     def setUp(self) -> None:
         ray.init()
@@ -152,6 +183,17 @@ class TestExternalEnv(unittest.TestCase):
             self.assertEqual(batch["actions"][0], 42)
             self.assertEqual(batch["actions"][-1], 42)
 
+    def test_external_env_batched_actions(self):
+        ev = RolloutWorker(
+            env_creator=lambda _: BatchedServing(lambda: MockEnv(25), 4),
+            policy=BatchSizePolicy,
+            rollout_fragment_length=100,
+            batch_mode="complete_episodes")
+        batch = ev.sample()
+        self.assertEqual(batch.count, 100)
+        # The actions of all episodes were computed together.
+        self.assertEqual(BatchSizePolicy.batch_sizes, [4] * 25)
+
     def test_external_env_bad_actions(self):
         ev = RolloutWorker(
             env_creator=lambda _: SimpleServing(MockEnv(25)),
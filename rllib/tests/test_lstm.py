@@ -12,6 +12,7 @@ from ray.rllib.models.tf.misc import linear, normc_initializer
 from ray.rllib.models.model import Model
 from ray.tune.registry import register_env
 from ray.rllib.utils import try_import_tf
+from ray.rllib.utils.test_utils import check
 
 tf = try_import_tf()
 
@@ -90,6 +91,39 @@ class TestLSTMUtils(unittest.TestCase):
         self.assertEqual([s.tolist() for s in s_init], [[1, 1]])
         self.assertEqual(seq_lens.tolist(), [1, 2])
 
+    def test_random_batches(self):
+        def chop_reference(ids, features, states, max_seq_len):
+            seq_lens = []
+            for i, uid in enumerate(ids):
+                if i == 0 or uid != ids[i - 1] or seq_lens[-1] == max_seq_len:
+                    seq_lens.append(0)
+                seq_lens[-1] += 1
+            max_seq_len = max(seq_lens)
+            f_pad = np.zeros((len(seq_lens) * max_seq_len, ) +
+                             features.shape[1:])
+            s_init = []
+            i = 0
+            for seq, l in enumerate(seq_lens):
+                f_pad[seq * max_seq_len:seq * max_seq_len + l] = \
+                    features[i:i + l]
+                s_init.append(states[i])
+                i += l
+            return f_pad, np.array(s_init), seq_lens
+
+        for _ in range(20):
+            eps_ids = np.repeat(np.arange(50), np.random.randint(1, 20, 50))
+            agent_ids = np.random.randint(0, 2, len(eps_ids))
+            f = np.random.random((len(eps_ids), 3))
+            s = np.random.random((len(eps_ids), 2))
+            max_seq_len = np.random.randint(1, 10)
+            f_pad, s_init, seq_lens = chop_into_sequences(
+                eps_ids, np.ones_like(eps_ids), agent_ids, [f], [s],
+                max_seq_len)
+            expected = chop_reference(eps_ids + agent_ids, f, s, max_seq_len)
+            check(f_pad[0], expected[0])
+            check(s_init[0], expected[1])
+            check(seq_lens, expected[2])
+
 
 class RNNSpyModel(Model):
     capture_index = 0
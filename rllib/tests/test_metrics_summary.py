@@ -0,0 +1,98 @@
+import numpy as np
+import unittest
+
+from ray.rllib.evaluation.metrics import smooth_summary, summarize_episodes, \
+    summarize_metrics
+from ray.rllib.evaluation.metrics_summary import MetricsSummary
+from ray.rllib.evaluation.rollout_metrics import RolloutMetrics
+from ray.rllib.offline.off_policy_estimator import OffPolicyEstimate
+from ray.rllib.utils.test_utils import check
+
+
+def random_metrics(num_episodes):
+    metrics = []
+    for i in range(num_episodes):
+        custom = {"score": np.random.uniform(-5, 5)}
+        if i % 3 == 0:
+            custom["rare"] = float("nan") if i % 2 else float(i)
+        metrics.append(
+            RolloutMetrics(
+                episode_length=np.random.randint(1, 200),
+                episode_reward=np.random.normal(0, 100),
+                agent_rewards={
+                    (0, "p0"): np.random.normal(),
+                    (1, "p1"): np.random.normal()
+                },
+                custom_metrics=custom,
+                perf_stats={"mean_env_wait_ms": np.random.random()},
+                hist_data={"actions": list(np.random.randint(0, 4, 5))}))
+    metrics.append(OffPolicyEstimate("is", {"V_prev": 1.0, "V_gain_est": 2.}))
+    return metrics
+
+
+class TestMetricsSummary(unittest.TestCase):
+    def test_merged_summaries_match_episodes(self):
+        worker_metrics = [random_metrics(n) for n in [13, 0, 40, 7]]
+        summary = MetricsSummary()
+        for metrics in worker_metrics:
+            summary.merge(MetricsSummary.from_metrics(metrics))
+        episodes = sum(worker_metrics, [])
+        expected = summarize_episodes(episodes)
+        result = summarize_metrics(summary)
+
+        self.assertEqual(result["episodes_this_iter"], 60)
+        for k in [
+                "episode_reward_max", "episode_reward_min",
+                "episode_reward_mean", "episode_len_mean", "policy_reward_min",
+                "policy_reward_max", "policy_reward_mean", "custom_metrics",
+                "sampler_perf", "off_policy_estimator"
+        ]:
+            check(result[k], expected[k])
+        self.assertEqual(result["hist_stats"].keys(),
+                         expected["hist_stats"].keys())
+        for k, values in expected["hist_stats"].items():
+            # Histogram buckets are within ~2.2% of their values.
+            check(
+                result["hist_stats"][k], sorted(values), rtol=0.03, atol=1e-6)
+
+    def test_merge_is_associative(self):
+        a, b, c = (MetricsSummary.from_metrics(random_metrics(n))
+                   for n in [3, 5, 8])
+        left = a.copy().merge(b).merge(c)
+        right = a.copy().merge(b.copy().merge(c))
+        check(summarize_metrics(left), summarize_metrics(right))
+
+    def test_include_episodes(self):
+        metrics = random_metrics(10)
+        summary = MetricsSummary.from_metrics(metrics, include_episodes=True)
+        summary.merge(MetricsSummary.from_metrics([], include_episodes=True))
+        self.assertEqual(len(summary.episodes), 10)
+        check(summarize_metrics(summary), summarize_episodes(metrics))
+        # Without details on one side, the merged summary has none.
+        summary.merge(MetricsSummary.from_metrics(metrics))
+        self.assertIsNone(summary.episodes)
+
+    def test_smoothing(self):
+        history = []
+        summaries = [
+            MetricsSummary.from_metrics(random_metrics(n))
+            for n in [30, 50, 40, 120, 10]
+        ]
+        covered = []
+        for summary in summaries:
+            covered.append(
+                smooth_summary(summary, history, min_history=100).num_episodes)
+        self.assertEqual(covered, [30, 80, 120, 120, 130])
+        self.assertEqual(len(history), 2)
+
+    def test_empty(self):
+        result = summarize_metrics(MetricsSummary())
+        self.assertTrue(np.isnan(result["episode_reward_mean"]))
+        self.assertEqual(result["episodes_this_iter"], 0)
+        self.assertEqual(result["hist_stats"], {})
+
+
+if __name__ == "__main__":
+    import pytest
+    import sys
+    sys.exit(pytest.main(["-v", __file__]))
@@ -381,6 +381,26 @@ class TestMultiAgentEnv(unittest.TestCase):
         batch = ev.sample()
         self.assertEqual(batch.count, 200)
 
+    def test_multi_agent_sample_grouped_remote(self):
+        # Allow to be run via Unittest.
+        ray.init(num_cpus=4, ignore_reinit_error=True)
+        act_space = gym.spaces.Discrete(2)
+        obs_space = gym.spaces.Discrete(2)
+        ev = RolloutWorker(
+            env_creator=lambda _: BasicMultiAgent(5),
+            policy={
+                "p0": (MockPolicy, obs_space, act_space, {}),
+                "p1": (MockPolicy, obs_space, act_space, {}),
+            },
+            policy_mapping_fn=lambda agent_id: "p{}".format(agent_id % 2),
+            rollout_fragment_length=50,
+            num_envs=5,
+            remote_worker_envs=True,
+            remote_envs_per_actor=2)
+        self.assertEqual(len(ev.async_env.actor_env_ids), 3)
+        batch = ev.sample()
+        self.assertEqual(batch.count, 250)
+
     def test_multi_agent_sample_with_horizon(self):
         act_space = gym.spaces.Discrete(2)
         obs_space = gym.spaces.Discrete(2)
@@ -1,10 +1,12 @@
 import gym
+import numpy as np
 import time
 import unittest
 
 import ray
 from ray.rllib.evaluation.rollout_worker import RolloutWorker
-from ray.rllib.tests.test_rollout_worker import MockPolicy
+from ray.rllib.policy.rnn_sequencing import chop_into_sequences
+from ray.rllib.tests.test_rollout_worker import MockEnv, MockPolicy
 
 
 class TestPerf(unittest.TestCase):
@@ -34,6 +36,50 @@ class TestPerf(unittest.TestCase):
                 count / (time.time() - start)))
             print()
 
+    def test_remote_env_performance(self):
+        # Lightweight envs, for which the overhead of actor calls dominates.
+        for envs_per_actor in [1, 8]:
+            ev = RolloutWorker(
+                env_creator=lambda _: MockEnv(episode_length=100),
+                policy=MockPolicy,
+                num_envs=16,
+                remote_worker_envs=True,
+                remote_envs_per_actor=envs_per_actor,
+                rollout_fragment_length=100)
+            ev.sample()
+            rates = []
+            for _ in range(5):
+                start = time.time()
+                count = 0
+                while time.time() - start < 1:
+                    count += ev.sample().count
+                rates.append(count / (time.time() - start))
+            print()
+            print("Samples per second with {} envs per actor: {}".format(
+                envs_per_actor, np.median(rates)))
+            print()
+            ev.stop()
+
+    def test_chop_into_sequences_performance(self):
+        # A 100k step batch of episodes of up to 200 steps.
+        batch_size = 100000
+        episode_lens = np.random.randint(1, 200, batch_size)
+        eps_ids = np.repeat(np.arange(batch_size), episode_lens)[:batch_size]
+        features = [
+            np.random.random((batch_size, 64)).astype(np.float32),
+            np.random.randint(0, 5, batch_size),
+            np.random.random(batch_size),
+        ]
+        states = [np.random.random((batch_size, 256)) for _ in range(2)]
+        start = time.time()
+        for _ in range(5):
+            chop_into_sequences(eps_ids, np.ones_like(eps_ids),
+                                np.zeros_like(eps_ids), features, states, 20)
+        print()
+        print("Seconds to chop a batch of {} steps: {}".format(
+            batch_size, (time.time() - start) / 5))
+        print()
+
 
 if __name__ == "__main__":
     import pytest
@@ -5,13 +5,17 @@ import os
 import random
 import time
 import unittest
+from unittest import mock
 
 import ray
 from ray.rllib.agents.pg import PGTrainer
 from ray.rllib.agents.a3c import A2CTrainer
 from ray.rllib.env.vector_env import VectorEnv
 from ray.rllib.evaluation.rollout_worker import RolloutWorker
-from ray.rllib.evaluation.metrics import collect_metrics
+from ray.rllib.evaluation.sample_batch_builder import \
+    VectorSampleBatchBuilder
+from ray.rllib.evaluation.metrics import collect_metrics, collect_summary, \
+    summarize_metrics
 from ray.rllib.evaluation.postprocessing import compute_advantages
 from ray.rllib.policy.tests.test_policy import TestPolicy
 from ray.rllib.policy.sample_batch import DEFAULT_POLICY_ID, SampleBatch
@@ -40,6 +44,19 @@ class MockPolicy(TestPolicy):
             batch, 100.0, 0.9, use_gae=False, use_critic=False)
 
 
+class ObsParityPolicy(MockPolicy):
+    def compute_actions(self,
+                        obs_batch,
+                        state_batches=None,
+                        prev_action_batch=None,
+                        prev_reward_batch=None,
+                        episodes=None,
+                        explore=None,
+                        timestep=None,
+                        **kwargs):
+        return [int(np.argmax(o)) % 2 for o in obs_batch], [], {}
+
+
 class BadPolicy(MockPolicy):
     def compute_actions(self,
                         obs_batch,
@@ -335,6 +352,29 @@ class TestRolloutWorker(unittest.TestCase):
         self.assertEqual(result["episodes_this_iter"], 20)
         self.assertEqual(result["episode_reward_mean"], 10)
 
+    def test_metrics_summary(self):
+        ray.init(num_cpus=5, ignore_reinit_error=True)
+        ev = RolloutWorker(
+            env_creator=lambda _: MockEnv(episode_length=10),
+            policy=MockPolicy,
+            batch_mode="complete_episodes")
+        remote_ev = RolloutWorker.as_remote().remote(
+            env_creator=lambda _: MockEnv(episode_length=10),
+            policy=MockPolicy,
+            batch_mode="complete_episodes")
+        ev.sample()
+        ray.get(remote_ev.sample.remote())
+        summary, _ = collect_summary(ev, [remote_ev])
+        self.assertEqual(summary.num_episodes, 20)
+        self.assertIsNone(summary.episodes)
+        result = summarize_metrics(summary)
+        self.assertEqual(result["episodes_this_iter"], 20)
+        self.assertEqual(result["episode_reward_mean"], 10)
+
+        ev.sample()
+        summary, _ = collect_summary(ev, [], include_episodes=True)
+        self.assertEqual(len(summary.episodes), summary.num_episodes)
+
     def test_async(self):
         ev = RolloutWorker(
             env_creator=lambda _: gym.make("CartPole-v0"),
@@ -400,6 +440,77 @@ class TestRolloutWorker(unittest.TestCase):
         result = collect_metrics(ev, [])
         self.assertEqual(result["episodes_this_iter"], 8)
 
+    def test_vectorized_sampler_matches_general_loop(self):
+        def sample(vectorized):
+            ev = RolloutWorker(
+                env_creator=lambda _: MockEnv2(episode_length=7),
+                policy=ObsParityPolicy,
+                num_envs=3,
+                episode_horizon=5,
+                batch_mode="truncate_episodes",
+                rollout_fragment_length=8)
+            with mock.patch(
+                    "ray.rllib.evaluation.sampler._can_run_vectorized",
+                    return_value=vectorized):
+                return SampleBatch.concat_samples(
+                    [ev.sample() for _ in range(4)])
+
+        fast, general = sample(True), sample(False)
+        self.assertEqual(fast.count, general.count)
+        for key in [
+                "t", "obs", "new_obs", "actions", "prev_actions", "rewards",
+                "prev_rewards", "dones", "advantages", "agent_index",
+                "unroll_id"
+        ]:
+            check(fast[key], general[key])
+        self.assertEqual(len(set(fast["eps_id"])), len(set(general["eps_id"])))
+
+    def test_vector_sample_batch_builder(self):
+        builder = VectorSampleBatchBuilder(2, initial_capacity=2)
+        for t in range(5):
+            builder.add_step(
+                t=np.array([t, t]),
+                obs=np.array([[t, 0.0], [t, 1.0]]),
+                mask=np.array([True, t != 1]))
+        self.assertEqual(builder.columns["obs"].dtype, np.float32)
+        env0 = builder.build_trajectory(0)
+        self.assertEqual(env0["t"].tolist(), [0, 1, 2, 3, 4])
+        self.assertEqual(builder.count(0), 0)
+        self.assertEqual(builder.count(1), 5)
+        env1 = builder.build_trajectory(1, mask_column="mask")
+        self.assertNotIn("mask", env1)
+        self.assertEqual(env1["t"].tolist(), [0, 2, 3, 4])
+        check(env1["obs"][:, 1], [1.0, 1.0, 1.0, 1.0])
+        # Built steps are dropped instead of growing the columns further.
+        capacity = builder.capacity
+        for t in range(5, 5 + capacity):
+            builder.add_step(
+                t=np.array([t, t]),
+                obs=np.array([[t, 0.0], [t, 1.0]]),
+                mask=np.array([True, True]))
+        self.assertEqual(builder.capacity, capacity)
+        self.assertEqual(
+            builder.build_trajectory(0)["t"].tolist(),
+            list(range(5, 5 + capacity)))
+
+    def test_grouped_remote_envs(self):
+        ev = RolloutWorker(
+            env_creator=lambda _: MockEnv(episode_length=10),
+            policy=MockPolicy,
+            num_envs=4,
+            remote_worker_envs=True,
+            remote_envs_per_actor=2,
+            batch_mode="complete_episodes",
+            rollout_fragment_length=40)
+        self.assertEqual(ev.async_env.actor_env_ids, [[0, 1], [2, 3]])
+        for _ in range(3):
+            batch = ev.sample()
+            self.assertEqual(batch.count % 10, 0)
+            self.assertEqual(batch["dones"].sum(), batch.count // 10)
+        result = collect_metrics(ev, [])
+        self.assertGreater(result["episodes_this_iter"], 0)
+        self.assertEqual(result["episode_len_mean"], 10)
+
     def test_truncate_episodes(self):
         ev = RolloutWorker(
             env_creator=lambda _: MockEnv(10),
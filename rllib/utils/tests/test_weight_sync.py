@@ -0,0 +1,169 @@
+import numpy as np
+import unittest
+
+from ray.rllib.utils.weight_sync import WeightBroadcaster, \
+    merge_weight_update
+
+
+class MockWorker:
+    def __init__(self, actor_id):
+        self._actor_id = actor_id
+        self.weights = None
+        self.weights_version = 0
+
+    def apply(self, update):
+        # Like RolloutWorker.apply_weight_update, deltas based on a newer
+        # version are ignored and only updated policies change.
+        if (update["base_version"] is not None
+                and self.weights_version < update["base_version"]):
+            return self.weights_version
+        weights = merge_weight_update(update, lambda pid: self.weights[pid])
+        self.weights = dict(self.weights or {}, **weights)
+        self.weights_version = update["version"]
+        return self.weights_version
+
+
+def make_weights(scale=1.0):
+    return {
+        "pol1": {
+            "w": np.ones((4, 4), dtype=np.float32) * scale,
+            "b": np.zeros(4, dtype=np.float32),
+        },
+        "pol2": [np.arange(3, dtype=np.float64)],
+    }
+
+
+def sync(broadcaster, weights, workers):
+    broadcaster.update_weights(weights)
+    updates = broadcaster.next_updates(workers)
+    for update, targets in updates:
+        broadcaster.record_versions(targets,
+                                    [w.apply(update) for w in targets])
+    return updates
+
+
+class WeightBroadcasterTest(unittest.TestCase):
+    def assertWeightsEqual(self, a, b):
+        self.assertEqual(a.keys(), b.keys())
+        for k in a["pol1"]:
+            np.testing.assert_array_equal(a["pol1"][k], b["pol1"][k])
+        self.assertEqual(len(a["pol2"]), len(b["pol2"]))
+        for x, y in zip(a["pol2"], b["pol2"]):
+            np.testing.assert_array_equal(x, y)
+
+    def testSkipsUnchangedWeights(self):
+        broadcaster = WeightBroadcaster()
+        workers = [MockWorker(i) for i in range(3)]
+        weights = make_weights()
+        self.assertEqual(len(sync(broadcaster, weights, workers)), 1)
+        self.assertEqual(broadcaster.version, 1)
+        for w in workers:
+            self.assertWeightsEqual(w.weights, weights)
+
+        # Nothing changed, so nothing is sent.
+        self.assertEqual(sync(broadcaster, make_weights(), workers), [])
+        self.assertEqual(broadcaster.version, 1)
+
+        # New workers get the current version.
+        workers.append(MockWorker(3))
+        updates = sync(broadcaster, make_weights(), workers)
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(updates[0][1], workers[3:])
+        self.assertWeightsEqual(workers[3].weights, weights)
+
+    def testInPlaceChangesDetected(self):
+        broadcaster = WeightBroadcaster()
+        workers = [MockWorker(0)]
+        weights = make_weights()
+        sync(broadcaster, weights, workers)
+        weights["pol1"]["w"] += 1
+        self.assertEqual(len(sync(broadcaster, weights, workers)), 1)
+        self.assertEqual(broadcaster.version, 2)
+        self.assertWeightsEqual(workers[0].weights, weights)
+
+    def testDeltaUpdates(self):
+        broadcaster = WeightBroadcaster(delta=True)
+        workers = [MockWorker(i) for i in range(2)]
+        weights = make_weights()
+        sync(broadcaster, weights, workers)
+
+        weights["pol1"]["b"] = weights["pol1"]["b"] + 1
+        updates = sync(broadcaster, weights, workers)
+        self.assertEqual(len(updates), 1)
+        update = updates[0][0]
+        self.assertEqual(update["base_version"], 1)
+        self.assertEqual(list(update["tensors"]), [("pol1", "b")])
+        for w in workers:
+            self.assertWeightsEqual(w.weights, weights)
+
+        # A new worker needs a full update, the others still get the delta.
+        workers.append(MockWorker(2))
+        weights["pol2"] = [weights["pol2"][0] + 1]
+        updates = sync(broadcaster, weights, workers)
+        self.assertEqual(len(updates), 2)
+        full, delta = updates
+        self.assertIsNone(full[0]["base_version"])
+        self.assertEqual(full[1], workers[2:])
+        self.assertEqual(
+            set(delta[0]["tensors"]), {("pol1", "b"), ("pol2", 0)})
+        for w in workers:
+            self.assertWeightsEqual(w.weights, weights)
+
+        # Once most of the weights changed, a full update is sent.
+        weights["pol1"]["w"] = weights["pol1"]["w"] * 2
+        updates = sync(broadcaster, weights, workers)
+        self.assertEqual(len(updates), 1)
+        self.assertIsNone(updates[0][0]["base_version"])
+        self.assertEqual(broadcaster.base_version, broadcaster.version)
+
+    def testUnconfirmedUpdatesResent(self):
+        broadcaster = WeightBroadcaster(delta=True)
+        workers = [MockWorker(i) for i in range(3)]
+        weights = make_weights()
+        sync(broadcaster, weights, workers)
+
+        # Worker 1 fails to apply the delta, worker 2 ignores it.
+        weights["pol1"]["b"] = weights["pol1"]["b"] + 1
+        broadcaster.update_weights(weights)
+        (update, targets), = broadcaster.next_updates(workers)
+        self.assertEqual(targets, workers)
+        workers[2].weights_version = 0
+        versions = [workers[0].apply(update), None, workers[2].apply(update)]
+        self.assertEqual(versions, [2, None, 0])
+        broadcaster.record_versions(workers, versions)
+
+        # Both get a full update, the other worker is up to date.
+        updates = sync(broadcaster, weights, workers)
+        self.assertEqual(len(updates), 1)
+        self.assertIsNone(updates[0][0]["base_version"])
+        self.assertEqual(updates[0][1], workers[1:])
+        for w in workers:
+            self.assertEqual(w.weights_version, 2)
+            self.assertWeightsEqual(w.weights, weights)
+        self.assertEqual(sync(broadcaster, weights, workers), [])
+
+    def testFp16(self):
+        broadcaster = WeightBroadcaster(fp16=True)
+        workers = [MockWorker(0)]
+        weights = make_weights(scale=0.1)
+        update = sync(broadcaster, weights, workers)[0][0]
+        self.assertEqual(update["tensors"][("pol1", "w")].dtype, np.float16)
+        self.assertEqual(update["tensors"][("pol2", 0)].dtype, np.float64)
+        received = workers[0].weights
+        self.assertEqual(received["pol1"]["w"].dtype, np.float32)
+        np.testing.assert_allclose(
+            received["pol1"]["w"], weights["pol1"]["w"], rtol=1e-3)
+
+    def testForgetWorkers(self):
+        broadcaster = WeightBroadcaster()
+        workers = [MockWorker(i) for i in range(2)]
+        sync(broadcaster, make_weights(), workers)
+        broadcaster.forget_workers(workers[1:])
+        updates = sync(broadcaster, make_weights(), workers)
+        self.assertEqual(updates[0][1], workers[:1])
+
+
+if __name__ == "__main__":
+    import pytest
+    import sys
+    sys.exit(pytest.main(["-v", __file__]))
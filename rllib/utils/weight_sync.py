@@ -0,0 +1,324 @@
+"""Versioned broadcast of policy weights to remote rollout workers.
+
+Every change of the local weights gets a new version number. Remote workers
+remember the version they hold, so unchanged weights are not sent again and
+duplicate updates are skipped. Optionally, only the tensors that changed
+since the last full broadcast are sent (delta mode), float32 tensors are sent
+as float16, and updates are relayed through a tree of workers instead of
+being pulled by every worker from the driver node.
+"""
+
+import copy
+import logging
+
+import numpy as np
+
+import ray
+from ray.exceptions import RayError
+from ray.rllib.utils.annotations import DeveloperAPI
+
+logger = logging.getLogger(__name__)
+
+# Send a full update once the tensors changed since the last full update
+# make up this fraction of the weights.
+DELTA_FULL_UPDATE_FRACTION = 0.5
+
+
+def _flatten(weights):
+    """Flattens {policy_id: weights} into {(policy_id, key): tensor}.
+
+    Policy weights can be a dict of tensors, a list of tensors or a single
+    tensor (key None).
+    """
+    flat = {}
+    layouts = {}
+    for pid, w in weights.items():
+        if isinstance(w, dict):
+            layouts[pid] = "dict"
+            flat.update(((pid, k), v) for k, v in w.items())
+        elif isinstance(w, (list, tuple)):
+            layouts[pid] = "list"
+            flat.update(((pid, i), v) for i, v in enumerate(w))
+        else:
+            layouts[pid] = "single"
+            flat[(pid, None)] = w
+    return flat, layouts
+
+
+def _equal(a, b):
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return (isinstance(a, np.ndarray) and isinstance(b, np.ndarray)
+                and a.shape == b.shape and a.dtype == b.dtype
+                and np.array_equal(a, b))
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
+
+
+def _snapshot(value):
+    # Weights may share memory with the model (e.g., torch tensors on CPU),
+    # so they have to be copied to detect later changes.
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    return copy.deepcopy(value)
+
+
+def _nbytes(value):
+    return value.nbytes if isinstance(value, np.ndarray) else 0
+
+
+@DeveloperAPI
+class WeightBroadcaster:
+    """Sends versioned weight updates from the local to remote workers.
+
+    Examples:
+        >>> broadcaster = WeightBroadcaster(delta=True, relay_fanout=16)
+        >>> broadcaster.broadcast(local_worker.get_weights(), remote_workers)
+    """
+
+    def __init__(self, delta=False, fp16=False, relay_fanout=0):
+        """Initializes a WeightBroadcaster.
+
+        Arguments:
+            delta (bool): Whether to only send the tensors that changed since
+                the last full update to workers that received it.
+            fp16 (bool): Whether to send float32 tensors as float16. This is
+                lossy, but halves the size of updates.
+            relay_fanout (int): If > 0, the driver sends updates to at most
+                this many workers, which relay them to the others in a tree
+                with the same fanout.
+        """
+        self.delta = delta
+        self.fp16 = fp16
+        self.relay_fanout = relay_fanout
+        self.version = 0
+        self.base_version = 0
+        self._weights = None
+        self._layouts = None
+        self._changed_since_base = set()
+        self._worker_versions = {}
+        # Pairs of (ObjectID of the versions, workers) of sent updates.
+        self._pending = []
+
+    def update_weights(self, weights):
+        """Records the current local weights, bumping the version if changed.
+
+        Returns:
+            bool: Whether the weights changed.
+        """
+        flat, layouts = _flatten(weights)
+        restructured = (self._weights is None or layouts != self._layouts
+                        or flat.keys() != self._weights.keys())
+        if restructured:
+            self._weights = {}
+            changed = set(flat)
+        else:
+            changed = {
+                k
+                for k, v in flat.items() if not _equal(v, self._weights[k])
+            }
+            if not changed:
+                return False
+        self.version += 1
+        self._layouts = layouts
+        for k in changed:
+            self._weights[k] = _snapshot(flat[k])
+        self._changed_since_base |= changed
+
+        full_update = restructured or not self.delta
+        if not full_update:
+            total = sum(_nbytes(v) for v in self._weights.values())
+            delta = sum(
+                _nbytes(self._weights[k]) for k in self._changed_since_base)
+            full_update = delta > DELTA_FULL_UPDATE_FRACTION * total
+        if full_update:
+            self.base_version = self.version
+            self._changed_since_base = set()
+        return True
+
+    def next_updates(self, workers):
+        """Returns the updates to send to bring the workers up to date.
+
+        The versions of the workers are only recorded once they confirm an
+        update, see ``record_versions``.
+
+        Arguments:
+            workers (list): Remote worker handles.
+
+        Returns:
+            list: Pairs of (update, workers to send it to).
+        """
+        if self._weights is None:
+            return []
+        full, delta = [], []
+        for w in workers:
+            worker_version = self._worker_versions.get(w._actor_id)
+            if worker_version == self.version:
+                continue
+            if (self.delta and worker_version is not None
+                    and worker_version >= self.base_version):
+                delta.append(w)
+            else:
+                full.append(w)
+        updates = []
+        if full:
+            updates.append((self._make_update(set(self._weights), None), full))
+        if delta:
+            updates.append((self._make_update(self._changed_since_base,
+                                              self.base_version), delta))
+        return updates
+
+    def record_versions(self, workers, versions):
+        """Records the weights versions that workers confirmed.
+
+        Workers that ignored an update keep their previous version, so they
+        get a full update next if they missed a delta.
+
+        Arguments:
+            workers (list): Remote worker handles.
+            versions (list): The version of each worker, or None if it is
+                unknown (e.g., because the update failed).
+        """
+        for w, version in zip(workers, versions):
+            if version is None:
+                self._worker_versions.pop(w._actor_id, None)
+            else:
+                self._worker_versions[w._actor_id] = version
+
+    def broadcast(self, weights, workers, global_vars=None):
+        """Sends the weights to the workers that do not have them yet.
+
+        Updates sent directly from the driver are applied before any task the
+        driver submits to the workers afterwards. Relayed updates are not, so
+        with relay_fanout > 0 this waits for them to be applied, and sends
+        the update directly to the workers that did not get it.
+
+        Arguments:
+            weights (dict): Map of policy ids to weights.
+            workers (list): Remote worker handles.
+            global_vars (dict): Optional global vars to set on all workers.
+        """
+        self.update_weights(weights)
+        self.wait_for_updates()
+        updated = set()
+        for update, targets in self.next_updates(workers):
+            self._pending.extend(
+                send_weight_update(update, targets, global_vars,
+                                   self.relay_fanout))
+            updated.update(w._actor_id for w in targets)
+        if self.relay_fanout > 0 and updated:
+            self.wait_for_updates()
+            for update, targets in self.next_updates(workers):
+                logger.warning("Sending weight update {} directly to {} "
+                               "workers that did not receive it.".format(
+                                   update["version"], len(targets)))
+                self._pending.extend(
+                    send_weight_update(update, targets, global_vars))
+        if global_vars:
+            for w in workers:
+                if w._actor_id not in updated:
+                    w.set_global_vars.remote(global_vars)
+
+    def wait_for_updates(self):
+        """Waits for the sent updates and records the confirmed versions."""
+        pending, self._pending = self._pending, []
+        for versions_id, targets in pending:
+            try:
+                versions = ray.get(versions_id)
+            except RayError as e:
+                logger.warning("Weight update of {} workers failed: {}".format(
+                    len(targets), e))
+                versions = [None] * len(targets)
+            self.record_versions(targets, versions)
+
+    def forget_workers(self, workers):
+        """Only keeps the versions of the given workers."""
+        self.wait_for_updates()
+        actor_ids = {w._actor_id for w in workers}
+        self._worker_versions = {
+            k: v
+            for k, v in self._worker_versions.items() if k in actor_ids
+        }
+
+    def _make_update(self, keys, base_version):
+        tensors, fp16_keys = {}, []
+        for k in keys:
+            value = self._weights[k]
+            if (self.fp16 and isinstance(value, np.ndarray)
+                    and value.dtype == np.float32):
+                value = value.astype(np.float16)
+                fp16_keys.append(k)
+            tensors[k] = value
+        return {
+            "version": self.version,
+            "base_version": base_version,
+            "layouts": self._layouts,
+            "tensors": tensors,
+            "fp16_keys": fp16_keys,
+        }
+
+
+@DeveloperAPI
+def send_weight_update(update, workers, global_vars=None, relay_fanout=0):
+    """Sends a weight update to workers, relaying it if relay_fanout > 0.
+
+    The workers are split into relay_fanout groups. The first worker of each
+    group receives the update directly and forwards it to the rest of its
+    group in the same way, so every node only serves relay_fanout copies.
+
+    Returns:
+        list: Pairs of (ObjectID, workers), where the ObjectID resolves to
+            the list of weights versions of the workers once they applied the
+            update.
+    """
+    if not workers:
+        return []
+    update_id = ray.put(update)
+    if relay_fanout > 0 and len(workers) > relay_fanout:
+        group_size = -(-len(workers) // relay_fanout)
+        groups = [
+            workers[i:i + group_size]
+            for i in range(0, len(workers), group_size)
+        ]
+        return [(group[0].apply_weight_update.remote(
+            update_id, global_vars, group[1:], relay_fanout), group)
+                for group in groups]
+    return [(w.apply_weight_update.remote(update_id, global_vars), [w])
+            for w in workers]
+
+
+@DeveloperAPI
+def merge_weight_update(update, get_weights):
+    """Returns the policy weights that result from applying an update.
+
+    Arguments:
+        update (dict): Update created by a WeightBroadcaster.
+        get_weights (func): Returns the current weights of a policy id. Only
+            called for delta updates.
+
+    Returns:
+        dict: Map of policy ids to the new weights of updated policies.
+    """
+    fp16_keys = set(update["fp16_keys"])
+    by_policy = {}
+    for (pid, key), value in update["tensors"].items():
+        if (pid, key) in fp16_keys:
+            value = value.astype(np.float32)
+        by_policy.setdefault(pid, {})[key] = value
+
+    weights = {}
+    for pid, tensors in by_policy.items():
+        layout = update["layouts"][pid]
+        if layout == "single":
+            weights[pid] = tensors[None]
+            continue
+        if update["base_version"] is None:
+            current = {} if layout == "dict" else [None] * len(tensors)
+        else:
+            current = get_weights(pid)
+            current = dict(current) if layout == "dict" else list(current)
+        for key, value in tensors.items():
+            current[key] = value
+        weights[pid] = current
+    return weights